@@ -50,6 +50,7 @@ from aiteqno.adapters import (
 )
 from aiteqno.adapters.tesseract import TesseractRasterTransformEvidence
 from aiteqno.application import (
+    ExtractionStageCache,
     OcrQualityConfig,
     OCR_LANGUAGE_CANDIDATE_LANGUAGES,
     OCR_LANGUAGE_CONTROL_LANGUAGES,
@@ -1121,12 +1122,16 @@ def _run_in_created_output(
         ),
     )
 
+    # Every arm decodes the same source with the same structure extractor and
+    # differs only in OCR settings, so decode and structure run once.
+    structure_extractor = OpenCvStructureExtractor()
+    stage_cache = ExtractionStageCache()
     control_bundle_directory = output_directory / "control-bundle"
     control_extraction = extract_png(
         source_data,
         control_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=control_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1134,6 +1139,7 @@ def _run_in_created_output(
         languages=LANGUAGES,
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
+        stage_cache=stage_cache,
     )
     padding_control_bundle_directory = (
         output_directory / "ocr-padding" / "control" / "bundle"
@@ -1147,7 +1153,7 @@ def _run_in_created_output(
         source_data,
         candidate_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=resolution_candidate_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1155,6 +1161,7 @@ def _run_in_created_output(
         languages=LANGUAGES,
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
+        stage_cache=stage_cache,
     )
     padding_candidate_bundle_directory = (
         output_directory / "ocr-padding" / "candidate" / "bundle"
@@ -1163,7 +1170,7 @@ def _run_in_created_output(
         source_data,
         padding_candidate_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=padding_candidate_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1171,6 +1178,7 @@ def _run_in_created_output(
         languages=LANGUAGES,
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
+        stage_cache=stage_cache,
     )
     language_control_bundle_directory = (
         output_directory / "ocr-language" / "control" / "bundle"
@@ -1179,7 +1187,7 @@ def _run_in_created_output(
         source_data,
         language_control_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=language_runtime.control_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1187,6 +1195,7 @@ def _run_in_created_output(
         languages=LANGUAGES,
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
+        stage_cache=stage_cache,
     )
     language_candidate_bundle_directory = (
         output_directory / "ocr-language" / "candidate" / "bundle"
@@ -1195,7 +1204,7 @@ def _run_in_created_output(
         source_data,
         language_candidate_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=language_runtime.candidate_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1203,6 +1212,7 @@ def _run_in_created_output(
         languages=LANGUAGE_CANDIDATE,
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
+        stage_cache=stage_cache,
     )
     grouping_control_bundle_directory = (
         output_directory / "ocr-region-grouping" / "control" / "bundle"
@@ -1211,7 +1221,7 @@ def _run_in_created_output(
         source_data,
         grouping_control_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=grouping_runtime.control_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1220,6 +1230,7 @@ def _run_in_created_output(
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=False),
         ocr_region_grouping_observer=grouping_runtime.control_plans.append,
+        stage_cache=stage_cache,
     )
     grouping_candidate_bundle_directory = (
         output_directory / "ocr-region-grouping" / "candidate" / "bundle"
@@ -1228,7 +1239,7 @@ def _run_in_created_output(
         source_data,
         grouping_candidate_bundle_directory,
         decoder=decoder,
-        structure_extractor=OpenCvStructureExtractor(),
+        structure_extractor=structure_extractor,
         ocr_backend=grouping_runtime.candidate_backend,
         asset_encoder=PillowPngAssetEncoder(),
         validator=JsonSchemaDocumentIRValidator(),
@@ -1237,6 +1248,7 @@ def _run_in_created_output(
         ocr_options=OCR_OPTIONS,
         ocr_region_grouping=OcrRegionGroupingConfig(enabled=True),
         ocr_region_grouping_observer=grouping_runtime.candidate_plans.append,
+        stage_cache=stage_cache,
     )
     multilingual_smoke, multilingual_smoke_tokens = _run_language_smoke(
         decoder=decoder,
@@ -12,10 +12,14 @@ from .docx import (
     PythonDocxRenderer,
 )
 from .extraction import (
+    ASSET_ENCODER_PROVIDER,
+    ASSET_ENCODER_PROVIDER_VERSION,
+    DEFAULT_ASSET_ENCODER_MAX_WORKERS,
     DEFAULT_MAX_ENCODED_ASSET_BYTES,
     DOCUMENT_IR_FILENAME,
     FilesystemDocumentBundleWriter,
     PillowPngAssetEncoder,
+    PngCompressionProfile,
 )
 from .evaluation import FilesystemEvaluationWriter, PythonDocxObserver
 from .json_schema import JsonSchemaDocumentIRValidator
@@ -28,6 +32,11 @@ from .libreoffice import (
     LibreOfficeSnapshotPage,
     LibreOfficeSnapshotRenderer,
 )
+from .ocr_cache import (
+    DEFAULT_OCR_CACHE_MAX_BYTES,
+    OCR_RESPONSE_CACHE_VERSION,
+    FilesystemOcrResponseCache,
+)
 from .ocr_fake import (
     FAKE_OCR_PROVIDER,
     FAKE_OCR_PROVIDER_VERSION,
@@ -49,7 +58,13 @@ from .structure import (
     OpenCvStructureExtractor,
     PillowPngDecoder,
 )
+from .structure_tiles import (
+    DEFAULT_STRUCTURE_TILE_ROWS,
+    STRUCTURE_TILE_VERSION,
+    TiledOpenCvStructureExtractor,
+)
 from .tesseract import (
+    DEFAULT_TESSERACT_MAX_WORKERS,
     DEFAULT_TESSERACT_REGION_PADDING_PX,
     MIN_TESSERACT_MAJOR_VERSION,
     TESSERACT_CROP_PADDING_MAPPING_POLICY,
@@ -61,16 +76,27 @@ from .tesseract import (
     TesseractCropPaddingTargetEvidence,
     TesseractInvocationEvidence,
     TesseractOcrBackend,
+    TesseractRegionTimingEvidence,
+    TesseractResponseCacheEvidence,
+    TesseractTimingEvidence,
     TesseractTrainedDataFileEvidence,
 )
+from .tesseract_batch import (
+    TESSERACT_BATCH_SESSION_VERSION,
+    TesseractBatchOcrBackend,
+)
 
 __all__ = [
     "DEFAULT_FALLBACK_FONT",
     "DEFAULT_FALLBACK_DPI",
     "DEFAULT_MAX_ASSET_BYTES",
     "DEFAULT_MAX_ASSET_PIXELS",
+    "ASSET_ENCODER_PROVIDER",
+    "ASSET_ENCODER_PROVIDER_VERSION",
+    "DEFAULT_ASSET_ENCODER_MAX_WORKERS",
     "DEFAULT_MAX_ENCODED_ASSET_BYTES",
     "DEFAULT_MAX_PREVIEW_PIXELS",
+    "DEFAULT_OCR_CACHE_MAX_BYTES",
     "DEFAULT_MAX_PNG_BYTES",
     "DEFAULT_MAX_PNG_PIXELS",
     "DEFAULT_LIBREOFFICE_TIMEOUT_SECONDS",
@@ -79,6 +105,8 @@ __all__ = [
     "DEFAULT_PREVIEW_DPI",
     "DEFAULT_PREVIEW_FONT_FALLBACKS",
     "DEFAULT_SUPPORTED_FONTS",
+    "DEFAULT_STRUCTURE_TILE_ROWS",
+    "DEFAULT_TESSERACT_MAX_WORKERS",
     "DEFAULT_TESSERACT_REGION_PADDING_PX",
     "DOCUMENT_IR_FILENAME",
     "FAKE_OCR_PROVIDER",
@@ -87,6 +115,7 @@ __all__ = [
     "FakeOcrObservation",
     "FilesystemEvaluationWriter",
     "FilesystemDocumentBundleWriter",
+    "FilesystemOcrResponseCache",
     "JsonSchemaDocumentIRValidator",
     "LIBREOFFICE_RENDERER_NAME",
     "PDFTOPPM_RASTERIZER_NAME",
@@ -97,20 +126,29 @@ __all__ = [
     "PillowPreviewRenderer",
     "PillowPngDecoder",
     "PillowPngAssetEncoder",
+    "PngCompressionProfile",
     "PythonDocxRenderer",
     "PythonDocxObserver",
     "OpenCvStructureExtractor",
     "MIN_TESSERACT_MAJOR_VERSION",
+    "OCR_RESPONSE_CACHE_VERSION",
     "STRUCTURE_PROVIDER",
     "STRUCTURE_PROVIDER_VERSION",
+    "STRUCTURE_TILE_VERSION",
     "TESSERACT_PROVIDER",
+    "TESSERACT_BATCH_SESSION_VERSION",
     "TESSERACT_CROP_PADDING_MAPPING_POLICY",
     "TESSERACT_CROP_PADDING_OPERATION_ORDER",
     "TESSERACT_CROP_PADDING_VERSION",
     "TESSERACT_INVOCATION_EVIDENCE_VERSION",
+    "TesseractBatchOcrBackend",
     "TesseractCropPaddingEvidence",
     "TesseractCropPaddingTargetEvidence",
     "TesseractInvocationEvidence",
     "TesseractOcrBackend",
+    "TesseractRegionTimingEvidence",
+    "TesseractResponseCacheEvidence",
+    "TesseractTimingEvidence",
     "TesseractTrainedDataFileEvidence",
+    "TiledOpenCvStructureExtractor",
 ]
@@ -16,12 +16,13 @@ import math
 import os
 import tempfile
 import unicodedata
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass, field, replace
 from io import BytesIO
 from os import PathLike
 from pathlib import Path
 
+import numpy as np
 from docx import Document as open_docx
 from docx.document import Document as WordDocument
 from docx.enum.section import WD_ORIENT, WD_SECTION
@@ -43,10 +44,12 @@ from PIL import Image
 
 from aiteqno._version import __version__
 from aiteqno.domain import (
+    ELEMENT_TYPE_CODES,
     GEOMETRY_TOLERANCE_PT,
     Asset,
     DocumentElement,
     DocumentIR,
+    ElementType,
     FontStyle,
     ImageElement,
     ImageFit,
@@ -89,6 +92,7 @@ DEFAULT_SUPPORTED_FONTS = (
 )
 
 _BAND_TOLERANCE_PT = 3.0
+_LINE_TYPE_CODE = ELEMENT_TYPE_CODES.index(ElementType.LINE)
 _MIN_LAYOUT_COLUMN_PT = 1.0
 _MAX_WORD_BORDER_PT = 12.0
 _MIN_WORD_BORDER_PT = 0.25
@@ -485,14 +489,14 @@ class PythonDocxRenderer:
             state=state,
         )
 
-        remaining = tuple(
-            element
-            for element in page.elements
+        remaining = [
+            index
+            for index, element in enumerate(page.elements)
             if element.id not in table_element_ids and element.id not in page_frame_ids
-        )
+        ]
         blocks: list[tuple[float, int, str, _LayoutBand | TableTopology]] = [
             (band.top, 0, min(element.id for element in band.elements), band)
-            for band in self._cluster_bands(remaining)
+            for band in self._cluster_bands(page, remaining)
         ]
         blocks.extend((table.bbox.y, 1, table.id, table) for table in topology.tables)
         blocks.sort(key=lambda item: (item[0], item[1], item[2]))
@@ -1212,7 +1216,7 @@ class PythonDocxRenderer:
         state: _RenderState,
     ) -> None:
         previous_bottom = vertical_margin
-        for band in self._cluster_bands(page.elements):
+        for band in self._cluster_bands(page):
             if len(band.elements) == 1 and isinstance(band.elements[0], TextElement):
                 element = band.elements[0]
                 paragraph = word_document.add_paragraph()
@@ -1252,37 +1256,69 @@ class PythonDocxRenderer:
 
     @staticmethod
     def _cluster_bands(
-        elements: tuple[DocumentElement, ...],
+        page: Page,
+        indexes: Sequence[int] | None = None,
     ) -> tuple[_LayoutBand, ...]:
-        def sort_key(element: DocumentElement) -> tuple[float, int, float, int, str]:
-            reading_order = (
-                element.reading_order if isinstance(element, TextElement) else 2**31 - 1
+        """Group elements, ordered top-down, into vertically overlapping bands.
+
+        Elements sort by top, reading order (text first), left, z-index, and
+        ID, using ``page.geometry`` columns for every numeric key. A band
+        grows while the next top is within ``_BAND_TOLERANCE_PT`` of the
+        band's bottom, and every top in the sorted run sits at or below the
+        bands before it, so each band's bottom is the running maximum of all
+        bottoms seen so far.
+        """
+
+        geometry = page.geometry
+        selected = (
+            np.arange(len(page.elements))
+            if indexes is None
+            else np.asarray(indexes, dtype=np.intp)
+        )
+        if not selected.size:
+            return ()
+        by_id = np.asarray(
+            sorted(range(selected.size), key=lambda k: page.elements[selected[k]].id),
+            dtype=np.intp,
+        )
+        candidates = selected[by_id]
+        reading_order = np.asarray(geometry.reading_order)[candidates]
+        y = np.asarray(geometry.y)[candidates]
+        order = candidates[
+            np.lexsort(
+                (
+                    np.asarray(geometry.z_index)[candidates],
+                    np.asarray(geometry.x)[candidates],
+                    np.where(reading_order < 0, 2**31 - 1, reading_order),
+                    y,
+                )
             )
-            return (
-                element.bbox.y,
-                reading_order,
-                element.bbox.x,
-                element.z_index,
-                element.id,
+        ]
+        top = np.asarray(geometry.y)[order]
+        bottom = top + np.asarray(geometry.height)[order]
+        lines = np.asarray(geometry.type_codes)[order] == _LINE_TYPE_CODE
+        start_y = np.asarray(geometry.start_y)[order]
+        end_y = np.asarray(geometry.end_y)[order]
+        top = np.where(lines, np.minimum(start_y, end_y), top)
+        bottom = np.where(lines, np.maximum(start_y, end_y), bottom)
+        reach = np.maximum.accumulate(bottom)
+        starts = np.flatnonzero(
+            np.concatenate(([True], top[1:] > reach[:-1] + _BAND_TOLERANCE_PT))
+        )
+        ends = (*starts[1:].tolist(), order.size)
+        return tuple(
+            _LayoutBand(
+                elements=tuple(page.elements[index] for index in order[start:end]),
+                top=float(band_top),
+                bottom=float(band_bottom),
             )
-
-        bands: list[_LayoutBand] = []
-        for element in sorted(elements, key=sort_key):
-            top = element.bbox.y
-            bottom = element.bbox.bottom
-            if isinstance(element, LineElement):
-                top = min(element.start.y, element.end.y)
-                bottom = max(element.start.y, element.end.y)
-            if bands and top <= bands[-1].bottom + _BAND_TOLERANCE_PT:
-                previous = bands[-1]
-                bands[-1] = _LayoutBand(
-                    elements=(*previous.elements, element),
-                    top=min(previous.top, top),
-                    bottom=max(previous.bottom, bottom),
-                )
-            else:
-                bands.append(_LayoutBand(elements=(element,), top=top, bottom=bottom))
-        return tuple(bands)
+            for start, end, band_top, band_bottom in zip(
+                starts.tolist(),
+                ends,
+                np.minimum.reduceat(top, starts),
+                np.maximum.reduceat(bottom, starts),
+            )
+        )
 
     @staticmethod
     def _apply_text_position(
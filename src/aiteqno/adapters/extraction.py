@@ -3,9 +3,13 @@
 from __future__ import annotations
 
 import hashlib
+import json
 import os
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from functools import partial
 from io import BytesIO
 from os import PathLike
 from pathlib import Path, PurePosixPath
@@ -13,7 +17,13 @@ from typing import Sequence
 
 from PIL import Image
 
-from aiteqno.domain import DocumentIR, MediaType, PixelBoundingBox
+from aiteqno.domain import (
+    DocumentIR,
+    MediaType,
+    PixelBoundingBox,
+    Provenance,
+    ProvenanceStage,
+)
 from aiteqno.ports.extraction import (
     AssetEncodingError,
     AssetPayload,
@@ -26,15 +36,42 @@ from aiteqno.ports.structure import ImageInput
 
 DOCUMENT_IR_FILENAME = "document.ir.json"
 DEFAULT_MAX_ENCODED_ASSET_BYTES = 25 * 1024 * 1024
+DEFAULT_ASSET_ENCODER_MAX_WORKERS = 1
+ASSET_ENCODER_PROVIDER = "aiteqno.pillow-png-asset"
+ASSET_ENCODER_PROVIDER_VERSION = "1.0"
+
+
+class PngCompressionProfile(str, Enum):
+    """Named zlib effort levels for lossless PNG asset crops."""
+
+    FAST = "fast"
+    BALANCED = "balanced"
+    SMALLEST = "smallest"
+
+
+_PNG_COMPRESS_LEVELS = {
+    PngCompressionProfile.FAST: 1,
+    PngCompressionProfile.BALANCED: 6,
+    PngCompressionProfile.SMALLEST: 9,
+}
 
 
 class PillowPngAssetEncoder:
-    """Crop normalized RGB pixels and encode deterministic portable PNG assets."""
+    """Crop normalized RGB pixels and encode deterministic portable PNG assets.
+
+    ``encode_png_crops`` validates the page once and encodes every crop of it,
+    on up to ``max_workers`` threads because zlib compression releases the GIL.
+    Results keep the requested order, so output never depends on scheduling.
+    ``profile`` selects the zlib level; pixels are identical in every profile,
+    bytes are deterministic within one, and each crop's provenance records it.
+    """
 
     def __init__(
         self,
         *,
         max_encoded_bytes: int = DEFAULT_MAX_ENCODED_ASSET_BYTES,
+        max_workers: int = DEFAULT_ASSET_ENCODER_MAX_WORKERS,
+        profile: PngCompressionProfile | str = PngCompressionProfile.SMALLEST,
     ) -> None:
         if (
             isinstance(max_encoded_bytes, bool)
@@ -42,7 +79,35 @@ class PillowPngAssetEncoder:
             or max_encoded_bytes <= 0
         ):
             raise ValueError("max_encoded_bytes must be a positive integer")
+        if (
+            isinstance(max_workers, bool)
+            or not isinstance(max_workers, int)
+            or max_workers <= 0
+        ):
+            raise ValueError("max_workers must be a positive integer")
+        try:
+            self._profile = PngCompressionProfile(profile)
+        except ValueError as exc:
+            raise ValueError(
+                "profile must be one of: "
+                + ", ".join(value.value for value in PngCompressionProfile)
+            ) from exc
         self._max_encoded_bytes = max_encoded_bytes
+        self._max_workers = max_workers
+        parameters = {
+            "compress_level": _PNG_COMPRESS_LEVELS[self._profile],
+            "optimize": False,
+            "profile": self._profile.value,
+        }
+        self._parameters_digest = hashlib.sha256(
+            json.dumps(parameters, sort_keys=True, separators=(",", ":")).encode(
+                "ascii"
+            )
+        ).hexdigest()
+
+    @property
+    def profile(self) -> PngCompressionProfile:
+        return self._profile
 
     def encode_png_crop(
         self,
@@ -53,6 +118,47 @@ class PillowPngAssetEncoder:
 
         if not isinstance(image, ImageInput):
             raise TypeError("image must be an ImageInput")
+        return self._encode_crop(image, bbox)
+
+    def encode_png_crops(
+        self,
+        image: ImageInput,
+        bboxes: Sequence[PixelBoundingBox],
+    ) -> tuple[EncodedImageAsset | AssetEncodingError, ...]:
+        """Encode every crop of one page; failures are returned per crop."""
+
+        if not isinstance(image, ImageInput):
+            raise TypeError("image must be an ImageInput")
+        if isinstance(bboxes, (str, bytes, bytearray)):
+            raise TypeError("bboxes must be a sequence of PixelBoundingBox values")
+        boxes = tuple(bboxes)
+        if any(not isinstance(bbox, PixelBoundingBox) for bbox in boxes):
+            raise TypeError("bboxes must be a sequence of PixelBoundingBox values")
+        encode = partial(self._encode_crop_or_error, image)
+        worker_count = min(self._max_workers, len(boxes))
+        if worker_count <= 1:
+            return tuple(map(encode, boxes))
+        with ThreadPoolExecutor(
+            max_workers=worker_count,
+            thread_name_prefix="aiteqno-asset",
+        ) as executor:
+            return tuple(executor.map(encode, boxes))
+
+    def _encode_crop_or_error(
+        self,
+        image: ImageInput,
+        bbox: PixelBoundingBox,
+    ) -> EncodedImageAsset | AssetEncodingError:
+        try:
+            return self._encode_crop(image, bbox)
+        except AssetEncodingError as exc:
+            return exc
+
+    def _encode_crop(
+        self,
+        image: ImageInput,
+        bbox: PixelBoundingBox,
+    ) -> EncodedImageAsset:
         if not isinstance(bbox, PixelBoundingBox):
             raise TypeError("bbox must be a PixelBoundingBox")
         if (
@@ -64,27 +170,18 @@ class PillowPngAssetEncoder:
                 "image asset region must remain inside the source page",
             )
 
-        page: Image.Image | None = None
         crop: Image.Image | None = None
         try:
-            page = Image.frombytes(
+            crop = Image.frombytes(
                 "RGB",
-                (image.source.pixel_width, image.source.pixel_height),
-                image.pixels,
-            )
-            crop = page.crop(
-                (
-                    bbox.x,
-                    bbox.y,
-                    bbox.x + bbox.width,
-                    bbox.y + bbox.height,
-                )
+                (bbox.width, bbox.height),
+                image.region_pixels(bbox),
             )
             encoded = BytesIO()
             crop.save(
                 encoded,
                 format="PNG",
-                compress_level=9,
+                compress_level=_PNG_COMPRESS_LEVELS[self._profile],
                 optimize=False,
                 dpi=(image.source.dpi_x, image.source.dpi_y),
             )
@@ -97,8 +194,6 @@ class PillowPngAssetEncoder:
         finally:
             if crop is not None:
                 crop.close()
-            if page is not None:
-                page.close()
 
         if len(data) > self._max_encoded_bytes:
             raise AssetEncodingError(
@@ -113,6 +208,14 @@ class PillowPngAssetEncoder:
             pixel_height=bbox.height,
             dpi_x=image.source.dpi_x,
             dpi_y=image.source.dpi_y,
+            provenance=Provenance(
+                stage=ProvenanceStage.NORMALIZE,
+                provider=ASSET_ENCODER_PROVIDER,
+                provider_version=ASSET_ENCODER_PROVIDER_VERSION,
+                source_bbox_px=bbox,
+                parameters_digest=self._parameters_digest,
+                notes=f"png_profile={self._profile.value}",
+            ),
         )
 
 
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import numbers
+import re
+from collections.abc import Callable
 from functools import lru_cache
 from importlib import metadata
 from pathlib import Path
@@ -11,11 +15,18 @@ from typing import Any, Mapping
 from jsonschema import Draft202012Validator
 from jsonschema.exceptions import SchemaError, ValidationError
 
-from aiteqno.domain import DocumentIR, DocumentIRValidationError, ValidationIssue
+from aiteqno.domain import (
+    DocumentBinaryReader,
+    DocumentIR,
+    DocumentIRValidationError,
+    ValidationIssue,
+    encode_document_binary,
+)
 from aiteqno.ports.extraction import DocumentIRSchemaError
 
 
 SCHEMA_FILENAME = "document-ir-v0.1.schema.json"
+DOCUMENT_IR_SIDECAR_SUFFIX = ".bin"
 _INSTALLED_SCHEMA_SUFFIX = f"share/aiteqno/schemas/{SCHEMA_FILENAME}"
 
 
@@ -54,6 +65,268 @@ def _validator() -> Draft202012Validator:
     return Draft202012Validator(load_document_ir_schema())
 
 
+_Check = Callable[[Any], bool]
+
+_ANNOTATION_KEYWORDS = frozenset(
+    {"$schema", "$id", "$comment", "$defs", "title", "description"}
+)
+_OBJECT_KEYWORDS = frozenset(
+    {"required", "properties", "additionalProperties", "propertyNames"}
+)
+_ARRAY_KEYWORDS = frozenset({"items", "minItems", "uniqueItems"})
+_STRING_KEYWORDS = frozenset({"minLength", "pattern"})
+_NUMBER_KEYWORDS = frozenset({"minimum", "maximum", "exclusiveMinimum"})
+_APPLICATOR_KEYWORDS = frozenset({"$ref", "allOf", "anyOf", "oneOf"})
+_SUPPORTED_KEYWORDS = (
+    _ANNOTATION_KEYWORDS
+    | _OBJECT_KEYWORDS
+    | _ARRAY_KEYWORDS
+    | _STRING_KEYWORDS
+    | _NUMBER_KEYWORDS
+    | _APPLICATOR_KEYWORDS
+    | {"type", "const", "enum"}
+)
+
+
+def _is_number(value: Any) -> bool:
+    return not isinstance(value, bool) and isinstance(value, numbers.Number)
+
+
+def _is_integer(value: Any) -> bool:
+    if isinstance(value, bool):
+        return False
+    return isinstance(value, int) or (
+        isinstance(value, float) and value.is_integer()
+    )
+
+
+# The same type predicates as the Draft 2020-12 type checker in jsonschema.
+_TYPE_CHECKS: dict[str, _Check] = {
+    "array": lambda value: isinstance(value, list),
+    "boolean": lambda value: isinstance(value, bool),
+    "integer": _is_integer,
+    "null": lambda value: value is None,
+    "number": _is_number,
+    "object": lambda value: isinstance(value, dict),
+    "string": lambda value: isinstance(value, str),
+}
+
+
+class _UnsupportedSchema(Exception):
+    """The schema uses a keyword the compiled fast path does not implement."""
+
+
+class _SchemaCompiler:
+    """Compile the Document IR schema into a plain ``value -> bool`` predicate.
+
+    Only the keywords the canonical schema uses are compiled, each with
+    jsonschema's semantics. Where those semantics are subtle (non-string
+    constants, unique non-string items, exotic number types), the predicate
+    answers ``False`` and leaves the verdict to jsonschema, so acceptance
+    never disagrees with the reference validator on a valid document.
+    """
+
+    __slots__ = ("_compiled", "_definitions")
+
+    def __init__(self, root: Mapping[str, Any]) -> None:
+        self._definitions = root.get("$defs", {})
+        self._compiled: dict[str, _Check | None] = {}
+
+    def compile(self, schema: Any) -> _Check:
+        if schema is True:
+            return _always
+        if schema is False:
+            return _never
+        if not isinstance(schema, dict):
+            raise _UnsupportedSchema(f"schema must be an object, not {schema!r}")
+        unsupported = set(schema) - _SUPPORTED_KEYWORDS
+        if unsupported:
+            raise _UnsupportedSchema(f"unsupported keywords {sorted(unsupported)}")
+
+        checks: list[_Check] = []
+        if "type" in schema:
+            names = schema["type"] if isinstance(schema["type"], list) else [
+                schema["type"]
+            ]
+            type_checks = tuple(_TYPE_CHECKS[name] for name in names)
+            checks.append(
+                lambda value: any(check(value) for check in type_checks)
+            )
+        if "const" in schema:
+            checks.append(_string_choice((schema["const"],)))
+        if "enum" in schema:
+            checks.append(_string_choice(tuple(schema["enum"])))
+        if _OBJECT_KEYWORDS & schema.keys():
+            checks.append(self._object(schema))
+        if _ARRAY_KEYWORDS & schema.keys():
+            checks.append(self._array(schema))
+        if _STRING_KEYWORDS & schema.keys():
+            checks.append(_string(schema))
+        if _NUMBER_KEYWORDS & schema.keys():
+            checks.append(_number(schema))
+        if "$ref" in schema:
+            checks.append(self._reference(schema["$ref"]))
+        if "allOf" in schema:
+            checks.extend(self.compile(item) for item in schema["allOf"])
+        if "anyOf" in schema:
+            any_of = tuple(self.compile(item) for item in schema["anyOf"])
+            checks.append(lambda value: any(check(value) for check in any_of))
+        if "oneOf" in schema:
+            one_of = tuple(self.compile(item) for item in schema["oneOf"])
+            checks.append(
+                lambda value: sum(1 for check in one_of if check(value)) == 1
+            )
+        return _all_of(tuple(checks))
+
+    def _reference(self, reference: Any) -> _Check:
+        prefix = "#/$defs/"
+        if not isinstance(reference, str) or not reference.startswith(prefix):
+            raise _UnsupportedSchema(f"unsupported reference {reference!r}")
+        name = reference[len(prefix) :]
+        if name not in self._definitions:
+            raise _UnsupportedSchema(f"unresolvable reference {reference!r}")
+        compiled = self._compiled
+        if name not in compiled:
+            compiled[name] = None
+            compiled[name] = self.compile(self._definitions[name])
+        check = compiled[name]
+        if check is None:
+            # A recursive reference is resolved once its definition is done.
+            return lambda value: compiled[name](value)  # type: ignore[misc]
+        return check
+
+    def _object(self, schema: Mapping[str, Any]) -> _Check:
+        required = tuple(schema.get("required", ()))
+        properties = {
+            name: self.compile(item)
+            for name, item in schema.get("properties", {}).items()
+        }
+        additional = (
+            self.compile(schema["additionalProperties"])
+            if "additionalProperties" in schema
+            else None
+        )
+        property_names = (
+            self.compile(schema["propertyNames"])
+            if "propertyNames" in schema
+            else None
+        )
+
+        def check(value: Any) -> bool:
+            if not isinstance(value, dict):
+                return True
+            for name in required:
+                if name not in value:
+                    return False
+            for key, item in value.items():
+                known = properties.get(key)
+                if known is not None:
+                    if not known(item):
+                        return False
+                elif additional is not None and not additional(item):
+                    return False
+                if property_names is not None and not property_names(key):
+                    return False
+            return True
+
+        return check
+
+    def _array(self, schema: Mapping[str, Any]) -> _Check:
+        items = self.compile(schema["items"]) if "items" in schema else None
+        min_items = schema.get("minItems", 0)
+        unique = schema.get("uniqueItems", False)
+
+        def check(value: Any) -> bool:
+            if not isinstance(value, list):
+                return True
+            if len(value) < min_items:
+                return False
+            if items is not None:
+                for item in value:
+                    if not items(item):
+                        return False
+            if unique and (
+                not all(isinstance(item, str) for item in value)
+                or len(set(value)) != len(value)
+            ):
+                return False
+            return True
+
+        return check
+
+
+def _always(value: Any) -> bool:
+    return True
+
+
+def _never(value: Any) -> bool:
+    return False
+
+
+def _all_of(checks: tuple[_Check, ...]) -> _Check:
+    if not checks:
+        return _always
+    if len(checks) == 1:
+        return checks[0]
+
+    def check(value: Any) -> bool:
+        for part in checks:
+            if not part(value):
+                return False
+        return True
+
+    return check
+
+
+def _string_choice(choices: tuple[Any, ...]) -> _Check:
+    if not all(isinstance(choice, str) for choice in choices):
+        raise _UnsupportedSchema("only string const and enum values are compiled")
+    allowed = frozenset(choices)
+    return lambda value: isinstance(value, str) and value in allowed
+
+
+def _string(schema: Mapping[str, Any]) -> _Check:
+    min_length = schema.get("minLength", 0)
+    pattern = re.compile(schema["pattern"]) if "pattern" in schema else None
+
+    def check(value: Any) -> bool:
+        if not isinstance(value, str):
+            return True
+        if len(value) < min_length:
+            return False
+        return pattern is None or pattern.search(value) is not None
+
+    return check
+
+
+def _number(schema: Mapping[str, Any]) -> _Check:
+    minimum = schema.get("minimum")
+    maximum = schema.get("maximum")
+    exclusive_minimum = schema.get("exclusiveMinimum")
+
+    def check(value: Any) -> bool:
+        if not _is_number(value):
+            return True
+        if not isinstance(value, (int, float)):
+            return False
+        if minimum is not None and value < minimum:
+            return False
+        if maximum is not None and value > maximum:
+            return False
+        return exclusive_minimum is None or value > exclusive_minimum
+
+    return check
+
+
+@lru_cache(maxsize=1)
+def _compiled_schema() -> _Check | None:
+    schema = load_document_ir_schema()
+    try:
+        return _SchemaCompiler(schema).compile(schema)
+    except _UnsupportedSchema:
+        return None
+
+
 def _json_path(parts: Any) -> str:
     path = "$"
     for part in parts:
@@ -85,8 +358,16 @@ def _issue_from_schema_error(error: ValidationError) -> ValidationIssue:
 
 
 def validate_document_ir_data(data: Any) -> None:
-    """Validate plain data against the formal schema with actionable paths."""
+    """Validate plain data against the formal schema with actionable paths.
+
+    A predicate compiled from the schema accepts valid data in one plain walk.
+    Only rejected data goes through jsonschema, which stays the single source
+    of the reported issues, their paths, and their order.
+    """
 
+    accepts = _compiled_schema()
+    if accepts is not None and accepts(data):
+        return
     errors = sorted(
         _validator().iter_errors(data),
         key=lambda error: (
@@ -131,9 +412,48 @@ def document_ir_from_json(text: str | bytes | bytearray) -> DocumentIR:
 
 
 def document_ir_from_file(path: str | Path) -> DocumentIR:
-    """Read and validate a UTF-8 Document IR JSON file."""
+    """Read and validate a UTF-8 Document IR JSON file.
 
-    return document_ir_from_json(Path(path).read_bytes())
+    When the file has a fresh binary sidecar, the document is decoded from the
+    sidecar instead. Fresh means the sidecar records the SHA-256 of exactly
+    these JSON bytes, which were schema-validated when the sidecar was packed.
+    A missing, stale, or unreadable sidecar is ignored.
+    """
+
+    source = Path(path)
+    data = source.read_bytes()
+    document = _document_ir_from_fresh_sidecar(source, data)
+    return document if document is not None else document_ir_from_json(data)
+
+
+def document_ir_sidecar_path(path: str | Path) -> Path:
+    """Return where the binary sidecar of a Document IR JSON file lives."""
+
+    return Path(path).with_suffix(DOCUMENT_IR_SIDECAR_SUFFIX)
+
+
+def encode_document_ir_sidecar(path: str | Path) -> bytes:
+    """Validate a Document IR JSON file and pack it as a binary sidecar."""
+
+    data = Path(path).read_bytes()
+    return encode_document_binary(
+        document_ir_from_json(data),
+        source_digest=hashlib.sha256(data).hexdigest(),
+    )
+
+
+def _document_ir_from_fresh_sidecar(source: Path, data: bytes) -> DocumentIR | None:
+    try:
+        sidecar = document_ir_sidecar_path(source).read_bytes()
+    except OSError:
+        return None
+    try:
+        reader = DocumentBinaryReader(sidecar)
+        if reader.source_digest != hashlib.sha256(data).hexdigest():
+            return None
+        return reader.document()
+    except (TypeError, ValueError):
+        return None
 
 
 def validate_document_ir(document: DocumentIR) -> None:
@@ -162,12 +482,15 @@ class JsonSchemaDocumentIRValidator:
 
 
 __all__ = [
+    "DOCUMENT_IR_SIDECAR_SUFFIX",
     "JsonSchemaDocumentIRValidator",
     "SchemaError",
     "document_ir_from_data",
     "document_ir_from_file",
     "document_ir_from_json",
     "document_ir_schema_path",
+    "document_ir_sidecar_path",
+    "encode_document_ir_sidecar",
     "load_document_ir_schema",
     "validate_document_ir",
     "validate_document_ir_data",
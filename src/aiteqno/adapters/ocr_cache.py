@@ -0,0 +1,184 @@
+"""Size-bounded, content-addressed filesystem cache for raw OCR engine responses."""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import tempfile
+import threading
+from collections.abc import Mapping, Sequence
+from os import PathLike
+from pathlib import Path
+
+
+OCR_RESPONSE_CACHE_VERSION = "ocr-response-cache-v1"
+DEFAULT_OCR_CACHE_MAX_BYTES = 256 * 1024 * 1024
+_KEY_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+_EVICTION_LOW_WATER = 0.9
+
+
+class FilesystemOcrResponseCache:
+    """Store engine responses by a caller-computed SHA-256 content key.
+
+    Entries are small JSON files written atomically, so several processes may
+    share one directory. Reading an entry refreshes its modification time, and
+    the least recently used entries are evicted once the directory exceeds
+    ``max_bytes``. Unreadable entries count as misses, corrupt ones are also
+    removed when the directory allows it, and write failures never fail
+    recognition.
+    """
+
+    def __init__(
+        self,
+        directory: str | PathLike[str],
+        *,
+        max_bytes: int = DEFAULT_OCR_CACHE_MAX_BYTES,
+    ) -> None:
+        if (
+            isinstance(max_bytes, bool)
+            or not isinstance(max_bytes, int)
+            or max_bytes <= 0
+        ):
+            raise ValueError("max_bytes must be a positive integer")
+        self._directory = Path(directory).expanduser()
+        if self._directory.exists() and not self._directory.is_dir():
+            raise ValueError(f"OCR cache path is not a directory: {self._directory}")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None
+
+    @property
+    def directory(self) -> Path:
+        return self._directory
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def load(self, key: str) -> dict[str, list[object]] | None:
+        """Return a cached response and mark it recently used, or ``None``."""
+
+        path = self._entry_path(key)
+        try:
+            text = path.read_text(encoding="utf-8")
+        except UnicodeDecodeError:
+            _discard(path)
+            return None
+        except OSError:
+            # Missing or transiently unreadable entries are plain misses.
+            return None
+        try:
+            payload = json.loads(text)
+        except ValueError:
+            _discard(path)
+            return None
+        response = payload.get("response") if isinstance(payload, dict) else None
+        if (
+            not isinstance(payload, dict)
+            or payload.get("cache_version") != OCR_RESPONSE_CACHE_VERSION
+            or not isinstance(response, dict)
+            or any(not isinstance(values, list) for values in response.values())
+        ):
+            _discard(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return response
+
+    def store(self, key: str, response: Mapping[str, Sequence[object]]) -> None:
+        """Persist one response; oversized entries and I/O failures are skipped."""
+
+        path = self._entry_path(key)
+        encoded = json.dumps(
+            {
+                "cache_version": OCR_RESPONSE_CACHE_VERSION,
+                "response": {name: list(values) for name, values in response.items()},
+            },
+            ensure_ascii=False,
+            sort_keys=True,
+            separators=(",", ":"),
+        ).encode("utf-8")
+        if len(encoded) > self._max_bytes:
+            return
+        try:
+            path.parent.mkdir(exist_ok=True)
+            descriptor, temporary_name = tempfile.mkstemp(
+                prefix=".entry-",
+                suffix=".tmp",
+                dir=path.parent,
+            )
+            temporary = Path(temporary_name)
+            try:
+                with os.fdopen(descriptor, "wb") as stream:
+                    stream.write(encoded)
+                previous_size = path.stat().st_size if path.exists() else 0
+                os.replace(temporary, path)
+            except BaseException:
+                temporary.unlink(missing_ok=True)
+                raise
+        except OSError:
+            return
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = self._scan_total()
+            else:
+                self._total_bytes += len(encoded) - previous_size
+            if self._total_bytes > self._max_bytes:
+                self._evict()
+
+    def _entry_path(self, key: str) -> Path:
+        if not isinstance(key, str) or not _KEY_PATTERN.fullmatch(key):
+            raise ValueError("OCR cache key must be 64 lower-case hex digits")
+        return self._directory / key[:2] / f"{key}.json"
+
+    def _entries(self) -> list[tuple[int, str, Path, int]]:
+        entries: list[tuple[int, str, Path, int]] = []
+        for path in self._directory.glob("??/*.json"):
+            try:
+                status = path.stat()
+            except OSError:
+                continue
+            entries.append((status.st_mtime_ns, path.name, path, status.st_size))
+        return entries
+
+    def _scan_total(self) -> int:
+        return sum(size for _mtime, _name, _path, size in self._entries())
+
+    def _evict(self) -> None:
+        # Other processes may share the directory, so eviction always works
+        # from a fresh scan and stops at a low-water mark to amortize it.
+        entries = sorted(self._entries())
+        total = sum(size for _mtime, _name, _path, size in entries)
+        target = int(self._max_bytes * _EVICTION_LOW_WATER)
+        for _mtime, _name, path, size in entries:
+            if total <= target:
+                break
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except OSError:
+                continue
+            total -= size
+        self._total_bytes = total
+
+
+def _discard(path: Path) -> None:
+    # A read-only or shared directory may refuse the cleanup; the entry then
+    # simply stays a miss.
+    try:
+        path.unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+__all__ = [
+    "DEFAULT_OCR_CACHE_MAX_BYTES",
+    "FilesystemOcrResponseCache",
+    "OCR_RESPONSE_CACHE_VERSION",
+]
+
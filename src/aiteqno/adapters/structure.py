@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from io import BytesIO
 from typing import Iterable
 
@@ -13,6 +13,21 @@ import cv2
 import numpy as np
 from PIL import Image, UnidentifiedImageError
 
+from aiteqno.adapters.structure_common import (
+    ALGORITHM_PARAMETERS,
+    ComponentInk,
+    RawLine,
+    accepted_lines,
+    adaptive_block_size,
+    binarize,
+    box_sums,
+    component_ink,
+    expand,
+    image_work_mask,
+    line_open_mask,
+    text_join_kernel,
+    text_mask,
+)
 from aiteqno.domain import (
     Confidence,
     DpiSource,
@@ -44,45 +59,9 @@ STRUCTURE_PROVIDER_VERSION = "1.0"
 
 _ALGORITHM_PARAMETERS = {
     "algorithm_version": STRUCTURE_PROVIDER_VERSION,
-    "adaptive_threshold_c": 11,
-    "line_kernel_fraction": 0.05,
-    "line_merge_gap_fraction": 0.01,
-    "max_line_thickness_fraction": 0.025,
-    "min_image_area_fraction": 0.0025,
-    "min_line_fraction": 0.06,
-    "text_join_fraction": 0.015,
+    **ALGORITHM_PARAMETERS,
 }
-
-
-@dataclass(frozen=True, slots=True)
-class _RawLine:
-    orientation: LineOrientation
-    bbox: PixelBoundingBox
-    occupancy: float
-
-    @property
-    def center(self) -> int:
-        if self.orientation is LineOrientation.HORIZONTAL:
-            return self.bbox.y + (self.bbox.height - 1) // 2
-        return self.bbox.x + (self.bbox.width - 1) // 2
-
-    @property
-    def interval_start(self) -> int:
-        if self.orientation is LineOrientation.HORIZONTAL:
-            return self.bbox.x
-        return self.bbox.y
-
-    @property
-    def interval_end(self) -> int:
-        if self.orientation is LineOrientation.HORIZONTAL:
-            return self.bbox.x + self.bbox.width - 1
-        return self.bbox.y + self.bbox.height - 1
-
-    @property
-    def thickness(self) -> int:
-        if self.orientation is LineOrientation.HORIZONTAL:
-            return self.bbox.height
-        return self.bbox.width
+_PYRAMID_ROI_MARGIN_PX = 64
 
 
 class PillowPngDecoder:
@@ -209,27 +188,55 @@ class PillowPngDecoder:
 
 
 class OpenCvStructureExtractor:
-    """Detect V1 visual candidates without OCR or domain element assembly."""
+    """Detect V1 visual candidates without OCR or domain element assembly.
+
+    ``pyramid_scale`` below ``1.0`` enables the pyramid mode: binarization and
+    morphology run on a page downscaled by that factor, and only the bands
+    around coarse lines and the windows around coarse text and image regions
+    are binarized and analyzed again at full resolution. Candidate geometry is
+    always in source pixels. The scale is part of the parameters digest and is
+    noted in every candidate's provenance; the default full-resolution mode is
+    unchanged.
+    """
 
     def __init__(
         self,
         *,
         max_image_pixels: int = DEFAULT_MAX_PNG_PIXELS,
+        pyramid_scale: float = 1.0,
     ) -> None:
         if isinstance(max_image_pixels, bool) or not isinstance(max_image_pixels, int):
             raise TypeError("max_image_pixels must be an integer")
         if max_image_pixels <= 0:
             raise ValueError("max_image_pixels must be positive")
+        if isinstance(pyramid_scale, bool) or not isinstance(pyramid_scale, int | float):
+            raise TypeError("pyramid_scale must be a number")
+        if not math.isfinite(pyramid_scale) or not 0.0 < pyramid_scale <= 1.0:
+            raise ValueError("pyramid_scale must be greater than 0 and at most 1")
         self._max_image_pixels = max_image_pixels
-        parameters = {**_ALGORITHM_PARAMETERS, "max_image_pixels": max_image_pixels}
+        self._pyramid_scale = float(pyramid_scale)
         encoded = json.dumps(
-            parameters,
+            self._digest_parameters(),
             ensure_ascii=True,
             sort_keys=True,
             separators=(",", ":"),
         ).encode("ascii")
         self._parameters_digest = hashlib.sha256(encoded).hexdigest()
 
+    @property
+    def pyramid_scale(self) -> float:
+        return self._pyramid_scale
+
+    def _digest_parameters(self) -> dict[str, object]:
+        parameters: dict[str, object] = {
+            **_ALGORITHM_PARAMETERS,
+            "max_image_pixels": self._max_image_pixels,
+        }
+        if self._pyramid_scale < 1.0:
+            parameters["pyramid_roi_margin_px"] = _PYRAMID_ROI_MARGIN_PX
+            parameters["pyramid_scale"] = self._pyramid_scale
+        return parameters
+
     def detect(self, image: ImageInput) -> StructureExtractionResult:
         """Return stable page, line, rectangle, text, and image candidates."""
 
@@ -249,14 +256,10 @@ class OpenCvStructureExtractor:
             source.pixel_width,
             3,
         )
-        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
-        binary = _binarize(gray)
-        raw_lines, line_mask = _detect_raw_lines(binary)
-        lines = self._line_candidates(raw_lines, source)
-        rectangles = self._rectangle_candidates(line_mask, lines)
-        content_mask = cv2.bitwise_and(binary, cv2.bitwise_not(_expand(line_mask, 3)))
-        image_regions = self._image_candidates(content_mask, source)
-        text_regions = self._text_candidates(content_mask, image_regions, source)
+        lines, rectangles, text_regions, image_regions = self._detect_candidates(
+            rgb,
+            source,
+        )
 
         page_bbox = PixelBoundingBox(
             x=0,
@@ -283,9 +286,145 @@ class OpenCvStructureExtractor:
             image_regions=tuple(image_regions),
         )
 
+    def _detect_candidates(
+        self,
+        rgb: np.ndarray,
+        source: PageSource,
+    ) -> tuple[
+        list[LineCandidate],
+        list[RectangleCandidate],
+        list[RegionCandidate],
+        list[RegionCandidate],
+    ]:
+        if self._pyramid_scale < 1.0:
+            return self._detect_pyramid(rgb, source)
+        gray = cv2.cvtColor(rgb, cv2.COLOR_RGB2GRAY)
+        binary = binarize(gray)
+        raw_lines, line_mask = _detect_raw_lines(binary)
+        lines = self._line_candidates(raw_lines, source)
+        rectangles = self._rectangle_candidates(line_mask, lines)
+        content_mask = cv2.bitwise_and(binary, cv2.bitwise_not(expand(line_mask, 3)))
+        image_regions = self._image_candidates(content_mask, source)
+        text_regions = self._text_candidates(content_mask, image_regions, source)
+        return lines, rectangles, text_regions, image_regions
+
+    def _detect_pyramid(
+        self,
+        rgb: np.ndarray,
+        source: PageSource,
+    ) -> tuple[
+        list[LineCandidate],
+        list[RectangleCandidate],
+        list[RegionCandidate],
+        list[RegionCandidate],
+    ]:
+        page_height, page_width = rgb.shape[:2]
+        coarse_width = max(1, round(page_width * self._pyramid_scale))
+        coarse_height = max(1, round(page_height * self._pyramid_scale))
+        coarse_gray = cv2.cvtColor(
+            cv2.resize(rgb, (coarse_width, coarse_height), interpolation=cv2.INTER_AREA),
+            cv2.COLOR_RGB2GRAY,
+        )
+        coarse_binary = binarize(coarse_gray)
+        coarse_lines, coarse_line_mask = _detect_raw_lines(coarse_binary)
+        coarse_content = cv2.bitwise_and(
+            coarse_binary,
+            cv2.bitwise_not(expand(coarse_line_mask, 3)),
+        )
+        coarse_source = replace(
+            source,
+            pixel_width=coarse_width,
+            pixel_height=coarse_height,
+        )
+        coarse_regions = [
+            *self._image_candidates(coarse_content, coarse_source),
+            *self._text_candidates(coarse_content, [], coarse_source),
+        ]
+        windows = _PyramidWindows(
+            scale_x=coarse_width / page_width,
+            scale_y=coarse_height / page_height,
+            page_width=page_width,
+            page_height=page_height,
+        )
+        # Full-resolution thresholds keep the whole-page Otsu level (estimated on
+        # the coarse page) and the whole-page adaptive block size, so a window
+        # binarizes the same way as that part of the full page would.
+        otsu_threshold = _otsu_threshold(coarse_gray)
+        block_size = adaptive_block_size(min(page_width, page_height))
+
+        def binary_window(window: PixelBoundingBox) -> np.ndarray:
+            crop = rgb[
+                window.y : window.y + window.height,
+                window.x : window.x + window.width,
+            ]
+            return binarize(
+                cv2.cvtColor(crop, cv2.COLOR_RGB2GRAY),
+                otsu_threshold=otsu_threshold,
+                block_size=block_size,
+            )
+
+        raw_lines: list[RawLine] = []
+        line_mask = np.zeros((page_height, page_width), dtype=np.uint8)
+        for coarse_line in coarse_lines:
+            window = windows.full_window(coarse_line.bbox)
+            refined, refined_mask = _detect_raw_lines(
+                binary_window(window),
+                page_shape=(page_height, page_width),
+                orientations=(coarse_line.orientation,),
+                origin=(window.x, window.y),
+            )
+            raw_lines.extend(refined)
+            mask_window = line_mask[
+                window.y : window.y + window.height,
+                window.x : window.x + window.width,
+            ]
+            np.maximum(mask_window, refined_mask, out=mask_window)
+        lines = self._line_candidates(raw_lines, source)
+        rectangles = self._rectangle_candidates(line_mask, lines)
+
+        content_windows: list[tuple[PixelBoundingBox, np.ndarray]] = []
+        image_regions: list[RegionCandidate] = []
+        for window in windows.merged_full_windows(
+            [region.bbox for region in coarse_regions],
+            coarse_width,
+            coarse_height,
+        ):
+            local_lines = line_mask[
+                window.y : window.y + window.height,
+                window.x : window.x + window.width,
+            ]
+            content_mask = cv2.bitwise_and(
+                binary_window(window),
+                cv2.bitwise_not(expand(local_lines, 3)),
+            )
+            content_windows.append((window, content_mask))
+            image_regions.extend(
+                region
+                for region in self._image_candidates(
+                    content_mask,
+                    source,
+                    origin=(window.x, window.y),
+                )
+                if windows.contains(window, region.bbox)
+            )
+        image_regions = _normalize_regions(image_regions)
+        text_regions: list[RegionCandidate] = []
+        for window, content_mask in content_windows:
+            text_regions.extend(
+                region
+                for region in self._text_candidates(
+                    content_mask,
+                    image_regions,
+                    source,
+                    origin=(window.x, window.y),
+                )
+                if windows.contains(window, region.bbox)
+            )
+        return lines, rectangles, _normalize_regions(text_regions), image_regions
+
     def _line_candidates(
         self,
-        raw_lines: list[_RawLine],
+        raw_lines: list[RawLine],
         source: PageSource,
     ) -> list[LineCandidate]:
         merged = _merge_raw_lines(raw_lines, source)
@@ -336,10 +475,25 @@ class OpenCvStructureExtractor:
         if not lines or not np.any(line_mask):
             return []
         contours, _ = cv2.findContours(
-            _expand(line_mask, 3),
+            expand(line_mask, 3),
             cv2.RETR_LIST,
             cv2.CHAIN_APPROX_SIMPLE,
         )
+        return self._rectangles_from_outlines(
+            (
+                (*cv2.boundingRect(contour), abs(float(cv2.contourArea(contour))))
+                for contour in contours
+            ),
+            lines,
+        )
+
+    def _rectangles_from_outlines(
+        self,
+        outlines: Iterable[tuple[int, int, int, int, float]],
+        lines: list[LineCandidate],
+    ) -> list[RectangleCandidate]:
+        """Build rectangles from ``(x, y, width, height, area)`` line-mask outlines."""
+
         horizontals = [
             line for line in lines if line.orientation is LineOrientation.HORIZONTAL
         ]
@@ -352,11 +506,9 @@ class OpenCvStructureExtractor:
             max((line.bbox.width for line in verticals), default=1) + 2,
         )
         found: dict[tuple[int, int, int, int], RectangleCandidate] = {}
-        for contour in contours:
-            x, y, width, height = cv2.boundingRect(contour)
+        for x, y, width, height, contour_area in outlines:
             if width < 12 or height < 12:
                 continue
-            contour_area = abs(float(cv2.contourArea(contour)))
             if contour_area < width * height * 0.50:
                 continue
             left = _nearest_axis(x, verticals, tolerance)
@@ -410,51 +562,58 @@ class OpenCvStructureExtractor:
         self,
         content_mask: np.ndarray,
         source: PageSource,
+        *,
+        origin: tuple[int, int] = (0, 0),
     ) -> list[RegionCandidate]:
-        height, width = content_mask.shape
-        work = cv2.morphologyEx(
-            content_mask,
-            cv2.MORPH_CLOSE,
-            cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9)),
-            iterations=1,
+        work = image_work_mask(content_mask)
+        count, labels = cv2.connectedComponents(work, connectivity=8)
+        foreground = content_mask > 0
+        ink = component_ink(labels, count, foreground)
+        # Density counts every foreground pixel inside the tight box, including
+        # other components' ink, so it is read from a summed-area table.
+        box_ink = box_sums(
+            cv2.integral(foreground.view(np.uint8)),
+            ink.x,
+            ink.y,
+            ink.width,
+            ink.height,
         )
-        work = _expand(work, 3)
-        count, labels, stats, _ = cv2.connectedComponentsWithStats(work, 8)
+        return self._image_candidates_from_ink(ink, box_ink, source, origin=origin)
+
+    def _image_candidates_from_ink(
+        self,
+        ink: ComponentInk,
+        box_ink: np.ndarray,
+        source: PageSource,
+        *,
+        origin: tuple[int, int] = (0, 0),
+    ) -> list[RegionCandidate]:
+        width, height = source.pixel_width, source.pixel_height
         min_width = max(16, int(round(width * 0.04)))
         min_height = max(12, int(round(height * 0.04)))
         min_area = max(64, int(round(width * height * 0.0025)))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            densities = box_ink / ink.area
+        survivors = (
+            (ink.count > 0)
+            & (ink.width >= min_width)
+            & (ink.height >= min_height)
+            & (ink.area >= min_area)
+            & (densities >= 0.18)
+            & ~(
+                (ink.height <= max(24, int(round(height * 0.08))))
+                & (densities < 0.55)
+            )
+        )
         candidates: list[RegionCandidate] = []
-        for label in range(1, count):
-            x = int(stats[label, cv2.CC_STAT_LEFT])
-            y = int(stats[label, cv2.CC_STAT_TOP])
-            box_width = int(stats[label, cv2.CC_STAT_WIDTH])
-            box_height = int(stats[label, cv2.CC_STAT_HEIGHT])
-            if box_width < min_width or box_height < min_height:
-                continue
-            label_window = labels[y : y + box_height, x : x + box_width] == label
-            foreground_window = content_mask[y : y + box_height, x : x + box_width] > 0
-            points = np.argwhere(label_window & foreground_window)
-            if points.size == 0:
-                continue
-            raw_y_min, raw_x_min = points.min(axis=0)
-            raw_y_max, raw_x_max = points.max(axis=0)
-            raw_x = x + int(raw_x_min)
-            raw_y = y + int(raw_y_min)
-            raw_width = int(raw_x_max - raw_x_min + 1)
-            raw_height = int(raw_y_max - raw_y_min + 1)
+        for label in np.flatnonzero(survivors):
+            raw_x = origin[0] + int(ink.x[label])
+            raw_y = origin[1] + int(ink.y[label])
+            raw_width = int(ink.width[label])
+            raw_height = int(ink.height[label])
             raw_area = raw_width * raw_height
-            if raw_width < min_width or raw_height < min_height or raw_area < min_area:
-                continue
-            raw_crop = content_mask[
-                raw_y : raw_y + raw_height,
-                raw_x : raw_x + raw_width,
-            ]
-            density = float(cv2.countNonZero(raw_crop)) / raw_area
-            if density < 0.18:
-                continue
+            density = float(box_ink[label]) / raw_area
             page_fraction = raw_area / (width * height)
-            if raw_height <= max(24, int(round(height * 0.08))) and density < 0.55:
-                continue
             bbox = PixelBoundingBox(
                 x=raw_x,
                 y=raw_y,
@@ -483,62 +642,47 @@ class OpenCvStructureExtractor:
         content_mask: np.ndarray,
         image_regions: list[RegionCandidate],
         source: PageSource,
+        *,
+        origin: tuple[int, int] = (0, 0),
     ) -> list[RegionCandidate]:
-        height, width = content_mask.shape
-        text_mask = content_mask.copy()
-        for image in image_regions:
-            bbox = image.bbox
-            x1 = max(0, bbox.x - 2)
-            y1 = max(0, bbox.y - 2)
-            x2 = min(width, bbox.x + bbox.width + 2)
-            y2 = min(height, bbox.y + bbox.height + 2)
-            text_mask[y1:y2, x1:x2] = 0
-
-        join_width = max(3, min(15, int(round(width * 0.015))))
-        join_height = max(1, min(3, int(round(height * 0.006))))
-        joined = cv2.dilate(
-            text_mask,
-            cv2.getStructuringElement(
-                cv2.MORPH_RECT,
-                (join_width, join_height),
-            ),
-            iterations=1,
-        )
-        count, labels, stats, _ = cv2.connectedComponentsWithStats(joined, 8)
+        text_pixels = text_mask(content_mask, image_regions, origin)
+        joined = cv2.dilate(text_pixels, text_join_kernel(source), iterations=1)
+        count, labels = cv2.connectedComponents(joined, connectivity=8)
+        ink = component_ink(labels, count, text_pixels > 0)
+        return self._text_candidates_from_ink(ink, source, origin=origin)
+
+    def _text_candidates_from_ink(
+        self,
+        ink: ComponentInk,
+        source: PageSource,
+        *,
+        origin: tuple[int, int] = (0, 0),
+    ) -> list[RegionCandidate]:
+        width, height = source.pixel_width, source.pixel_height
         max_height = max(64, int(round(height * 0.20)))
         max_area = width * height * 0.20
+        with np.errstate(divide="ignore", invalid="ignore"):
+            densities = ink.count / ink.area
+        survivors = (
+            (ink.count >= 6)
+            & (ink.width >= 4)
+            & (ink.height >= 4)
+            & (ink.height <= max_height)
+            & (ink.area <= max_area)
+            & ~(
+                (ink.height <= 2)
+                & (ink.width >= max(12, int(round(width * 0.06))))
+            )
+            & (densities >= 0.015)
+        )
         candidates: list[RegionCandidate] = []
-        for label in range(1, count):
-            x = int(stats[label, cv2.CC_STAT_LEFT])
-            y = int(stats[label, cv2.CC_STAT_TOP])
-            box_width = int(stats[label, cv2.CC_STAT_WIDTH])
-            box_height = int(stats[label, cv2.CC_STAT_HEIGHT])
-            if box_width < 2 or box_height < 2:
-                continue
-            label_window = labels[y : y + box_height, x : x + box_width] == label
-            raw_window = text_mask[y : y + box_height, x : x + box_width] > 0
-            points = np.argwhere(label_window & raw_window)
-            if points.size == 0:
-                continue
-            raw_count = int(points.shape[0])
-            if raw_count < 6:
-                continue
-            raw_y_min, raw_x_min = points.min(axis=0)
-            raw_y_max, raw_x_max = points.max(axis=0)
-            raw_x = x + int(raw_x_min)
-            raw_y = y + int(raw_y_min)
-            raw_width = int(raw_x_max - raw_x_min + 1)
-            raw_height = int(raw_y_max - raw_y_min + 1)
-            raw_area = raw_width * raw_height
-            if raw_width < 4 or raw_height < 4:
-                continue
-            if raw_height > max_height or raw_area > max_area:
-                continue
-            if raw_height <= 2 and raw_width >= max(12, int(round(width * 0.06))):
-                continue
-            density = raw_count / raw_area
-            if density < 0.015:
-                continue
+        for label in np.flatnonzero(survivors):
+            raw_count = int(ink.count[label])
+            raw_x = origin[0] + int(ink.x[label])
+            raw_y = origin[1] + int(ink.y[label])
+            raw_width = int(ink.width[label])
+            raw_height = int(ink.height[label])
+            density = raw_count / (raw_width * raw_height)
             bbox = PixelBoundingBox(
                 x=raw_x,
                 y=raw_y,
@@ -559,6 +703,8 @@ class OpenCvStructureExtractor:
         return _normalize_regions(candidates)
 
     def _provenance(self, bbox: PixelBoundingBox, notes: str) -> Provenance:
+        if self._pyramid_scale < 1.0:
+            notes += f"; pyramid_scale={self._pyramid_scale:g}"
         return Provenance(
             stage=ProvenanceStage.STRUCTURE,
             provider=STRUCTURE_PROVIDER,
@@ -569,6 +715,75 @@ class OpenCvStructureExtractor:
         )
 
 
+@dataclass(frozen=True, slots=True)
+class _PyramidWindows:
+    """Map coarse pyramid boxes to padded full-resolution analysis windows."""
+
+    scale_x: float
+    scale_y: float
+    page_width: int
+    page_height: int
+
+    def full_window(self, coarse: PixelBoundingBox) -> PixelBoundingBox:
+        left = max(0, math.floor(coarse.x / self.scale_x) - _PYRAMID_ROI_MARGIN_PX)
+        top = max(0, math.floor(coarse.y / self.scale_y) - _PYRAMID_ROI_MARGIN_PX)
+        right = min(
+            self.page_width,
+            math.ceil((coarse.x + coarse.width) / self.scale_x) + _PYRAMID_ROI_MARGIN_PX,
+        )
+        bottom = min(
+            self.page_height,
+            math.ceil((coarse.y + coarse.height) / self.scale_y)
+            + _PYRAMID_ROI_MARGIN_PX,
+        )
+        return PixelBoundingBox(x=left, y=top, width=right - left, height=bottom - top)
+
+    def merged_full_windows(
+        self,
+        coarse_boxes: Iterable[PixelBoundingBox],
+        coarse_width: int,
+        coarse_height: int,
+    ) -> list[PixelBoundingBox]:
+        # Overlapping padded boxes are merged by painting them on a coarse
+        # canvas, so nearby regions are analyzed together and not clipped.
+        margin_x = math.ceil(_PYRAMID_ROI_MARGIN_PX * self.scale_x)
+        margin_y = math.ceil(_PYRAMID_ROI_MARGIN_PX * self.scale_y)
+        canvas = np.zeros((coarse_height, coarse_width), dtype=np.uint8)
+        for box in coarse_boxes:
+            canvas[
+                max(0, box.y - margin_y) : box.y + box.height + margin_y,
+                max(0, box.x - margin_x) : box.x + box.width + margin_x,
+            ] = 255
+        count, _labels, stats, _ = cv2.connectedComponentsWithStats(canvas, 8)
+        return [
+            self.full_window(
+                PixelBoundingBox(
+                    x=int(stats[label, cv2.CC_STAT_LEFT]),
+                    y=int(stats[label, cv2.CC_STAT_TOP]),
+                    width=int(stats[label, cv2.CC_STAT_WIDTH]),
+                    height=int(stats[label, cv2.CC_STAT_HEIGHT]),
+                )
+            )
+            for label in range(1, count)
+        ]
+
+    def contains(self, window: PixelBoundingBox, bbox: PixelBoundingBox) -> bool:
+        """Reject candidates clipped by a window edge that is not a page edge."""
+
+        return (
+            (window.x == 0 or bbox.x > window.x)
+            and (window.y == 0 or bbox.y > window.y)
+            and (
+                window.x + window.width == self.page_width
+                or bbox.x + bbox.width < window.x + window.width
+            )
+            and (
+                window.y + window.height == self.page_height
+                or bbox.y + bbox.height < window.y + window.height
+            )
+        )
+
+
 def _white_composited_rgb(image: Image.Image) -> Image.Image:
     if image.mode in {"RGBA", "LA"} or "transparency" in image.info:
         rgba = image.convert("RGBA")
@@ -577,88 +792,54 @@ def _white_composited_rgb(image: Image.Image) -> Image.Image:
     return image.convert("RGB")
 
 
-def _binarize(gray: np.ndarray) -> np.ndarray:
-    blurred = cv2.GaussianBlur(gray, (3, 3), 0)
-    _, otsu = cv2.threshold(
-        blurred,
+def _otsu_threshold(gray: np.ndarray) -> float:
+    threshold, _ = cv2.threshold(
+        cv2.GaussianBlur(gray, (3, 3), 0),
         0,
         255,
         cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU,
     )
-    shortest = min(gray.shape)
-    block_size = max(15, min(51, (shortest // 8) | 1))
-    adaptive = cv2.adaptiveThreshold(
-        blurred,
-        255,
-        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
-        cv2.THRESH_BINARY_INV,
-        block_size,
-        int(_ALGORITHM_PARAMETERS["adaptive_threshold_c"]),
-    )
-    return cv2.bitwise_or(otsu, adaptive)
-
-
-def _detect_raw_lines(binary: np.ndarray) -> tuple[list[_RawLine], np.ndarray]:
-    height, width = binary.shape
-    detected: list[_RawLine] = []
+    return float(threshold)
+
+
+def _detect_raw_lines(
+    binary: np.ndarray,
+    *,
+    page_shape: tuple[int, int] | None = None,
+    orientations: tuple[LineOrientation, ...] = (
+        LineOrientation.HORIZONTAL,
+        LineOrientation.VERTICAL,
+    ),
+    origin: tuple[int, int] = (0, 0),
+) -> tuple[list[RawLine], np.ndarray]:
+    # Kernel and length limits always derive from the page size, so a window
+    # of the page (``origin`` plus the window's shape) finds the same lines.
+    height, width = page_shape or binary.shape
+    detected: list[RawLine] = []
     accepted_mask = np.zeros_like(binary)
-    for orientation, axis_length in (
-        (LineOrientation.HORIZONTAL, width),
-        (LineOrientation.VERTICAL, height),
-    ):
-        kernel_length = max(
-            12,
-            int(round(axis_length * float(_ALGORITHM_PARAMETERS["line_kernel_fraction"]))),
-        )
-        if orientation is LineOrientation.HORIZONTAL:
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_length, 1))
-            close_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 1))
-        else:
-            kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, kernel_length))
-            close_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 3))
-        mask = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, close_kernel, iterations=1)
+    for orientation in orientations:
+        mask = line_open_mask(binary, orientation, height=height, width=width)
         count, labels, stats, _ = cv2.connectedComponentsWithStats(mask, 8)
-        minimum_length = max(
-            12,
-            int(round(axis_length * float(_ALGORITHM_PARAMETERS["min_line_fraction"]))),
-        )
-        maximum_thickness = max(
-            5,
-            int(round(min(width, height) * float(_ALGORITHM_PARAMETERS["max_line_thickness_fraction"]))),
-        )
-        for label in range(1, count):
-            x = int(stats[label, cv2.CC_STAT_LEFT])
-            y = int(stats[label, cv2.CC_STAT_TOP])
-            box_width = int(stats[label, cv2.CC_STAT_WIDTH])
-            box_height = int(stats[label, cv2.CC_STAT_HEIGHT])
-            area = int(stats[label, cv2.CC_STAT_AREA])
-            if orientation is LineOrientation.HORIZONTAL:
-                length, thickness = box_width, box_height
-            else:
-                length, thickness = box_height, box_width
-            if length < minimum_length or thickness > maximum_thickness:
-                continue
-            if length < thickness * 4:
-                continue
-            bbox = PixelBoundingBox(x=x, y=y, width=box_width, height=box_height)
-            occupancy = min(1.0, area / max(1, box_width * box_height))
-            detected.append(
-                _RawLine(
-                    orientation=orientation,
-                    bbox=bbox,
-                    occupancy=occupancy,
-                )
-            )
-            accepted_mask[labels == label] = 255
+        accepted = np.zeros(count, dtype=bool)
+        for label, line in accepted_lines(
+            orientation,
+            stats,
+            range(1, count),
+            height=height,
+            width=width,
+            origin=origin,
+        ):
+            detected.append(line)
+            accepted[label] = True
+        accepted_mask[accepted[labels]] = 255
     return detected, accepted_mask
 
 
 def _merge_raw_lines(
-    lines: Iterable[_RawLine],
+    lines: Iterable[RawLine],
     source: PageSource,
-) -> list[_RawLine]:
-    merged: list[_RawLine] = []
+) -> list[RawLine]:
+    merged: list[RawLine] = []
     for orientation in (LineOrientation.HORIZONTAL, LineOrientation.VERTICAL):
         axis_length = (
             source.pixel_width
@@ -701,7 +882,7 @@ def _merge_raw_lines(
                 current.bbox.y + current.bbox.height,
                 line.bbox.y + line.bbox.height,
             )
-            merged[match_index] = _RawLine(
+            merged[match_index] = RawLine(
                 orientation=orientation,
                 bbox=PixelBoundingBox(
                     x=left,
@@ -784,14 +965,6 @@ def _covering_line(
     return max(matches, key=rank)
 
 
-def _expand(mask: np.ndarray, size: int) -> np.ndarray:
-    return cv2.dilate(
-        mask,
-        cv2.getStructuringElement(cv2.MORPH_RECT, (size, size)),
-        iterations=1,
-    )
-
-
 def _normalize_regions(candidates: list[RegionCandidate]) -> list[RegionCandidate]:
     ordered = sorted(
         candidates,
@@ -0,0 +1,267 @@
+"""OpenCV mask and line primitives shared by the whole-page and banded detectors.
+
+This module is internal to the structure adapters and is not re-exported.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Iterable
+
+import cv2
+import numpy as np
+
+from aiteqno.domain import PageSource, PixelBoundingBox
+from aiteqno.ports.structure import LineOrientation, RegionCandidate
+
+
+# Recorded in the structure parameters digest with the provider version.
+ALGORITHM_PARAMETERS = {
+    "adaptive_threshold_c": 11,
+    "line_kernel_fraction": 0.05,
+    "line_merge_gap_fraction": 0.01,
+    "max_line_thickness_fraction": 0.025,
+    "min_image_area_fraction": 0.0025,
+    "min_line_fraction": 0.06,
+    "text_join_fraction": 0.015,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RawLine:
+    orientation: LineOrientation
+    bbox: PixelBoundingBox
+    occupancy: float
+
+    @property
+    def center(self) -> int:
+        if self.orientation is LineOrientation.HORIZONTAL:
+            return self.bbox.y + (self.bbox.height - 1) // 2
+        return self.bbox.x + (self.bbox.width - 1) // 2
+
+    @property
+    def interval_start(self) -> int:
+        if self.orientation is LineOrientation.HORIZONTAL:
+            return self.bbox.x
+        return self.bbox.y
+
+    @property
+    def interval_end(self) -> int:
+        if self.orientation is LineOrientation.HORIZONTAL:
+            return self.bbox.x + self.bbox.width - 1
+        return self.bbox.y + self.bbox.height - 1
+
+    @property
+    def thickness(self) -> int:
+        if self.orientation is LineOrientation.HORIZONTAL:
+            return self.bbox.height
+        return self.bbox.width
+
+
+@dataclass(frozen=True, slots=True)
+class ComponentInk:
+    """Per-label foreground counts and tight foreground bounds, indexed by label."""
+
+    count: np.ndarray
+    x: np.ndarray
+    y: np.ndarray
+    width: np.ndarray
+    height: np.ndarray
+
+    @property
+    def area(self) -> np.ndarray:
+        return self.width * self.height
+
+
+def component_ink(
+    labels: np.ndarray,
+    count: int,
+    foreground: np.ndarray,
+) -> ComponentInk:
+    # One pass over the foreground pixels replaces a window scan per label.
+    # ``np.nonzero`` yields row-major order, and a stable sort by label keeps
+    # each label's rows ascending, so row bounds are the first and last entry.
+    rows, columns = np.nonzero(foreground)
+    owners = labels[rows, columns]
+    totals = np.bincount(owners, minlength=count).astype(np.int64)
+    x = np.zeros(count, dtype=np.int64)
+    y = np.zeros(count, dtype=np.int64)
+    width = np.zeros(count, dtype=np.int64)
+    height = np.zeros(count, dtype=np.int64)
+    present = np.flatnonzero(totals)
+    if present.size:
+        order = np.argsort(owners, kind="stable")
+        rows = rows[order]
+        columns = columns[order]
+        starts = (np.cumsum(totals) - totals)[present]
+        ends = starts + totals[present] - 1
+        x_min = np.minimum.reduceat(columns, starts)
+        x_max = np.maximum.reduceat(columns, starts)
+        x[present] = x_min
+        y[present] = rows[starts]
+        width[present] = x_max - x_min + 1
+        height[present] = rows[ends] - rows[starts] + 1
+    totals[0] = 0
+    return ComponentInk(count=totals, x=x, y=y, width=width, height=height)
+
+
+def box_sums(
+    integral: np.ndarray,
+    x: np.ndarray,
+    y: np.ndarray,
+    width: np.ndarray,
+    height: np.ndarray,
+) -> np.ndarray:
+    right = x + width
+    bottom = y + height
+    return (
+        integral[bottom, right].astype(np.int64)
+        - integral[y, right]
+        - integral[bottom, x]
+        + integral[y, x]
+    )
+
+
+def binarize(
+    gray: np.ndarray,
+    *,
+    otsu_threshold: float | None = None,
+    block_size: int | None = None,
+) -> np.ndarray:
+    blurred = cv2.GaussianBlur(gray, (3, 3), 0)
+    if otsu_threshold is None:
+        _, otsu = cv2.threshold(
+            blurred,
+            0,
+            255,
+            cv2.THRESH_BINARY_INV | cv2.THRESH_OTSU,
+        )
+    else:
+        _, otsu = cv2.threshold(blurred, otsu_threshold, 255, cv2.THRESH_BINARY_INV)
+    if block_size is None:
+        block_size = adaptive_block_size(min(gray.shape))
+    adaptive = cv2.adaptiveThreshold(
+        blurred,
+        255,
+        cv2.ADAPTIVE_THRESH_GAUSSIAN_C,
+        cv2.THRESH_BINARY_INV,
+        block_size,
+        int(ALGORITHM_PARAMETERS["adaptive_threshold_c"]),
+    )
+    return cv2.bitwise_or(otsu, adaptive)
+
+
+def image_work_mask(content_mask: np.ndarray) -> np.ndarray:
+    work = cv2.morphologyEx(
+        content_mask,
+        cv2.MORPH_CLOSE,
+        cv2.getStructuringElement(cv2.MORPH_RECT, (9, 9)),
+        iterations=1,
+    )
+    return expand(work, 3)
+
+
+def text_mask(
+    content_mask: np.ndarray,
+    image_regions: Iterable[RegionCandidate],
+    origin: tuple[int, int] = (0, 0),
+) -> np.ndarray:
+    mask_height, mask_width = content_mask.shape
+    masked = content_mask.copy()
+    for image in image_regions:
+        bbox = image.bbox
+        x1 = max(0, bbox.x - 2 - origin[0])
+        y1 = max(0, bbox.y - 2 - origin[1])
+        x2 = min(mask_width, bbox.x + bbox.width + 2 - origin[0])
+        y2 = min(mask_height, bbox.y + bbox.height + 2 - origin[1])
+        if x1 < x2 and y1 < y2:
+            masked[y1:y2, x1:x2] = 0
+    return masked
+
+
+def text_join_kernel(source: PageSource) -> np.ndarray:
+    join_width = max(3, min(15, int(round(source.pixel_width * 0.015))))
+    join_height = max(1, min(3, int(round(source.pixel_height * 0.006))))
+    return cv2.getStructuringElement(cv2.MORPH_RECT, (join_width, join_height))
+
+
+def adaptive_block_size(shortest: int) -> int:
+    return max(15, min(51, (shortest // 8) | 1))
+
+
+def line_kernel_length(axis_length: int) -> int:
+    return max(
+        12,
+        int(round(axis_length * float(ALGORITHM_PARAMETERS["line_kernel_fraction"]))),
+    )
+
+
+def line_open_mask(
+    binary: np.ndarray,
+    orientation: LineOrientation,
+    *,
+    height: int,
+    width: int,
+) -> np.ndarray:
+    if orientation is LineOrientation.HORIZONTAL:
+        kernel_length = line_kernel_length(width)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (kernel_length, 1))
+        close_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (3, 1))
+    else:
+        kernel_length = line_kernel_length(height)
+        kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, kernel_length))
+        close_kernel = cv2.getStructuringElement(cv2.MORPH_RECT, (1, 3))
+    mask = cv2.morphologyEx(binary, cv2.MORPH_OPEN, kernel, iterations=1)
+    return cv2.morphologyEx(mask, cv2.MORPH_CLOSE, close_kernel, iterations=1)
+
+
+def accepted_lines(
+    orientation: LineOrientation,
+    stats: np.ndarray,
+    labels: Iterable[int],
+    *,
+    height: int,
+    width: int,
+    origin: tuple[int, int] = (0, 0),
+) -> Iterable[tuple[int, RawLine]]:
+    """Yield ``(label, line)`` for component stats rows that look like lines."""
+
+    axis_length = width if orientation is LineOrientation.HORIZONTAL else height
+    minimum_length = max(
+        12,
+        int(round(axis_length * float(ALGORITHM_PARAMETERS["min_line_fraction"]))),
+    )
+    maximum_thickness = max(
+        5,
+        int(round(min(width, height) * float(ALGORITHM_PARAMETERS["max_line_thickness_fraction"]))),
+    )
+    for label in labels:
+        x = int(stats[label, cv2.CC_STAT_LEFT])
+        y = int(stats[label, cv2.CC_STAT_TOP])
+        box_width = int(stats[label, cv2.CC_STAT_WIDTH])
+        box_height = int(stats[label, cv2.CC_STAT_HEIGHT])
+        area = int(stats[label, cv2.CC_STAT_AREA])
+        if orientation is LineOrientation.HORIZONTAL:
+            length, thickness = box_width, box_height
+        else:
+            length, thickness = box_height, box_width
+        if length < minimum_length or thickness > maximum_thickness:
+            continue
+        if length < thickness * 4:
+            continue
+        bbox = PixelBoundingBox(
+            x=origin[0] + x,
+            y=origin[1] + y,
+            width=box_width,
+            height=box_height,
+        )
+        occupancy = min(1.0, area / max(1, box_width * box_height))
+        yield label, RawLine(orientation=orientation, bbox=bbox, occupancy=occupancy)
+
+
+def expand(mask: np.ndarray, size: int) -> np.ndarray:
+    return cv2.dilate(
+        mask,
+        cv2.getStructuringElement(cv2.MORPH_RECT, (size, size)),
+        iterations=1,
+    )
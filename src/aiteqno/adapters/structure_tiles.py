@@ -0,0 +1,599 @@
+"""Bounded-memory OpenCV structure detection over overlapping horizontal bands."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from typing import Iterator
+
+import cv2
+import numpy as np
+
+from aiteqno.adapters.structure import DEFAULT_MAX_PNG_PIXELS, OpenCvStructureExtractor
+from aiteqno.adapters.structure_common import (
+    ComponentInk,
+    RawLine,
+    accepted_lines,
+    adaptive_block_size,
+    binarize,
+    box_sums,
+    component_ink,
+    expand,
+    image_work_mask,
+    line_kernel_length,
+    line_open_mask,
+    text_join_kernel,
+    text_mask,
+)
+from aiteqno.domain import PageSource
+from aiteqno.ports.structure import (
+    LineCandidate,
+    LineOrientation,
+    RectangleCandidate,
+    RegionCandidate,
+)
+
+
+STRUCTURE_TILE_VERSION = "opencv-structure-bands-v1"
+DEFAULT_STRUCTURE_TILE_ROWS = 512
+# Rows of context around a band for the 3x3 line-mask expansion, the 9x9
+# image closing, and the second 3x3 expansion applied before image labeling.
+_CONTENT_HALO_ROWS = 12
+_TEXT_HALO_ROWS = 2
+_FLT_EPSILON = float(np.finfo(np.float32).eps)
+
+
+class TiledOpenCvStructureExtractor(OpenCvStructureExtractor):
+    """Detect structure in bands of ``tile_rows`` rows with bounded memory.
+
+    The full-page extractor holds about a dozen page-sized 8-bit and 32-bit
+    working images at once. This extractor keeps only band-sized working
+    images, each computed with enough overlapping context rows that its band
+    is pixel-identical to the full-page image. Between stages the page-level
+    binary, line, and content masks are kept packed at one bit per pixel.
+    Connected components are labeled per band and joined across band seams
+    with union-find, so lines, text regions, and image regions match the
+    full-page extractor. The Otsu level comes from a page histogram
+    accumulated band by band.
+
+    Rectangles come from the line-mask outlines and enclosed holes found by
+    the same stitched labeling instead of ``cv2.findContours``. Outline areas
+    are estimated from pixel counts. The estimate is exact for axis-aligned
+    frames, so for other outlines rectangularity scores can differ slightly.
+    The band height is part of the parameters digest.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_image_pixels: int = DEFAULT_MAX_PNG_PIXELS,
+        tile_rows: int = DEFAULT_STRUCTURE_TILE_ROWS,
+    ) -> None:
+        if isinstance(tile_rows, bool) or not isinstance(tile_rows, int):
+            raise TypeError("tile_rows must be an integer")
+        if tile_rows <= 0:
+            raise ValueError("tile_rows must be positive")
+        self._tile_rows = tile_rows
+        super().__init__(max_image_pixels=max_image_pixels)
+
+    @property
+    def tile_rows(self) -> int:
+        return self._tile_rows
+
+    def _digest_parameters(self) -> dict[str, object]:
+        return {
+            **super()._digest_parameters(),
+            "tile_rows": self._tile_rows,
+            "tile_version": STRUCTURE_TILE_VERSION,
+        }
+
+    def _detect_candidates(
+        self,
+        rgb: np.ndarray,
+        source: PageSource,
+    ) -> tuple[
+        list[LineCandidate],
+        list[RectangleCandidate],
+        list[RegionCandidate],
+        list[RegionCandidate],
+    ]:
+        height, width = rgb.shape[:2]
+        bands = [
+            (top, min(height, top + self._tile_rows))
+            for top in range(0, height, self._tile_rows)
+        ]
+        binary = self._binary_mask(rgb, bands)
+
+        raw_lines: list[RawLine] = []
+        line_masks: list[tuple[_PackedMask, _StitchedComponents, np.ndarray]] = []
+        for orientation in (LineOrientation.HORIZONTAL, LineOrientation.VERTICAL):
+            axis_length = width if orientation is LineOrientation.HORIZONTAL else height
+            halo = line_kernel_length(axis_length) + 3
+            opened = _PackedMask(height, width)
+            components = _BandComponents(connectivity=8)
+            for top, bottom in bands:
+                window, window_top = binary.read(top, bottom, halo=halo)
+                core = _core(
+                    line_open_mask(window, orientation, height=height, width=width),
+                    window_top,
+                    top,
+                    bottom,
+                )
+                opened.write(top, core)
+                components.add(core, top)
+            stitched = components.finish()
+            accepted = np.zeros(stitched.count, dtype=bool)
+            for label, line in accepted_lines(
+                orientation,
+                stitched.stats,
+                range(1, stitched.count),
+                height=height,
+                width=width,
+            ):
+                raw_lines.append(line)
+                accepted[label] = True
+            line_masks.append((opened, stitched, accepted))
+        lines = self._line_candidates(raw_lines, source)
+
+        line_mask = _PackedMask(height, width)
+        for band_index, (top, bottom) in enumerate(bands):
+            core = np.zeros((bottom - top, width), dtype=np.uint8)
+            for opened, stitched, accepted in line_masks:
+                window, _window_top = opened.read(top, bottom)
+                _count, labels, _stats, _ = cv2.connectedComponentsWithStats(
+                    window,
+                    connectivity=8,
+                )
+                core[accepted[stitched.band_labels(band_index)[labels]]] = 255
+            line_mask.write(top, core)
+
+        content = _PackedMask(height, width)
+        image_components = _BandComponents(connectivity=8)
+        outline_components = _BandComponents(connectivity=8)
+        hole_components = _BandComponents(connectivity=4)
+        for top, bottom in bands:
+            binary_window, window_top = binary.read(top, bottom, halo=_CONTENT_HALO_ROWS)
+            lines_window, _window_top = line_mask.read(
+                top,
+                bottom,
+                halo=_CONTENT_HALO_ROWS,
+            )
+            content_window = cv2.bitwise_and(
+                binary_window,
+                cv2.bitwise_not(expand(lines_window, 3)),
+            )
+            content_core = _core(content_window, window_top, top, bottom)
+            content.write(top, content_core)
+            image_components.add(
+                _core(image_work_mask(content_window), window_top, top, bottom),
+                top,
+                ink=content_core > 0,
+            )
+            expanded_lines = _core(expand(lines_window, 3), window_top, top, bottom)
+            outline_components.add(expanded_lines, top)
+            hole_components.add(cv2.bitwise_not(expanded_lines), top)
+
+        rectangles = (
+            self._rectangles_from_outlines(
+                _line_mask_outlines(
+                    outline_components.finish(),
+                    hole_components.finish(),
+                    height=height,
+                    width=width,
+                ),
+                lines,
+            )
+            if lines and any(accepted.any() for _, _, accepted in line_masks)
+            else []
+        )
+
+        image_ink = image_components.finish().ink
+        image_regions = self._image_candidates_from_ink(
+            image_ink,
+            _packed_box_sums(content, image_ink, self._tile_rows),
+            source,
+        )
+
+        join_kernel = text_join_kernel(source)
+        text_components = _BandComponents(connectivity=8)
+        for top, bottom in bands:
+            content_window, window_top = content.read(top, bottom, halo=_TEXT_HALO_ROWS)
+            text_window = text_mask(content_window, image_regions, (0, window_top))
+            text_components.add(
+                _core(
+                    cv2.dilate(text_window, join_kernel, iterations=1),
+                    window_top,
+                    top,
+                    bottom,
+                ),
+                top,
+                ink=_core(text_window, window_top, top, bottom) > 0,
+            )
+        text_regions = self._text_candidates_from_ink(
+            text_components.finish().ink,
+            source,
+        )
+        return lines, rectangles, text_regions, image_regions
+
+    def _binary_mask(
+        self,
+        rgb: np.ndarray,
+        bands: list[tuple[int, int]],
+    ) -> _PackedMask:
+        height, width = rgb.shape[:2]
+        histogram = np.zeros(256, dtype=np.int64)
+        for top, bottom in bands:
+            window_top = max(0, top - 1)
+            blurred = cv2.GaussianBlur(
+                cv2.cvtColor(rgb[window_top : bottom + 1], cv2.COLOR_RGB2GRAY),
+                (3, 3),
+                0,
+            )
+            histogram += np.bincount(
+                _core(blurred, window_top, top, bottom).ravel(),
+                minlength=256,
+            )
+        otsu_threshold = _otsu_from_histogram(histogram)
+        block_size = adaptive_block_size(min(height, width))
+        # The 3x3 pre-blur and the adaptive Gaussian window both read context
+        # rows, so a band is binarized with that much of its neighbors.
+        halo = block_size // 2 + 2
+        binary = _PackedMask(height, width)
+        for top, bottom in bands:
+            window_top = max(0, top - halo)
+            window = binarize(
+                cv2.cvtColor(rgb[window_top : bottom + halo], cv2.COLOR_RGB2GRAY),
+                otsu_threshold=otsu_threshold,
+                block_size=block_size,
+            )
+            binary.write(top, _core(window, window_top, top, bottom))
+        return binary
+
+
+class _PackedMask:
+    """A page-sized 0/255 mask stored at one bit per pixel."""
+
+    def __init__(self, height: int, width: int) -> None:
+        self._height = height
+        self._width = width
+        self._bits = np.zeros((height, math.ceil(width / 8)), dtype=np.uint8)
+
+    @property
+    def height(self) -> int:
+        return self._height
+
+    def write(self, top: int, rows: np.ndarray) -> None:
+        self._bits[top : top + rows.shape[0]] = np.packbits(rows > 0, axis=1)
+
+    def read(self, top: int, bottom: int, *, halo: int = 0) -> tuple[np.ndarray, int]:
+        """Return rows ``[top - halo, bottom + halo)`` clipped to the page."""
+
+        window_top = max(0, top - halo)
+        window_bottom = min(self._height, bottom + halo)
+        bits = np.unpackbits(
+            self._bits[window_top:window_bottom],
+            axis=1,
+            count=self._width,
+        )
+        return np.multiply(bits, 255, dtype=np.uint8), window_top
+
+
+@dataclass(frozen=True, slots=True)
+class _StitchedComponents:
+    """Page-level components in first-band order; label 0 is the background.
+
+    ``stats`` uses the ``cv2.connectedComponentsWithStats`` column layout.
+    """
+
+    count: int
+    stats: np.ndarray
+    ink: ComponentInk
+    _band_lookups: tuple[np.ndarray, ...]
+
+    def band_labels(self, band_index: int) -> np.ndarray:
+        """Map the band's own labels to page-level labels."""
+
+        return self._band_lookups[band_index]
+
+
+class _BandComponents:
+    """Label a page mask that arrives in horizontal bands, top to bottom.
+
+    Every band is labeled on its own. Labels that touch across a seam are
+    joined with union-find whose root is the earliest label, so page-level
+    labels keep the order in which components first appear.
+    """
+
+    def __init__(self, *, connectivity: int) -> None:
+        self._connectivity = connectivity
+        self._parent: list[int] = [0]
+        self._band_ids: list[np.ndarray] = []
+        self._stats: list[np.ndarray] = []
+        self._ink: list[np.ndarray] = []
+        self._previous_row: np.ndarray | None = None
+
+    def add(self, core: np.ndarray, top: int, *, ink: np.ndarray | None = None) -> None:
+        count, labels, stats, _ = cv2.connectedComponentsWithStats(
+            core,
+            connectivity=self._connectivity,
+        )
+        base = len(self._parent)
+        ids = np.arange(base - 1, base + count - 1, dtype=np.int64)
+        ids[0] = 0
+        self._parent.extend(range(base, base + count - 1))
+        self._band_ids.append(ids)
+        left = stats[1:, cv2.CC_STAT_LEFT].astype(np.int64)
+        upper = stats[1:, cv2.CC_STAT_TOP].astype(np.int64) + top
+        self._stats.append(
+            np.column_stack(
+                (
+                    ids[1:],
+                    left,
+                    upper,
+                    left + stats[1:, cv2.CC_STAT_WIDTH] - 1,
+                    upper + stats[1:, cv2.CC_STAT_HEIGHT] - 1,
+                    stats[1:, cv2.CC_STAT_AREA],
+                )
+            )
+        )
+        if ink is not None:
+            local = component_ink(labels, count, ink)
+            self._ink.append(
+                np.column_stack(
+                    (
+                        ids[1:],
+                        local.count[1:],
+                        local.x[1:],
+                        local.y[1:] + top,
+                        local.x[1:] + local.width[1:] - 1,
+                        local.y[1:] + local.height[1:] - 1 + top,
+                    )
+                )
+            )
+        if not core.shape[0]:
+            return
+        if self._previous_row is not None:
+            self._join_seam(self._previous_row, ids[labels[0]])
+        self._previous_row = ids[labels[-1]]
+
+    def finish(self) -> _StitchedComponents:
+        parent = np.asarray(self._parent, dtype=np.int64)
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+        roots = np.unique(parent)
+        compact = np.zeros(parent.size, dtype=np.int64)
+        compact[roots] = np.arange(roots.size)
+        compact = compact[parent]
+        count = int(roots.size)
+
+        rows = (
+            np.concatenate(self._stats)
+            if self._stats
+            else np.zeros((0, 6), dtype=np.int64)
+        )
+        owners = compact[rows[:, 0]]
+        x0 = _reduced(np.minimum, owners, rows[:, 1], count)
+        y0 = _reduced(np.minimum, owners, rows[:, 2], count)
+        x1 = _reduced(np.maximum, owners, rows[:, 3], count)
+        y1 = _reduced(np.maximum, owners, rows[:, 4], count)
+        stats = np.zeros((count, 5), dtype=np.int64)
+        stats[:, cv2.CC_STAT_LEFT] = x0
+        stats[:, cv2.CC_STAT_TOP] = y0
+        stats[:, cv2.CC_STAT_WIDTH] = x1 - x0 + 1
+        stats[:, cv2.CC_STAT_HEIGHT] = y1 - y0 + 1
+        stats[:, cv2.CC_STAT_AREA] = np.bincount(
+            owners,
+            weights=rows[:, 5],
+            minlength=count,
+        ).astype(np.int64)
+        stats[0] = 0
+
+        ink_rows = (
+            np.concatenate(self._ink) if self._ink else np.zeros((0, 6), dtype=np.int64)
+        )
+        ink_rows = ink_rows[ink_rows[:, 1] > 0]
+        ink_owners = compact[ink_rows[:, 0]]
+        ink_count = np.bincount(
+            ink_owners,
+            weights=ink_rows[:, 1],
+            minlength=count,
+        ).astype(np.int64)
+        ink_x0 = _reduced(np.minimum, ink_owners, ink_rows[:, 2], count)
+        ink_y0 = _reduced(np.minimum, ink_owners, ink_rows[:, 3], count)
+        ink_x1 = _reduced(np.maximum, ink_owners, ink_rows[:, 4], count)
+        ink_y1 = _reduced(np.maximum, ink_owners, ink_rows[:, 5], count)
+        present = ink_count > 0
+        ink_count[0] = 0
+        ink = ComponentInk(
+            count=ink_count,
+            x=np.where(present, ink_x0, 0),
+            y=np.where(present, ink_y0, 0),
+            width=np.where(present, ink_x1 - ink_x0 + 1, 0),
+            height=np.where(present, ink_y1 - ink_y0 + 1, 0),
+        )
+        return _StitchedComponents(
+            count=count,
+            stats=stats,
+            ink=ink,
+            _band_lookups=tuple(compact[ids] for ids in self._band_ids),
+        )
+
+    def _join_seam(self, above: np.ndarray, below: np.ndarray) -> None:
+        offsets = (-1, 0, 1) if self._connectivity == 8 else (0,)
+        pairs: list[np.ndarray] = []
+        for offset in offsets:
+            if offset < 0:
+                upper, lower = above[:offset], below[-offset:]
+            elif offset > 0:
+                upper, lower = above[offset:], below[:-offset]
+            else:
+                upper, lower = above, below
+            touching = (upper > 0) & (lower > 0)
+            pairs.append(np.column_stack((upper[touching], lower[touching])))
+        for first, second in np.unique(np.concatenate(pairs), axis=0):
+            self._union(int(first), int(second))
+
+    def _find(self, node: int) -> int:
+        parent = self._parent
+        root = node
+        while parent[root] != root:
+            root = parent[root]
+        while parent[node] != root:
+            parent[node], node = root, parent[node]
+        return root
+
+    def _union(self, first: int, second: int) -> None:
+        first_root = self._find(first)
+        second_root = self._find(second)
+        if first_root != second_root:
+            low, high = sorted((first_root, second_root))
+            self._parent[high] = low
+
+
+def _reduced(
+    operation: np.ufunc,
+    owners: np.ndarray,
+    values: np.ndarray,
+    count: int,
+) -> np.ndarray:
+    result = np.zeros(count, dtype=np.int64)
+    if owners.size:
+        order = np.argsort(owners, kind="stable")
+        owners = owners[order]
+        starts = np.flatnonzero(np.r_[True, owners[1:] != owners[:-1]])
+        result[owners[starts]] = operation.reduceat(values[order], starts)
+    return result
+
+
+def _core(window: np.ndarray, window_top: int, top: int, bottom: int) -> np.ndarray:
+    return window[top - window_top : bottom - window_top]
+
+
+def _otsu_from_histogram(histogram: np.ndarray) -> float:
+    # The same between-class variance search as OpenCV's 8-bit Otsu, so a
+    # page histogram gathered band by band selects the full-page level.
+    scale = 1.0 / max(1, int(histogram.sum()))
+    mean = sum(level * float(histogram[level]) for level in range(256)) * scale
+    lower_mean = 0.0
+    lower_weight = 0.0
+    best_variance = 0.0
+    best_level = 0.0
+    for level in range(256):
+        probability = float(histogram[level]) * scale
+        lower_mean *= lower_weight
+        lower_weight += probability
+        upper_weight = 1.0 - lower_weight
+        if (
+            min(lower_weight, upper_weight) < _FLT_EPSILON
+            or max(lower_weight, upper_weight) > 1.0 - _FLT_EPSILON
+        ):
+            continue
+        lower_mean = (lower_mean + level * probability) / lower_weight
+        upper_mean = (mean - lower_weight * lower_mean) / upper_weight
+        variance = (
+            lower_weight
+            * upper_weight
+            * (lower_mean - upper_mean)
+            * (lower_mean - upper_mean)
+        )
+        if variance > best_variance:
+            best_variance = variance
+            best_level = float(level)
+    return best_level
+
+
+def _packed_box_sums(mask: _PackedMask, ink: ComponentInk, rows: int) -> np.ndarray:
+    totals = np.zeros(ink.count.shape, dtype=np.int64)
+    height = mask.height
+    for top in range(0, height, rows):
+        bottom = min(height, top + rows)
+        overlap_top = np.clip(ink.y, top, bottom)
+        overlap_bottom = np.clip(ink.y + ink.height, top, bottom)
+        active = (ink.count > 0) & (overlap_bottom > overlap_top)
+        if not active.any():
+            continue
+        chunk, _window_top = mask.read(top, bottom)
+        integral = cv2.integral((chunk > 0).view(np.uint8))
+        totals[active] += box_sums(
+            integral,
+            ink.x[active],
+            overlap_top[active] - top,
+            ink.width[active],
+            overlap_bottom[active] - overlap_top[active],
+        )
+    return totals
+
+
+def _line_mask_outlines(
+    outlines: _StitchedComponents,
+    holes: _StitchedComponents,
+    *,
+    height: int,
+    width: int,
+) -> Iterator[tuple[int, int, int, int, float]]:
+    """Yield ``findContours``-equivalent boxes and areas for the line mask.
+
+    An outer contour runs through the boundary pixel centers of a component.
+    A hole contour runs through the component pixels around the hole and cuts
+    the hole's four corners diagonally. Both areas follow from the pixels each
+    contour encloses.
+    """
+
+    hole_boxes = holes.stats[1:]
+    enclosed_holes = (
+        (hole_boxes[:, cv2.CC_STAT_LEFT] > 0)
+        & (hole_boxes[:, cv2.CC_STAT_TOP] > 0)
+        & (
+            hole_boxes[:, cv2.CC_STAT_LEFT] + hole_boxes[:, cv2.CC_STAT_WIDTH]
+            < width
+        )
+        & (
+            hole_boxes[:, cv2.CC_STAT_TOP] + hole_boxes[:, cv2.CC_STAT_HEIGHT]
+            < height
+        )
+    )
+    pieces = np.concatenate((outlines.stats[1:], hole_boxes[enclosed_holes]))
+    for x, y, box_width, box_height, _area in outlines.stats[1:]:
+        filled = _enclosed_pixels(pieces, x, y, box_width, box_height)
+        yield (
+            int(x),
+            int(y),
+            int(box_width),
+            int(box_height),
+            float(max(0, filled - box_width - box_height + 1)),
+        )
+    for x, y, box_width, box_height, _area in hole_boxes[enclosed_holes]:
+        filled = _enclosed_pixels(pieces, x, y, box_width, box_height)
+        yield (
+            int(x) - 1,
+            int(y) - 1,
+            int(box_width) + 2,
+            int(box_height) + 2,
+            float(filled + box_width + box_height - 1),
+        )
+
+
+def _enclosed_pixels(
+    pieces: np.ndarray,
+    x: int,
+    y: int,
+    width: int,
+    height: int,
+) -> int:
+    inside = (
+        (pieces[:, cv2.CC_STAT_LEFT] >= x)
+        & (pieces[:, cv2.CC_STAT_TOP] >= y)
+        & (pieces[:, cv2.CC_STAT_LEFT] + pieces[:, cv2.CC_STAT_WIDTH] <= x + width)
+        & (pieces[:, cv2.CC_STAT_TOP] + pieces[:, cv2.CC_STAT_HEIGHT] <= y + height)
+    )
+    return int(pieces[inside, cv2.CC_STAT_AREA].sum())
+
+
+__all__ = [
+    "DEFAULT_STRUCTURE_TILE_ROWS",
+    "STRUCTURE_TILE_VERSION",
+    "TiledOpenCvStructureExtractor",
+]
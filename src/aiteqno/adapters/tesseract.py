@@ -10,17 +10,26 @@ import re
 import shutil
 import subprocess
 import threading
+import time
 import unicodedata
 from collections.abc import Callable, Mapping, Sequence
 from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import partial
 from os import PathLike
 from pathlib import Path
-from typing import Any, Iterator
+from typing import Any, ClassVar, Iterator
 
 import pytesseract
 from PIL import Image, __version__ as PILLOW_VERSION
 
+from aiteqno.adapters.ocr_cache import OCR_RESPONSE_CACHE_VERSION
+from aiteqno.adapters.tesseract_common import (
+    TSV_COLUMNS,
+    RecognitionContext,
+    TargetRecognition,
+    ordered_results,
+)
 from aiteqno.domain import PixelBoundingBox, Provenance, ProvenanceStage
 from aiteqno.ports.ocr import (
     DEFAULT_OCR_LANGUAGES,
@@ -28,6 +37,7 @@ from aiteqno.ports.ocr import (
     OcrCapabilities,
     OcrOptions,
     OcrRegion,
+    OcrResponseCache,
     OcrToken,
     normalize_ocr_languages,
     validate_ocr_request,
@@ -40,6 +50,7 @@ MIN_TESSERACT_MAJOR_VERSION = 5
 DEFAULT_TESSERACT_TARGET_DPI: int | None = None
 DEFAULT_TESSERACT_REGION_PADDING_PX = 2
 DEFAULT_MAX_TESSERACT_WORKING_PIXELS = 40_000_000
+DEFAULT_TESSERACT_MAX_WORKERS = 1
 TESSERACT_RASTER_TRANSFORM_VERSION = "tesseract-raster-transform-v1"
 TESSERACT_CROP_PADDING_VERSION = "tesseract-crop-padding-v1"
 TESSERACT_INVOCATION_EVIDENCE_VERSION = "tesseract-invocation-evidence-v1"
@@ -61,7 +72,6 @@ TESSERACT_CROP_PADDING_OPERATION_ORDER = (
     "restore-original-source-pixel-coordinates",
 )
 _RUNTIME_LOCK = threading.RLock()
-_TSV_COLUMNS = ("text", "conf", "left", "top", "width", "height")
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -258,6 +268,76 @@ class TesseractTrainedDataFileEvidence:
         }
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TesseractResponseCacheEvidence:
+    """Response-cache usage for one recognize invocation."""
+
+    cache_version: str
+    enabled: bool
+    hits: int
+    misses: int
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a deterministic JSON-compatible representation."""
+
+        return {
+            "cache_version": self.cache_version,
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TesseractRegionTimingEvidence:
+    """Wall time spent on one OCR target of a recognize invocation.
+
+    ``prepare_seconds`` covers cropping, raster scaling, and padding.
+    ``engine_seconds`` covers the response-cache lookup and the engine call.
+    A batch session reports its whole wall time on every crop it carried, and
+    ``session_regions`` says how many crops shared it; a cached crop never
+    reaches the engine and reports zero. ``restore_seconds`` covers parsing
+    the response and mapping tokens back to source pixels.
+    """
+
+    region_ref: str | None
+    prepare_seconds: float
+    engine_seconds: float
+    restore_seconds: float
+    session_regions: int
+    token_count: int
+    response_cached: bool
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a deterministic JSON-compatible representation."""
+
+        return {
+            "region_ref": self.region_ref,
+            "prepare_seconds": self.prepare_seconds,
+            "engine_seconds": self.engine_seconds,
+            "restore_seconds": self.restore_seconds,
+            "session_regions": self.session_regions,
+            "token_count": self.token_count,
+            "response_cached": self.response_cached,
+        }
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TesseractTimingEvidence:
+    """Region timings for one successful recognize invocation, in target order."""
+
+    wall_seconds: float
+    regions: tuple[TesseractRegionTimingEvidence, ...]
+
+    def to_dict(self) -> dict[str, object]:
+        """Return a deterministic JSON-compatible representation."""
+
+        return {
+            "wall_seconds": self.wall_seconds,
+            "regions": [item.to_dict() for item in self.regions],
+        }
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class TesseractInvocationEvidence:
     """Backend-owned evidence for one successful recognize invocation."""
@@ -285,12 +365,13 @@ class TesseractInvocationEvidence:
     parameters_digest: str
     raster_transform: TesseractRasterTransformEvidence
     crop_padding: TesseractCropPaddingEvidence
+    response_cache: TesseractResponseCacheEvidence | None = None
 
     def to_dict(self) -> dict[str, object]:
         """Return all measured configuration and raster evidence."""
 
         padding = self.crop_padding.to_dict()
-        return {
+        rendered: dict[str, object] = {
             "schema_version": self.schema_version,
             "invocation_version": self.invocation_version,
             "provider": self.provider,
@@ -323,11 +404,44 @@ class TesseractInvocationEvidence:
             # independently auditable above.
             "crops": padding["crops"],
         }
+        if self.response_cache is not None:
+            rendered["response_cache"] = self.response_cache.to_dict()
+        return rendered
+
+
+_ProbeCacheKey = tuple[str, str | None, tuple[str, ...]]
+_RuntimeFingerprint = tuple[tuple[str, int, int], ...]
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _ProbeCacheEntry:
+    fingerprint: _RuntimeFingerprint
+    tessdata_directory: Path
+    capabilities: OcrCapabilities
+    traineddata: tuple[TesseractTrainedDataFileEvidence, ...] | None
+
+
+# Capability probes and traineddata hashes are shared by every backend in the
+# process and revalidated against executable and traineddata mtime/size.
+_PROBE_CACHE_LOCK = threading.Lock()
+_PROBE_CACHE: dict[_ProbeCacheKey, _ProbeCacheEntry] = {}
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class _PreparedTarget:
+    region_ref: str | None
+    offset_x: int
+    offset_y: int
+    ocr_image: Image.Image
+    transform: TesseractCropTransformEvidence
+    padding: TesseractCropPaddingTargetEvidence
 
 
 class TesseractOcrBackend:
     """Recognize source-pixel tokens through a configurable local Tesseract 5.x."""
 
+    _ENGINE_SESSION: ClassVar[str | None] = None
+
     def __init__(
         self,
         *,
@@ -337,11 +451,14 @@ class TesseractOcrBackend:
         target_dpi: int | None = DEFAULT_TESSERACT_TARGET_DPI,
         region_padding_px: int = DEFAULT_TESSERACT_REGION_PADDING_PX,
         max_working_pixels: int = DEFAULT_MAX_TESSERACT_WORKING_PIXELS,
+        max_workers: int = DEFAULT_TESSERACT_MAX_WORKERS,
+        response_cache: OcrResponseCache | None = None,
         transform_observer: Callable[[TesseractRasterTransformEvidence], None]
         | None = None,
         padding_observer: Callable[[TesseractCropPaddingEvidence], None] | None = None,
         invocation_observer: Callable[[TesseractInvocationEvidence], None]
         | None = None,
+        timing_observer: Callable[[TesseractTimingEvidence], None] | None = None,
     ) -> None:
         self._executable_path = (
             os.fspath(executable_path) if executable_path is not None else "tesseract"
@@ -376,21 +493,39 @@ class TesseractOcrBackend:
             or max_working_pixels <= 0
         ):
             raise ValueError("max_working_pixels must be a positive integer")
+        if (
+            isinstance(max_workers, bool)
+            or not isinstance(max_workers, int)
+            or max_workers <= 0
+        ):
+            raise ValueError("max_workers must be a positive integer")
+        if response_cache is not None and not isinstance(
+            response_cache, OcrResponseCache
+        ):
+            raise TypeError("response_cache must be an OcrResponseCache or None")
         if transform_observer is not None and not callable(transform_observer):
             raise TypeError("transform_observer must be callable or None")
         if padding_observer is not None and not callable(padding_observer):
             raise TypeError("padding_observer must be callable or None")
         if invocation_observer is not None and not callable(invocation_observer):
             raise TypeError("invocation_observer must be callable or None")
+        if timing_observer is not None and not callable(timing_observer):
+            raise TypeError("timing_observer must be callable or None")
         self._target_dpi = target_dpi
         self._region_padding_px = region_padding_px
         self._max_working_pixels = max_working_pixels
+        self._max_workers = max_workers
+        self._response_cache = response_cache
         self._transform_observer = transform_observer
         self._padding_observer = padding_observer
         self._invocation_observer = invocation_observer
+        self._timing_observer = timing_observer
 
     def healthcheck(self) -> OcrCapabilities:
-        """Verify executable, major version, and configured language data."""
+        """Verify executable, major version, and configured language data.
+
+        Unlike ``recognize``, this always probes the runtime again.
+        """
 
         return self._probe(self._required_languages)
 
@@ -403,25 +538,14 @@ class TesseractOcrBackend:
     ) -> tuple[OcrToken, ...]:
         """Recognize full-page or cropped regions and restore source coordinates."""
 
+        started = time.perf_counter()
         collected_regions, normalized_languages = validate_ocr_request(
             image,
             regions,
             languages,
             options,
         )
-        capabilities = self._probe(normalized_languages)
-        try:
-            page_image = Image.frombytes(
-                "RGB",
-                (image.source.pixel_width, image.source.pixel_height),
-                image.pixels,
-            )
-        except (OSError, ValueError) as exc:
-            raise OcrBackendError(
-                "ocr_unreadable_input",
-                f"normalized image pixels could not be opened: {exc}",
-                provider=TESSERACT_PROVIDER,
-            ) from exc
+        capabilities = self._cached_probe(normalized_languages)
 
         targets: tuple[OcrRegion | None, ...]
         if collected_regions:
@@ -445,125 +569,52 @@ class TesseractOcrBackend:
             target_dpi=self._target_dpi,
             region_padding_px=self._region_padding_px,
             max_working_pixels=self._max_working_pixels,
+            engine_session=self._ENGINE_SESSION,
         )
+        config = self._config(options, effective_ocr_dpi)
         tokens: list[OcrToken] = []
+        region_timings: list[TesseractRegionTimingEvidence] = []
         transform_crops: list[TesseractCropTransformEvidence] = []
         padding_crops: list[TesseractCropPaddingTargetEvidence] = []
         traineddata: tuple[TesseractTrainedDataFileEvidence, ...] = ()
-        try:
-            resolved_executable = capabilities.executable
-            with self._configured_runtime(resolved_executable):
-                if self._invocation_observer is not None:
-                    traineddata = _traineddata_evidence(
-                        resolved_executable,
-                        normalized_languages,
-                        configured_prefix=self._tessdata_prefix,
-                    )
-                for target in targets:
-                    source_crop, offset_x, offset_y, region_ref = _target_image(
-                        page_image,
-                        target,
-                    )
-                    working_image = source_crop
-                    ocr_image = source_crop
-                    try:
-                        working_image, transform = _working_image(
-                            source_crop,
-                            offset_x=offset_x,
-                            offset_y=offset_y,
-                            region_ref=region_ref,
-                            source_effective_dpi=source_effective_dpi,
-                            target_dpi=self._target_dpi,
-                            max_working_pixels=self._max_working_pixels,
-                        )
-                        transform_crops.append(transform)
-                        ocr_image, padding = _region_padded_image(
-                            working_image,
-                            offset_x=offset_x,
-                            offset_y=offset_y,
-                            region_ref=region_ref,
-                            source_width=source_crop.width,
-                            source_height=source_crop.height,
-                            region_padding_px=self._region_padding_px,
-                            max_working_pixels=self._max_working_pixels,
-                        )
-                        padding_crops.append(padding)
-                        config = self._config(options, effective_ocr_dpi)
-                        try:
-                            response = pytesseract.image_to_data(
-                                ocr_image,
-                                lang=language_spec,
-                                config=config,
-                                output_type=pytesseract.Output.DICT,
-                                timeout=options.timeout_seconds,
-                            )
-                        except pytesseract.TesseractNotFoundError as exc:
-                            raise OcrBackendError(
-                                "ocr_executable_missing",
-                                "Tesseract executable became unavailable: "
-                                f"{resolved_executable}",
-                                provider=TESSERACT_PROVIDER,
-                            ) from exc
-                        except pytesseract.TesseractError as exc:
-                            raise OcrBackendError(
-                                "ocr_engine_failure",
-                                f"Tesseract OCR process failed: {exc}",
-                                provider=TESSERACT_PROVIDER,
-                            ) from exc
-                        except RuntimeError as exc:
-                            code = (
-                                "ocr_timeout"
-                                if "timeout" in str(exc).casefold()
-                                else "ocr_engine_failure"
-                            )
-                            message = (
-                                f"Tesseract exceeded {options.timeout_seconds:g} seconds"
-                                if code == "ocr_timeout"
-                                else f"Tesseract OCR process failed: {exc}"
-                            )
-                            raise OcrBackendError(
-                                code,
-                                message,
-                                provider=TESSERACT_PROVIDER,
-                            ) from exc
-                        except OSError as exc:
-                            raise OcrBackendError(
-                                "ocr_engine_failure",
-                                f"Tesseract OCR process could not start: {exc}",
-                                provider=TESSERACT_PROVIDER,
-                            ) from exc
-                        tokens.extend(
-                            _tokens_from_response(
-                                response,
-                                source_crop_width=source_crop.width,
-                                source_crop_height=source_crop.height,
-                                working_width=working_image.width,
-                                working_height=working_image.height,
-                                ocr_working_width=ocr_image.width,
-                                ocr_working_height=ocr_image.height,
-                                offset_x=offset_x,
-                                offset_y=offset_y,
-                                region_ref=region_ref,
-                                languages=normalized_languages,
-                                provider_version=capabilities.provider_version,
-                                model=model,
-                                options=options,
-                                parameters_digest=parameters_digest,
-                                transform=transform,
-                                effective_ocr_dpi=effective_ocr_dpi,
-                                target_dpi=self._target_dpi,
-                                padding=padding,
-                            )
-                        )
-                    finally:
-                        if ocr_image is not working_image:
-                            ocr_image.close()
-                        if working_image is not source_crop:
-                            working_image.close()
-                        if target is not None:
-                            source_crop.close()
-        finally:
-            page_image.close()
+        cache_namespace: str | None = None
+        cache_hits = 0
+        resolved_executable = capabilities.executable
+        with self._configured_runtime(resolved_executable):
+            if self._invocation_observer is not None:
+                traineddata = self._cached_traineddata(
+                    resolved_executable,
+                    normalized_languages,
+                )
+            cache_namespace = self._response_cache_namespace(
+                capabilities,
+                normalized_languages,
+                traineddata,
+                config,
+            )
+            outcomes = self._recognize_targets(
+                image,
+                targets,
+                RecognitionContext(
+                    resolved_executable=resolved_executable,
+                    language_spec=language_spec,
+                    config=config,
+                    languages=normalized_languages,
+                    provider_version=capabilities.provider_version,
+                    model=model,
+                    options=options,
+                    parameters_digest=parameters_digest,
+                    source_effective_dpi=source_effective_dpi,
+                    effective_ocr_dpi=effective_ocr_dpi,
+                    response_cache_namespace=cache_namespace,
+                ),
+            )
+            for outcome in outcomes:
+                tokens.extend(outcome.tokens)
+                transform_crops.append(outcome.transform)
+                padding_crops.append(outcome.padding)
+                region_timings.append(outcome.timing)
+                cache_hits += outcome.response_cached
         evidence = TesseractRasterTransformEvidence(
             schema_version="1.0",
             transform_version=TESSERACT_RASTER_TRANSFORM_VERSION,
@@ -623,14 +674,291 @@ class TesseractOcrBackend:
                     region_padding_px=self._region_padding_px,
                     max_working_pixels=self._max_working_pixels,
                     tessdata_configured=self._tessdata_prefix is not None,
-                    tesseract_config=self._config(options, effective_ocr_dpi),
+                    tesseract_config=config,
                     parameters_digest=parameters_digest,
                     raster_transform=evidence,
                     crop_padding=padding_evidence,
+                    response_cache=(
+                        TesseractResponseCacheEvidence(
+                            cache_version=OCR_RESPONSE_CACHE_VERSION,
+                            enabled=cache_namespace is not None,
+                            hits=cache_hits,
+                            misses=len(targets) - cache_hits,
+                        )
+                        if self._response_cache is not None
+                        else None
+                    ),
+                )
+            )
+        if self._timing_observer is not None:
+            self._timing_observer(
+                TesseractTimingEvidence(
+                    wall_seconds=time.perf_counter() - started,
+                    regions=tuple(region_timings),
                 )
             )
         return tuple(tokens)
 
+    def _recognize_targets(
+        self,
+        page: ImageInput,
+        targets: Sequence[OcrRegion | None],
+        context: RecognitionContext,
+    ) -> list[TargetRecognition]:
+        return ordered_results(
+            partial(self._recognize_target, page, context=context),
+            targets,
+            max_workers=self._max_workers,
+        )
+
+    def _recognize_target(
+        self,
+        page: ImageInput,
+        target: OcrRegion | None,
+        *,
+        context: RecognitionContext,
+    ) -> TargetRecognition:
+        started = time.perf_counter()
+        with self._prepared_target(page, target, context) as prepared:
+            prepared_at = time.perf_counter()
+            cached = self._cached_response(prepared, context)
+            if cached is not None:
+                return self._target_recognition(
+                    prepared,
+                    cached,
+                    context,
+                    prepare_seconds=prepared_at - started,
+                    engine_seconds=time.perf_counter() - prepared_at,
+                    session_regions=0,
+                    response_cached=True,
+                )
+            response = _image_to_data(prepared.ocr_image, context)
+            outcome = self._target_recognition(
+                prepared,
+                response,
+                context,
+                prepare_seconds=prepared_at - started,
+                engine_seconds=time.perf_counter() - prepared_at,
+                session_regions=1,
+            )
+        self._store_response(prepared, response, context)
+        return outcome
+
+    def _response_cache_namespace(
+        self,
+        capabilities: OcrCapabilities,
+        languages: tuple[str, ...],
+        traineddata: tuple[TesseractTrainedDataFileEvidence, ...],
+        config: str,
+    ) -> str | None:
+        if self._response_cache is None:
+            return None
+        if not traineddata:
+            try:
+                traineddata = self._cached_traineddata(
+                    capabilities.executable,
+                    languages,
+                )
+            except OcrBackendError:
+                # Responses are only reusable when the model content is known.
+                return None
+        payload = {
+            "cache_version": OCR_RESPONSE_CACHE_VERSION,
+            "config": config,
+            "engine_session": self._ENGINE_SESSION,
+            "executable": capabilities.executable,
+            "languages": list(languages),
+            "provider": capabilities.provider,
+            "provider_version": capabilities.provider_version,
+            "traineddata": [item.sha256 for item in traineddata],
+        }
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _cached_response(
+        self,
+        prepared: _PreparedTarget,
+        context: RecognitionContext,
+    ) -> Mapping[str, Sequence[object]] | None:
+        key = _response_cache_key(prepared, context)
+        if key is None or self._response_cache is None:
+            return None
+        return self._response_cache.load(key)
+
+    def _store_response(
+        self,
+        prepared: _PreparedTarget,
+        response: object,
+        context: RecognitionContext,
+    ) -> None:
+        key = _response_cache_key(prepared, context)
+        if key is None or self._response_cache is None:
+            return
+        rows = _response_rows(response)
+        self._response_cache.store(
+            key,
+            {name: [row[name] for row in rows] for name in TSV_COLUMNS},
+        )
+
+    @contextmanager
+    def _prepared_target(
+        self,
+        page: ImageInput,
+        target: OcrRegion | None,
+        context: RecognitionContext,
+    ) -> Iterator[_PreparedTarget]:
+        source_crop, offset_x, offset_y, region_ref = _target_image(page, target)
+        working_image = source_crop
+        ocr_image = source_crop
+        try:
+            working_image, transform = _working_image(
+                source_crop,
+                offset_x=offset_x,
+                offset_y=offset_y,
+                region_ref=region_ref,
+                source_effective_dpi=context.source_effective_dpi,
+                target_dpi=self._target_dpi,
+                max_working_pixels=self._max_working_pixels,
+            )
+            ocr_image, padding = _region_padded_image(
+                working_image,
+                offset_x=offset_x,
+                offset_y=offset_y,
+                region_ref=region_ref,
+                source_width=source_crop.width,
+                source_height=source_crop.height,
+                region_padding_px=self._region_padding_px,
+                max_working_pixels=self._max_working_pixels,
+            )
+            yield _PreparedTarget(
+                region_ref=region_ref,
+                offset_x=offset_x,
+                offset_y=offset_y,
+                ocr_image=ocr_image,
+                transform=transform,
+                padding=padding,
+            )
+        finally:
+            if ocr_image is not working_image:
+                ocr_image.close()
+            if working_image is not source_crop:
+                working_image.close()
+            source_crop.close()
+
+    def _target_recognition(
+        self,
+        prepared: _PreparedTarget,
+        response: object,
+        context: RecognitionContext,
+        *,
+        prepare_seconds: float,
+        engine_seconds: float,
+        session_regions: int,
+        response_cached: bool = False,
+    ) -> TargetRecognition:
+        transform = prepared.transform
+        padding = prepared.padding
+        started = time.perf_counter()
+        tokens = _tokens_from_response(
+            response,
+            source_crop_width=transform.source_width,
+            source_crop_height=transform.source_height,
+            working_width=transform.working_width,
+            working_height=transform.working_height,
+            ocr_working_width=padding.working_width,
+            ocr_working_height=padding.working_height,
+            offset_x=prepared.offset_x,
+            offset_y=prepared.offset_y,
+            region_ref=prepared.region_ref,
+            languages=context.languages,
+            provider_version=context.provider_version,
+            model=context.model,
+            options=context.options,
+            parameters_digest=context.parameters_digest,
+            transform=transform,
+            effective_ocr_dpi=context.effective_ocr_dpi,
+            target_dpi=self._target_dpi,
+            padding=padding,
+        )
+        return TargetRecognition(
+            tokens=tuple(tokens),
+            transform=transform,
+            padding=padding,
+            timing=TesseractRegionTimingEvidence(
+                region_ref=prepared.region_ref,
+                prepare_seconds=prepare_seconds,
+                engine_seconds=engine_seconds,
+                restore_seconds=time.perf_counter() - started,
+                session_regions=session_regions,
+                token_count=len(tokens),
+                response_cached=response_cached,
+            ),
+            response_cached=response_cached,
+        )
+
+    def _cached_probe(self, languages: tuple[str, ...]) -> OcrCapabilities:
+        key = self._probe_cache_key(self._resolve_executable(), languages)
+        entry = _fresh_probe_entry(key)
+        if entry is not None:
+            return entry.capabilities
+        capabilities = self._probe(languages)
+        if _runtime_fingerprint(capabilities.executable, None, ()) is None:
+            return capabilities
+        try:
+            directory = _resolve_tessdata_directory(
+                capabilities.executable,
+                languages,
+                configured_prefix=self._tessdata_prefix,
+            )
+        except OcrBackendError:
+            # Without a resolvable traineddata directory the result cannot be
+            # invalidated safely, so such a runtime is probed on every call.
+            return capabilities
+        _store_probe_entry(
+            key,
+            tessdata_directory=directory,
+            capabilities=capabilities,
+            traineddata=None,
+        )
+        return capabilities
+
+    def _cached_traineddata(
+        self,
+        executable: str,
+        languages: tuple[str, ...],
+    ) -> tuple[TesseractTrainedDataFileEvidence, ...]:
+        key = self._probe_cache_key(executable, languages)
+        entry = _fresh_probe_entry(key)
+        if entry is None:
+            return _traineddata_evidence(
+                executable,
+                languages,
+                configured_prefix=self._tessdata_prefix,
+            )
+        if entry.traineddata is not None:
+            return entry.traineddata
+        records = _traineddata_records(entry.tessdata_directory, languages)
+        _store_probe_entry(
+            key,
+            tessdata_directory=entry.tessdata_directory,
+            capabilities=entry.capabilities,
+            traineddata=records,
+            expected_fingerprint=entry.fingerprint,
+        )
+        return records
+
+    def _probe_cache_key(
+        self,
+        executable: str,
+        languages: tuple[str, ...],
+    ) -> _ProbeCacheKey:
+        prefix = (
+            self._tessdata_prefix
+            if self._tessdata_prefix is not None
+            else os.environ.get("TESSDATA_PREFIX")
+        )
+        return executable, prefix, languages
+
     def _probe(self, required_languages: Sequence[str]) -> OcrCapabilities:
         normalized_languages = normalize_ocr_languages(required_languages)
         resolved_executable = self._resolve_executable()
@@ -751,23 +1079,101 @@ class TesseractOcrBackend:
 
 
 def _target_image(
-    page_image: Image.Image,
+    page: ImageInput,
     region: OcrRegion | None,
 ) -> tuple[Image.Image, int, int, str | None]:
-    if region is None:
-        return page_image, 0, 0, None
-    bbox = region.bbox
-    crop = page_image.crop(
-        (
-            bbox.x,
-            bbox.y,
-            bbox.x + bbox.width,
-            bbox.y + bbox.height,
+    # Only the target region is materialized; the decoded page buffer is
+    # shared by every crop instead of being copied into a full-page raster.
+    bbox = (
+        region.bbox
+        if region is not None
+        else PixelBoundingBox(
+            x=0,
+            y=0,
+            width=page.source.pixel_width,
+            height=page.source.pixel_height,
         )
     )
+    try:
+        crop = Image.frombytes(
+            "RGB",
+            (bbox.width, bbox.height),
+            page.region_pixels(bbox),
+        )
+    except (OSError, ValueError) as exc:
+        raise OcrBackendError(
+            "ocr_unreadable_input",
+            f"normalized image pixels could not be opened: {exc}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    if region is None:
+        return crop, 0, 0, None
     return crop, bbox.x, bbox.y, region.region_ref
 
 
+def _response_cache_key(
+    prepared: _PreparedTarget,
+    context: RecognitionContext,
+) -> str | None:
+    # The key covers the exact engine input raster rather than the region
+    # plan, so an identical crop is reused across pages and region layouts.
+    if context.response_cache_namespace is None:
+        return None
+    digest = hashlib.sha256()
+    digest.update(context.response_cache_namespace.encode("ascii"))
+    digest.update(b"\0")
+    digest.update(prepared.padding.working_raster_sha256.encode("ascii"))
+    return digest.hexdigest()
+
+
+def _image_to_data(
+    ocr_image: Image.Image,
+    context: RecognitionContext,
+) -> object:
+    options = context.options
+    try:
+        return pytesseract.image_to_data(
+            ocr_image,
+            lang=context.language_spec,
+            config=context.config,
+            output_type=pytesseract.Output.DICT,
+            timeout=options.timeout_seconds,
+        )
+    except pytesseract.TesseractNotFoundError as exc:
+        raise OcrBackendError(
+            "ocr_executable_missing",
+            "Tesseract executable became unavailable: "
+            f"{context.resolved_executable}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    except pytesseract.TesseractError as exc:
+        raise OcrBackendError(
+            "ocr_engine_failure",
+            f"Tesseract OCR process failed: {exc}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    except RuntimeError as exc:
+        code = (
+            "ocr_timeout" if "timeout" in str(exc).casefold() else "ocr_engine_failure"
+        )
+        message = (
+            f"Tesseract exceeded {options.timeout_seconds:g} seconds"
+            if code == "ocr_timeout"
+            else f"Tesseract OCR process failed: {exc}"
+        )
+        raise OcrBackendError(
+            code,
+            message,
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    except OSError as exc:
+        raise OcrBackendError(
+            "ocr_engine_failure",
+            f"Tesseract OCR process could not start: {exc}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+
+
 def _source_effective_dpi(image: ImageInput) -> float:
     return round((image.source.dpi_x + image.source.dpi_y) / 2.0, 6)
 
@@ -1120,7 +1526,7 @@ def _response_rows(response: object) -> list[dict[str, object]]:
             provider=TESSERACT_PROVIDER,
         )
     columns: dict[str, Sequence[Any]] = {}
-    for name in _TSV_COLUMNS:
+    for name in TSV_COLUMNS:
         value = response.get(name)
         if isinstance(value, (str, bytes, bytearray)) or not isinstance(
             value, Sequence
@@ -1139,7 +1545,7 @@ def _response_rows(response: object) -> list[dict[str, object]]:
             provider=TESSERACT_PROVIDER,
         )
     return [
-        {name: columns[name][index] for name in _TSV_COLUMNS}
+        {name: columns[name][index] for name in TSV_COLUMNS}
         for index in range(row_count)
     ]
 
@@ -1231,6 +1637,13 @@ def _traineddata_evidence(
         languages,
         configured_prefix=configured_prefix,
     )
+    return _traineddata_records(directory, languages)
+
+
+def _traineddata_records(
+    directory: Path,
+    languages: tuple[str, ...],
+) -> tuple[TesseractTrainedDataFileEvidence, ...]:
     records: list[TesseractTrainedDataFileEvidence] = []
     for language in languages:
         path = (directory / f"{language}.traineddata").resolve()
@@ -1269,6 +1682,69 @@ def _traineddata_evidence(
     return tuple(records)
 
 
+def _fresh_probe_entry(key: _ProbeCacheKey) -> _ProbeCacheEntry | None:
+    with _PROBE_CACHE_LOCK:
+        entry = _PROBE_CACHE.get(key)
+    if entry is None:
+        return None
+    executable, _prefix, languages = key
+    fingerprint = _runtime_fingerprint(
+        executable,
+        entry.tessdata_directory,
+        languages,
+    )
+    if fingerprint == entry.fingerprint:
+        return entry
+    with _PROBE_CACHE_LOCK:
+        if _PROBE_CACHE.get(key) is entry:
+            del _PROBE_CACHE[key]
+    return None
+
+
+def _store_probe_entry(
+    key: _ProbeCacheKey,
+    *,
+    tessdata_directory: Path,
+    capabilities: OcrCapabilities,
+    traineddata: tuple[TesseractTrainedDataFileEvidence, ...] | None,
+    expected_fingerprint: _RuntimeFingerprint | None = None,
+) -> None:
+    executable, _prefix, languages = key
+    fingerprint = _runtime_fingerprint(executable, tessdata_directory, languages)
+    if fingerprint is None:
+        return
+    if expected_fingerprint is not None and fingerprint != expected_fingerprint:
+        # The files changed while they were hashed; keep nothing stale.
+        return
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE[key] = _ProbeCacheEntry(
+            fingerprint=fingerprint,
+            tessdata_directory=tessdata_directory,
+            capabilities=capabilities,
+            traineddata=traineddata,
+        )
+
+
+def _runtime_fingerprint(
+    executable: str,
+    tessdata_directory: Path | None,
+    languages: tuple[str, ...],
+) -> _RuntimeFingerprint | None:
+    paths = [Path(executable)]
+    if tessdata_directory is not None:
+        paths.extend(
+            tessdata_directory / f"{language}.traineddata" for language in languages
+        )
+    fingerprint: list[tuple[str, int, int]] = []
+    for path in paths:
+        try:
+            status = path.stat()
+        except OSError:
+            return None
+        fingerprint.append((str(path), status.st_mtime_ns, status.st_size))
+    return tuple(fingerprint)
+
+
 def _resolve_tessdata_directory(
     executable: str,
     languages: tuple[str, ...],
@@ -1352,8 +1828,9 @@ def _parameters_digest(
     target_dpi: int | None,
     region_padding_px: int,
     max_working_pixels: int,
+    engine_session: str | None = None,
 ) -> str:
-    payload = {
+    payload: dict[str, object] = {
         "dpi_x": image.source.dpi_x,
         "dpi_y": image.source.dpi_y,
         "engine_mode": options.engine_mode,
@@ -1405,5 +1882,9 @@ def _parameters_digest(
             },
         },
     }
+    if engine_session is not None:
+        # Only alternative engine sessions extend the payload, so per-crop
+        # digests recorded by earlier runs remain reproducible.
+        payload["engine_session"] = engine_session
     encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("ascii")
     return hashlib.sha256(encoded).hexdigest()
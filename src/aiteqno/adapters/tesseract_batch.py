@@ -0,0 +1,262 @@
+"""Tesseract sessions that load the language model once per engine worker."""
+
+from __future__ import annotations
+
+import io
+import math
+import os
+import shlex
+import subprocess
+import time
+from collections.abc import Sequence
+from contextlib import ExitStack
+from functools import partial
+
+from PIL import Image
+
+from aiteqno.adapters.tesseract import TESSERACT_PROVIDER, TesseractOcrBackend
+from aiteqno.adapters.tesseract_common import (
+    TSV_COLUMNS,
+    RecognitionContext,
+    TargetRecognition,
+    ordered_results,
+    tsv_columns,
+)
+from aiteqno.ports.ocr import OcrBackendError, OcrRegion
+from aiteqno.ports.structure import ImageInput
+
+
+TESSERACT_BATCH_SESSION_VERSION = "tesseract-multipage-stdin-session-v1"
+_STDERR_EXCERPT_CHARS = 400
+
+
+class TesseractBatchOcrBackend(TesseractOcrBackend):
+    """Stream many OCR crops through a few Tesseract processes per invocation.
+
+    The per-crop backend starts one process per region, each writing a
+    temporary PNG and loading trained data from scratch. This backend splits
+    the planned regions into ``max_workers`` contiguous groups, streams each
+    group to one process as an uncompressed multi-page TIFF on stdin, and reads
+    TSV for every page from stdout. Cropping, raster transforms, padding,
+    coordinate restoration, and evidence are shared with the per-crop backend;
+    only the engine session differs, and it is recorded in the parameters
+    digest. ``OcrOptions.timeout_seconds`` remains a per-crop budget, and
+    crops found in the response cache are left out of the session.
+    """
+
+    _ENGINE_SESSION = TESSERACT_BATCH_SESSION_VERSION
+
+    def _recognize_targets(
+        self,
+        page: ImageInput,
+        targets: Sequence[OcrRegion | None],
+        context: RecognitionContext,
+    ) -> list[TargetRecognition]:
+        groups = _contiguous_groups(targets, self._max_workers)
+        outcomes = ordered_results(
+            partial(self._recognize_group, page, context=context),
+            groups,
+            max_workers=len(groups),
+        )
+        return [outcome for group in outcomes for outcome in group]
+
+    def _recognize_group(
+        self,
+        page: ImageInput,
+        targets: tuple[OcrRegion | None, ...],
+        *,
+        context: RecognitionContext,
+    ) -> list[TargetRecognition]:
+        prepare_seconds: list[float] = []
+        lookup_seconds: list[float] = []
+        with ExitStack() as stack:
+            prepared = []
+            for target in targets:
+                started = time.perf_counter()
+                prepared.append(
+                    stack.enter_context(
+                        self._prepared_target(page, target, context)
+                    )
+                )
+                prepare_seconds.append(time.perf_counter() - started)
+            cached = []
+            for item in prepared:
+                started = time.perf_counter()
+                cached.append(self._cached_response(item, context))
+                lookup_seconds.append(time.perf_counter() - started)
+            pending = [
+                item
+                for item, response in zip(prepared, cached, strict=True)
+                if response is None
+            ]
+            session_started = time.perf_counter()
+            stream = (
+                _multipage_tiff([item.ocr_image for item in pending])
+                if pending
+                else b""
+            )
+        responses = iter(
+            _run_session(stream, len(pending), context) if pending else ()
+        )
+        session_seconds = time.perf_counter() - session_started
+        outcomes: list[TargetRecognition] = []
+        for item, response, prepare, lookup in zip(
+            prepared,
+            cached,
+            prepare_seconds,
+            lookup_seconds,
+            strict=True,
+        ):
+            if response is not None:
+                outcomes.append(
+                    self._target_recognition(
+                        item,
+                        response,
+                        context,
+                        prepare_seconds=prepare,
+                        engine_seconds=lookup,
+                        session_regions=0,
+                        response_cached=True,
+                    )
+                )
+                continue
+            response = next(responses)
+            outcomes.append(
+                self._target_recognition(
+                    item,
+                    response,
+                    context,
+                    prepare_seconds=prepare,
+                    engine_seconds=lookup + session_seconds,
+                    session_regions=len(pending),
+                )
+            )
+            self._store_response(item, response, context)
+        return outcomes
+
+
+def _contiguous_groups(
+    targets: Sequence[OcrRegion | None],
+    group_count: int,
+) -> list[tuple[OcrRegion | None, ...]]:
+    size = max(1, math.ceil(len(targets) / group_count))
+    return [
+        tuple(targets[start : start + size])
+        for start in range(0, len(targets), size)
+    ]
+
+
+def _multipage_tiff(images: Sequence[Image.Image]) -> bytes:
+    first, *rest = images
+    buffer = io.BytesIO()
+    try:
+        first.save(
+            buffer,
+            format="TIFF",
+            save_all=True,
+            append_images=rest,
+            compression="raw",
+        )
+    except (MemoryError, OSError, ValueError) as exc:
+        raise OcrBackendError(
+            "ocr_working_raster_failure",
+            f"Tesseract session input could not be encoded: {exc}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    return buffer.getvalue()
+
+
+def _run_session(
+    stream: bytes,
+    page_count: int,
+    context: RecognitionContext,
+) -> list[dict[str, list[object]]]:
+    options = context.options
+    timeout = options.timeout_seconds * page_count
+    command = [
+        context.resolved_executable,
+        "stdin",
+        "stdout",
+        "-l",
+        context.language_spec,
+        "-c",
+        "tessedit_create_tsv=1",
+        *shlex.split(context.config, posix=os.name != "nt"),
+    ]
+    try:
+        completed = subprocess.run(
+            command,
+            input=stream,
+            capture_output=True,
+            check=False,
+            timeout=timeout,
+        )
+    except FileNotFoundError as exc:
+        raise OcrBackendError(
+            "ocr_executable_missing",
+            "Tesseract executable became unavailable: "
+            f"{context.resolved_executable}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    except subprocess.TimeoutExpired as exc:
+        raise OcrBackendError(
+            "ocr_timeout",
+            f"Tesseract exceeded {timeout:g} seconds for {page_count} crops",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    except OSError as exc:
+        raise OcrBackendError(
+            "ocr_engine_failure",
+            f"Tesseract OCR process could not start: {exc}",
+            provider=TESSERACT_PROVIDER,
+        ) from exc
+    if completed.returncode != 0:
+        detail = completed.stderr.decode("utf-8", errors="replace").strip()
+        raise OcrBackendError(
+            "ocr_engine_failure",
+            f"Tesseract OCR process failed with exit code {completed.returncode}: "
+            f"{detail[-_STDERR_EXCERPT_CHARS:]}",
+            provider=TESSERACT_PROVIDER,
+        )
+    return _page_responses(
+        completed.stdout.decode("utf-8", errors="replace"),
+        page_count,
+    )
+
+
+def _page_responses(tsv: str, page_count: int) -> list[dict[str, list[object]]]:
+    # The same TSV conversion as pytesseract's dictionary output keeps token
+    # confidence and geometry identical to the per-crop backend.
+    columns = tsv_columns(tsv)
+    page_numbers = columns.get("page_num", [])
+    if any(len(values) != len(page_numbers) for values in columns.values()):
+        raise OcrBackendError(
+            "ocr_invalid_response",
+            "Tesseract TSV columns have inconsistent lengths",
+            provider=TESSERACT_PROVIDER,
+        )
+    names = tuple(columns) or TSV_COLUMNS
+    responses: list[dict[str, list[object]]] = [
+        {name: [] for name in names} for _ in range(page_count)
+    ]
+    for index, page_number in enumerate(page_numbers):
+        if (
+            isinstance(page_number, bool)
+            or not isinstance(page_number, int)
+            or not 1 <= page_number <= page_count
+        ):
+            raise OcrBackendError(
+                "ocr_invalid_response",
+                f"Tesseract TSV page number is outside the session: {page_number!r}",
+                provider=TESSERACT_PROVIDER,
+            )
+        response = responses[page_number - 1]
+        for name in names:
+            response[name].append(columns[name][index])
+    return responses
+
+
+__all__ = [
+    "TESSERACT_BATCH_SESSION_VERSION",
+    "TesseractBatchOcrBackend",
+]
@@ -0,0 +1,112 @@
+"""Recognition plumbing shared by the per-crop and batched Tesseract backends.
+
+This module is internal to the Tesseract adapters and is not re-exported.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, TypeVar
+
+from aiteqno.ports.ocr import OcrOptions, OcrToken
+
+if TYPE_CHECKING:
+    from aiteqno.adapters.tesseract import (
+        TesseractCropPaddingTargetEvidence,
+        TesseractCropTransformEvidence,
+        TesseractRegionTimingEvidence,
+    )
+
+
+TSV_COLUMNS = ("text", "conf", "left", "top", "width", "height")
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RecognitionContext:
+    """Per-invocation engine settings resolved once before any crop runs."""
+
+    resolved_executable: str
+    language_spec: str
+    config: str
+    languages: tuple[str, ...]
+    provider_version: str
+    model: str
+    options: OcrOptions
+    parameters_digest: str
+    source_effective_dpi: float
+    effective_ocr_dpi: int
+    response_cache_namespace: str | None = None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TargetRecognition:
+    """Restored tokens and evidence for one planned OCR target."""
+
+    tokens: tuple[OcrToken, ...]
+    transform: TesseractCropTransformEvidence
+    padding: TesseractCropPaddingTargetEvidence
+    timing: TesseractRegionTimingEvidence
+    response_cached: bool = False
+
+
+def ordered_results(
+    function: Callable[[_T], _R],
+    items: Sequence[_T],
+    *,
+    max_workers: int,
+) -> list[_R]:
+    """Map ``function`` over ``items`` on up to ``max_workers`` threads."""
+
+    # Results are collected in planned order, so the first failing item raises
+    # exactly as it would sequentially; pending items are cancelled and running
+    # ones release their rasters before this returns.
+    worker_count = min(max_workers, len(items))
+    if worker_count <= 1:
+        return [function(item) for item in items]
+    executor = ThreadPoolExecutor(
+        max_workers=worker_count,
+        thread_name_prefix="aiteqno-tesseract",
+    )
+    try:
+        futures = [executor.submit(function, item) for item in items]
+        return [future.result() for future in futures]
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def tsv_columns(tsv: str) -> dict[str, list[object]]:
+    """Parse Tesseract TSV output into columns like pytesseract's DICT output.
+
+    Numeric cells become ``int`` (through ``float`` so ``-1`` and ``96.5``
+    parse); the last column is text and stays a string. A final row missing
+    its empty text cell is completed, as Tesseract omits trailing empty text.
+    """
+
+    rows = [row.split("\t") for row in tsv.strip().split("\n")]
+    if len(rows) < 2:
+        return {}
+    header = rows.pop(0)
+    if len(rows[-1]) < len(header):
+        rows[-1].append("")
+    text_index = len(header) - 1
+    columns: dict[str, list[object]] = {}
+    for index, name in enumerate(header):
+        values: list[object] = []
+        for row in rows:
+            if len(row) <= index:
+                continue
+            cell = row[index]
+            values.append(cell if index == text_index else _tsv_number(cell))
+        columns[name] = values
+    return columns
+
+
+def _tsv_number(cell: str) -> object:
+    try:
+        return int(float(cell))
+    except (ValueError, OverflowError):
+        return cell
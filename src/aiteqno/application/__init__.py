@@ -13,11 +13,14 @@ from .baseline import (
     normalize_source_text,
     source_character_accuracy,
 )
+from .edit_distance import levenshtein_difference_runs, levenshtein_distance
 from .extract import (
     EXTRACTION_PROVIDER,
     EXTRACTION_PROVIDER_VERSION,
     PAGE_COVERING_IMAGE_FRACTION,
     ExtractionDiagnostic,
+    ExtractionStageCache,
+    ExtractionStageTiming,
     PngExtractionError,
     PngExtractionResult,
     extract_png,
@@ -99,6 +102,7 @@ from .table_topology import (
     TABLE_TOPOLOGY_PARAMETERS_DIGEST,
     infer_table_topology,
 )
+from .text_matching import DEFAULT_TEXT_MATCHER, LongestBlockTextMatcher
 
 __all__ = [
     "DEFAULT_LOGICAL_BLOCK_ACCURACY_THRESHOLD",
@@ -109,8 +113,11 @@ __all__ = [
     "EXTRACTION_PROVIDER_VERSION",
     "PAGE_COVERING_IMAGE_FRACTION",
     "ExtractionDiagnostic",
+    "ExtractionStageCache",
+    "ExtractionStageTiming",
     "COMPONENT_WEIGHTS",
     "DEFAULT_RESTORATION_THRESHOLD",
+    "DEFAULT_TEXT_MATCHER",
     "DEFAULT_LOW_CONFIDENCE_THRESHOLD",
     "DEFAULT_MINIMUM_LOGICAL_BLOCK_COVERAGE",
     "DEFAULT_MINIMUM_TEXT_ACCURACY",
@@ -120,6 +127,7 @@ __all__ = [
     "EvaluationConfig",
     "GEOMETRY_CENTER_WEIGHT",
     "GEOMETRY_IOU_WEIGHT",
+    "LongestBlockTextMatcher",
     "MIN_TEXT_ELEMENT_SIMILARITY",
     "OCR_QUALITY_EVALUATOR_NAME",
     "OCR_QUALITY_EVALUATOR_VERSION",
@@ -177,5 +185,7 @@ __all__ = [
     "render_docx",
     "render_preview",
     "source_character_accuracy",
+    "levenshtein_difference_runs",
+    "levenshtein_distance",
     "ocr_character_accuracy",
 ]
@@ -8,6 +8,7 @@ import unicodedata
 from dataclasses import dataclass
 from typing import Final, Sequence
 
+from aiteqno.application.edit_distance import levenshtein_distance
 from aiteqno.domain import (
     DocumentIR,
     ElementType,
@@ -169,7 +170,7 @@ def source_character_accuracy(expected: str, observed: str) -> float:
     denominator = max(len(normalized_expected), len(normalized_observed))
     if denominator == 0:
         return 0.0
-    distance = _levenshtein_distance(normalized_expected, normalized_observed)
+    distance = levenshtein_distance(normalized_expected, normalized_observed)
     return round(100 * max(0.0, 1.0 - distance / denominator), 6)
 
 
@@ -877,23 +878,6 @@ def _f1(*, expected: int, observed: int, matched: int) -> float:
     return 2 * precision * recall / (precision + recall)
 
 
-def _levenshtein_distance(expected: str, observed: str) -> int:
-    if len(expected) < len(observed):
-        expected, observed = observed, expected
-    previous = list(range(len(observed) + 1))
-    for expected_index, expected_character in enumerate(expected, start=1):
-        current = [expected_index]
-        for observed_index, observed_character in enumerate(observed, start=1):
-            insertion = current[observed_index - 1] + 1
-            deletion = previous[observed_index] + 1
-            substitution = previous[observed_index - 1] + (
-                expected_character != observed_character
-            )
-            current.append(min(insertion, deletion, substitution))
-        previous = current
-    return previous[-1]
-
-
 __all__ = [
     "DEFAULT_LOGICAL_BLOCK_ACCURACY_THRESHOLD",
     "DEFAULT_SOURCE_BASELINE_COMPONENT_MINIMA",
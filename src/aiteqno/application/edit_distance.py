@@ -0,0 +1,183 @@
+"""Unit-cost Levenshtein scoring and difference runs shared by text evaluators."""
+
+from __future__ import annotations
+
+import math
+
+
+def levenshtein_distance(
+    expected: str,
+    observed: str,
+    *,
+    max_distance: int | None = None,
+) -> int:
+    """Return the insert/delete/substitute distance between two strings.
+
+    The distance is computed column by column with the Myers/Hyyrö
+    bit-parallel recurrence, so each character of the longer string costs a
+    few big-integer operations instead of one Python step per cell. With
+    ``max_distance``, the length difference and a running lower bound stop
+    the scan early; any distance above the limit is reported as
+    ``max_distance + 1``.
+    """
+
+    if not isinstance(expected, str) or not isinstance(observed, str):
+        raise TypeError("edit-distance inputs must be strings")
+    if max_distance is not None:
+        if isinstance(max_distance, bool) or not isinstance(max_distance, int):
+            raise TypeError("max_distance must be an integer or None")
+        if max_distance < 0:
+            raise ValueError("max_distance must not be negative")
+    text, pattern = (
+        (expected, observed) if len(expected) >= len(observed) else (observed, expected)
+    )
+    limit = math.inf if max_distance is None else max_distance
+    if len(text) - len(pattern) > limit:
+        return max_distance + 1  # type: ignore[operator]
+    if not pattern:
+        return len(text)
+
+    masks = _character_masks(pattern)
+    full = (1 << len(pattern)) - 1
+    positive = full
+    negative = 0
+    for index, character in enumerate(text, start=1):
+        positive, negative = _advance(
+            positive, negative, masks.get(character, 0), full
+        )
+        # The column ends at distance(text[:index], pattern), and each of the
+        # remaining columns lowers the final distance by at most one.
+        if max_distance is not None and (
+            index + positive.bit_count() - negative.bit_count()
+            - (len(text) - index)
+            > max_distance
+        ):
+            return max_distance + 1
+    return len(text) + positive.bit_count() - negative.bit_count()
+
+
+def levenshtein_difference_runs(
+    expected: str,
+    observed: str,
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Return maximal missing and extra runs along one minimal alignment.
+
+    The alignment is the one traced back from the end of the full dynamic
+    programming matrix, preferring a match, then a substitution, then a
+    deletion, then an insertion. Matrix rows are never materialized: each row
+    is two bit vectors of the bit-parallel recurrence, any cell is a popcount
+    away, and only every ``sqrt(len(expected))``-th row is kept on the
+    forward pass. Each band of rows is recomputed from its checkpoint while
+    tracing back, so memory grows with ``sqrt(n) * m`` bits for the same
+    alignment the full matrix would give.
+    """
+
+    if not isinstance(expected, str) or not isinstance(observed, str):
+        raise TypeError("edit-distance inputs must be strings")
+    masks = _character_masks(observed)
+    full = (1 << len(observed)) - 1
+    band = math.isqrt(len(expected)) + 1
+    checkpoints: list[tuple[int, int]] = []
+    vectors = (full, 0)
+    for index in range(len(expected) + 1):
+        if index:
+            vectors = _advance(*vectors, masks.get(expected[index - 1], 0), full)
+        if index % band == 0:
+            checkpoints.append(vectors)
+
+    edits: list[tuple[bool, str, str]] = []
+    expected_index = len(expected)
+    observed_index = len(observed)
+    while expected_index:
+        start = (expected_index - 1) // band * band
+        rows = [checkpoints[start // band]]
+        for index in range(start + 1, expected_index + 1):
+            rows.append(_advance(*rows[-1], masks.get(expected[index - 1], 0), full))
+        while expected_index > start:
+            row = expected_index - start
+            cost = _cell(rows[row], expected_index, observed_index)
+            expected_character = expected[expected_index - 1]
+            if observed_index and cost == _cell(
+                rows[row - 1], expected_index - 1, observed_index - 1
+            ) + (expected_character != observed[observed_index - 1]):
+                edits.append(
+                    (
+                        expected_character == observed[observed_index - 1],
+                        expected_character,
+                        observed[observed_index - 1],
+                    )
+                )
+                expected_index -= 1
+                observed_index -= 1
+            elif cost == _cell(rows[row - 1], expected_index - 1, observed_index) + 1:
+                edits.append((False, expected_character, ""))
+                expected_index -= 1
+            else:
+                edits.append((False, "", observed[observed_index - 1]))
+                observed_index -= 1
+    edits.extend(
+        (False, "", observed[index - 1]) for index in range(observed_index, 0, -1)
+    )
+
+    missing: list[str] = []
+    extra: list[str] = []
+    missing_run: list[str] = []
+    extra_run: list[str] = []
+
+    def flush() -> None:
+        if missing_run:
+            missing.append("".join(missing_run))
+            missing_run.clear()
+        if extra_run:
+            extra.append("".join(extra_run))
+            extra_run.clear()
+
+    for equal, expected_character, observed_character in reversed(edits):
+        if equal:
+            flush()
+        else:
+            if expected_character:
+                missing_run.append(expected_character)
+            if observed_character:
+                extra_run.append(observed_character)
+    flush()
+    return tuple(missing), tuple(extra)
+
+
+def _character_masks(pattern: str) -> dict[str, int]:
+    masks: dict[str, int] = {}
+    for index, character in enumerate(pattern):
+        masks[character] = masks.get(character, 0) | (1 << index)
+    return masks
+
+
+def _advance(positive: int, negative: int, equal: int, full: int) -> tuple[int, int]:
+    # One Myers/Hyyrö column step. Bit k of the vectors is the +1/-1 change
+    # from pattern prefix k to k + 1 within the column; row zero grows by one
+    # per column, so a positive horizontal delta is shifted in at the bottom.
+    vertical = equal | negative
+    horizontal = (((equal & positive) + positive) ^ positive) | equal
+    horizontal_positive = negative | (~(horizontal | positive) & full)
+    horizontal_negative = positive & horizontal
+    horizontal_positive = ((horizontal_positive << 1) | 1) & full
+    horizontal_negative = (horizontal_negative << 1) & full
+    return (
+        horizontal_negative | (~(vertical | horizontal_positive) & full),
+        horizontal_positive & vertical,
+    )
+
+
+def _cell(vectors: tuple[int, int], column: int, prefix: int) -> int:
+    # distance(text[:column], pattern[:prefix]) from one column's vectors.
+    mask = (1 << prefix) - 1
+    return (
+        column
+        + (vectors[0] & mask).bit_count()
+        - (vectors[1] & mask).bit_count()
+    )
+
+
+__all__ = [
+    "levenshtein_difference_runs",
+    "levenshtein_distance",
+]
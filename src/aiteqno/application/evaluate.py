@@ -2,14 +2,16 @@
 
 from __future__ import annotations
 
+import bisect
 import math
 import unicodedata
-from collections.abc import Iterable, Sequence
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
 from dataclasses import dataclass
-from difflib import SequenceMatcher
 from os import PathLike
 from typing import Final
 
+from aiteqno.application.text_matching import DEFAULT_TEXT_MATCHER
 from aiteqno.domain import (
     DocumentIR,
     ElementType,
@@ -22,6 +24,7 @@ from aiteqno.ports import DocxRenderReport
 from aiteqno.ports.evaluation import (
     ComponentScore,
     DocxObserver,
+    ElementAssignment,
     ElementMatch,
     EvaluationReference,
     EvaluationState,
@@ -34,6 +37,7 @@ from aiteqno.ports.evaluation import (
     RestorationEvaluationResult,
     SnapshotObservation,
     StructuralRelationship,
+    TextMatcher,
 )
 
 
@@ -68,9 +72,19 @@ _SOURCE_BACKGROUND_WARNING_CODE: Final = "source_page_background_rejected"
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class EvaluationConfig:
-    """The configurable V1 pass threshold; metric weights remain contractual."""
+    """The configurable V1 pass threshold; metric weights remain contractual.
+
+    ``element_assignment`` defaults to the frozen V1 greedy matching rule.
+    ``ElementAssignment.OPTIMAL`` instead maximizes the total similarity of
+    the matched pairs and is recorded in the evaluation artifact.
+    ``text_matcher`` counts matched characters for every text similarity; the
+    default reproduces the V1 ``SequenceMatcher`` ratio exactly, and any other
+    matcher's type is recorded in the evaluation artifact.
+    """
 
     threshold: float = DEFAULT_RESTORATION_THRESHOLD
+    element_assignment: ElementAssignment = ElementAssignment.GREEDY
+    text_matcher: TextMatcher = DEFAULT_TEXT_MATCHER
 
     def __post_init__(self) -> None:
         if isinstance(self.threshold, bool) or not isinstance(
@@ -83,6 +97,16 @@ class EvaluationConfig:
                 "evaluation threshold must be finite and between 0 and 100"
             )
         object.__setattr__(self, "threshold", threshold)
+        if not isinstance(self.element_assignment, ElementAssignment):
+            try:
+                assignment = ElementAssignment(self.element_assignment)
+            except (TypeError, ValueError) as exc:
+                raise ValueError(
+                    "element assignment must be greedy or optimal"
+                ) from exc
+            object.__setattr__(self, "element_assignment", assignment)
+        if not callable(getattr(self.text_matcher, "matched_characters", None)):
+            raise TypeError("text_matcher must provide matched_characters()")
 
 
 def normalize_evaluation_text(value: str) -> str:
@@ -279,7 +303,11 @@ def evaluate_restoration_input(
 
     reference = evaluation_input.reference
     observation = evaluation_input.observation
-    matches = _match_elements(evaluation_input)
+    matches = _match_elements(
+        evaluation_input,
+        config.element_assignment,
+        config.text_matcher,
+    )
     matched_reference_ids = {item.reference_id for item in matches}
     matched_observed_ids = {item.observed_id for item in matches}
     missing_ids = tuple(
@@ -297,7 +325,11 @@ def evaluate_restoration_input(
         )
     )
 
-    text_score = 100 * _text_similarity(reference.elements, observation.elements)
+    text_score = 100 * _text_similarity(
+        reference.elements,
+        observation.elements,
+        config.text_matcher,
+    )
     element_score = 100 * _f1(
         expected=len(reference.elements),
         observed=len(observation.elements),
@@ -396,45 +428,285 @@ def evaluate_restoration_input(
         state=state,
         reasons=tuple(reasons),
         required_human_checks=pending_checks,
+        element_assignment=config.element_assignment,
+        text_matcher=(
+            None
+            if config.text_matcher is DEFAULT_TEXT_MATCHER
+            else _matcher_identifier(config.text_matcher)
+        ),
     )
 
 
+def _matcher_identifier(matcher: TextMatcher) -> str:
+    matcher_type = type(matcher)
+    return f"{matcher_type.__module__}.{matcher_type.__qualname__}"
+
+
 def _match_elements(
     evaluation_input: RestorationEvaluationInput,
+    assignment: ElementAssignment = ElementAssignment.GREEDY,
+    matcher: TextMatcher = DEFAULT_TEXT_MATCHER,
 ) -> tuple[ElementMatch, ...]:
     report = evaluation_input.render_report
     rendered_ids = set(report.rendered_element_ids) - set(report.omitted_element_ids)
+    candidates = _candidate_pairs(
+        tuple(
+            expected
+            for expected in evaluation_input.reference.elements
+            if expected.id in rendered_ids
+        ),
+        evaluation_input.observation.elements,
+        matcher,
+    )
+    if assignment is ElementAssignment.OPTIMAL:
+        assigned = _optimal_assignment(candidates)
+    else:
+        assigned = _greedy_assignment(candidates)
+    matches = [
+        ElementMatch(
+            reference_id=reference_id,
+            observed_id=observed_id,
+            similarity=round(similarity, 6),
+        )
+        for similarity, reference_id, observed_id in assigned
+    ]
+    return tuple(sorted(matches, key=lambda item: item.reference_id))
+
+
+def _candidate_pairs(
+    expected_elements: Sequence[ReferenceElement],
+    observed_elements: Sequence[ObservedElement],
+    matcher: TextMatcher = DEFAULT_TEXT_MATCHER,
+) -> list[tuple[float, str, str]]:
+    # Pairs on different pages or of different types never match, so both
+    # sides are blocked by (page, type) first. Within a text block, a pair is
+    # only scored when a cheap bound on the similarity ratio can still reach
+    # the text threshold: the length bound narrows the observed texts to a
+    # bisected range, and the shared character multiset bound, which is
+    # SequenceMatcher.quick_ratio(), rejects most of the rest. A TextMatcher
+    # never matches more than the shared multiset, so both are upper bounds
+    # and the surviving candidates are exactly those a full scan would keep.
+    blocks: dict[tuple[int, ElementType], list[ObservedElement]] = {}
+    for observed in observed_elements:
+        blocks.setdefault((observed.page_number, observed.element_type), []).append(
+            observed
+        )
     candidates: list[tuple[float, str, str]] = []
-    for expected in evaluation_input.reference.elements:
-        if expected.id not in rendered_ids:
+    text_blocks: dict[tuple[int, ElementType], _TextBlock] = {}
+    for expected in expected_elements:
+        key = (expected.page_number, expected.element_type)
+        block = blocks.get(key, ())
+        if expected.element_type is not ElementType.TEXT:
+            for observed in block:
+                similarity = _element_pair_similarity(expected, observed)
+                if similarity is not None:
+                    candidates.append((similarity, expected.id, observed.id))
             continue
-        for observed in evaluation_input.observation.elements:
-            similarity = _element_pair_similarity(expected, observed)
+        text_block = text_blocks.get(key)
+        if text_block is None:
+            text_block = text_blocks[key] = _TextBlock(block, matcher)
+        expected_text = _TextProfile(expected.text or "")
+        for observed, observed_text in text_block.candidates(expected_text):
+            similarity = _element_pair_similarity(
+                expected,
+                observed,
+                text_similarity=text_block.similarity(expected_text, observed_text),
+            )
             if similarity is not None:
                 candidates.append((similarity, expected.id, observed.id))
-    candidates.sort(key=lambda item: (-item[0], item[1], item[2]))
+    return candidates
+
+
+class _TextProfile:
+    __slots__ = ("characters", "length", "text")
+
+    def __init__(self, text: str) -> None:
+        self.text = normalize_evaluation_text(text)
+        self.length = len(self.text)
+        self.characters = Counter(self.text)
 
+    def may_reach(self, other: _TextProfile, threshold: float) -> bool:
+        shared = sum((self.characters & other.characters).values())
+        return 2.0 * shared / (self.length + other.length) >= threshold
+
+
+class _TextBlock:
+    __slots__ = ("_lengths", "_matcher", "_profiles")
+
+    def __init__(
+        self,
+        elements: Sequence[ObservedElement],
+        matcher: TextMatcher,
+    ) -> None:
+        profiled = sorted(
+            ((element, _TextProfile(element.text or "")) for element in elements),
+            key=lambda item: item[1].length,
+        )
+        self._profiles = profiled
+        self._lengths = [profile.length for _, profile in profiled]
+        self._matcher = matcher
+
+    def candidates(
+        self,
+        expected: _TextProfile,
+    ) -> Iterator[tuple[ObservedElement, _TextProfile]]:
+        # An empty text scores 1.0 only against another empty text and 0.0
+        # against anything else, so each side only meets its own kind.
+        threshold = MIN_TEXT_ELEMENT_SIMILARITY
+        if not expected.length:
+            yield from self._profiles[: bisect.bisect_right(self._lengths, 0)]
+            return
+        # 2 * min(a, b) / (a + b) >= t bounds b to [a * t / (2 - t),
+        # a * (2 - t) / t]; one unit of slack absorbs float rounding.
+        low = max(1.0, expected.length * threshold / (2 - threshold) - 1)
+        high = expected.length * (2 - threshold) / threshold + 1
+        for element, profile in self._profiles[
+            bisect.bisect_left(self._lengths, low) : bisect.bisect_right(
+                self._lengths, high
+            )
+        ]:
+            if expected.may_reach(profile, threshold):
+                yield element, profile
+
+    def similarity(self, expected: _TextProfile, observed: _TextProfile) -> float:
+        if not expected.length and not observed.length:
+            return 1.0
+        if not expected.length or not observed.length:
+            return 0.0
+        return _ratio(
+            self._matcher.matched_characters(expected.text, observed.text),
+            expected.length + observed.length,
+        )
+
+
+def _greedy_assignment(
+    candidates: list[tuple[float, str, str]],
+) -> list[tuple[float, str, str]]:
+    candidates.sort(key=lambda item: (-item[0], item[1], item[2]))
     used_reference: set[str] = set()
     used_observed: set[str] = set()
-    matches: list[ElementMatch] = []
+    assigned: list[tuple[float, str, str]] = []
     for similarity, reference_id, observed_id in candidates:
         if reference_id in used_reference or observed_id in used_observed:
             continue
         used_reference.add(reference_id)
         used_observed.add(observed_id)
-        matches.append(
-            ElementMatch(
-                reference_id=reference_id,
-                observed_id=observed_id,
-                similarity=round(similarity, 6),
-            )
-        )
-    return tuple(sorted(matches, key=lambda item: item.reference_id))
+        assigned.append((similarity, reference_id, observed_id))
+    return assigned
+
+
+def _optimal_assignment(
+    candidates: list[tuple[float, str, str]],
+) -> list[tuple[float, str, str]]:
+    # Candidate pairs form a sparse bipartite graph. Each connected component
+    # is solved independently with the Hungarian method over reference and
+    # observed IDs in sorted order, which keeps the result deterministic.
+    parents: dict[tuple[int, str], tuple[int, str]] = {}
+
+    def root(node: tuple[int, str]) -> tuple[int, str]:
+        parents.setdefault(node, node)
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    for _, reference_id, observed_id in candidates:
+        first, second = root((0, reference_id)), root((1, observed_id))
+        if first != second:
+            parents[max(first, second)] = min(first, second)
+    components: dict[tuple[int, str], list[tuple[float, str, str]]] = {}
+    for candidate in candidates:
+        components.setdefault(root((0, candidate[1])), []).append(candidate)
+
+    assigned: list[tuple[float, str, str]] = []
+    for component in components.values():
+        reference_ids = sorted({item[1] for item in component})
+        observed_ids = sorted({item[2] for item in component})
+        rows = {value: index for index, value in enumerate(reference_ids)}
+        columns = {value: index for index, value in enumerate(observed_ids)}
+        weights: list[list[float | None]] = [
+            [None] * len(observed_ids) for _ in reference_ids
+        ]
+        for similarity, reference_id, observed_id in component:
+            weights[rows[reference_id]][columns[observed_id]] = similarity
+        for row, column in _maximum_weight_matching(weights):
+            similarity = weights[row][column]
+            assert similarity is not None
+            assigned.append((similarity, reference_ids[row], observed_ids[column]))
+    return assigned
+
+
+def _maximum_weight_matching(
+    weights: list[list[float | None]],
+) -> list[tuple[int, int]]:
+    # Kuhn-Munkres with potentials on a square cost matrix; absent pairs cost
+    # nothing and are dropped from the result.
+    row_count = len(weights)
+    column_count = len(weights[0])
+    size = max(row_count, column_count)
+    costs = [[0.0] * (size + 1) for _ in range(size + 1)]
+    for row, row_weights in enumerate(weights, start=1):
+        for column, weight in enumerate(row_weights, start=1):
+            if weight is not None:
+                costs[row][column] = -weight
+
+    row_potential = [0.0] * (size + 1)
+    column_potential = [0.0] * (size + 1)
+    owner = [0] * (size + 1)
+    way = [0] * (size + 1)
+    for row in range(1, size + 1):
+        owner[0] = row
+        column = 0
+        minimum = [math.inf] * (size + 1)
+        used = [False] * (size + 1)
+        while True:
+            used[column] = True
+            current_row = owner[column]
+            current_costs = costs[current_row]
+            current_potential = row_potential[current_row]
+            delta = math.inf
+            next_column = 0
+            for candidate in range(1, size + 1):
+                if used[candidate]:
+                    continue
+                reduced = (
+                    current_costs[candidate]
+                    - current_potential
+                    - column_potential[candidate]
+                )
+                if reduced < minimum[candidate]:
+                    minimum[candidate] = reduced
+                    way[candidate] = column
+                if minimum[candidate] < delta:
+                    delta = minimum[candidate]
+                    next_column = candidate
+            for candidate in range(size + 1):
+                if used[candidate]:
+                    row_potential[owner[candidate]] += delta
+                    column_potential[candidate] -= delta
+                else:
+                    minimum[candidate] -= delta
+            column = next_column
+            if owner[column] == 0:
+                break
+        while column:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+    return [
+        (owner[column] - 1, column - 1)
+        for column in range(1, size + 1)
+        if owner[column] - 1 < row_count
+        and column - 1 < column_count
+        and weights[owner[column] - 1][column - 1] is not None
+    ]
 
 
 def _element_pair_similarity(
     expected: ReferenceElement,
     observed: ObservedElement,
+    *,
+    text_similarity: float | None = None,
 ) -> float | None:
     if (
         expected.element_type is not observed.element_type
@@ -448,7 +720,10 @@ def _element_pair_similarity(
     )
     source_matches = observed.source_element_id == expected.id
     if expected.element_type is ElementType.TEXT:
-        text_similarity = _string_similarity(expected.text or "", observed.text or "")
+        if text_similarity is None:
+            text_similarity = _string_similarity(
+                expected.text or "", observed.text or ""
+            )
         if text_similarity < MIN_TEXT_ELEMENT_SIMILARITY:
             return None
         return min(
@@ -475,10 +750,11 @@ def _element_pair_similarity(
 def _text_similarity(
     expected: Sequence[ReferenceElement],
     observed: Sequence[ObservedElement],
+    matcher: TextMatcher = DEFAULT_TEXT_MATCHER,
 ) -> float:
     expected_text = _combined_text(expected)
     observed_text = _combined_text(observed)
-    return _string_similarity(expected_text, observed_text)
+    return _string_similarity(expected_text, observed_text, matcher)
 
 
 def _combined_text(
@@ -495,19 +771,26 @@ def _combined_text(
     return normalize_evaluation_text("\n".join(element.text or "" for element in texts))
 
 
-def _string_similarity(expected: str, observed: str) -> float:
+def _string_similarity(
+    expected: str,
+    observed: str,
+    matcher: TextMatcher = DEFAULT_TEXT_MATCHER,
+) -> float:
     normalized_expected = normalize_evaluation_text(expected)
     normalized_observed = normalize_evaluation_text(observed)
     if not normalized_expected and not normalized_observed:
         return 1.0
     if not normalized_expected or not normalized_observed:
         return 0.0
-    return SequenceMatcher(
-        None,
-        normalized_expected,
-        normalized_observed,
-        autojunk=False,
-    ).ratio()
+    return _ratio(
+        matcher.matched_characters(normalized_expected, normalized_observed),
+        len(normalized_expected) + len(normalized_observed),
+    )
+
+
+def _ratio(matches: int, length: int) -> float:
+    # Same expression as difflib's ratio, so scores keep every float bit.
+    return 2.0 * matches / length
 
 
 def _mapped_observed_relationships(
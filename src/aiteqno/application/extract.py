@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import hashlib
+import heapq
+import math
 import re
+import time
+import tracemalloc
+from contextlib import contextmanager
 from dataclasses import dataclass
 from os import PathLike
-from typing import Callable, Sequence
+from typing import Callable, Iterator, Sequence, TypeVar
 
 from aiteqno import __version__
 from aiteqno.domain import (
@@ -13,6 +19,7 @@ from aiteqno.domain import (
     Asset,
     BoundingBox,
     Confidence,
+    DocumentElement,
     DocumentIR,
     DocumentIRValidationError,
     FontStyle,
@@ -26,6 +33,7 @@ from aiteqno.domain import (
     PageSize,
     PixelBoundingBox,
     Point,
+    Provenance,
     RectangleElement,
     RectangleStyle,
     TextAlign,
@@ -35,6 +43,7 @@ from aiteqno.domain import (
 from aiteqno.ports.extraction import (
     AssetEncodingError,
     AssetPayload,
+    BatchImageAssetEncoder,
     BundleWriteError,
     BundleWriteResult,
     DocumentBundleWriter,
@@ -68,7 +77,7 @@ from aiteqno.ports.structure import (
     StructureExtractor,
 )
 
-from .ocr_grouping import plan_ocr_regions
+from .ocr_grouping import OcrRegionGroupingPlan, plan_ocr_regions
 from .table_topology import infer_table_topology
 
 
@@ -80,10 +89,15 @@ _DIAGNOSTIC_CODE_PATTERN = re.compile(r"^[a-z][a-z0-9_]*$")
 _EXTRACTION_STAGES = frozenset(
     {"decode", "structure", "ocr", "asset", "assemble", "validate", "write"}
 )
+_CACHED_STAGES = ("decode", "structure", "region_plan", "ocr")
 _TEXT_Z_INDEX = 30
 _LINE_Z_INDEX = 20
 _IMAGE_Z_INDEX = 10
 _RECTANGLE_Z_INDEX = 0
+_OMITTED_CROP = object()
+
+_T = TypeVar("_T")
+_StageKey = tuple[object, ...]
 
 
 class PngExtractionError(RuntimeError):
@@ -119,13 +133,63 @@ class ExtractionDiagnostic:
             raise ValueError("diagnostic source_ref must be null or non-empty")
 
 
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ExtractionStageTiming:
+    """The measured cost of one completed extraction stage.
+
+    ``wall_seconds`` and ``cpu_seconds`` come from ``time.perf_counter`` and
+    ``time.process_time``. CPU time covers every thread of this process but
+    not OCR engine subprocesses. ``peak_traced_bytes`` is the highest
+    tracemalloc level above the one at stage start, and is ``None`` unless
+    tracemalloc was already tracing. ``item_count`` is what the stage
+    produced: decoded pixels, structure candidates, OCR tokens, encoded assets,
+    page elements, validated elements, or published files.
+    """
+
+    stage: str
+    wall_seconds: float
+    cpu_seconds: float
+    item_count: int
+    peak_traced_bytes: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.stage not in _EXTRACTION_STAGES:
+            raise ValueError("timing stage is not an extraction pipeline stage")
+        for name in ("wall_seconds", "cpu_seconds"):
+            value = getattr(self, name)
+            if (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or not math.isfinite(value)
+                or value < 0
+            ):
+                raise ValueError(f"{name} must be a finite non-negative number")
+            object.__setattr__(self, name, float(value))
+        if not _is_count(self.item_count):
+            raise ValueError("item_count must be a non-negative integer")
+        if self.peak_traced_bytes is not None and not _is_count(
+            self.peak_traced_bytes
+        ):
+            raise ValueError("peak_traced_bytes must be null or a non-negative integer")
+
+    def to_dict(self) -> dict[str, object]:
+        return {
+            "stage": self.stage,
+            "wall_seconds": self.wall_seconds,
+            "cpu_seconds": self.cpu_seconds,
+            "item_count": self.item_count,
+            "peak_traced_bytes": self.peak_traced_bytes,
+        }
+
+
 @dataclass(frozen=True, slots=True, kw_only=True)
 class PngExtractionResult:
-    """The validated semantic model, published paths, and non-fatal diagnostics."""
+    """The validated model, published paths, diagnostics, and stage timings."""
 
     document: DocumentIR
     bundle: BundleWriteResult
     diagnostics: tuple[ExtractionDiagnostic, ...] = ()
+    timings: tuple[ExtractionStageTiming, ...] = ()
 
     def __post_init__(self) -> None:
         if not isinstance(self.document, DocumentIR):
@@ -138,6 +202,71 @@ class PngExtractionResult:
         if any(not isinstance(item, ExtractionDiagnostic) for item in diagnostics):
             raise TypeError("extraction diagnostics contain an invalid value")
         object.__setattr__(self, "diagnostics", diagnostics)
+        if isinstance(self.timings, (str, bytes, bytearray)):
+            raise TypeError("extraction timings must be a sequence")
+        timings = tuple(self.timings)
+        if any(not isinstance(item, ExtractionStageTiming) for item in timings):
+            raise TypeError("extraction timings contain an invalid value")
+        object.__setattr__(self, "timings", timings)
+
+
+class ExtractionStageCache:
+    """Memoize deterministic extraction stages shared by several extractions.
+
+    Decoding, structure detection, OCR region planning, and OCR recognition are
+    keyed by the PNG digest, each stage's configuration, and the identity of the
+    adapters that produced the stage inputs. Arms that differ only in OCR
+    settings therefore share one decode and one structure pass. A cached OCR
+    stage returns its tokens without calling the backend again, so backend
+    observers only see the first recognition. Asset encoding, validation, and
+    bundle publication always run. Cached decoded pixels stay alive until
+    ``clear`` is called or the cache is released.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[_StageKey, tuple[tuple[object, ...], object]] = {}
+        self._hits = dict.fromkeys(_CACHED_STAGES, 0)
+        self._misses = dict.fromkeys(_CACHED_STAGES, 0)
+
+    @property
+    def hits(self) -> dict[str, int]:
+        return dict(self._hits)
+
+    @property
+    def misses(self) -> dict[str, int]:
+        return dict(self._misses)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _memoized(
+        self,
+        stage: str,
+        key: _StageKey,
+        adapters: tuple[object, ...],
+        compute: Callable[[], _T],
+    ) -> _T:
+        # Adapter ids are part of the key; keeping the adapters in the entry
+        # prevents a recycled id from matching a different adapter.
+        entry = self._entries.get((stage, *key))
+        if entry is not None and all(
+            cached is adapter
+            for cached, adapter in zip(entry[0], adapters, strict=True)
+        ):
+            self._hits[stage] += 1
+            return entry[1]  # type: ignore[return-value]
+        self._misses[stage] += 1
+        value = compute()
+        self._entries[(stage, *key)] = (adapters, value)
+        return value
+
+
+@dataclass(frozen=True, slots=True)
+class _StructureStage:
+    lines: tuple[LineCandidate, ...]
+    rectangles: tuple[RectangleCandidate, ...]
+    text_regions: tuple[RegionCandidate, ...]
+    image_regions: tuple[RegionCandidate, ...]
 
 
 @dataclass(frozen=True, slots=True)
@@ -155,6 +284,124 @@ class _TokenRow:
     left: int
 
 
+class _RegionIndex:
+    """A uniform grid over OCR region bboxes, built once per extraction.
+
+    Each region is listed in every square cell its pixels touch, so a point or
+    bbox query only visits regions that share a cell with it. Candidates are
+    returned in their original order, which keeps ``min``/``max`` tie-breaking
+    identical to a scan over all regions.
+    """
+
+    __slots__ = ("_by_ref", "_cell", "_cells", "_regions")
+
+    def __init__(self, regions: Sequence[tuple[str, RegionCandidate]]) -> None:
+        self._regions = tuple(regions)
+        self._by_ref = {region_ref: region for region_ref, region in self._regions}
+        # A cell as large as the mean region keeps the number of cell entries
+        # within a small multiple of the region count.
+        area = sum(
+            region.bbox.width * region.bbox.height for _, region in self._regions
+        )
+        self._cell = max(1, math.isqrt(area // max(1, len(self._regions))))
+        self._cells: dict[tuple[int, int], list[int]] = {}
+        for position, (_, region) in enumerate(self._regions):
+            for key in self._cell_keys(region.bbox):
+                self._cells.setdefault(key, []).append(position)
+
+    def by_ref(self, region_ref: str | None) -> RegionCandidate | None:
+        return self._by_ref.get(region_ref) if region_ref is not None else None
+
+    def near_point(
+        self,
+        x: float,
+        y: float,
+    ) -> tuple[tuple[str, RegionCandidate], ...]:
+        positions = self._cells.get(
+            (math.floor(x) // self._cell, math.floor(y) // self._cell),
+            (),
+        )
+        return tuple(self._regions[position] for position in positions)
+
+    def near_bbox(
+        self,
+        bbox: PixelBoundingBox,
+    ) -> tuple[tuple[str, RegionCandidate], ...]:
+        columns = (bbox.x + bbox.width - 1) // self._cell - bbox.x // self._cell + 1
+        rows = (bbox.y + bbox.height - 1) // self._cell - bbox.y // self._cell + 1
+        if columns * rows >= len(self._regions):
+            return self._regions
+        positions = {
+            position
+            for key in self._cell_keys(bbox)
+            for position in self._cells.get(key, ())
+        }
+        return tuple(self._regions[position] for position in sorted(positions))
+
+    def _cell_keys(self, bbox: PixelBoundingBox) -> Iterator[tuple[int, int]]:
+        cell = self._cell
+        for row in range(bbox.y // cell, (bbox.y + bbox.height - 1) // cell + 1):
+            for column in range(
+                bbox.x // cell,
+                (bbox.x + bbox.width - 1) // cell + 1,
+            ):
+                yield column, row
+
+
+class _StageTimer:
+    """Accumulate wall, CPU, and traced-memory cost per extraction stage.
+
+    A stage may be measured in several segments; ``finish`` closes it, records
+    one ``ExtractionStageTiming``, and hands it to the observer. tracemalloc
+    keeps a single process-wide peak, so each segment calls
+    ``tracemalloc.reset_peak()`` and a caller's own peak does not survive the
+    extraction. A segment during which tracing stops records no peak.
+    """
+
+    __slots__ = ("_observer", "_open", "timings")
+
+    def __init__(
+        self,
+        observer: Callable[[ExtractionStageTiming], None] | None,
+    ) -> None:
+        self._observer = observer
+        self._open: dict[str, list[float | int | None]] = {}
+        self.timings: list[ExtractionStageTiming] = []
+
+    @contextmanager
+    def measure(self, stage: str) -> Iterator[None]:
+        tracing = tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.reset_peak()
+            traced_at_start = tracemalloc.get_traced_memory()[0]
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        yield
+        cpu = time.process_time() - cpu
+        wall = time.perf_counter() - wall
+        peak = None
+        if tracing and tracemalloc.is_tracing():
+            peak = max(0, tracemalloc.get_traced_memory()[1] - traced_at_start)
+        totals = self._open.setdefault(stage, [0.0, 0.0, None])
+        totals[0] += wall
+        totals[1] += cpu
+        if peak is not None:
+            totals[2] = max(peak, totals[2] or 0)
+
+    def finish(self, stage: str, item_count: int) -> None:
+        wall, cpu, peak = self._open.pop(stage)
+        timing = ExtractionStageTiming(
+            stage=stage,
+            wall_seconds=wall,
+            cpu_seconds=cpu,
+            item_count=item_count,
+            peak_traced_bytes=peak,
+        )
+        self.timings.append(timing)
+        if self._observer is not None:
+            self._observer(timing)
+
+
 def extract_png(
     png_data: bytes,
     output_directory: str | PathLike[str],
@@ -171,8 +418,17 @@ def extract_png(
     ocr_region_grouping_observer: Callable[[OcrRegionGroupingEvidence], None]
     | None = None,
     enrich_table_topology: bool = False,
+    stage_cache: ExtractionStageCache | None = None,
+    stage_timing_observer: Callable[[ExtractionStageTiming], None] | None = None,
 ) -> PngExtractionResult:
-    """Extract, schema-validate, and atomically publish one PNG document bundle."""
+    """Extract, schema-validate, and atomically publish one PNG document bundle.
+
+    Every stage is timed into ``PngExtractionResult.timings`` and reported to
+    ``stage_timing_observer`` as soon as it completes, so a failed extraction
+    still reports the stages before the failure. Start ``tracemalloc`` before
+    calling to also record per-stage peak memory. Each stage calls
+    ``tracemalloc.reset_peak()``, so read any peak of your own before calling.
+    """
 
     if not isinstance(png_data, bytes):
         raise TypeError("png_data must be immutable bytes")
@@ -187,66 +443,150 @@ def extract_png(
         raise TypeError("ocr_region_grouping_observer must be callable or None")
     if not isinstance(enrich_table_topology, bool):
         raise TypeError("enrich_table_topology must be a boolean")
+    if stage_cache is not None and not isinstance(stage_cache, ExtractionStageCache):
+        raise TypeError("stage_cache must be an ExtractionStageCache or None")
+    if stage_timing_observer is not None and not callable(stage_timing_observer):
+        raise TypeError("stage_timing_observer must be callable or None")
     diagnostics: list[ExtractionDiagnostic] = []
+    timer = _StageTimer(stage_timing_observer)
 
-    try:
-        image = decoder.decode(png_data)
-    except StructureExtractionError as exc:
-        raise _pipeline_error("decode", exc.code, str(exc)) from exc
-    if not isinstance(image, ImageInput):
-        raise PngExtractionError(
-            "decode_invalid_response",
+    # Keys are only hashed when a cache is supplied.
+    source_digest = (
+        hashlib.sha256(png_data).hexdigest() if stage_cache is not None else None
+    )
+    decode_key: _StageKey = (source_digest, id(decoder))
+    with timer.measure("decode"):
+        image = _cached_stage(
+            stage_cache,
             "decode",
-            "PNG decoder returned an invalid image type",
+            decode_key,
+            (decoder,),
+            lambda: _decoded_image(png_data, decoder),
         )
-
-    try:
-        structure = structure_extractor.detect(image)
-    except StructureExtractionError as exc:
-        raise _pipeline_error("structure", exc.code, str(exc)) from exc
-    _validate_structure_boundary(image, structure)
-
-    lines = _normalize_lines(structure.lines)
-    rectangles = _normalize_rectangles(structure.rectangles)
-    text_regions = _normalize_regions(structure.text_regions)
-    image_regions = _normalize_regions(structure.image_regions)
-    source_region_entries = tuple(
-        (f"p001-text-region-{index:04d}", region)
-        for index, region in enumerate(text_regions)
-    )
-    region_plan = plan_ocr_regions(
-        source_region_entries,
-        lines,
-        config=ocr_region_grouping,
-    )
-    if ocr_region_grouping_observer is not None:
-        ocr_region_grouping_observer(region_plan.evidence)
-    region_entries = tuple(
-        (value.region_ref, value.region) for value in region_plan.regions
+    timer.finish(
+        "decode",
+        image.source.pixel_width * image.source.pixel_height,
     )
-    ocr_regions = tuple(
-        OcrRegion(region_ref=region_ref, bbox=region.bbox)
-        for region_ref, region in region_entries
+    structure_key = (*decode_key, id(structure_extractor))
+    with timer.measure("structure"):
+        structure = _cached_stage(
+            stage_cache,
+            "structure",
+            structure_key,
+            (decoder, structure_extractor),
+            lambda: _structure_stage(image, structure_extractor),
+        )
+    timer.finish(
+        "structure",
+        len(structure.lines)
+        + len(structure.rectangles)
+        + len(structure.text_regions)
+        + len(structure.image_regions),
     )
-
-    try:
-        raw_tokens = tuple(
-            ocr_backend.recognize(
-                image,
-                regions=ocr_regions,
-                languages=normalized_languages,
-                options=ocr_options,
-            )
+    lines = structure.lines
+    rectangles = structure.rectangles
+    image_regions = structure.image_regions
+    plan_key = (*structure_key, ocr_region_grouping)
+    with timer.measure("ocr"):
+        region_plan = _cached_stage(
+            stage_cache,
+            "region_plan",
+            plan_key,
+            (decoder, structure_extractor),
+            lambda: _region_plan(structure, ocr_region_grouping),
         )
-    except OcrBackendError as exc:
-        raise _pipeline_error("ocr", exc.code, str(exc)) from exc
-    if any(not isinstance(token, OcrToken) for token in raw_tokens):
-        raise PngExtractionError(
-            "ocr_invalid_response",
+        if ocr_region_grouping_observer is not None:
+            ocr_region_grouping_observer(region_plan.evidence)
+        region_entries = tuple(
+            (value.region_ref, value.region) for value in region_plan.regions
+        )
+        raw_tokens = _cached_stage(
+            stage_cache,
             "ocr",
-            "OCR backend returned a value that is not an OcrToken",
+            (*plan_key, id(ocr_backend), normalized_languages, ocr_options),
+            (decoder, structure_extractor, ocr_backend),
+            lambda: _recognized_tokens(
+                image,
+                region_entries,
+                ocr_backend,
+                normalized_languages,
+                ocr_options,
+            ),
+        )
+        associated = _associated_tokens(raw_tokens, region_entries, image, diagnostics)
+    timer.finish("ocr", len(raw_tokens))
+
+    with timer.measure("assemble"):
+        text_elements = _text_elements(
+            _reading_order(associated),
+            image,
+            diagnostics,
         )
+        line_elements = _line_elements(lines, image)
+        rectangle_elements = _rectangle_elements(rectangles, image)
+    with timer.measure("asset"):
+        image_elements, assets, asset_payloads = _image_elements(
+            image_regions,
+            image,
+            asset_encoder,
+            diagnostics,
+        )
+    timer.finish("asset", len(assets))
+
+    elements = (
+        *text_elements,
+        *line_elements,
+        *rectangle_elements,
+        *image_elements,
+    )
+    with timer.measure("assemble"):
+        document = _assembled_document(
+            image,
+            elements,
+            assets,
+            enrich_table_topology,
+        )
+    timer.finish("assemble", len(elements))
+
+    with timer.measure("validate"):
+        try:
+            validator.validate(document)
+        except DocumentIRValidationError as exc:
+            raise _pipeline_error(
+                "validate",
+                "document_ir_schema_invalid",
+                str(exc),
+            ) from exc
+        except DocumentIRSchemaError as exc:
+            raise _pipeline_error("validate", exc.code, str(exc)) from exc
+    timer.finish("validate", len(elements))
+
+    with timer.measure("write"):
+        try:
+            bundle = bundle_writer.write(document, asset_payloads, output_directory)
+        except BundleWriteError as exc:
+            raise _pipeline_error("write", exc.code, str(exc)) from exc
+        if not isinstance(bundle, BundleWriteResult):
+            raise PngExtractionError(
+                "bundle_invalid_response",
+                "write",
+                "bundle writer returned an invalid result type",
+            )
+    timer.finish("write", 1 + len(bundle.asset_paths))
+    return PngExtractionResult(
+        document=document,
+        bundle=bundle,
+        diagnostics=tuple(diagnostics),
+        timings=tuple(timer.timings),
+    )
+
 
+def _associated_tokens(
+    raw_tokens: Sequence[OcrToken],
+    region_entries: Sequence[tuple[str, RegionCandidate]],
+    image: ImageInput,
+    diagnostics: list[ExtractionDiagnostic],
+) -> list[_AssociatedToken]:
     tokens_inside_page: list[OcrToken] = []
     for token in raw_tokens:
         if _bbox_inside(token.bbox, image):
@@ -270,10 +610,11 @@ def extract_png(
             )
         )
 
+    region_index = _RegionIndex(region_entries)
     associated: list[_AssociatedToken] = []
     matched_region_refs: set[str] = set()
     for token in normalized_tokens:
-        region_ref, region, inferred = _associate_region(token, region_entries)
+        region_ref, region, inferred = _associate_region(token, region_index)
         associated.append(
             _AssociatedToken(token=token, region_ref=region_ref, region=region)
         )
@@ -315,21 +656,15 @@ def extract_png(
                 message="no OCR token or text region was detected",
             )
         )
+    return associated
 
-    text_elements = _text_elements(
-        _reading_order(associated),
-        image,
-        diagnostics,
-    )
-    line_elements = _line_elements(lines, image)
-    rectangle_elements = _rectangle_elements(rectangles, image)
-    image_elements, assets, asset_payloads = _image_elements(
-        image_regions,
-        image,
-        asset_encoder,
-        diagnostics,
-    )
 
+def _assembled_document(
+    image: ImageInput,
+    elements: tuple[DocumentElement, ...],
+    assets: tuple[Asset, ...],
+    enrich_table_topology: bool,
+) -> DocumentIR:
     try:
         document = DocumentIR(
             ir_version=IR_VERSION,
@@ -344,12 +679,7 @@ def extract_png(
                         height=_pt(image.source.pixel_height, image.source.dpi_y),
                     ),
                     source=image.source,
-                    elements=(
-                        *text_elements,
-                        *line_elements,
-                        *rectangle_elements,
-                        *image_elements,
-                    ),
+                    elements=elements,
                 ),
             ),
             assets=assets,
@@ -377,33 +707,92 @@ def extract_png(
                 "table_topology_inference_invalid",
                 str(exc),
             ) from exc
+    return document
+
+
+def _cached_stage(
+    cache: ExtractionStageCache | None,
+    stage: str,
+    key: _StageKey,
+    adapters: tuple[object, ...],
+    compute: Callable[[], _T],
+) -> _T:
+    if cache is None:
+        return compute()
+    return cache._memoized(stage, key, adapters, compute)
 
-    try:
-        validator.validate(document)
-    except DocumentIRValidationError as exc:
-        raise _pipeline_error(
-            "validate",
-            "document_ir_schema_invalid",
-            str(exc),
-        ) from exc
-    except DocumentIRSchemaError as exc:
-        raise _pipeline_error("validate", exc.code, str(exc)) from exc
 
+def _decoded_image(png_data: bytes, decoder: PngDecoder) -> ImageInput:
     try:
-        bundle = bundle_writer.write(document, asset_payloads, output_directory)
-    except BundleWriteError as exc:
-        raise _pipeline_error("write", exc.code, str(exc)) from exc
-    if not isinstance(bundle, BundleWriteResult):
+        image = decoder.decode(png_data)
+    except StructureExtractionError as exc:
+        raise _pipeline_error("decode", exc.code, str(exc)) from exc
+    if not isinstance(image, ImageInput):
         raise PngExtractionError(
-            "bundle_invalid_response",
-            "write",
-            "bundle writer returned an invalid result type",
+            "decode_invalid_response",
+            "decode",
+            "PNG decoder returned an invalid image type",
         )
-    return PngExtractionResult(
-        document=document,
-        bundle=bundle,
-        diagnostics=tuple(diagnostics),
+    return image
+
+
+def _structure_stage(
+    image: ImageInput,
+    structure_extractor: StructureExtractor,
+) -> _StructureStage:
+    try:
+        structure = structure_extractor.detect(image)
+    except StructureExtractionError as exc:
+        raise _pipeline_error("structure", exc.code, str(exc)) from exc
+    _validate_structure_boundary(image, structure)
+    return _StructureStage(
+        lines=_normalize_lines(structure.lines),
+        rectangles=_normalize_rectangles(structure.rectangles),
+        text_regions=_normalize_regions(structure.text_regions),
+        image_regions=_normalize_regions(structure.image_regions),
+    )
+
+
+def _region_plan(
+    structure: _StructureStage,
+    config: OcrRegionGroupingConfig,
+) -> OcrRegionGroupingPlan:
+    source_region_entries = tuple(
+        (f"p001-text-region-{index:04d}", region)
+        for index, region in enumerate(structure.text_regions)
     )
+    return plan_ocr_regions(source_region_entries, structure.lines, config=config)
+
+
+def _recognized_tokens(
+    image: ImageInput,
+    region_entries: Sequence[tuple[str, RegionCandidate]],
+    ocr_backend: OcrBackend,
+    languages: tuple[str, ...],
+    options: OcrOptions,
+) -> tuple[OcrToken, ...]:
+    ocr_regions = tuple(
+        OcrRegion(region_ref=region_ref, bbox=region.bbox)
+        for region_ref, region in region_entries
+    )
+    try:
+        raw_tokens = tuple(
+            ocr_backend.recognize(
+                image,
+                regions=ocr_regions,
+                languages=languages,
+                options=options,
+            )
+        )
+    except OcrBackendError as exc:
+        raise _pipeline_error("ocr", exc.code, str(exc)) from exc
+    if any(not isinstance(token, OcrToken) for token in raw_tokens):
+        raise PngExtractionError(
+            "ocr_invalid_response",
+            "ocr",
+            "OCR backend returned a value that is not an OcrToken",
+        )
+    return raw_tokens
 
 
 def _pipeline_error(
@@ -517,17 +906,17 @@ def _normalize_tokens(tokens: Sequence[OcrToken]) -> tuple[tuple[OcrToken, ...],
 
 def _associate_region(
     token: OcrToken,
-    regions: Sequence[tuple[str, RegionCandidate]],
+    index: _RegionIndex,
 ) -> tuple[str | None, RegionCandidate | None, bool]:
-    by_ref = {region_ref: region for region_ref, region in regions}
-    if token.parent_region_ref in by_ref:
-        return token.parent_region_ref, by_ref[token.parent_region_ref], False
+    region = index.by_ref(token.parent_region_ref)
+    if region is not None:
+        return token.parent_region_ref, region, False
 
     center_x = token.bbox.x + (token.bbox.width - 1) / 2
     center_y = token.bbox.y + (token.bbox.height - 1) / 2
     containing = [
         (region_ref, region)
-        for region_ref, region in regions
+        for region_ref, region in index.near_point(center_x, center_y)
         if (
             region.bbox.x <= center_x < region.bbox.x + region.bbox.width
             and region.bbox.y <= center_y < region.bbox.y + region.bbox.height
@@ -547,7 +936,7 @@ def _associate_region(
 
     overlapping = [
         (region_ref, region, _intersection_fraction(token.bbox, region.bbox))
-        for region_ref, region in regions
+        for region_ref, region in index.near_bbox(token.bbox)
     ]
     overlapping = [item for item in overlapping if item[2] >= 0.5]
     if overlapping:
@@ -567,10 +956,21 @@ def _associate_region(
 def _reading_order(tokens: Sequence[_AssociatedToken]) -> tuple[_AssociatedToken, ...]:
     ordered = sorted(tokens, key=_token_position_key)
     rows: list[_TokenRow] = []
+    # Tokens arrive top-down, so a row whose bottom is at or above the current
+    # token's top can overlap neither it nor any later token. Only rows still
+    # open below the sweep are compared; the dict keeps them in creation order
+    # for the lowest-index tie-break, and the heap retires them by bottom.
+    open_rows: dict[int, _TokenRow] = {}
+    bottoms: list[tuple[int, int]] = []
     for item in ordered:
         bbox = item.token.bbox
+        while bottoms and bottoms[0][0] <= bbox.y:
+            bottom, index = heapq.heappop(bottoms)
+            row = open_rows.get(index)
+            if row is not None and row.bottom == bottom:
+                del open_rows[index]
         matches: list[tuple[float, int, _TokenRow]] = []
-        for index, row in enumerate(rows):
+        for index, row in open_rows.items():
             overlap = max(
                 0, min(bbox.y + bbox.height, row.bottom) - max(bbox.y, row.top)
             )
@@ -579,20 +979,25 @@ def _reading_order(tokens: Sequence[_AssociatedToken]) -> tuple[_AssociatedToken
             if ratio >= 0.45:
                 matches.append((ratio, -index, row))
         if matches:
-            row = max(matches, key=lambda match: (match[0], match[1]))[2]
+            _, negative_index, row = max(
+                matches, key=lambda match: (match[0], match[1])
+            )
             row.items.append(item)
             row.top = min(row.top, bbox.y)
-            row.bottom = max(row.bottom, bbox.y + bbox.height)
             row.left = min(row.left, bbox.x)
+            if bbox.y + bbox.height > row.bottom:
+                row.bottom = bbox.y + bbox.height
+                heapq.heappush(bottoms, (row.bottom, -negative_index))
         else:
-            rows.append(
-                _TokenRow(
-                    items=[item],
-                    top=bbox.y,
-                    bottom=bbox.y + bbox.height,
-                    left=bbox.x,
-                )
+            row = _TokenRow(
+                items=[item],
+                top=bbox.y,
+                bottom=bbox.y + bbox.height,
+                left=bbox.x,
             )
+            open_rows[len(rows)] = row
+            heapq.heappush(bottoms, (row.bottom, len(rows)))
+            rows.append(row)
     rows.sort(key=lambda row: (row.top, row.left, row.bottom))
     result: list[_AssociatedToken] = []
     for row in rows:
@@ -745,11 +1150,27 @@ def _image_elements(
 ) -> tuple[tuple[ImageElement, ...], tuple[Asset, ...], tuple[AssetPayload, ...]]:
     page_area = image.source.pixel_width * image.source.pixel_height
     registry: dict[str, tuple[Asset, AssetPayload]] = {}
-    emitted: list[tuple[RegionCandidate, Asset]] = []
+    emitted: list[tuple[RegionCandidate, Asset, Provenance | None]] = []
+    planned: list[tuple[str, RegionCandidate, bool]] = []
     for source_index, candidate in enumerate(candidates):
-        source_ref = f"p001-image-region-{source_index:04d}"
         fraction = candidate.bbox.width * candidate.bbox.height / page_area
-        if fraction >= PAGE_COVERING_IMAGE_FRACTION:
+        planned.append(
+            (
+                f"p001-image-region-{source_index:04d}",
+                candidate,
+                fraction >= PAGE_COVERING_IMAGE_FRACTION,
+            )
+        )
+    encoded_crops = iter(
+        _encoded_crops(
+            encoder,
+            image,
+            [candidate.bbox for _, candidate, covering in planned if not covering],
+            diagnostics,
+        )
+    )
+    for source_ref, candidate, covering in planned:
+        if covering:
             diagnostics.append(
                 ExtractionDiagnostic(
                     code="page_covering_image_skipped",
@@ -759,12 +1180,13 @@ def _image_elements(
                 )
             )
             continue
-        try:
-            encoded = encoder.encode_png_crop(image, candidate.bbox)
-        except AssetEncodingError as exc:
+        encoded = next(encoded_crops)
+        if encoded is _OMITTED_CROP:
+            continue
+        if isinstance(encoded, AssetEncodingError):
             diagnostics.append(
                 ExtractionDiagnostic(
-                    code=exc.code,
+                    code=encoded.code,
                     stage="asset",
                     message="image region was omitted because portable encoding failed",
                     source_ref=source_ref,
@@ -798,7 +1220,7 @@ def _image_elements(
             registry[digest] = (asset, payload)
         else:
             asset, _ = registered
-        emitted.append((candidate, asset))
+        emitted.append((candidate, asset, encoded.provenance))
 
     elements = tuple(
         ImageElement(
@@ -806,17 +1228,58 @@ def _image_elements(
             bbox=_point_bbox(candidate.bbox, image),
             z_index=_IMAGE_Z_INDEX,
             confidence=candidate.confidence,
-            provenance=candidate.provenance,
+            provenance=(
+                candidate.provenance
+                if encoding is None
+                else (*candidate.provenance, encoding)
+            ),
             asset_id=asset.id,
             fit=ImageFit.CONTAIN,
         )
-        for index, (candidate, asset) in enumerate(emitted)
+        for index, (candidate, asset, encoding) in enumerate(emitted)
     )
     assets = tuple(pair[0] for pair in registry.values())
     payloads = tuple(pair[1] for pair in registry.values())
     return elements, assets, payloads
 
 
+def _encoded_crops(
+    encoder: ImageAssetEncoder,
+    image: ImageInput,
+    bboxes: Sequence[PixelBoundingBox],
+    diagnostics: list[ExtractionDiagnostic],
+) -> list[object]:
+    # A batch response that cannot be paired with its crops omits all of them
+    # under one page-level diagnostic instead of a misleading one per crop.
+    if not bboxes:
+        return []
+    if isinstance(encoder, BatchImageAssetEncoder):
+        try:
+            encoded = list(encoder.encode_png_crops(image, bboxes))
+        except AssetEncodingError as exc:
+            return [exc] * len(bboxes)
+        if len(encoded) != len(bboxes):
+            diagnostics.append(
+                ExtractionDiagnostic(
+                    code="asset_batch_length_mismatch",
+                    stage="asset",
+                    message=(
+                        f"batch asset encoder returned {len(encoded)} results "
+                        f"for {len(bboxes)} image regions; all were omitted"
+                    ),
+                )
+            )
+            return [_OMITTED_CROP] * len(bboxes)
+        return encoded
+    results: list[object] = []
+    for bbox in bboxes:
+        try:
+            results.append(encoder.encode_png_crop(image, bbox))
+        except AssetEncodingError as exc:
+            results.append(exc)
+    return results
+
+
 def _point_bbox(bbox: PixelBoundingBox, image: ImageInput) -> BoundingBox:
     left = _pt(bbox.x, image.source.dpi_x)
     top = _pt(bbox.y, image.source.dpi_y)
@@ -841,6 +1304,10 @@ def _bbox_inside(bbox: PixelBoundingBox, image: ImageInput) -> bool:
     )
 
 
+def _is_count(value: object) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool) and value >= 0
+
+
 def _bbox_key(bbox: PixelBoundingBox) -> tuple[int, int, int, int]:
     return bbox.y, bbox.x, bbox.height, bbox.width
 
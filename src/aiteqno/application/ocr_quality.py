@@ -10,6 +10,7 @@ from aiteqno.application.baseline import (
     normalize_source_text,
     source_character_accuracy,
 )
+from aiteqno.application.edit_distance import levenshtein_difference_runs
 from aiteqno.domain import DocumentIR, TextElement, validate_document
 from aiteqno.ports.baseline import SourceBaselineReference
 from aiteqno.ports.evaluation import (
@@ -164,7 +165,10 @@ def evaluate_ocr_quality(
         minimum=config.required_anchor_recall,
     )
 
-    missing_strings, extra_strings = _text_differences(expected_text, observed_text)
+    missing_strings, extra_strings = levenshtein_difference_runs(
+        expected_text,
+        observed_text,
+    )
     unrecovered_blocks = tuple(
         block.reference_id for block in blocks if not block.recovered
     )
@@ -410,93 +414,6 @@ def _confidence_diagnostics(
     return distribution, tuple(low_tokens)
 
 
-def _text_differences(
-    expected: str,
-    observed: str,
-) -> tuple[tuple[str, ...], tuple[str, ...]]:
-    """Return deterministic edit runs from the same Levenshtein model as scoring."""
-
-    missing: list[str] = []
-    extra: list[str] = []
-    rows = [[0] * (len(observed) + 1) for _ in range(len(expected) + 1)]
-    for index in range(len(expected) + 1):
-        rows[index][0] = index
-    for index in range(len(observed) + 1):
-        rows[0][index] = index
-    for expected_index, expected_character in enumerate(expected, start=1):
-        for observed_index, observed_character in enumerate(observed, start=1):
-            rows[expected_index][observed_index] = min(
-                rows[expected_index - 1][observed_index] + 1,
-                rows[expected_index][observed_index - 1] + 1,
-                rows[expected_index - 1][observed_index - 1]
-                + (expected_character != observed_character),
-            )
-
-    edits: list[tuple[str, str, str]] = []
-    expected_index = len(expected)
-    observed_index = len(observed)
-    while expected_index or observed_index:
-        if (
-            expected_index
-            and observed_index
-            and expected[expected_index - 1] == observed[observed_index - 1]
-            and rows[expected_index][observed_index]
-            == rows[expected_index - 1][observed_index - 1]
-        ):
-            edits.append(
-                (
-                    "equal",
-                    expected[expected_index - 1],
-                    observed[observed_index - 1],
-                )
-            )
-            expected_index -= 1
-            observed_index -= 1
-        elif (
-            expected_index
-            and observed_index
-            and rows[expected_index][observed_index]
-            == rows[expected_index - 1][observed_index - 1] + 1
-        ):
-            edits.append(
-                ("edit", expected[expected_index - 1], observed[observed_index - 1])
-            )
-            expected_index -= 1
-            observed_index -= 1
-        elif (
-            expected_index
-            and rows[expected_index][observed_index]
-            == rows[expected_index - 1][observed_index] + 1
-        ):
-            edits.append(("edit", expected[expected_index - 1], ""))
-            expected_index -= 1
-        else:
-            edits.append(("edit", "", observed[observed_index - 1]))
-            observed_index -= 1
-
-    missing_run: list[str] = []
-    extra_run: list[str] = []
-
-    def flush() -> None:
-        if missing_run:
-            missing.append("".join(missing_run))
-            missing_run.clear()
-        if extra_run:
-            extra.append("".join(extra_run))
-            extra_run.clear()
-
-    for operation, expected_character, observed_character in reversed(edits):
-        if operation == "equal":
-            flush()
-        else:
-            if expected_character:
-                missing_run.append(expected_character)
-            if observed_character:
-                extra_run.append(observed_character)
-    flush()
-    return tuple(missing), tuple(extra)
-
-
 def _normalized_bbox(
     x: float,
     y: float,
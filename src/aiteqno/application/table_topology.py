@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import json
 from dataclasses import dataclass, field
@@ -122,6 +123,89 @@ def infer_table_topology(document: DocumentIR) -> DocumentIR:
     )
 
 
+class _ContainmentIndex:
+    # Rectangles sorted by left and by top edge. A query bisects both orders
+    # for the slab its answers must start in, scans the narrower slab, and
+    # applies the exact predicate, so answers equal a scan of every rectangle
+    # and keep the input order.
+
+    __slots__ = (
+        "_by_x",
+        "_by_y",
+        "_lefts",
+        "_max_height",
+        "_max_width",
+        "_rectangles",
+        "_tops",
+    )
+
+    def __init__(self, rectangles: tuple[RectangleElement, ...]) -> None:
+        self._rectangles = rectangles
+        self._by_x = sorted(
+            range(len(rectangles)), key=lambda index: rectangles[index].bbox.x
+        )
+        self._by_y = sorted(
+            range(len(rectangles)), key=lambda index: rectangles[index].bbox.y
+        )
+        self._lefts = [rectangles[index].bbox.x for index in self._by_x]
+        self._tops = [rectangles[index].bbox.y for index in self._by_y]
+        self._max_width = max(
+            (rectangle.bbox.width for rectangle in rectangles), default=0.0
+        )
+        self._max_height = max(
+            (rectangle.bbox.height for rectangle in rectangles), default=0.0
+        )
+
+    def inside(self, container: BoundingBox) -> tuple[RectangleElement, ...]:
+        """Rectangles that ``container`` strictly contains."""
+
+        tolerance = TABLE_TOPOLOGY_BOUNDARY_TOLERANCE_PT
+        return tuple(
+            rectangle
+            for rectangle in self._slab(
+                container.x - tolerance,
+                container.right + tolerance,
+                container.y - tolerance,
+                container.bottom + tolerance,
+            )
+            if _strictly_contains(container, rectangle.bbox)
+        )
+
+    def at_point(self, x: float, y: float) -> tuple[RectangleElement, ...]:
+        """Rectangles whose closed bbox contains the point."""
+
+        # The tolerance only widens the slab against float rounding of the
+        # subtraction; the exact predicate decides membership.
+        slack = TABLE_TOPOLOGY_BOUNDARY_TOLERANCE_PT
+        return tuple(
+            rectangle
+            for rectangle in self._slab(
+                x - self._max_width - slack,
+                x,
+                y - self._max_height - slack,
+                y,
+            )
+            if _contains_point(rectangle.bbox, x, y)
+        )
+
+    def _slab(
+        self,
+        left: float,
+        right: float,
+        top: float,
+        bottom: float,
+    ) -> list[RectangleElement]:
+        x_start = bisect.bisect_left(self._lefts, left)
+        x_end = bisect.bisect_right(self._lefts, right)
+        y_start = bisect.bisect_left(self._tops, top)
+        y_end = bisect.bisect_right(self._tops, bottom)
+        if x_end - x_start <= y_end - y_start:
+            positions = self._by_x[x_start:x_end]
+        else:
+            positions = self._by_y[y_start:y_end]
+        return [self._rectangles[index] for index in sorted(positions)]
+
+
 def _infer_page_topology(page: Page) -> PageTableTopology | None:
     rectangles = tuple(
         sorted(
@@ -157,23 +241,23 @@ def _infer_page_topology(page: Page) -> PageTableTopology | None:
     usable_rectangles = tuple(
         rectangle for rectangle in rectangles if rectangle.id not in frame_rectangles
     )
+    usable_index = _ContainmentIndex(usable_rectangles)
     outer_candidates = tuple(
         rectangle
         for rectangle in usable_rectangles
-        if sum(
-            _strictly_contains(rectangle.bbox, other.bbox)
-            for other in usable_rectangles
-            if other is not rectangle
-        )
+        if len(usable_index.inside(rectangle.bbox))
         >= TABLE_TOPOLOGY_MINIMUM_CELL_COUNT
     )
+    candidate_index = _ContainmentIndex(outer_candidates)
+    contained_candidates = {
+        id(other)
+        for candidate in outer_candidates
+        for other in candidate_index.inside(candidate.bbox)
+    }
     maximal_outers = tuple(
         candidate
         for candidate in outer_candidates
-        if not any(
-            other is not candidate and _strictly_contains(other.bbox, candidate.bbox)
-            for other in outer_candidates
-        )
+        if id(candidate) not in contained_candidates
     )
 
     grouped_cells: dict[str, list[RectangleElement]] = {
@@ -181,17 +265,17 @@ def _infer_page_topology(page: Page) -> PageTableTopology | None:
     }
     ambiguous_primitives: set[str] = set()
     outer_ids = {outer.id for outer in maximal_outers}
+    containers: dict[int, list[RectangleElement]] = {}
+    for outer in maximal_outers:
+        for rectangle in usable_index.inside(outer.bbox):
+            containers.setdefault(id(rectangle), []).append(outer)
     for rectangle in usable_rectangles:
         if rectangle.id in outer_ids:
             continue
-        containers = tuple(
-            outer
-            for outer in maximal_outers
-            if _strictly_contains(outer.bbox, rectangle.bbox)
-        )
-        if len(containers) == 1:
-            grouped_cells[containers[0].id].append(rectangle)
-        elif len(containers) > 1:
+        rectangle_containers = containers.get(id(rectangle), ())
+        if len(rectangle_containers) == 1:
+            grouped_cells[rectangle_containers[0].id].append(rectangle)
+        elif len(rectangle_containers) > 1:
             ambiguous_primitives.add(rectangle.id)
 
     detected: list[_DetectedTable] = []
@@ -221,13 +305,14 @@ def _infer_page_topology(page: Page) -> PageTableTopology | None:
     ambiguous_text_ids: list[str] = []
     unassigned_text_ids: list[str] = []
     all_cells = tuple(cell for table in detected for cell in table.cells)
+    cell_index = _ContainmentIndex(tuple(cell.rectangle for cell in all_cells))
+    cells_by_rectangle = {id(cell.rectangle): cell for cell in all_cells}
     for text in texts:
         center_x = text.bbox.x + text.bbox.width / 2
         center_y = text.bbox.y + text.bbox.height / 2
         matches = tuple(
-            cell
-            for cell in all_cells
-            if _contains_point(cell.rectangle.bbox, center_x, center_y)
+            cells_by_rectangle[id(rectangle)]
+            for rectangle in cell_index.at_point(center_x, center_y)
         )
         if len(matches) == 1:
             matches[0].texts.append(text)
@@ -0,0 +1,145 @@
+"""Matching-character counts behind the evaluator's text similarity ratio."""
+
+from __future__ import annotations
+
+
+class LongestBlockTextMatcher:
+    """Count the characters of ``SequenceMatcher(autojunk=False)`` blocks.
+
+    The blocks are found exactly as ``difflib`` finds them: the longest
+    common substring of the current ranges, earliest in ``expected`` and then
+    earliest in ``observed``, followed by the same search on both sides of
+    it. Each search walks ``expected`` through a suffix automaton of the
+    observed range, so a search costs time linear in the two ranges instead
+    of one step per pair of equal characters. ``2 * matches / total length``
+    is therefore bit-for-bit the V1 ``SequenceMatcher.ratio()``.
+    """
+
+    __slots__ = ()
+
+    def matched_characters(self, expected: str, observed: str) -> int:
+        if not isinstance(expected, str) or not isinstance(observed, str):
+            raise TypeError("matched texts must be strings")
+        if expected == observed:
+            return len(expected)
+        total = 0
+        ranges = [(0, len(expected), 0, len(observed))]
+        while ranges:
+            expected_low, expected_high, observed_low, observed_high = ranges.pop()
+            expected_index, observed_index, size = _longest_block(
+                expected,
+                observed,
+                expected_low,
+                expected_high,
+                observed_low,
+                observed_high,
+            )
+            if not size:
+                continue
+            total += size
+            if expected_low < expected_index and observed_low < observed_index:
+                ranges.append(
+                    (expected_low, expected_index, observed_low, observed_index)
+                )
+            if (
+                expected_index + size < expected_high
+                and observed_index + size < observed_high
+            ):
+                ranges.append(
+                    (
+                        expected_index + size,
+                        expected_high,
+                        observed_index + size,
+                        observed_high,
+                    )
+                )
+        return total
+
+
+DEFAULT_TEXT_MATCHER = LongestBlockTextMatcher()
+
+
+def _longest_block(
+    expected: str,
+    observed: str,
+    expected_low: int,
+    expected_high: int,
+    observed_low: int,
+    observed_high: int,
+) -> tuple[int, int, int]:
+    if expected_low >= expected_high or observed_low >= observed_high:
+        return expected_low, observed_low, 0
+    transitions, links, lengths = _suffix_automaton(
+        observed[observed_low:observed_high]
+    )
+    # Matching statistics: after each expected character, ``run`` is the
+    # longest suffix of the expected prefix that occurs in the observed range.
+    # Only a strictly longer run moves the end, which keeps difflib's earliest
+    # start among the longest blocks.
+    state = 0
+    run = 0
+    best = 0
+    best_end = expected_low
+    for index in range(expected_low, expected_high):
+        character = expected[index]
+        while state and character not in transitions[state]:
+            state = links[state]
+            run = lengths[state]
+        following = transitions[state].get(character)
+        if following is None:
+            state = 0
+            run = 0
+            continue
+        state = following
+        run += 1
+        if run > best:
+            best = run
+            best_end = index
+    if not best:
+        return expected_low, observed_low, 0
+    start = best_end - best + 1
+    return (
+        start,
+        observed.find(expected[start : start + best], observed_low, observed_high),
+        best,
+    )
+
+
+def _suffix_automaton(
+    text: str,
+) -> tuple[list[dict[str, int]], list[int], list[int]]:
+    transitions: list[dict[str, int]] = [{}]
+    links = [-1]
+    lengths = [0]
+    last = 0
+    for character in text:
+        current = len(lengths)
+        transitions.append({})
+        links.append(0)
+        lengths.append(lengths[last] + 1)
+        state = last
+        while state != -1 and character not in transitions[state]:
+            transitions[state][character] = current
+            state = links[state]
+        if state != -1:
+            target = transitions[state][character]
+            if lengths[state] + 1 == lengths[target]:
+                links[current] = target
+            else:
+                clone = len(lengths)
+                transitions.append(dict(transitions[target]))
+                links.append(links[target])
+                lengths.append(lengths[state] + 1)
+                while state != -1 and transitions[state].get(character) == target:
+                    transitions[state][character] = clone
+                    state = links[state]
+                links[target] = clone
+                links[current] = clone
+        last = current
+    return transitions, links, lengths
+
+
+__all__ = [
+    "DEFAULT_TEXT_MATCHER",
+    "LongestBlockTextMatcher",
+]
@@ -3,31 +3,46 @@
 from __future__ import annotations
 
 import argparse
+import json
 import math
+import multiprocessing
 import os
 import shutil
 import sys
 import tempfile
-from collections.abc import Callable, Sequence
+import tracemalloc
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import redirect_stderr, redirect_stdout
 from dataclasses import dataclass
 from enum import IntEnum
+from functools import partial
 from pathlib import Path
+from multiprocessing.synchronize import Event
 from typing import TextIO
 
 from aiteqno import __version__
 from aiteqno.adapters import (
+    DEFAULT_TESSERACT_MAX_WORKERS,
     BundleAssetResolver,
     FilesystemDocumentBundleWriter,
+    FilesystemOcrResponseCache,
     JsonSchemaDocumentIRValidator,
     OpenCvStructureExtractor,
     PillowPngAssetEncoder,
     PillowPngDecoder,
     PillowPreviewRenderer,
+    PngCompressionProfile,
     PythonDocxRenderer,
     TesseractOcrBackend,
 )
-from aiteqno.adapters.json_schema import document_ir_from_file
+from aiteqno.adapters.json_schema import (
+    document_ir_from_file,
+    document_ir_sidecar_path,
+    encode_document_ir_sidecar,
+)
 from aiteqno.application import (
     PngExtractionError,
     PngExtractionResult,
@@ -39,6 +54,7 @@ from aiteqno.domain import DocumentIR, DocumentIRValidationError
 from aiteqno.ports import (
     DEFAULT_OCR_LANGUAGES,
     DocxRenderError,
+    DocxRenderResult,
     DocxRenderer,
     DocumentBundleWriter,
     DocumentIRValidator,
@@ -47,6 +63,7 @@ from aiteqno.ports import (
     OcrOptions,
     PngDecoder,
     PreviewRenderError,
+    PreviewRenderResult,
     PreviewRenderer,
     StructureExtractor,
 )
@@ -56,6 +73,7 @@ DOCUMENT_IR_FILENAME = "document.ir.json"
 RECONSTRUCTED_DOCX_FILENAME = "reconstructed.docx"
 RECONSTRUCTED_PREVIEW_FILENAME = "reconstructed.png"
 ASSET_DIRECTORY_NAME = "assets"
+BATCH_SUMMARY_VERSION = "aiteqno-batch-summary-v1"
 
 _DEPENDENCY_ERROR_CODES = frozenset(
     {
@@ -99,21 +117,47 @@ class CliRuntime:
     bundle_writer: DocumentBundleWriter
     docx_renderer_factory: Callable[[Path], DocxRenderer]
     preview_renderer_factory: Callable[[Path], PreviewRenderer]
+    ocr_timing_log: list[dict[str, object]] | None = None
+
 
+def default_runtime(
+    *,
+    ocr_max_workers: int = DEFAULT_TESSERACT_MAX_WORKERS,
+    ocr_cache_directory: Path | None = None,
+    asset_png_profile: PngCompressionProfile | str = PngCompressionProfile.SMALLEST,
+    record_ocr_timings: bool = False,
+) -> CliRuntime:
+    """Build the local V1 adapter set without probing Tesseract eagerly.
 
-def default_runtime() -> CliRuntime:
-    """Build the local V1 adapter set without probing Tesseract eagerly."""
+    ``record_ocr_timings`` collects Tesseract region timings in
+    ``ocr_timing_log`` for ``--timings`` reports.
+    """
 
     executable = os.environ.get("AITEQNO_TESSERACT_EXECUTABLE") or None
     tessdata = os.environ.get("AITEQNO_TESSDATA_PREFIX") or None
+    response_cache = (
+        FilesystemOcrResponseCache(ocr_cache_directory)
+        if ocr_cache_directory is not None
+        else None
+    )
+    ocr_timing_log: list[dict[str, object]] | None = (
+        [] if record_ocr_timings else None
+    )
     return CliRuntime(
         decoder=PillowPngDecoder(),
         structure_extractor=OpenCvStructureExtractor(),
         ocr_backend=TesseractOcrBackend(
             executable_path=executable,
             tessdata_prefix=tessdata,
+            max_workers=ocr_max_workers,
+            response_cache=response_cache,
+            timing_observer=(
+                (lambda evidence: ocr_timing_log.append(evidence.to_dict()))
+                if ocr_timing_log is not None
+                else None
+            ),
         ),
-        asset_encoder=PillowPngAssetEncoder(),
+        asset_encoder=PillowPngAssetEncoder(profile=asset_png_profile),
         validator=JsonSchemaDocumentIRValidator(),
         bundle_writer=FilesystemDocumentBundleWriter(),
         docx_renderer_factory=lambda bundle_root: PythonDocxRenderer(
@@ -122,6 +166,7 @@ def default_runtime() -> CliRuntime:
         preview_renderer_factory=lambda bundle_root: PillowPreviewRenderer(
             asset_resolver=BundleAssetResolver(bundle_root)
         ),
+        ocr_timing_log=ocr_timing_log,
     )
 
 
@@ -130,7 +175,7 @@ def build_parser() -> argparse.ArgumentParser:
 
     parser = argparse.ArgumentParser(
         prog="aiteqno",
-        description="Extract and reconstruct a single-page PNG through Document IR.",
+        description="Extract and reconstruct single-page PNGs through Document IR.",
     )
     parser.add_argument(
         "--version",
@@ -152,6 +197,10 @@ def build_parser() -> argparse.ArgumentParser:
         help="new JSON path; assets are written to a sibling assets directory",
     )
     _add_languages(extract_parser)
+    _add_ocr_workers(extract_parser)
+    _add_ocr_cache(extract_parser)
+    _add_png_profile(extract_parser)
+    _add_timings(extract_parser)
 
     render_parser = commands.add_parser(
         "render",
@@ -186,6 +235,12 @@ def build_parser() -> argparse.ArgumentParser:
         help="preview resolution in dots per inch (default: 144)",
     )
 
+    pack_parser = commands.add_parser(
+        "pack",
+        help="write a binary sidecar that render and preview load instead of JSON",
+    )
+    _add_ir_input(pack_parser)
+
     roundtrip_parser = commands.add_parser(
         "roundtrip",
         help="extract, render DOCX, and render PNG into one new directory",
@@ -199,6 +254,10 @@ def build_parser() -> argparse.ArgumentParser:
         help="new output directory for IR, assets, DOCX, and PNG",
     )
     _add_languages(roundtrip_parser)
+    _add_ocr_workers(roundtrip_parser)
+    _add_ocr_cache(roundtrip_parser)
+    _add_png_profile(roundtrip_parser)
+    _add_timings(roundtrip_parser)
     roundtrip_parser.add_argument(
         "--dpi",
         type=_positive_float,
@@ -206,6 +265,58 @@ def build_parser() -> argparse.ArgumentParser:
         metavar="DPI",
         help="preview resolution in dots per inch (default: 144)",
     )
+
+    batch_parser = commands.add_parser(
+        "batch",
+        help="extract many PNGs in one process and write a JSONL summary",
+    )
+    batch_inputs = batch_parser.add_mutually_exclusive_group(required=True)
+    batch_inputs.add_argument(
+        "input",
+        nargs="?",
+        metavar="INPUT_DIRECTORY",
+        help="directory whose top-level .png files are processed in name order",
+    )
+    batch_inputs.add_argument(
+        "--manifest",
+        metavar="MANIFEST",
+        help=(
+            "UTF-8 text file listing one PNG path per line; relative paths "
+            "are resolved from the manifest directory"
+        ),
+    )
+    batch_parser.add_argument(
+        "-o",
+        "--output",
+        required=True,
+        metavar="DIRECTORY",
+        help="directory that receives one new bundle directory per input",
+    )
+    batch_parser.add_argument(
+        "--roundtrip",
+        action="store_true",
+        help="also render DOCX and PNG into every bundle",
+    )
+    batch_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=_positive_int,
+        default=1,
+        metavar="COUNT",
+        help="worker processes; each builds its adapters once (default: 1)",
+    )
+    _add_languages(batch_parser)
+    _add_ocr_workers(batch_parser)
+    _add_ocr_cache(batch_parser)
+    _add_png_profile(batch_parser)
+    _add_timings(batch_parser)
+    batch_parser.add_argument(
+        "--dpi",
+        type=_positive_float,
+        default=144.0,
+        metavar="DPI",
+        help="preview resolution with --roundtrip (default: 144)",
+    )
     return parser
 
 
@@ -213,10 +324,16 @@ def main(
     argv: Sequence[str] | None = None,
     *,
     runtime: CliRuntime | None = None,
+    runtime_factory: Callable[[], CliRuntime] | None = None,
     stdout: TextIO | None = None,
     stderr: TextIO | None = None,
 ) -> int:
-    """Run one command and return a stable process exit code."""
+    """Run one command and return a stable process exit code.
+
+    ``runtime`` serves commands in this process. ``batch --jobs`` worker
+    processes call the picklable ``runtime_factory`` once each instead, and
+    default to ``default_runtime`` with the command's OCR options.
+    """
 
     output_stream = stdout if stdout is not None else sys.stdout
     error_stream = stderr if stderr is not None else sys.stderr
@@ -227,15 +344,27 @@ def main(
         return int(exc.code)
 
     try:
-        selected_runtime = runtime if runtime is not None else default_runtime()
+        selected_runtime = (
+            runtime if runtime is not None else _default_runtime_for(arguments)
+        )
         if arguments.command == "extract":
             _command_extract(arguments, selected_runtime, output_stream, error_stream)
         elif arguments.command == "render":
             _command_render(arguments, selected_runtime, output_stream, error_stream)
         elif arguments.command == "preview":
             _command_preview(arguments, selected_runtime, output_stream, error_stream)
+        elif arguments.command == "pack":
+            _command_pack(arguments, selected_runtime, output_stream, error_stream)
         elif arguments.command == "roundtrip":
             _command_roundtrip(arguments, selected_runtime, output_stream, error_stream)
+        elif arguments.command == "batch":
+            _command_batch(
+                arguments,
+                selected_runtime,
+                output_stream,
+                error_stream,
+                runtime_factory,
+            )
         else:  # pragma: no cover - argparse guarantees the command set
             raise CliError(
                 "unknown_command",
@@ -290,6 +419,96 @@ def _add_languages(parser: argparse.ArgumentParser) -> None:
     )
 
 
+def _add_ocr_workers(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--ocr-workers",
+        type=_positive_int,
+        default=DEFAULT_TESSERACT_MAX_WORKERS,
+        metavar="COUNT",
+        help=(
+            "maximum concurrent Tesseract region crops "
+            f"(default: {DEFAULT_TESSERACT_MAX_WORKERS})"
+        ),
+    )
+
+
+def _add_ocr_cache(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--ocr-cache",
+        metavar="DIRECTORY",
+        help="reuse OCR engine responses for identical crops from this directory",
+    )
+
+
+def _add_png_profile(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--png-profile",
+        choices=[profile.value for profile in PngCompressionProfile],
+        default=PngCompressionProfile.SMALLEST.value,
+        help=(
+            "image asset PNG compression; pixels are identical for every "
+            "profile (default: smallest)"
+        ),
+    )
+
+
+def _add_timings(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--timings",
+        choices=["json"],
+        help=(
+            "report wall time, CPU time, peak traced memory, and item counts "
+            "per extraction stage plus OCR region timings"
+        ),
+    )
+
+
+def _default_runtime_for(arguments: argparse.Namespace) -> CliRuntime:
+    cache_directory = _ocr_cache_directory(arguments)
+    try:
+        return default_runtime(
+            ocr_max_workers=getattr(
+                arguments,
+                "ocr_workers",
+                DEFAULT_TESSERACT_MAX_WORKERS,
+            ),
+            ocr_cache_directory=cache_directory,
+            asset_png_profile=_png_profile(arguments),
+            record_ocr_timings=_timings_requested(arguments),
+        )
+    except (OSError, ValueError) as exc:
+        raise CliError(
+            "ocr_cache_unavailable",
+            f"could not open OCR cache directory {cache_directory}: {exc}",
+            ExitCode.OPERATIONAL_ERROR,
+        ) from exc
+
+
+def _ocr_cache_directory(arguments: argparse.Namespace) -> Path | None:
+    raw_cache = getattr(arguments, "ocr_cache", None)
+    return _resolved(raw_cache) if raw_cache is not None else None
+
+
+def _timings_requested(arguments: argparse.Namespace) -> bool:
+    return getattr(arguments, "timings", None) is not None
+
+
+def _png_profile(arguments: argparse.Namespace) -> PngCompressionProfile:
+    return PngCompressionProfile(
+        getattr(arguments, "png_profile", PngCompressionProfile.SMALLEST.value)
+    )
+
+
+def _positive_int(value: str) -> int:
+    try:
+        number = int(value)
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError("must be an integer") from exc
+    if number <= 0:
+        raise argparse.ArgumentTypeError("must be greater than zero")
+    return number
+
+
 def _positive_float(value: str) -> float:
     try:
         number = float(value)
@@ -315,7 +534,13 @@ def _command_extract(
     container = _temporary_container(output_path.parent, "extract")
     try:
         staged_bundle = container / "bundle"
-        result = _extract_to_bundle(input_path, staged_bundle, languages, runtime)
+        result = _extract_to_bundle(
+            input_path,
+            staged_bundle,
+            languages,
+            runtime,
+            timed=_timings_requested(arguments),
+        )
         _publish_extract_result(result, output_path)
     finally:
         _remove_temporary_container(container)
@@ -323,6 +548,8 @@ def _command_extract(
     _print_extraction_diagnostics(result, stderr)
     print(f"document_ir={output_path}", file=stdout)
     print(f"assets={assets_path}", file=stdout)
+    if _timings_requested(arguments):
+        _print_timings(result, runtime, stdout)
 
 
 def _command_render(
@@ -390,6 +617,54 @@ def _command_preview(
     print(f"preview={output_path}", file=stdout)
 
 
+def _command_pack(
+    arguments: argparse.Namespace,
+    runtime: CliRuntime,
+    stdout: TextIO,
+    stderr: TextIO,
+) -> None:
+    input_path = _input_file(arguments.input, ".json", "Document IR JSON")
+    output_path = document_ir_sidecar_path(input_path)
+    _refuse_existing(output_path, "binary sidecar output")
+    try:
+        sidecar = encode_document_ir_sidecar(input_path)
+    except DocumentIRValidationError as exc:
+        raise CliError(
+            "invalid_document_ir",
+            str(exc),
+            ExitCode.INPUT_ERROR,
+        ) from exc
+    except OSError as exc:
+        raise CliError(
+            "input_unreadable",
+            f"could not read Document IR input {input_path}: {exc}",
+            ExitCode.INPUT_ERROR,
+        ) from exc
+    except ValueError as exc:
+        raise CliError(
+            "sidecar_encode_failed",
+            str(exc),
+            ExitCode.OPERATIONAL_ERROR,
+        ) from exc
+
+    container = _temporary_container(output_path.parent, "pack")
+    try:
+        staged_output = container / output_path.name
+        try:
+            staged_output.write_bytes(sidecar)
+        except OSError as exc:
+            raise CliError(
+                "output_publish_failed",
+                f"could not stage output {output_path}: {exc}",
+                ExitCode.OPERATIONAL_ERROR,
+            ) from exc
+        _copy_file_exclusive(staged_output, output_path)
+    finally:
+        _remove_temporary_container(container)
+
+    print(f"sidecar={output_path}", file=stdout)
+
+
 def _command_roundtrip(
     arguments: argparse.Namespace,
     runtime: CliRuntime,
@@ -403,41 +678,14 @@ def _command_roundtrip(
     container = _temporary_container(output_directory.parent, "roundtrip")
     try:
         staged_bundle = container / "bundle"
-        extraction = _extract_to_bundle(
+        extraction, docx_result, preview_result = _roundtrip_to_bundle(
             input_path,
             staged_bundle,
             languages,
+            arguments.dpi,
             runtime,
+            timed=_timings_requested(arguments),
         )
-        document = extraction.document
-        docx_renderer = _renderer(
-            runtime.docx_renderer_factory,
-            staged_bundle,
-            "DOCX",
-        )
-        preview_renderer = _renderer(
-            runtime.preview_renderer_factory,
-            staged_bundle,
-            "preview",
-        )
-        try:
-            docx_result = render_docx(
-                document,
-                staged_bundle / RECONSTRUCTED_DOCX_FILENAME,
-                renderer=docx_renderer,
-            )
-            preview_result = render_preview(
-                document,
-                staged_bundle / RECONSTRUCTED_PREVIEW_FILENAME,
-                renderer=preview_renderer,
-                dpi=arguments.dpi,
-            )
-        except (DocxRenderError, PreviewRenderError, OSError, ValueError) as exc:
-            raise CliError(
-                "roundtrip_render_failed",
-                str(exc),
-                ExitCode.OPERATIONAL_ERROR,
-            ) from exc
         _copy_directory_exclusive(staged_bundle, output_directory)
     finally:
         _remove_temporary_container(container)
@@ -458,6 +706,440 @@ def _command_roundtrip(
         f"preview={output_directory / RECONSTRUCTED_PREVIEW_FILENAME}",
         file=stdout,
     )
+    if _timings_requested(arguments):
+        _print_timings(extraction, runtime, stdout)
+
+
+def _command_batch(
+    arguments: argparse.Namespace,
+    runtime: CliRuntime,
+    stdout: TextIO,
+    stderr: TextIO,
+    runtime_factory: Callable[[], CliRuntime] | None = None,
+) -> None:
+    if arguments.manifest is not None:
+        inputs = _manifest_inputs(arguments.manifest)
+    else:
+        inputs = _directory_inputs(arguments.input)
+    output_root = _resolved(arguments.output)
+    _ensure_parent(output_root)
+    job = _BatchJob(
+        languages=tuple(arguments.languages or DEFAULT_OCR_LANGUAGES),
+        roundtrip=arguments.roundtrip,
+        dpi=arguments.dpi,
+        timed=_timings_requested(arguments),
+    )
+    items = [
+        (input_path, output_root / bundle_name)
+        for input_path, bundle_name in _batch_targets(inputs)
+    ]
+    if arguments.jobs > 1:
+        records = _parallel_batch_records(
+            items,
+            job,
+            runtime_factory
+            or partial(
+                default_runtime,
+                ocr_max_workers=arguments.ocr_workers,
+                ocr_cache_directory=_ocr_cache_directory(arguments),
+                asset_png_profile=_png_profile(arguments),
+                record_ocr_timings=job.timed,
+            ),
+            arguments.jobs,
+        )
+    else:
+        records = _sequential_batch_records(items, job, runtime)
+
+    first_failure: dict[str, object] | None = None
+    try:
+        for record in records:
+            print(
+                json.dumps(record, ensure_ascii=False, sort_keys=True),
+                file=stdout,
+                flush=True,
+            )
+            error = record.get("error")
+            if not isinstance(error, dict):
+                continue
+            print(f"aiteqno: error [{error['code']}]: {error['message']}", file=stderr)
+            first_failure = first_failure or error
+    finally:
+        close = getattr(records, "close", None)
+        if close is not None:
+            close()
+    if first_failure is not None:
+        raise CliError(
+            "batch_incomplete",
+            "at least one batch input failed; first failure: "
+            f"{first_failure['code']}",
+            ExitCode(first_failure["exit_code"]),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class _BatchJob:
+    languages: tuple[str, ...]
+    roundtrip: bool
+    dpi: float
+    timed: bool = False
+
+
+class _BatchStopped(Exception):
+    """A worker skipped an input because the batch is stopping."""
+
+
+_BATCH_WORKER_RUNTIME: CliRuntime | None = None
+_BATCH_WORKER_STOP: Event | None = None
+
+
+def _initialize_batch_worker(
+    runtime_factory: Callable[[], CliRuntime],
+    stop: Event,
+) -> None:
+    global _BATCH_WORKER_RUNTIME, _BATCH_WORKER_STOP
+    _BATCH_WORKER_STOP = stop
+    _BATCH_WORKER_RUNTIME = runtime_factory()
+
+
+def _worker_batch_record(
+    input_path: Path,
+    bundle_directory: Path,
+    job: _BatchJob,
+) -> dict[str, object] | None:
+    if _BATCH_WORKER_RUNTIME is None:  # pragma: no cover - initializer contract
+        raise RuntimeError("batch worker runtime was not initialized")
+    try:
+        return _batch_record(
+            input_path,
+            bundle_directory,
+            job,
+            _BATCH_WORKER_RUNTIME,
+            stopping=(
+                _BATCH_WORKER_STOP.is_set if _BATCH_WORKER_STOP is not None else None
+            ),
+        )
+    except _BatchStopped:
+        return None
+
+
+def _sequential_batch_records(
+    items: Sequence[tuple[Path, Path]],
+    job: _BatchJob,
+    runtime: CliRuntime,
+) -> Iterator[dict[str, object]]:
+    for input_path, bundle_directory in items:
+        record = _batch_record(input_path, bundle_directory, job, runtime)
+        yield record
+        if _stops_batch(record):
+            return
+
+
+def _stops_batch(record: dict[str, object]) -> bool:
+    error = record.get("error")
+    return isinstance(error, dict) and error["exit_code"] == ExitCode.DEPENDENCY_ERROR
+
+
+def _parallel_batch_records(
+    items: Sequence[tuple[Path, Path]],
+    job: _BatchJob,
+    runtime_factory: Callable[[], CliRuntime],
+    workers: int,
+) -> Iterator[dict[str, object]]:
+    # Each worker process builds its adapters once. At most two inputs per
+    # worker are in flight, and records are yielded in input order, so the
+    # summary is identical to a sequential run and memory stays bounded.
+    # When the batch stops early, workers skip inputs they have not published
+    # yet, and every input that was published anyway still gets its record.
+    stop = multiprocessing.Event()
+    executor = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_initialize_batch_worker,
+        initargs=(runtime_factory, stop),
+    )
+    pending: deque[tuple[Path, Path, Future[dict[str, object] | None]]] = deque()
+    remaining = iter(items)
+    try:
+        while True:
+            while len(pending) < workers * 2:
+                item = next(remaining, None)
+                if item is None:
+                    break
+                input_path, bundle_directory = item
+                pending.append(
+                    (
+                        input_path,
+                        bundle_directory,
+                        executor.submit(
+                            _worker_batch_record,
+                            input_path,
+                            bundle_directory,
+                            job,
+                        ),
+                    )
+                )
+            if not pending:
+                return
+            input_path, bundle_directory, future = pending.popleft()
+            try:
+                record = future.result()
+            except BrokenProcessPool as exc:
+                record = _failed_batch_record(
+                    input_path,
+                    bundle_directory,
+                    CliError(
+                        "batch_worker_failed",
+                        f"batch worker process terminated abruptly: {exc}",
+                        ExitCode.OPERATIONAL_ERROR,
+                    ),
+                )
+                yield record
+                stop.set()
+                yield from _published_batch_records(pending)
+                return
+            except Exception as exc:
+                record = _unexpected_batch_record(input_path, bundle_directory, exc)
+            if record is None:  # pragma: no cover - only skipped after a stop
+                continue
+            yield record
+            if _stops_batch(record):
+                stop.set()
+                yield from _published_batch_records(pending)
+                return
+    finally:
+        stop.set()
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _published_batch_records(
+    pending: Sequence[tuple[Path, Path, Future[dict[str, object] | None]]],
+) -> Iterator[dict[str, object]]:
+    # Queued inputs are cancelled; running ones either skip publication after
+    # seeing the stop flag or finish, and a finished input needs its record.
+    for _, _, future in pending:
+        future.cancel()
+    for input_path, bundle_directory, future in pending:
+        if future.cancelled():
+            continue
+        try:
+            record = future.result()
+        except BrokenProcessPool:
+            continue
+        except Exception as exc:
+            record = _unexpected_batch_record(input_path, bundle_directory, exc)
+        if record is not None:
+            yield record
+
+
+def _batch_record(
+    input_path: Path,
+    bundle_directory: Path,
+    job: _BatchJob,
+    runtime: CliRuntime,
+    *,
+    stopping: Callable[[], bool] | None = None,
+) -> dict[str, object]:
+    try:
+        extraction, warnings = _batch_item(
+            input_path,
+            bundle_directory,
+            job,
+            runtime,
+            stopping=stopping,
+        )
+    except CliError as exc:
+        return _failed_batch_record(input_path, bundle_directory, exc)
+    except _BatchStopped:
+        raise
+    except (ModuleNotFoundError, ImportError) as exc:
+        return _failed_batch_record(
+            input_path,
+            bundle_directory,
+            CliError(
+                "python_dependency_missing",
+                f"required Python dependency is unavailable: {exc}",
+                ExitCode.DEPENDENCY_ERROR,
+            ),
+        )
+    except Exception as exc:
+        # One page's unexpected failure is isolated like any typed failure.
+        return _unexpected_batch_record(input_path, bundle_directory, exc)
+    record: dict[str, object] = {
+        **_batch_record_identity(input_path, bundle_directory),
+        "status": "succeeded",
+        "warnings": warnings,
+    }
+    if job.timed:
+        record["timings"] = _timings_record(extraction, runtime)
+    return record
+
+
+def _failed_batch_record(
+    input_path: Path,
+    bundle_directory: Path,
+    error: CliError,
+) -> dict[str, object]:
+    return {
+        **_batch_record_identity(input_path, bundle_directory),
+        "status": "failed",
+        "error": {
+            "code": error.code,
+            "exit_code": int(error.exit_code),
+            "message": str(error),
+        },
+    }
+
+
+def _unexpected_batch_record(
+    input_path: Path,
+    bundle_directory: Path,
+    error: Exception,
+) -> dict[str, object]:
+    return _failed_batch_record(
+        input_path,
+        bundle_directory,
+        CliError(
+            "batch_item_failed",
+            f"unexpected failure while processing the input: {error}",
+            ExitCode.OPERATIONAL_ERROR,
+        ),
+    )
+
+
+def _batch_record_identity(
+    input_path: Path,
+    bundle_directory: Path,
+) -> dict[str, object]:
+    return {
+        "summary_version": BATCH_SUMMARY_VERSION,
+        "input": str(input_path),
+        "bundle": str(bundle_directory),
+    }
+
+
+def _batch_item(
+    input_path: Path,
+    bundle_directory: Path,
+    job: _BatchJob,
+    runtime: CliRuntime,
+    *,
+    stopping: Callable[[], bool] | None = None,
+) -> tuple[PngExtractionResult, list[str]]:
+    if stopping is not None and stopping():
+        raise _BatchStopped
+    _input_file(str(input_path), ".png", "PNG")
+    _refuse_existing(bundle_directory, "batch bundle directory")
+    container = _temporary_container(bundle_directory.parent, "batch")
+    try:
+        staged_bundle = container / "bundle"
+        if job.roundtrip:
+            extraction, docx_result, preview_result = _roundtrip_to_bundle(
+                input_path,
+                staged_bundle,
+                job.languages,
+                job.dpi,
+                runtime,
+                timed=job.timed,
+            )
+            report_warnings = [
+                *(
+                    f"render.{getattr(warning, 'code', 'render_warning')}"
+                    for warning in docx_result.report.warnings
+                ),
+                *(
+                    f"preview.{getattr(warning, 'code', 'render_warning')}"
+                    for warning in preview_result.report.warnings
+                ),
+            ]
+        else:
+            extraction = _extract_to_bundle(
+                input_path,
+                staged_bundle,
+                job.languages,
+                runtime,
+                timed=job.timed,
+            )
+            report_warnings = []
+        if stopping is not None and stopping():
+            raise _BatchStopped
+        _copy_directory_exclusive(staged_bundle, bundle_directory)
+    finally:
+        _remove_temporary_container(container)
+    return extraction, [
+        *(diagnostic.code for diagnostic in extraction.diagnostics),
+        *report_warnings,
+    ]
+
+
+def _directory_inputs(raw_path: str) -> list[Path]:
+    directory = _resolved(raw_path)
+    if not directory.is_dir():
+        raise CliError(
+            "input_not_found",
+            f"batch input directory does not exist: {directory}",
+            ExitCode.INPUT_ERROR,
+        )
+    try:
+        entries = list(directory.iterdir())
+    except OSError as exc:
+        raise CliError(
+            "input_unreadable",
+            f"could not list batch input directory {directory}: {exc}",
+            ExitCode.INPUT_ERROR,
+        ) from exc
+    return sorted(
+        (
+            path
+            for path in entries
+            if path.suffix.lower() == ".png" and path.is_file()
+        ),
+        key=lambda path: path.name,
+    )
+
+
+def _manifest_inputs(raw_path: str) -> list[Path]:
+    manifest = _resolved(raw_path)
+    try:
+        lines = manifest.read_text(encoding="utf-8-sig").splitlines()
+    except FileNotFoundError as exc:
+        raise CliError(
+            "input_not_found",
+            f"batch manifest does not exist: {manifest}",
+            ExitCode.INPUT_ERROR,
+        ) from exc
+    except (OSError, UnicodeDecodeError) as exc:
+        raise CliError(
+            "input_unreadable",
+            f"could not read batch manifest {manifest}: {exc}",
+            ExitCode.INPUT_ERROR,
+        ) from exc
+    inputs: list[Path] = []
+    for line in lines:
+        entry = line.strip()
+        if not entry or entry.startswith("#"):
+            continue
+        path = Path(entry).expanduser()
+        if not path.is_absolute():
+            path = manifest.parent / path
+        inputs.append(path.resolve(strict=False))
+    return inputs
+
+
+def _batch_targets(inputs: Sequence[Path]) -> Iterator[tuple[Path, str]]:
+    # Bundle names come from input stems, so repeated stems from different
+    # manifest directories are disambiguated by their position in the list,
+    # and by a counter when that name is itself another input's stem.
+    used: set[str] = set()
+    for index, input_path in enumerate(inputs, start=1):
+        stem = input_path.stem or f"input-{index}"
+        name = stem
+        if name.casefold() in used:
+            name = f"{stem}-{index}"
+            suffix = 2
+            while name.casefold() in used:
+                name = f"{stem}-{index}-{suffix}"
+                suffix += 1
+        used.add(name.casefold())
+        yield input_path, name
 
 
 def _input_file(raw_path: str, suffix: str, label: str) -> Path:
@@ -554,6 +1236,8 @@ def _extract_to_bundle(
     output_directory: Path,
     languages: tuple[str, ...],
     runtime: CliRuntime,
+    *,
+    timed: bool = False,
 ) -> PngExtractionResult:
     try:
         png_data = input_path.read_bytes()
@@ -563,6 +1247,13 @@ def _extract_to_bundle(
             f"could not read PNG input {input_path}: {exc}",
             ExitCode.INPUT_ERROR,
         ) from exc
+    if runtime.ocr_timing_log is not None:
+        runtime.ocr_timing_log.clear()
+    # Peak memory is only recorded while tracemalloc traces, which slows
+    # allocation-heavy stages, so tracing is limited to timed extractions.
+    started_tracing = timed and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
     try:
         return extract_png(
             png_data,
@@ -585,6 +1276,57 @@ def _extract_to_bundle(
             str(exc),
             ExitCode.INPUT_ERROR,
         ) from exc
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+
+def _roundtrip_to_bundle(
+    input_path: Path,
+    output_directory: Path,
+    languages: tuple[str, ...],
+    dpi: float,
+    runtime: CliRuntime,
+    *,
+    timed: bool = False,
+) -> tuple[PngExtractionResult, DocxRenderResult, PreviewRenderResult]:
+    extraction = _extract_to_bundle(
+        input_path,
+        output_directory,
+        languages,
+        runtime,
+        timed=timed,
+    )
+    document = extraction.document
+    docx_renderer = _renderer(
+        runtime.docx_renderer_factory,
+        output_directory,
+        "DOCX",
+    )
+    preview_renderer = _renderer(
+        runtime.preview_renderer_factory,
+        output_directory,
+        "preview",
+    )
+    try:
+        docx_result = render_docx(
+            document,
+            output_directory / RECONSTRUCTED_DOCX_FILENAME,
+            renderer=docx_renderer,
+        )
+        preview_result = render_preview(
+            document,
+            output_directory / RECONSTRUCTED_PREVIEW_FILENAME,
+            renderer=preview_renderer,
+            dpi=dpi,
+        )
+    except (DocxRenderError, PreviewRenderError, OSError, ValueError) as exc:
+        raise CliError(
+            "roundtrip_render_failed",
+            str(exc),
+            ExitCode.OPERATIONAL_ERROR,
+        ) from exc
+    return extraction, docx_result, preview_result
 
 
 def _cli_error_from_extraction(exc: PngExtractionError) -> CliError:
@@ -770,6 +1512,31 @@ def _print_extraction_diagnostics(
         )
 
 
+def _timings_record(
+    result: PngExtractionResult,
+    runtime: CliRuntime,
+) -> dict[str, object]:
+    record: dict[str, object] = {
+        "stages": [timing.to_dict() for timing in result.timings],
+    }
+    if runtime.ocr_timing_log is not None:
+        record["ocr_invocations"] = list(runtime.ocr_timing_log)
+        runtime.ocr_timing_log.clear()
+    return record
+
+
+def _print_timings(
+    result: PngExtractionResult,
+    runtime: CliRuntime,
+    stdout: TextIO,
+) -> None:
+    record = _timings_record(result, runtime)
+    print(
+        f"timings={json.dumps(record, ensure_ascii=False, sort_keys=True)}",
+        file=stdout,
+    )
+
+
 def _print_report_warnings(
     warnings: Sequence[object],
     stage: str,
@@ -787,6 +1554,7 @@ def _print_error(error: CliError, stderr: TextIO) -> None:
 
 __all__ = [
     "ASSET_DIRECTORY_NAME",
+    "BATCH_SUMMARY_VERSION",
     "CliError",
     "CliRuntime",
     "DOCUMENT_IR_FILENAME",
@@ -1,13 +1,23 @@
 """Dependency-free Document IR types, codecs, invariants, and errors."""
 
+from .binary import (
+    DOCUMENT_BINARY_MAGIC,
+    DocumentBinaryReader,
+    document_from_binary,
+    encode_document_binary,
+)
 from .codec import (
     document_from_dict,
     document_from_json,
+    document_from_json_stream,
     document_to_dict,
     document_to_json,
+    document_to_json_stream,
+    iter_document_json,
 )
 from .errors import DocumentIRValidationError, ValidationIssue
 from .model import (
+    ELEMENT_TYPE_CODES,
     GEOMETRY_TOLERANCE_PT,
     IR_VERSION,
     SUPPORTED_IR_VERSIONS,
@@ -28,6 +38,7 @@ from .model import (
     LineStyle,
     MediaType,
     Page,
+    PageGeometry,
     PageSize,
     PageSource,
     PixelBoundingBox,
@@ -61,12 +72,15 @@ from .table_topology import (
 )
 
 __all__ = [
+    "DOCUMENT_BINARY_MAGIC",
+    "ELEMENT_TYPE_CODES",
     "GEOMETRY_TOLERANCE_PT",
     "IR_VERSION",
     "SUPPORTED_IR_VERSIONS",
     "Asset",
     "BoundingBox",
     "Confidence",
+    "DocumentBinaryReader",
     "DocumentElement",
     "DocumentIR",
     "DocumentIRValidationError",
@@ -82,6 +96,7 @@ __all__ = [
     "LineStyle",
     "MediaType",
     "Page",
+    "PageGeometry",
     "PageSize",
     "PageSource",
     "PixelBoundingBox",
@@ -108,10 +123,15 @@ __all__ = [
     "TableTopologyDiagnostics",
     "TopologyAxis",
     "TopologyProvenance",
+    "document_from_binary",
     "document_from_dict",
     "document_from_json",
+    "document_from_json_stream",
     "document_to_dict",
     "document_to_json",
+    "document_to_json_stream",
+    "encode_document_binary",
+    "iter_document_json",
     "read_page_table_topology",
     "validate_page_table_topology",
     "validate_document",
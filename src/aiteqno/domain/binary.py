@@ -0,0 +1,489 @@
+"""Columnar binary sidecar encoding for Document IR with lazy page access."""
+
+from __future__ import annotations
+
+import json
+import re
+import struct
+import sys
+from array import array
+from collections.abc import Callable
+from dataclasses import replace
+from typing import Any
+
+from .codec import (
+    asset_to_dict,
+    element_to_dict,
+    page_to_dict,
+    parse_confidence,
+    parse_document,
+    parse_line_style,
+    parse_page,
+    parse_provenance_array,
+    parse_rectangle_style,
+    parse_text_style,
+    thaw_json,
+)
+from .model import (
+    BoundingBox,
+    DocumentElement,
+    DocumentIR,
+    ImageElement,
+    ImageFit,
+    LineElement,
+    Page,
+    Point,
+    RectangleElement,
+    TextElement,
+)
+
+
+DOCUMENT_BINARY_MAGIC = b"AIQIRB\x00\x01"
+
+# Magic, source digest, head length, page count; then one (offset, length)
+# pair per page, the head JSON, and the page blocks.
+_HEADER = struct.Struct("<8s32sII")
+_PAGE_ENTRY = struct.Struct("<QQ")
+# Meta JSON length, element count, line count, string count, string bytes.
+_PAGE_HEADER = struct.Struct("<IIIII")
+_SHA256_PATTERN = re.compile(r"[0-9a-f]{64}")
+_KINDS = (TextElement, LineElement, RectangleElement, ImageElement)
+_FITS = tuple(ImageFit)
+_TABLES = (
+    "text_styles",
+    "line_styles",
+    "rectangle_styles",
+    "provenance",
+    "confidence",
+    "extensions",
+)
+
+
+def encode_document_binary(document: DocumentIR, *, source_digest: str) -> bytes:
+    """Pack a validated document into the columnar binary sidecar format.
+
+    ``source_digest`` is the SHA-256 hex digest of the JSON bytes the document
+    was read from; readers compare it to decide whether the sidecar is fresh.
+    Each page stores element geometry as separate ``x``/``y``/``width``/
+    ``height`` float64 columns, and styles, provenance, confidence, and
+    extensions are interned once per document.
+    """
+
+    if not isinstance(document, DocumentIR):
+        raise TypeError("document must be a DocumentIR")
+    if not isinstance(source_digest, str) or not _SHA256_PATTERN.fullmatch(
+        source_digest
+    ):
+        raise ValueError("source_digest must be 64 lower-case hex digits")
+    tables = _InternTables()
+    blocks = [_encode_page(page, tables) for page in document.pages]
+    head: dict[str, Any] = {
+        "ir_version": document.ir_version,
+        "document_id": document.document_id,
+        "generator": {
+            "name": document.generator.name,
+            "version": document.generator.version,
+        },
+        "pages": [],
+        "assets": [asset_to_dict(asset) for asset in document.assets],
+    }
+    if document.metadata:
+        head["metadata"] = thaw_json(document.metadata)
+    if document.extensions:
+        head["extensions"] = thaw_json(document.extensions)
+    head["tables"] = tables.to_json()
+    head_bytes = _json_bytes(head)
+    offset = _HEADER.size + _PAGE_ENTRY.size * len(blocks) + len(head_bytes)
+    parts = [
+        _HEADER.pack(
+            DOCUMENT_BINARY_MAGIC,
+            bytes.fromhex(source_digest),
+            len(head_bytes),
+            len(blocks),
+        )
+    ]
+    for block in blocks:
+        parts.append(_PAGE_ENTRY.pack(offset, len(block)))
+        offset += len(block)
+    parts.append(head_bytes)
+    parts.extend(blocks)
+    return b"".join(parts)
+
+
+class DocumentBinaryReader:
+    """Decode a binary sidecar one page at a time.
+
+    Opening a sidecar reads only the header, the page offsets, and the
+    interned tables. ``page()`` decodes one page's columns into elements and
+    keeps the result, so ``document()`` reuses pages that were already read.
+    """
+
+    __slots__ = ("_data", "_head", "_pages", "_spans", "_tables", "source_digest")
+
+    def __init__(self, data: bytes | bytearray | memoryview) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise TypeError("Document IR binary data must be bytes")
+        view = memoryview(data).cast("B")
+        if len(view) < _HEADER.size:
+            raise ValueError("Document IR binary data is truncated")
+        magic, digest, head_length, page_count = _HEADER.unpack_from(view)
+        if magic != DOCUMENT_BINARY_MAGIC:
+            raise ValueError("data is not a Document IR binary sidecar")
+        head_start = _HEADER.size + _PAGE_ENTRY.size * page_count
+        if head_start + head_length > len(view):
+            raise ValueError("Document IR binary data is truncated")
+        spans = [
+            _PAGE_ENTRY.unpack_from(view, _HEADER.size + _PAGE_ENTRY.size * index)
+            for index in range(page_count)
+        ]
+        if any(offset + length > len(view) for offset, length in spans):
+            raise ValueError("Document IR binary page lies outside the data")
+        head = _json_value(view[head_start : head_start + head_length])
+        if not isinstance(head, dict) or not isinstance(head.get("tables"), dict):
+            raise ValueError("Document IR binary head must be an object with tables")
+        self.source_digest = digest.hex()
+        self._data = view
+        self._spans = spans
+        self._tables = _parse_tables(head.pop("tables"))
+        self._head = head
+        self._pages: list[Page | None] = [None] * page_count
+
+    @property
+    def page_count(self) -> int:
+        return len(self._spans)
+
+    def page(self, index: int) -> Page:
+        """Return one type-checked page, decoding only its own block.
+
+        Bounds, reading-order, and table-topology invariants are checked only
+        by ``document()``, which validates every page together.
+        """
+
+        if isinstance(index, bool) or not isinstance(index, int):
+            raise TypeError("page index must be an integer")
+        if not 0 <= index < len(self._spans):
+            raise IndexError("page index out of range")
+        page = self._pages[index]
+        if page is None:
+            offset, length = self._spans[index]
+            page = _decode_page(
+                self._data[offset : offset + length],
+                self._tables,
+                f"$.pages[{index}]",
+            )
+            self._pages[index] = page
+        return page
+
+    def document(self) -> DocumentIR:
+        """Return the whole document with every cross-page invariant checked."""
+
+        return parse_document(
+            self._head,
+            tuple(self.page(index) for index in range(len(self._spans))),
+        )
+
+
+def document_from_binary(data: bytes | bytearray | memoryview) -> DocumentIR:
+    """Decode a complete binary sidecar into a validated document."""
+
+    return DocumentBinaryReader(data).document()
+
+
+class _InternTables:
+    """First-seen indexes of the shared objects referenced by element columns.
+
+    Keys are ``repr`` strings rather than the objects themselves, because
+    equal model values such as ``0.0`` and ``-0.0`` must not share a slot.
+    """
+
+    __slots__ = ("_indexes", "_values")
+
+    def __init__(self) -> None:
+        self._indexes: dict[str, dict[str, int]] = {name: {} for name in _TABLES}
+        self._values: dict[str, list[Any]] = {name: [] for name in _TABLES}
+
+    def index(self, table: str, key: str, value: Callable[[], Any]) -> int:
+        indexes = self._indexes[table]
+        found = indexes.get(key)
+        if found is None:
+            found = indexes[key] = len(self._values[table])
+            self._values[table].append(value())
+        return found
+
+    def to_json(self) -> dict[str, list[Any]]:
+        return self._values
+
+
+def _encode_page(page: Page, tables: _InternTables) -> bytes:
+    count = len(page.elements)
+    kinds = array("B", bytes(count))
+    aux = array("b", bytes(count))
+    geometry = array("d", [0.0]) * (4 * count)
+    z_index = array("q", [0]) * count
+    reading_order = array("q", [0]) * count
+    styles = array("i", [-1]) * count
+    provenance = array("i", [0]) * count
+    confidence = array("i", [-1]) * count
+    extensions = array("i", [-1]) * count
+    points = array("d")
+    strings: list[str] = []
+    for index, element in enumerate(page.elements):
+        kind = _KINDS.index(type(element))
+        kinds[index] = kind
+        bbox = element.bbox
+        geometry[index] = bbox.x
+        geometry[count + index] = bbox.y
+        geometry[2 * count + index] = bbox.width
+        geometry[3 * count + index] = bbox.height
+        try:
+            z_index[index] = element.z_index
+            if isinstance(element, TextElement):
+                reading_order[index] = element.reading_order
+        except OverflowError as exc:
+            raise ValueError(
+                f"element {element.id!r} has an integer outside the int64 range"
+            ) from exc
+        provenance[index] = tables.index(
+            "provenance",
+            repr(element.provenance),
+            lambda element=element: element_to_dict(element)["provenance"],
+        )
+        if element.confidence is not None:
+            confidence[index] = tables.index(
+                "confidence",
+                repr(element.confidence),
+                lambda element=element: element_to_dict(element)["confidence"],
+            )
+        if element.extensions:
+            thawed = thaw_json(element.extensions)
+            extensions[index] = tables.index(
+                "extensions", _json_bytes(thawed).decode("utf-8"), lambda: thawed
+            )
+        strings.append(element.id)
+        if isinstance(element, ImageElement):
+            strings.append(element.asset_id)
+            aux[index] = _FITS.index(element.fit) * 2 + (element.alt_text is not None)
+            if element.alt_text is not None:
+                strings.append(element.alt_text)
+            continue
+        if isinstance(element, TextElement):
+            strings.append(element.text)
+        elif isinstance(element, LineElement):
+            points.extend((element.start.x, element.start.y))
+            points.extend((element.end.x, element.end.y))
+        styles[index] = tables.index(
+            _TABLES[kind],
+            repr(element.style),
+            lambda element=element: element_to_dict(element)["style"],
+        )
+    meta = _json_bytes(page_to_dict(replace(page, elements=())))
+    text = "".join(strings).encode("utf-8")
+    lengths = array("I", [len(value) for value in strings])
+    return b"".join(
+        (
+            _PAGE_HEADER.pack(
+                len(meta), count, len(points) // 4, len(strings), len(text)
+            ),
+            meta,
+            *(
+                _little_endian(column)
+                for column in (
+                    kinds,
+                    aux,
+                    geometry,
+                    z_index,
+                    reading_order,
+                    styles,
+                    provenance,
+                    confidence,
+                    extensions,
+                    points,
+                    lengths,
+                )
+            ),
+            text,
+        )
+    )
+
+
+def _decode_page(view: memoryview, tables: dict[str, list[Any]], path: str) -> Page:
+    try:
+        meta_length, count, line_count, string_count, text_length = (
+            _PAGE_HEADER.unpack_from(view)
+        )
+    except struct.error as exc:
+        raise ValueError(f"{path}: Document IR binary page is truncated") from exc
+    cursor = _PAGE_HEADER.size
+    meta = _json_value(view[cursor : cursor + meta_length])
+    cursor += meta_length
+    columns = []
+    for typecode, length in (
+        ("B", count),
+        ("b", count),
+        ("d", 4 * count),
+        ("q", count),
+        ("q", count),
+        ("i", count),
+        ("i", count),
+        ("i", count),
+        ("i", count),
+        ("d", 4 * line_count),
+        ("I", string_count),
+    ):
+        column = array(typecode)
+        end = cursor + column.itemsize * length
+        if end > len(view):
+            raise ValueError(f"{path}: Document IR binary page is truncated")
+        column.frombytes(view[cursor:end])
+        if sys.byteorder == "big" and column.itemsize > 1:
+            column.byteswap()
+        columns.append(column)
+        cursor = end
+    if cursor + text_length != len(view):
+        raise ValueError(f"{path}: Document IR binary page has a wrong length")
+    (
+        kinds,
+        aux,
+        geometry,
+        z_index,
+        reading_order,
+        styles,
+        provenance,
+        confidence,
+        extensions,
+        points,
+        lengths,
+    ) = columns
+    text = str(view[cursor:], "utf-8")
+    strings = iter(_split(text, lengths))
+    line_points = iter(points)
+    elements: list[DocumentElement] = []
+    try:
+        for index in range(count):
+            kind = kinds[index]
+            common = {
+                "id": next(strings),
+                "bbox": BoundingBox(
+                    x=geometry[index],
+                    y=geometry[count + index],
+                    width=geometry[2 * count + index],
+                    height=geometry[3 * count + index],
+                ),
+                "z_index": z_index[index],
+                "confidence": None
+                if confidence[index] < 0
+                else tables["confidence"][confidence[index]],
+                "provenance": tables["provenance"][provenance[index]],
+                "extensions": {}
+                if extensions[index] < 0
+                else tables["extensions"][extensions[index]],
+            }
+            if kind == 0:
+                elements.append(
+                    TextElement(
+                        **common,
+                        text=next(strings),
+                        reading_order=reading_order[index],
+                        style=tables["text_styles"][styles[index]],
+                    )
+                )
+            elif kind == 1:
+                elements.append(
+                    LineElement(
+                        **common,
+                        start=Point(x=next(line_points), y=next(line_points)),
+                        end=Point(x=next(line_points), y=next(line_points)),
+                        style=tables["line_styles"][styles[index]],
+                    )
+                )
+            elif kind == 2:
+                elements.append(
+                    RectangleElement(
+                        **common,
+                        style=tables["rectangle_styles"][styles[index]],
+                    )
+                )
+            elif kind == 3:
+                elements.append(
+                    ImageElement(
+                        **common,
+                        asset_id=next(strings),
+                        fit=_FITS[aux[index] // 2],
+                        alt_text=next(strings) if aux[index] % 2 else None,
+                    )
+                )
+            else:
+                raise ValueError(f"unknown element kind {kind}")
+    except (IndexError, StopIteration, TypeError, ValueError) as exc:
+        raise ValueError(
+            f"{path}.elements[{len(elements)}]: invalid Document IR binary "
+            f"element: {exc}"
+        ) from exc
+    return parse_page(meta, path, tuple(elements))
+
+
+def _parse_tables(raw: dict[str, Any]) -> dict[str, list[Any]]:
+    parsers = {
+        "text_styles": parse_text_style,
+        "line_styles": parse_line_style,
+        "rectangle_styles": parse_rectangle_style,
+        "provenance": parse_provenance_array,
+        "confidence": parse_confidence,
+    }
+    tables: dict[str, list[Any]] = {}
+    for name in _TABLES:
+        values = raw.get(name)
+        if not isinstance(values, list):
+            raise ValueError(f"Document IR binary table {name!r} must be an array")
+        parser = parsers.get(name)
+        tables[name] = (
+            values
+            if parser is None
+            else [
+                parser(value, f"$binary.{name}[{index}]")
+                for index, value in enumerate(values)
+            ]
+        )
+    return tables
+
+
+def _split(text: str, lengths: array) -> list[str]:
+    values = []
+    start = 0
+    for length in lengths:
+        values.append(text[start : start + length])
+        start += length
+    if start != len(text):
+        raise ValueError("Document IR binary string lengths do not match the text")
+    return values
+
+
+def _little_endian(column: array) -> bytes:
+    if sys.byteorder == "big" and column.itemsize > 1:
+        column = array(column.typecode, column)
+        column.byteswap()
+    return column.tobytes()
+
+
+def _json_bytes(value: Any) -> bytes:
+    return json.dumps(
+        value,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _json_value(view: memoryview) -> Any:
+    try:
+        return json.loads(str(view, "utf-8"))
+    except (UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError(f"Document IR binary JSON section is invalid: {exc}") from exc
+
+
+__all__ = [
+    "DOCUMENT_BINARY_MAGIC",
+    "DocumentBinaryReader",
+    "document_from_binary",
+    "encode_document_binary",
+]
@@ -1,11 +1,19 @@
-"""JSON serialization and parsing for the Document IR domain model."""
+"""JSON serialization and parsing for the Document IR domain model.
+
+Helpers without a leading underscore that the package does not re-export are
+shared with the binary sidecar codec only.
+"""
 
 from __future__ import annotations
 
+import codecs
 import json
-from collections.abc import Callable, Mapping, Sequence
+import math
+import re
+from collections.abc import Callable, Iterator, Mapping, Sequence
 from enum import Enum
-from typing import Any, TypeVar
+from json.encoder import encode_basestring
+from typing import IO, Any, TypeVar
 
 from .errors import DocumentIRValidationError
 from .model import (
@@ -60,14 +68,18 @@ def _check_fields(
     required: set[str],
     optional: set[str] = frozenset(),
 ) -> None:
-    missing = sorted(required - value.keys())
+    keys = value.keys()
+    if required <= keys and len(keys) <= len(required) + len(optional):
+        if len(keys) == len(required) or keys <= required | optional:
+            return
+    missing = sorted(required - keys)
     if missing:
         _fail(
             path,
             "missing required field(s): " + ", ".join(missing),
             "missing_field",
         )
-    unknown = sorted(value.keys() - required - optional)
+    unknown = sorted(keys - required - optional)
     if unknown:
         _fail(
             path,
@@ -153,7 +165,7 @@ def _parse_page_source(value: Any, path: str) -> PageSource:
     )
 
 
-def _parse_confidence(value: Any, path: str) -> Confidence | None:
+def parse_confidence(value: Any, path: str) -> Confidence | None:
     if value is None:
         return None
     obj = _as_object(value, path)
@@ -197,7 +209,7 @@ def _parse_provenance(value: Any, path: str) -> Provenance:
     )
 
 
-def _parse_provenance_array(value: Any, path: str) -> tuple[Provenance, ...]:
+def parse_provenance_array(value: Any, path: str) -> tuple[Provenance, ...]:
     items = _as_array(value, path)
     return tuple(
         _parse_provenance(item, f"{path}[{index}]")
@@ -205,7 +217,7 @@ def _parse_provenance_array(value: Any, path: str) -> tuple[Provenance, ...]:
     )
 
 
-def _parse_text_style(value: Any, path: str) -> TextStyle:
+def parse_text_style(value: Any, path: str) -> TextStyle:
     obj = _as_object(value, path)
     _check_fields(
         obj,
@@ -237,7 +249,7 @@ def _parse_text_style(value: Any, path: str) -> TextStyle:
     )
 
 
-def _parse_line_style(value: Any, path: str) -> LineStyle:
+def parse_line_style(value: Any, path: str) -> LineStyle:
     obj = _as_object(value, path)
     _check_fields(
         obj,
@@ -255,7 +267,7 @@ def _parse_line_style(value: Any, path: str) -> LineStyle:
     )
 
 
-def _parse_rectangle_style(value: Any, path: str) -> RectangleStyle:
+def parse_rectangle_style(value: Any, path: str) -> RectangleStyle:
     obj = _as_object(value, path)
     _check_fields(
         obj,
@@ -294,8 +306,8 @@ def _common_element_values(obj: Mapping[str, Any], path: str) -> dict[str, Any]:
         "id": obj["id"],
         "bbox": _parse_bbox(obj["bbox"], f"{path}.bbox"),
         "z_index": obj["z_index"],
-        "confidence": _parse_confidence(obj["confidence"], f"{path}.confidence"),
-        "provenance": _parse_provenance_array(
+        "confidence": parse_confidence(obj["confidence"], f"{path}.confidence"),
+        "provenance": parse_provenance_array(
             obj["provenance"], f"{path}.provenance"
         ),
         "extensions": obj.get("extensions", {}),
@@ -322,7 +334,7 @@ def _parse_element(value: Any, path: str) -> DocumentElement:
             **_common_element_values(obj, path),
             text=obj["text"],
             reading_order=obj["reading_order"],
-            style=_parse_text_style(obj["style"], f"{path}.style"),
+            style=parse_text_style(obj["style"], f"{path}.style"),
         )
     if element_type == "line":
         _check_fields(
@@ -337,7 +349,7 @@ def _parse_element(value: Any, path: str) -> DocumentElement:
             **_common_element_values(obj, path),
             start=_parse_point(obj["start"], f"{path}.start"),
             end=_parse_point(obj["end"], f"{path}.end"),
-            style=_parse_line_style(obj["style"], f"{path}.style"),
+            style=parse_line_style(obj["style"], f"{path}.style"),
         )
     if element_type == "rectangle":
         _check_fields(
@@ -350,7 +362,7 @@ def _parse_element(value: Any, path: str) -> DocumentElement:
             RectangleElement,
             path,
             **_common_element_values(obj, path),
-            style=_parse_rectangle_style(obj["style"], f"{path}.style"),
+            style=parse_rectangle_style(obj["style"], f"{path}.style"),
         )
     if element_type == "image":
         _check_fields(
@@ -375,7 +387,11 @@ def _parse_element(value: Any, path: str) -> DocumentElement:
     )
 
 
-def _parse_page(value: Any, path: str) -> Page:
+def parse_page(
+    value: Any,
+    path: str,
+    elements: tuple[DocumentElement, ...] | None = None,
+) -> Page:
     obj = _as_object(value, path)
     _check_fields(
         obj,
@@ -383,7 +399,8 @@ def _parse_page(value: Any, path: str) -> Page:
         required={"id", "number", "size", "elements"},
         optional={"source", "extensions"},
     )
-    elements = _as_array(obj["elements"], f"{path}.elements")
+    if elements is None:
+        items = _as_array(obj["elements"], f"{path}.elements")
     source = None
     if "source" in obj:
         source = _parse_page_source(obj["source"], f"{path}.source")
@@ -394,9 +411,11 @@ def _parse_page(value: Any, path: str) -> Page:
         number=obj["number"],
         size=_parse_page_size(obj["size"], f"{path}.size"),
         source=source,
-        elements=tuple(
+        elements=elements
+        if elements is not None
+        else tuple(
             _parse_element(element, f"{path}.elements[{index}]")
-            for index, element in enumerate(elements)
+            for index, element in enumerate(items)
         ),
         extensions=obj.get("extensions", {}),
     )
@@ -434,6 +453,13 @@ def _parse_asset(value: Any, path: str) -> Asset:
 def document_from_dict(data: Mapping[str, Any]) -> DocumentIR:
     """Parse plain Python data and enforce all Document IR invariants."""
 
+    return parse_document(data)
+
+
+def parse_document(
+    data: Mapping[str, Any],
+    pages: tuple[Page, ...] | None = None,
+) -> DocumentIR:
     obj = _as_object(data, "$")
     _check_fields(
         obj,
@@ -441,7 +467,8 @@ def document_from_dict(data: Mapping[str, Any]) -> DocumentIR:
         required={"ir_version", "document_id", "generator", "pages", "assets"},
         optional={"metadata", "extensions"},
     )
-    pages = _as_array(obj["pages"], "$.pages")
+    if pages is None:
+        items = _as_array(obj["pages"], "$.pages")
     assets = _as_array(obj["assets"], "$.assets")
     return _construct(
         DocumentIR,
@@ -449,9 +476,11 @@ def document_from_dict(data: Mapping[str, Any]) -> DocumentIR:
         ir_version=obj["ir_version"],
         document_id=obj["document_id"],
         generator=_parse_generator(obj["generator"], "$.generator"),
-        pages=tuple(
-            _parse_page(page, f"$.pages[{index}]")
-            for index, page in enumerate(pages)
+        pages=pages
+        if pages is not None
+        else tuple(
+            parse_page(page, f"$.pages[{index}]")
+            for index, page in enumerate(items)
         ),
         assets=tuple(
             _parse_asset(asset, f"$.assets[{index}]")
@@ -493,11 +522,235 @@ def document_from_json(text: str | bytes | bytearray) -> DocumentIR:
     return document_from_dict(data)
 
 
-def _thaw_json(value: Any) -> Any:
+def document_from_json_stream(
+    stream: IO[str] | IO[bytes],
+    *,
+    chunk_size: int = 1 << 16,
+) -> DocumentIR:
+    """Parse Document IR JSON from a text or UTF-8 byte stream incrementally.
+
+    Elements are decoded one at a time and turned into model objects at once,
+    so neither the whole text nor the whole dict tree is held in memory. The
+    result equals ``document_from_json`` of the same text; when a document
+    has several problems, the first one in stream order is reported.
+    """
+
+    if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+        raise TypeError("chunk_size must be an integer")
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    reader = _JsonStreamReader(stream, chunk_size)
+    if reader.peek() != "{":
+        data = reader.value()
+        reader.finish()
+        return document_from_dict(data)
+    fields: dict[str, Any] = {}
+    pages: tuple[Page, ...] | None = None
+    for key in reader.members():
+        if key == "pages" and reader.peek() == "[":
+            pages = tuple(
+                _read_page(reader, f"$.pages[{index}]") for index in reader.items()
+            )
+            fields[key] = pages
+        else:
+            fields[key] = reader.value()
+            if key == "pages":
+                pages = None
+    reader.finish()
+    return parse_document(fields, pages)
+
+
+def _read_page(reader: _JsonStreamReader, path: str) -> Page:
+    if reader.peek() != "{":
+        return parse_page(reader.value(), path)
+    fields: dict[str, Any] = {}
+    elements: tuple[DocumentElement, ...] | None = None
+    for key in reader.members():
+        if key == "elements" and reader.peek() == "[":
+            elements = tuple(
+                _parse_element(reader.value(), f"{path}.elements[{index}]")
+                for index in reader.items()
+            )
+            fields[key] = elements
+        else:
+            fields[key] = reader.value()
+            if key == "elements":
+                elements = None
+    return parse_page(fields, path, elements)
+
+
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+class _JsonStreamReader:
+    """A pull reader over JSON text arriving in chunks from a stream."""
+
+    __slots__ = (
+        "_buffer",
+        "_bytes_read",
+        "_chunk_size",
+        "_column_before",
+        "_decoder",
+        "_eof",
+        "_lines_before",
+        "_position",
+        "_stream",
+        "_text_decoder",
+    )
+
+    def __init__(self, stream: IO[str] | IO[bytes], chunk_size: int) -> None:
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder(parse_constant=_reject_json_constant)
+        self._text_decoder: codecs.IncrementalDecoder | None = None
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+        self._bytes_read = 0
+        # Line and column bookkeeping for text already dropped from the buffer.
+        self._lines_before = 0
+        self._column_before = 0
+        if self._fill() and self._buffer.startswith("\ufeff"):
+            self._fail_json("Unexpected UTF-8 BOM (decode using utf-8-sig)", 0)
+
+    def _fill(self, minimum: int = 0) -> bool:
+        while not self._eof:
+            chunk = self._stream.read(max(self._chunk_size, minimum))
+            if isinstance(chunk, (bytes, bytearray)):
+                if self._text_decoder is None:
+                    self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+                pending = len(self._text_decoder.getstate()[0])
+                try:
+                    text = self._text_decoder.decode(bytes(chunk), final=not chunk)
+                except UnicodeDecodeError as exc:
+                    _fail(
+                        "$",
+                        "Document IR must be UTF-8: byte "
+                        f"{self._bytes_read - pending + exc.start} is invalid",
+                        "invalid_json",
+                    )
+                self._bytes_read += len(chunk)
+            elif isinstance(chunk, str):
+                text = chunk
+            else:
+                _fail("$", "JSON stream must yield str or bytes", "invalid_type")
+            if not chunk:
+                self._eof = True
+            if text:
+                self._compact()
+                self._buffer += text
+                return True
+        return False
+
+    def _compact(self) -> None:
+        if self._position <= len(self._buffer) // 2:
+            return
+        dropped = self._buffer[: self._position]
+        newline = dropped.rfind("\n")
+        if newline < 0:
+            self._column_before += len(dropped)
+        else:
+            self._lines_before += dropped.count("\n")
+            self._column_before = len(dropped) - newline - 1
+        self._buffer = self._buffer[self._position :]
+        self._position = 0
+
+    def _fail_json(self, message: str, position: int) -> None:
+        newline = self._buffer.rfind("\n", 0, position)
+        line = self._lines_before + self._buffer.count("\n", 0, position) + 1
+        column = (
+            position - newline if newline >= 0 else self._column_before + position + 1
+        )
+        _fail(
+            "$",
+            f"invalid JSON at line {line}, column {column}: {message}",
+            "invalid_json",
+        )
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character, or "" at the end."""
+
+        while True:
+            self._position = _JSON_WHITESPACE.match(
+                self._buffer, self._position
+            ).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ""
+
+    def value(self) -> Any:
+        """Decode one complete JSON value at the current position."""
+
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError as exc:
+                # Anything may be a truncated value until the stream ends.
+                if self._fill(len(self._buffer)):
+                    continue
+                self._fail_json(exc.msg, exc.pos)
+            # A number or literal that touches the end of the buffer may
+            # continue in the next chunk.
+            if end < len(self._buffer) or not self._fill(len(self._buffer)):
+                self._position = end
+                return value
+
+    def _expect(self, character: str, message: str) -> None:
+        if self.peek() != character:
+            self._fail_json(message, self._position)
+        self._position += 1
+
+    def members(self) -> Iterator[str]:
+        """Yield object keys; the caller consumes each member value."""
+
+        self._expect("{", "Expecting value")
+        if self.peek() == "}":
+            self._position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self._fail_json(
+                    "Expecting property name enclosed in double quotes",
+                    self._position,
+                )
+            key = self.value()
+            self._expect(":", "Expecting ':' delimiter")
+            yield key
+            delimiter = self.peek()
+            if delimiter == "}":
+                self._position += 1
+                return
+            self._expect(",", "Expecting ',' delimiter")
+
+    def items(self) -> Iterator[int]:
+        """Yield array indexes; the caller consumes each item value."""
+
+        self._expect("[", "Expecting value")
+        if self.peek() == "]":
+            self._position += 1
+            return
+        index = 0
+        while True:
+            yield index
+            index += 1
+            delimiter = self.peek()
+            if delimiter == "]":
+                self._position += 1
+                return
+            self._expect(",", "Expecting ',' delimiter")
+
+    def finish(self) -> None:
+        if self.peek():
+            self._fail_json("Extra data", self._position)
+
+
+def thaw_json(value: Any) -> Any:
     if isinstance(value, Mapping):
-        return {key: _thaw_json(item) for key, item in value.items()}
+        return {key: thaw_json(item) for key, item in value.items()}
     if isinstance(value, tuple):
-        return [_thaw_json(item) for item in value]
+        return [thaw_json(item) for item in value]
     return value
 
 
@@ -557,11 +810,11 @@ def _common_element_to_dict(element: DocumentElement) -> dict[str, Any]:
         ],
     }
     if element.extensions:
-        result["extensions"] = _thaw_json(element.extensions)
+        result["extensions"] = thaw_json(element.extensions)
     return result
 
 
-def _element_to_dict(element: DocumentElement) -> dict[str, Any]:
+def element_to_dict(element: DocumentElement) -> dict[str, Any]:
     result = _common_element_to_dict(element)
     if isinstance(element, TextElement):
         result.update(
@@ -611,7 +864,7 @@ def _element_to_dict(element: DocumentElement) -> dict[str, Any]:
     return result
 
 
-def _page_to_dict(page: Page) -> dict[str, Any]:
+def page_to_dict(page: Page) -> dict[str, Any]:
     result: dict[str, Any] = {
         "id": page.id,
         "number": page.number,
@@ -620,7 +873,7 @@ def _page_to_dict(page: Page) -> dict[str, Any]:
             "height": page.size.height,
             "unit": page.size.unit.value,
         },
-        "elements": [_element_to_dict(element) for element in page.elements],
+        "elements": [element_to_dict(element) for element in page.elements],
     }
     if page.source is not None:
         result["source"] = {
@@ -631,11 +884,11 @@ def _page_to_dict(page: Page) -> dict[str, Any]:
             "dpi_source": page.source.dpi_source.value,
         }
     if page.extensions:
-        result["extensions"] = _thaw_json(page.extensions)
+        result["extensions"] = thaw_json(page.extensions)
     return result
 
 
-def _asset_to_dict(asset: Asset) -> dict[str, Any]:
+def asset_to_dict(asset: Asset) -> dict[str, Any]:
     result: dict[str, Any] = {
         "id": asset.id,
         "path": asset.path,
@@ -661,24 +914,370 @@ def document_to_dict(document: DocumentIR) -> dict[str, Any]:
             "name": document.generator.name,
             "version": document.generator.version,
         },
-        "pages": [_page_to_dict(page) for page in document.pages],
-        "assets": [_asset_to_dict(asset) for asset in document.assets],
+        "pages": [page_to_dict(page) for page in document.pages],
+        "assets": [asset_to_dict(asset) for asset in document.assets],
     }
     if document.metadata:
-        result["metadata"] = _thaw_json(document.metadata)
+        result["metadata"] = thaw_json(document.metadata)
     if document.extensions:
-        result["extensions"] = _thaw_json(document.extensions)
+        result["extensions"] = thaw_json(document.extensions)
     return result
 
 
 def document_to_json(document: DocumentIR, *, indent: int | None = 2) -> str:
-    """Serialize a validated model as deterministic UTF-8 JSON text."""
-
-    serialized = json.dumps(
-        document_to_dict(document),
-        ensure_ascii=False,
-        allow_nan=False,
-        indent=indent,
-        separators=None if indent is not None else (",", ":"),
+    """Serialize a validated model as deterministic UTF-8 JSON text.
+
+    Compact text comes from the C encoder, which already outruns a direct
+    writer; indented text would fall back to the pure-Python encoder, so it is
+    written straight from the model instead. Both spell every byte the same.
+    """
+
+    if indent is None:
+        return (
+            json.dumps(
+                document_to_dict(document),
+                ensure_ascii=False,
+                allow_nan=False,
+                separators=(",", ":"),
+            )
+            + "\n"
+        )
+    return "".join(iter_document_json(document, indent=indent))
+
+
+def iter_document_json(
+    document: DocumentIR,
+    *,
+    indent: int | None = 2,
+) -> Iterator[str]:
+    """Yield ``document_to_json`` text in chunks of at most one element.
+
+    The text is written straight from the frozen model without building the
+    intermediate dict tree. Its characters equal ``json.dumps`` of
+    ``document_to_dict`` with the same ``indent``, because scalars use the
+    encoder's own string, integer, and float spellings.
+    """
+
+    layout = _JsonLayout(indent)
+    head = [
+        ("ir_version", _json_scalar(document.ir_version)),
+        ("document_id", _json_scalar(document.document_id)),
+        (
+            "generator",
+            layout.object(
+                [
+                    ("name", _json_scalar(document.generator.name)),
+                    ("version", _json_scalar(document.generator.version)),
+                ],
+                1,
+            ),
+        ),
+    ]
+    yield "{" + layout.members(head, 1) + "," + layout.newline(1)
+    yield encode_basestring("pages") + layout.key_separator + "["
+    for index, page in enumerate(document.pages):
+        yield ("," if index else "") + layout.newline(2)
+        yield from _iter_page_json(page, layout, 2)
+    tail = [
+        (
+            "assets",
+            layout.array([_asset_json(asset, layout, 2) for asset in document.assets], 1),
+        )
+    ]
+    if document.metadata:
+        tail.append(("metadata", _json_text(document.metadata, layout, 1)))
+    if document.extensions:
+        tail.append(("extensions", _json_text(document.extensions, layout, 1)))
+    yield (
+        layout.newline(1)
+        + "],"
+        + layout.members(tail, 1)
+        + layout.newline(0)
+        + "}\n"
+    )
+
+
+def document_to_json_stream(
+    document: DocumentIR,
+    stream: IO[str],
+    *,
+    indent: int | None = 2,
+) -> None:
+    """Write ``document_to_json`` text to a text stream one element at a time."""
+
+    for chunk in iter_document_json(document, indent=indent):
+        stream.write(chunk)
+
+
+class _JsonLayout:
+    """``json.dumps`` indentation and separators for one ``indent`` value."""
+
+    __slots__ = ("_breaks", "_indent", "key_separator")
+
+    def __init__(self, indent: int | str | None) -> None:
+        if indent is not None and not isinstance(indent, str):
+            indent = " " * indent
+        self._indent = indent
+        self._breaks: list[str] = []
+        self.key_separator = ":" if indent is None else ": "
+
+    def newline(self, level: int) -> str:
+        if self._indent is None:
+            return ""
+        breaks = self._breaks
+        while len(breaks) <= level:
+            breaks.append("\n" + self._indent * len(breaks))
+        return breaks[level]
+
+    def members(self, members: list[tuple[str, str]], level: int) -> str:
+        # Members of an object whose opening brace sits at ``level - 1``.
+        inner = self.newline(level)
+        separator = self.key_separator
+        return inner + ("," + inner).join(
+            encode_basestring(key) + separator + value for key, value in members
+        )
+
+    def object(self, members: list[tuple[str, str]], level: int) -> str:
+        if not members:
+            return "{}"
+        return "{" + self.members(members, level + 1) + self.newline(level) + "}"
+
+    def array(self, items: list[str], level: int) -> str:
+        if not items:
+            return "[]"
+        inner = self.newline(level + 1)
+        return "[" + inner + ("," + inner).join(items) + self.newline(level) + "]"
+
+
+def _json_scalar(value: Any) -> str:
+    # The same dispatch order and spellings as json.encoder.
+    if isinstance(value, str):
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if isinstance(value, int):
+        return int.__repr__(value)
+    if isinstance(value, float):
+        if not math.isfinite(value):
+            raise ValueError(
+                "Out of range float values are not JSON compliant: " + repr(value)
+            )
+        return float.__repr__(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _json_text(value: Any, layout: _JsonLayout, level: int) -> str:
+    if isinstance(value, Mapping):
+        return layout.object(
+            [(key, _json_text(item, layout, level + 1)) for key, item in value.items()],
+            level,
+        )
+    if isinstance(value, (tuple, list)):
+        return layout.array(
+            [_json_text(item, layout, level + 1) for item in value],
+            level,
+        )
+    return _json_scalar(value)
+
+
+def _bbox_json(
+    bbox: BoundingBox | PixelBoundingBox,
+    layout: _JsonLayout,
+    level: int,
+) -> str:
+    return layout.object(
+        [
+            ("x", _json_scalar(bbox.x)),
+            ("y", _json_scalar(bbox.y)),
+            ("width", _json_scalar(bbox.width)),
+            ("height", _json_scalar(bbox.height)),
+        ],
+        level,
     )
-    return serialized + "\n"
+
+
+def _point_json(point: Point, layout: _JsonLayout, level: int) -> str:
+    return layout.object(
+        [("x", _json_scalar(point.x)), ("y", _json_scalar(point.y))],
+        level,
+    )
+
+
+def _confidence_json(
+    confidence: Confidence | None,
+    layout: _JsonLayout,
+    level: int,
+) -> str:
+    if confidence is None:
+        return "null"
+    members = [("overall", _json_scalar(confidence.overall))]
+    if confidence.detection is not None:
+        members.append(("detection", _json_scalar(confidence.detection)))
+    if confidence.recognition is not None:
+        members.append(("recognition", _json_scalar(confidence.recognition)))
+    return layout.object(members, level)
+
+
+def _provenance_json(provenance: Provenance, layout: _JsonLayout, level: int) -> str:
+    members = [
+        ("stage", _json_scalar(provenance.stage.value)),
+        ("provider", _json_scalar(provenance.provider)),
+        ("provider_version", _json_scalar(provenance.provider_version)),
+        (
+            "source_refs",
+            layout.array(
+                [_json_scalar(reference) for reference in provenance.source_refs],
+                level + 1,
+            ),
+        ),
+    ]
+    if provenance.source_bbox_px is not None:
+        members.append(
+            ("source_bbox_px", _bbox_json(provenance.source_bbox_px, layout, level + 1))
+        )
+    if provenance.parameters_digest is not None:
+        members.append(
+            ("parameters_digest", _json_scalar(provenance.parameters_digest))
+        )
+    if provenance.notes is not None:
+        members.append(("notes", _json_scalar(provenance.notes)))
+    return layout.object(members, level)
+
+
+def _element_json(element: DocumentElement, layout: _JsonLayout, level: int) -> str:
+    inner = level + 1
+    members = [
+        ("id", _json_scalar(element.id)),
+        ("type", _json_scalar(element.type.value)),
+        ("bbox", _bbox_json(element.bbox, layout, inner)),
+        ("z_index", _json_scalar(element.z_index)),
+        ("confidence", _confidence_json(element.confidence, layout, inner)),
+        (
+            "provenance",
+            layout.array(
+                [
+                    _provenance_json(record, layout, inner + 1)
+                    for record in element.provenance
+                ],
+                inner,
+            ),
+        ),
+    ]
+    if element.extensions:
+        members.append(("extensions", _json_text(element.extensions, layout, inner)))
+    if isinstance(element, TextElement):
+        style = element.style
+        members.append(("text", _json_scalar(element.text)))
+        members.append(("reading_order", _json_scalar(element.reading_order)))
+        style_members = [
+            ("font_family", _json_scalar(style.font_family)),
+            ("font_size_pt", _json_scalar(style.font_size_pt)),
+            ("font_weight", _json_scalar(style.font_weight)),
+            ("font_style", _json_scalar(style.font_style.value)),
+            ("color", _json_scalar(style.color)),
+            ("align", _json_scalar(style.align.value)),
+            ("line_height", _json_scalar(style.line_height)),
+            ("rotation_deg", _json_scalar(style.rotation_deg)),
+            ("opacity", _json_scalar(style.opacity)),
+        ]
+    elif isinstance(element, LineElement):
+        members.append(("start", _point_json(element.start, layout, inner)))
+        members.append(("end", _point_json(element.end, layout, inner)))
+        style_members = [
+            ("width_pt", _json_scalar(element.style.width_pt)),
+            ("color", _json_scalar(element.style.color)),
+            ("dash", _json_scalar(element.style.dash.value)),
+            ("opacity", _json_scalar(element.style.opacity)),
+        ]
+    elif isinstance(element, RectangleElement):
+        style_members = [
+            ("stroke_color", _json_scalar(element.style.stroke_color)),
+            ("stroke_width_pt", _json_scalar(element.style.stroke_width_pt)),
+            ("fill_color", _json_scalar(element.style.fill_color)),
+            ("corner_radius_pt", _json_scalar(element.style.corner_radius_pt)),
+            ("opacity", _json_scalar(element.style.opacity)),
+        ]
+    elif isinstance(element, ImageElement):
+        members.append(("asset_id", _json_scalar(element.asset_id)))
+        members.append(("fit", _json_scalar(element.fit.value)))
+        if element.alt_text is not None:
+            members.append(("alt_text", _json_scalar(element.alt_text)))
+        return layout.object(members, level)
+    else:
+        raise TypeError(f"unsupported Document IR element: {type(element).__name__}")
+    members.append(("style", layout.object(style_members, inner)))
+    return layout.object(members, level)
+
+
+def _iter_page_json(page: Page, layout: _JsonLayout, level: int) -> Iterator[str]:
+    inner = level + 1
+    head = [
+        ("id", _json_scalar(page.id)),
+        ("number", _json_scalar(page.number)),
+        (
+            "size",
+            layout.object(
+                [
+                    ("width", _json_scalar(page.size.width)),
+                    ("height", _json_scalar(page.size.height)),
+                    ("unit", _json_scalar(page.size.unit.value)),
+                ],
+                inner,
+            ),
+        ),
+    ]
+    yield "{" + layout.members(head, inner) + "," + layout.newline(inner)
+    yield encode_basestring("elements") + layout.key_separator
+    if not page.elements:
+        yield "[]"
+    else:
+        yield "["
+        for index, element in enumerate(page.elements):
+            yield (
+                ("," if index else "")
+                + layout.newline(inner + 1)
+                + _element_json(element, layout, inner + 1)
+            )
+        yield layout.newline(inner) + "]"
+    tail = []
+    if page.source is not None:
+        tail.append(
+            (
+                "source",
+                layout.object(
+                    [
+                        ("pixel_width", _json_scalar(page.source.pixel_width)),
+                        ("pixel_height", _json_scalar(page.source.pixel_height)),
+                        ("dpi_x", _json_scalar(page.source.dpi_x)),
+                        ("dpi_y", _json_scalar(page.source.dpi_y)),
+                        ("dpi_source", _json_scalar(page.source.dpi_source.value)),
+                    ],
+                    inner,
+                ),
+            )
+        )
+    if page.extensions:
+        tail.append(("extensions", _json_text(page.extensions, layout, inner)))
+    yield ("," + layout.members(tail, inner) if tail else "") + layout.newline(
+        level
+    ) + "}"
+
+
+def _asset_json(asset: Asset, layout: _JsonLayout, level: int) -> str:
+    members = [
+        ("id", _json_scalar(asset.id)),
+        ("path", _json_scalar(asset.path)),
+        ("media_type", _json_scalar(asset.media_type.value)),
+        ("sha256", _json_scalar(asset.sha256)),
+        ("pixel_width", _json_scalar(asset.pixel_width)),
+        ("pixel_height", _json_scalar(asset.pixel_height)),
+    ]
+    if asset.dpi_x is not None:
+        members.append(("dpi_x", _json_scalar(asset.dpi_x)))
+    if asset.dpi_y is not None:
+        members.append(("dpi_y", _json_scalar(asset.dpi_y)))
+    return layout.object(members, level)
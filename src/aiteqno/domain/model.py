@@ -4,7 +4,8 @@ from __future__ import annotations
 
 import math
 import re
-from dataclasses import dataclass, field
+from array import array
+from dataclasses import dataclass, field, replace
 from enum import Enum
 from pathlib import PurePosixPath
 from types import MappingProxyType
@@ -706,6 +707,115 @@ class ImageElement(Element):
 
 DocumentElement: TypeAlias = TextElement | LineElement | RectangleElement | ImageElement
 
+ELEMENT_TYPE_CODES: tuple[ElementType, ...] = tuple(ElementType)
+_ELEMENT_TYPE_CODE = {element_type: code for code, element_type in enumerate(ElementType)}
+
+
+class PageGeometry:
+    """Read-only columns of one page's element geometry in element order.
+
+    Every column is a read-only ``memoryview`` with one value per element, so
+    array libraries can wrap it without copying, for example
+    ``numpy.asarray(geometry.y)``. Coordinates are float64 points; line
+    endpoints are NaN for other element types. ``type_codes`` index
+    ``ELEMENT_TYPE_CODES``, ``z_index`` is int64, and ``reading_order`` is
+    int64 with ``-1`` for non-text elements. The elements stay the source of
+    truth; these columns are only derived from them.
+    """
+
+    __slots__ = (
+        "_end_x",
+        "_end_y",
+        "_height",
+        "_reading_order",
+        "_start_x",
+        "_start_y",
+        "_type_codes",
+        "_width",
+        "_x",
+        "_y",
+        "_z_index",
+    )
+
+    def __init__(self, elements: Sequence[DocumentElement]) -> None:
+        count = len(elements)
+        nan = array("d", [math.nan]) * count
+        self._x = array("d", [element.bbox.x for element in elements])
+        self._y = array("d", [element.bbox.y for element in elements])
+        self._width = array("d", [element.bbox.width for element in elements])
+        self._height = array("d", [element.bbox.height for element in elements])
+        self._type_codes = array(
+            "B", [_ELEMENT_TYPE_CODE[element.type] for element in elements]
+        )
+        self._start_x = array("d", nan)
+        self._start_y = array("d", nan)
+        self._end_x = array("d", nan)
+        self._end_y = array("d", nan)
+        try:
+            self._z_index = array("q", [element.z_index for element in elements])
+            self._reading_order = array(
+                "q",
+                [
+                    element.reading_order if isinstance(element, TextElement) else -1
+                    for element in elements
+                ],
+            )
+        except OverflowError as exc:
+            raise ValueError("element integers must fit in 64 bits") from exc
+        for index, element in enumerate(elements):
+            if isinstance(element, LineElement):
+                self._start_x[index] = element.start.x
+                self._start_y[index] = element.start.y
+                self._end_x[index] = element.end.x
+                self._end_y[index] = element.end.y
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    @property
+    def x(self) -> memoryview:
+        return memoryview(self._x).toreadonly()
+
+    @property
+    def y(self) -> memoryview:
+        return memoryview(self._y).toreadonly()
+
+    @property
+    def width(self) -> memoryview:
+        return memoryview(self._width).toreadonly()
+
+    @property
+    def height(self) -> memoryview:
+        return memoryview(self._height).toreadonly()
+
+    @property
+    def type_codes(self) -> memoryview:
+        return memoryview(self._type_codes).toreadonly()
+
+    @property
+    def z_index(self) -> memoryview:
+        return memoryview(self._z_index).toreadonly()
+
+    @property
+    def reading_order(self) -> memoryview:
+        return memoryview(self._reading_order).toreadonly()
+
+    @property
+    def start_x(self) -> memoryview:
+        return memoryview(self._start_x).toreadonly()
+
+    @property
+    def start_y(self) -> memoryview:
+        return memoryview(self._start_y).toreadonly()
+
+    @property
+    def end_x(self) -> memoryview:
+        return memoryview(self._end_x).toreadonly()
+
+    @property
+    def end_y(self) -> memoryview:
+        return memoryview(self._end_y).toreadonly()
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class Page:
@@ -715,6 +825,10 @@ class Page:
     elements: tuple[DocumentElement, ...]
     source: PageSource | None = None
     extensions: JSONObject = field(default_factory=dict)
+    _geometry: PageGeometry | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         _require_identifier(self.id, "page.id")
@@ -729,6 +843,16 @@ class Page:
         object.__setattr__(self, "elements", elements)
         object.__setattr__(self, "extensions", _freeze_extensions(self.extensions))
 
+    @property
+    def geometry(self) -> PageGeometry:
+        """Columnar element geometry, built on first use and then reused."""
+
+        geometry = self._geometry
+        if geometry is None:
+            geometry = PageGeometry(self.elements)
+            object.__setattr__(self, "_geometry", geometry)
+        return geometry
+
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class DocumentIR:
@@ -739,6 +863,7 @@ class DocumentIR:
     assets: tuple[Asset, ...]
     metadata: JSONObject = field(default_factory=dict)
     extensions: JSONObject = field(default_factory=dict)
+    _validated: bool = field(default=False, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         _require_string(self.ir_version, "ir_version")
@@ -759,6 +884,26 @@ class DocumentIR:
         object.__setattr__(self, "extensions", _freeze_extensions(self.extensions))
         validate_document(self)
 
+    def replace_pages(self, pages: Mapping[int, Page]) -> DocumentIR:
+        """Return a copy with the pages at the given indexes replaced.
+
+        Only the replacement pages rerun their page-local checks: bounds,
+        reading order, and the table-topology extension. Unchanged pages keep
+        the result of their earlier validation, while document-wide ID and
+        asset references are still checked across every page.
+        """
+
+        if not isinstance(pages, Mapping):
+            raise TypeError("pages must map page indexes to Page values")
+        replaced = list(self.pages)
+        for index, page in pages.items():
+            if isinstance(index, bool) or not isinstance(index, int):
+                raise TypeError("page indexes must be integers")
+            if not 0 <= index < len(replaced):
+                raise IndexError(f"page index {index} is out of range")
+            replaced[index] = page
+        return replace(self, pages=tuple(replaced))
+
     def to_dict(self) -> dict[str, JSONValue]:
         """Serialize this document into plain JSON-compatible Python values."""
 
@@ -791,8 +936,16 @@ class DocumentIR:
 
 
 def validate_document(document: DocumentIR) -> None:
-    """Validate cross-object invariants that JSON Schema cannot express."""
+    """Validate cross-object invariants that JSON Schema cannot express.
 
+    A document that has passed once is not walked again: every field is
+    frozen, so the result cannot change. Pages remember passing their
+    page-local checks in the same way, which lets a document rebuilt around
+    edited pages check only those pages beyond IDs and asset references.
+    """
+
+    if document._validated:
+        return
     issues: list[ValidationIssue] = []
 
     if document.ir_version not in SUPPORTED_IR_VERSIONS:
@@ -855,10 +1008,27 @@ def validate_document(document: DocumentIR) -> None:
         else:
             asset_paths[asset.path] = f"$.assets[{asset_index}].path"
 
+    def check_asset_reference(element: DocumentElement, element_path: str) -> None:
+        if isinstance(element, ImageElement) and element.asset_id not in asset_ids:
+            issues.append(
+                ValidationIssue(
+                    path=f"{element_path}.asset_id",
+                    message=f"asset {element.asset_id!r} is not registered in $.assets",
+                    code="unknown_asset",
+                )
+            )
+
     for page_index, page in enumerate(document.pages):
         page_path = f"$.pages[{page_index}]"
         register_id(page.id, f"{page_path}.id")
-
+        if page._validated:
+            for element_index, element in enumerate(page.elements):
+                element_path = f"{page_path}.elements[{element_index}]"
+                register_id(element.id, f"{element_path}.id")
+                check_asset_reference(element, element_path)
+            continue
+
+        page_issues = 0
         text_orders: list[int] = []
         for element_index, element in enumerate(page.elements):
             element_path = f"{page_path}.elements[{element_index}]"
@@ -881,17 +1051,12 @@ def validate_document(document: DocumentIR) -> None:
                         code="out_of_page_geometry",
                     )
                 )
+                page_issues += 1
 
             if isinstance(element, TextElement):
                 text_orders.append(element.reading_order)
-            elif isinstance(element, ImageElement) and element.asset_id not in asset_ids:
-                issues.append(
-                    ValidationIssue(
-                        path=f"{element_path}.asset_id",
-                        message=f"asset {element.asset_id!r} is not registered in $.assets",
-                        code="unknown_asset",
-                    )
-                )
+            else:
+                check_asset_reference(element, element_path)
 
         expected_text_orders = list(range(len(text_orders)))
         if text_orders != expected_text_orders:
@@ -906,6 +1071,7 @@ def validate_document(document: DocumentIR) -> None:
                     code="invalid_reading_order",
                 )
             )
+            page_issues += 1
 
         topology_key = "jp.reactorfront.aiteqno.table_topology"
         topology_value = page.extensions.get(topology_key)
@@ -914,13 +1080,16 @@ def validate_document(document: DocumentIR) -> None:
             # types without creating a module-import cycle.
             from .table_topology import validate_table_topology_extension
 
-            issues.extend(
-                validate_table_topology_extension(
-                    page,
-                    topology_value,
-                    path=f'{page_path}.extensions["{topology_key}"]',
-                )
+            topology_issues = validate_table_topology_extension(
+                page,
+                topology_value,
+                path=f'{page_path}.extensions["{topology_key}"]',
             )
+            issues.extend(topology_issues)
+            page_issues += len(topology_issues)
+        if not page_issues:
+            object.__setattr__(page, "_validated", True)
 
     if issues:
         raise DocumentIRValidationError(issues)
+    object.__setattr__(document, "_validated", True)
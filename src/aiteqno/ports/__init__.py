@@ -29,6 +29,7 @@ from .evaluation import (
     DocxObservation,
     DocxObservationError,
     DocxObserver,
+    ElementAssignment,
     ElementMatch,
     EvaluationArtifactWriter,
     EvaluationReference,
@@ -44,10 +45,12 @@ from .evaluation import (
     SnapshotObservation,
     SnapshotRegion,
     StructuralRelationship,
+    TextMatcher,
 )
 from .extraction import (
     AssetEncodingError,
     AssetPayload,
+    BatchImageAssetEncoder,
     BundleWriteError,
     BundleWriteResult,
     DocumentBundleWriter,
@@ -63,6 +66,7 @@ from .ocr import (
     OcrCapabilities,
     OcrOptions,
     OcrRegion,
+    OcrResponseCache,
     OcrToken,
 )
 from .ocr_experiment import (
@@ -138,6 +142,7 @@ __all__ = [
     "BundleWriteError",
     "BundleWriteResult",
     "BaselineComponentScore",
+    "BatchImageAssetEncoder",
     "ComponentScore",
     "DocxObservation",
     "DocxObservationError",
@@ -151,11 +156,13 @@ __all__ = [
     "DocumentIRValidator",
     "DEFAULT_OCR_LANGUAGES",
     "FontSubstitution",
+    "ElementAssignment",
     "ElementMatch",
     "EvaluationArtifactWriter",
     "EvaluationReference",
     "EvaluationState",
     "EvaluationWriteError",
+    "TextMatcher",
     "EncodedImageAsset",
     "ImageInput",
     "ImageAssetEncoder",
@@ -187,6 +194,7 @@ __all__ = [
     "OcrProtectedLiteralRecovery",
     "OcrAnchorEvaluation",
     "OcrOptions",
+    "OcrResponseCache",
     "OcrBlockEvaluation",
     "OcrConfidenceDistribution",
     "OcrMetricEvaluation",
@@ -73,6 +73,13 @@ class EvaluationState(str, Enum):
     REQUIRES_HUMAN_REVIEW = "requires_human_review"
 
 
+class ElementAssignment(str, Enum):
+    """How eligible expected-to-observed element pairs become matches."""
+
+    GREEDY = "greedy"
+    OPTIMAL = "optimal"
+
+
 class RelationshipKind(str, Enum):
     """Structural relation kinds used by the V1 quality contract."""
 
@@ -684,13 +691,27 @@ class RestorationEvaluationResult:
     state: EvaluationState
     reasons: tuple[str, ...]
     required_human_checks: tuple[str, ...]
+    element_assignment: ElementAssignment = ElementAssignment.GREEDY
+    text_matcher: str | None = None
 
     def to_dict(self) -> dict[str, object]:
+        elements: dict[str, object] = {
+            "matched": [match.to_dict() for match in self.matches],
+            "missing": list(self.missing_element_ids),
+            "unexpected": list(self.unexpected_element_ids),
+        }
+        # The frozen V1 greedy rule is implied; only an opt-in rule is recorded.
+        if self.element_assignment is not ElementAssignment.GREEDY:
+            elements["assignment"] = self.element_assignment.value
+        evaluator: dict[str, object] = {
+            "name": self.evaluator_name,
+            "version": self.evaluator_version,
+        }
+        # Likewise, only a text matcher other than the V1 default is recorded.
+        if self.text_matcher is not None:
+            evaluator["text_matcher"] = self.text_matcher
         return {
-            "evaluator": {
-                "name": self.evaluator_name,
-                "version": self.evaluator_version,
-            },
+            "evaluator": evaluator,
             "ir_version": self.ir_version,
             "reference_id": self.reference_id,
             "overall_score": self.overall_score,
@@ -698,11 +719,7 @@ class RestorationEvaluationResult:
             "components": {
                 component.name: component.to_dict() for component in self.components
             },
-            "elements": {
-                "matched": [match.to_dict() for match in self.matches],
-                "missing": list(self.missing_element_ids),
-                "unexpected": list(self.unexpected_element_ids),
-            },
+            "elements": elements,
             "hard_gates": [gate.to_dict() for gate in self.hard_gates],
             "state": self.state.value,
             "reasons": list(self.reasons),
@@ -737,6 +754,19 @@ class DocxObserver(Protocol):
         """Return normalized evidence without consulting the source image."""
 
 
+class TextMatcher(Protocol):
+    """Backend counting the characters two normalized texts have in common.
+
+    Text similarity is ``2 * matched / (len(expected) + len(observed))``.
+    Before calling the backend, the evaluator rejects element pairs with length
+    and character-histogram bounds. A backend must therefore never report
+    more matches than the two texts share as character multisets.
+    """
+
+    def matched_characters(self, expected: str, observed: str) -> int:
+        """Return the matched character count for two non-empty texts."""
+
+
 class EvaluationArtifactWriter(Protocol):
     """Adapter boundary for create-only publication of evaluation.json."""
 
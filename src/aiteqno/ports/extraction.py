@@ -7,9 +7,15 @@ import math
 from dataclasses import dataclass
 from os import PathLike
 from pathlib import Path
-from typing import Protocol, Sequence
-
-from aiteqno.domain import Asset, DocumentIR, MediaType, PixelBoundingBox
+from typing import Protocol, Sequence, runtime_checkable
+
+from aiteqno.domain import (
+    Asset,
+    DocumentIR,
+    MediaType,
+    PixelBoundingBox,
+    Provenance,
+)
 from aiteqno.ports.structure import ImageInput
 
 
@@ -49,6 +55,7 @@ class EncodedImageAsset:
     pixel_height: int
     dpi_x: float | None = None
     dpi_y: float | None = None
+    provenance: Provenance | None = None
 
     def __post_init__(self) -> None:
         if not isinstance(self.data, bytes) or not self.data:
@@ -80,6 +87,8 @@ class EncodedImageAsset:
             ):
                 raise ValueError(f"{field_name} must be a positive finite number")
             object.__setattr__(self, field_name, float(value))
+        if self.provenance is not None and not isinstance(self.provenance, Provenance):
+            raise TypeError("encoded image provenance must be a Provenance or None")
 
     @property
     def sha256(self) -> str:
@@ -140,6 +149,18 @@ class ImageAssetEncoder(Protocol):
         """Return deterministic encoded bytes for exactly one source crop."""
 
 
+@runtime_checkable
+class BatchImageAssetEncoder(ImageAssetEncoder, Protocol):
+    """An asset encoder that can encode every crop of one page in one call."""
+
+    def encode_png_crops(
+        self,
+        image: ImageInput,
+        bboxes: Sequence[PixelBoundingBox],
+    ) -> tuple[EncodedImageAsset | AssetEncodingError, ...]:
+        """Return one encoded asset or per-crop error for each box, in order."""
+
+
 class DocumentIRValidator(Protocol):
     """Validate a semantic model against the canonical formal schema."""
 
@@ -5,7 +5,7 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass
-from typing import Protocol, Sequence
+from typing import Mapping, Protocol, Sequence, runtime_checkable
 
 from aiteqno.domain import PixelBoundingBox, Provenance, ProvenanceStage
 from aiteqno.ports.structure import ImageInput
@@ -266,3 +266,18 @@ class OcrBackend(Protocol):
         options: OcrOptions = OcrOptions(),
     ) -> tuple[OcrToken, ...]:
         """Recognize full-page or region text in original source pixels."""
+
+
+@runtime_checkable
+class OcrResponseCache(Protocol):
+    """Store raw OCR engine responses under a caller-computed content key.
+
+    Keys are 64 lower-case hex digits. A cache may drop entries at any time,
+    and neither method may fail recognition.
+    """
+
+    def load(self, key: str) -> Mapping[str, Sequence[object]] | None:
+        """Return the stored column mapping for ``key``, or ``None`` on a miss."""
+
+    def store(self, key: str, response: Mapping[str, Sequence[object]]) -> None:
+        """Persist one column mapping, or silently skip it."""
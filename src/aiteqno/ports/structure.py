@@ -62,11 +62,17 @@ class PixelPoint:
 
 @dataclass(frozen=True, slots=True, kw_only=True)
 class ImageInput:
-    """Immutable, normalized pixels and source metadata passed through the port."""
+    """Immutable, normalized pixels and source metadata passed through the port.
+
+    ``pixels`` is either ``bytes`` or a read-only, C-contiguous byte buffer such
+    as a memoryview or a non-writeable NumPy array. Buffers are kept as a flat
+    memoryview without copying, so adapters can share one decoded page; the
+    owner must not mutate the underlying storage while the image is in use.
+    """
 
     source: PageSource
     mode: PixelMode
-    pixels: bytes
+    pixels: bytes | memoryview
     source_sha256: str
 
     def __post_init__(self) -> None:
@@ -78,7 +84,7 @@ class ImageInput:
             except (TypeError, ValueError) as exc:
                 raise ValueError("image mode must be rgb8") from exc
         if not isinstance(self.pixels, bytes):
-            raise TypeError("image pixels must be immutable bytes")
+            object.__setattr__(self, "pixels", _read_only_byte_view(self.pixels))
         expected_size = self.source.pixel_width * self.source.pixel_height * 3
         if len(self.pixels) != expected_size:
             raise ValueError(
@@ -90,6 +96,45 @@ class ImageInput:
         ):
             raise ValueError("source_sha256 must be 64 lower-case hex digits")
 
+    def region_pixels(self, bbox: PixelBoundingBox) -> bytes | memoryview:
+        """Return packed rgb8 rows of one region, copying only that region."""
+
+        if not isinstance(bbox, PixelBoundingBox):
+            raise TypeError("bbox must be a PixelBoundingBox")
+        width = self.source.pixel_width
+        if (
+            bbox.x + bbox.width > width
+            or bbox.y + bbox.height > self.source.pixel_height
+        ):
+            raise ValueError("pixel region must remain inside the source page")
+        view = memoryview(self.pixels)
+        stride = width * 3
+        start = bbox.y * stride
+        stop = start + bbox.height * stride
+        if bbox.x == 0 and bbox.width == width:
+            return view[start:stop]
+        left = bbox.x * 3
+        right = left + bbox.width * 3
+        return b"".join(
+            view[row + left : row + right] for row in range(start, stop, stride)
+        )
+
+
+def _read_only_byte_view(pixels: object) -> memoryview:
+    try:
+        view = memoryview(pixels)  # type: ignore[arg-type]
+    except TypeError as exc:
+        raise TypeError(
+            "image pixels must be bytes or a read-only byte buffer"
+        ) from exc
+    if not view.readonly:
+        raise TypeError("image pixel buffers must be read-only")
+    if view.itemsize != 1 or view.format not in {"B", "b", "c"}:
+        raise TypeError("image pixel buffers must contain single bytes")
+    if not view.c_contiguous:
+        raise ValueError("image pixel buffers must be C-contiguous")
+    return view if view.ndim == 1 and view.format == "B" else view.cast("B")
+
 
 def _validate_evidence(
     confidence: Confidence,
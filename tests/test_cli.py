@@ -1,12 +1,16 @@
 import base64
+import json
 import os
 import subprocess
 import sys
 import tempfile
+import time
 import tomllib
 import unittest
+from dataclasses import replace
 from io import StringIO
 from pathlib import Path
+from unittest.mock import patch
 
 from docx import Document as open_docx
 from PIL import Image
@@ -20,10 +24,13 @@ from aiteqno.adapters import (
     PillowPngAssetEncoder,
     PillowPngDecoder,
     PillowPreviewRenderer,
+    PngCompressionProfile,
     PythonDocxRenderer,
+    TesseractOcrBackend,
+    TesseractTimingEvidence,
 )
 from aiteqno.adapters.json_schema import document_ir_from_file
-from aiteqno.cli import CliRuntime, ExitCode, main
+from aiteqno.cli import CliRuntime, ExitCode, default_runtime, main
 from aiteqno.domain import read_page_table_topology
 from aiteqno.ports import DEFAULT_OCR_LANGUAGES, OcrBackendError, OcrOptions
 
@@ -86,7 +93,7 @@ class CliContractTest(unittest.TestCase):
 
         self.assertEqual(exit_code, ExitCode.SUCCESS)
         self.assertEqual(stderr, "")
-        for command in ("extract", "render", "preview", "roundtrip"):
+        for command in ("extract", "render", "preview", "roundtrip", "batch"):
             self.assertIn(command, stdout)
             command_code, command_stdout, command_stderr = _run([command, "--help"])
             self.assertEqual(command_code, ExitCode.SUCCESS)
@@ -140,6 +147,15 @@ class CliContractTest(unittest.TestCase):
             self.assertEqual(len(topology.tables), 1)
             self.assertEqual(sum(len(table.cells) for table in topology.tables), 4)
 
+            sidecar_path = bundle_root / "文書.ir.bin"
+            pack_code, pack_stdout, pack_stderr = _run(["pack", str(ir_path)])
+            self.assertEqual(pack_code, ExitCode.SUCCESS, pack_stderr)
+            self.assertIn(f"sidecar={sidecar_path.resolve()}", pack_stdout)
+            self.assertEqual(document_ir_from_file(ir_path), extracted_document)
+            repack_code, _, repack_stderr = _run(["pack", str(ir_path)])
+            self.assertEqual(repack_code, ExitCode.OUTPUT_CONFLICT)
+            self.assertIn("output_exists", repack_stderr)
+
             input_path.unlink()
             docx_path = bundle_root / "復元結果.docx"
             preview_path = bundle_root / "復元結果.png"
@@ -378,6 +394,478 @@ class CliContractTest(unittest.TestCase):
             self.assertEqual(marker.read_text(encoding="utf-8"), "preserve")
             self.assertFalse((output_parent / "document.ir.json").exists())
 
+    def test_ocr_workers_configure_only_the_default_tesseract_runtime(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            input_path = root / "input.png"
+            input_path.write_bytes(_png_data())
+            with patch(
+                "aiteqno.cli.main.default_runtime",
+                return_value=_runtime(),
+            ) as factory:
+                exit_code = main(
+                    [
+                        "roundtrip",
+                        str(input_path),
+                        "-o",
+                        str(root / "output"),
+                        "--ocr-workers",
+                        "4",
+                    ],
+                    stdout=StringIO(),
+                    stderr=StringIO(),
+                )
+
+            self.assertEqual(exit_code, ExitCode.SUCCESS)
+            factory.assert_called_once_with(
+                ocr_max_workers=4,
+                ocr_cache_directory=None,
+                asset_png_profile=PngCompressionProfile.SMALLEST,
+                record_ocr_timings=False,
+            )
+            usage_error, _, usage_stderr = _run(
+                [
+                    "extract",
+                    str(input_path),
+                    "-o",
+                    str(root / "usage" / "document.ir.json"),
+                    "--ocr-workers",
+                    "0",
+                ]
+            )
+            self.assertEqual(usage_error, ExitCode.USAGE_ERROR)
+            self.assertIn("--ocr-workers", usage_stderr)
+
+    def test_ocr_cache_directory_is_resolved_and_opened_for_default_runtime(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            input_path = root / "input.png"
+            input_path.write_bytes(_png_data())
+            with patch(
+                "aiteqno.cli.main.default_runtime",
+                return_value=_runtime(),
+            ) as factory:
+                exit_code = main(
+                    [
+                        "extract",
+                        str(input_path),
+                        "-o",
+                        str(root / "bundle" / "document.ir.json"),
+                        "--ocr-cache",
+                        str(root / "ocr-cache"),
+                        "--png-profile",
+                        "fast",
+                        "--timings",
+                        "json",
+                    ],
+                    stdout=StringIO(),
+                    stderr=StringIO(),
+                )
+            self.assertEqual(exit_code, ExitCode.SUCCESS)
+            factory.assert_called_once_with(
+                ocr_max_workers=1,
+                ocr_cache_directory=(root / "ocr-cache").resolve(),
+                asset_png_profile=PngCompressionProfile.FAST,
+                record_ocr_timings=True,
+            )
+
+            blocker = root / "not-a-directory"
+            blocker.write_text("file", encoding="utf-8")
+            stderr = StringIO()
+            failure = main(
+                [
+                    "extract",
+                    str(input_path),
+                    "-o",
+                    str(root / "blocked" / "document.ir.json"),
+                    "--ocr-cache",
+                    str(blocker),
+                ],
+                stdout=StringIO(),
+                stderr=stderr,
+            )
+            self.assertEqual(failure, ExitCode.OPERATIONAL_ERROR)
+            self.assertIn("ocr_cache_unavailable", stderr.getvalue())
+
+    def test_timings_report_stages_and_only_the_current_ocr_invocations(self):
+        stages = ["decode", "structure", "ocr", "asset", "assemble", "validate", "write"]
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            input_path = root / "input.png"
+            input_path.write_bytes(_png_data())
+            (root / "batch").mkdir()
+            (root / "batch" / "page.png").write_bytes(_png_data())
+            log = [{"stale": True}]
+            runtime = replace(
+                _runtime(_TimedOcrBackend(log)),
+                ocr_timing_log=log,
+            )
+
+            exit_code, stdout, _ = _run(
+                [
+                    "extract",
+                    str(input_path),
+                    "-o",
+                    str(root / "extract" / "document.ir.json"),
+                    "--timings",
+                    "json",
+                ],
+                runtime=runtime,
+            )
+            self.assertEqual(exit_code, ExitCode.SUCCESS)
+            lines = stdout.splitlines()
+            self.assertTrue(lines[-1].startswith("timings="))
+            timings = json.loads(lines[-1].removeprefix("timings="))
+            self.assertEqual([item["stage"] for item in timings["stages"]], stages)
+            self.assertTrue(
+                all(
+                    isinstance(item["peak_traced_bytes"], int)
+                    for item in timings["stages"]
+                )
+            )
+            self.assertEqual(timings["ocr_invocations"], [{"wall_seconds": 0.5}])
+            self.assertEqual(log, [])
+
+            batch_code, batch_stdout, _ = _run(
+                [
+                    "batch",
+                    str(root / "batch"),
+                    "-o",
+                    str(root / "batch-output"),
+                    "--timings",
+                    "json",
+                ],
+                runtime=runtime,
+            )
+            self.assertEqual(batch_code, ExitCode.SUCCESS)
+            (record,) = [json.loads(line) for line in batch_stdout.splitlines()]
+            self.assertEqual(
+                [item["stage"] for item in record["timings"]["stages"]],
+                stages,
+            )
+            self.assertEqual(
+                record["timings"]["ocr_invocations"],
+                [{"wall_seconds": 0.5}],
+            )
+
+            _, untimed_stdout, _ = _run(
+                [
+                    "extract",
+                    str(input_path),
+                    "-o",
+                    str(root / "untimed" / "document.ir.json"),
+                ]
+            )
+            self.assertNotIn("timings=", untimed_stdout)
+
+        with patch(
+            "aiteqno.cli.main.TesseractOcrBackend",
+            wraps=TesseractOcrBackend,
+        ) as backend_factory:
+            recorded = default_runtime(record_ocr_timings=True)
+        observer = backend_factory.call_args.kwargs["timing_observer"]
+        observer(TesseractTimingEvidence(wall_seconds=0.25, regions=()))
+        self.assertEqual(
+            recorded.ocr_timing_log,
+            [{"wall_seconds": 0.25, "regions": []}],
+        )
+        self.assertIsNone(default_runtime().ocr_timing_log)
+
+    def test_batch_directory_publishes_one_bundle_per_png_with_jsonl_summary(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            inputs = root / "入力"
+            inputs.mkdir()
+            (inputs / "b-page.PNG").write_bytes(_png_data())
+            (inputs / "a-page.png").write_bytes(_png_data())
+            (inputs / "c-broken.png").write_bytes(b"not a PNG")
+            (inputs / "notes.txt").write_text("ignored", encoding="utf-8")
+            (inputs / "nested.png").mkdir()
+            output = root / "batch output"
+            backend = _RecordingOcrBackend()
+
+            exit_code, stdout, stderr = _run(
+                ["batch", str(inputs), "-o", str(output), "--language", "eng"],
+                runtime=_runtime(backend),
+            )
+
+            self.assertEqual(exit_code, ExitCode.INPUT_ERROR)
+            records = [json.loads(line) for line in stdout.splitlines()]
+            self.assertEqual(
+                [(Path(record["input"]).name, record["status"]) for record in records],
+                [
+                    ("a-page.png", "succeeded"),
+                    ("b-page.PNG", "succeeded"),
+                    ("c-broken.png", "failed"),
+                ],
+            )
+            self.assertEqual(records[2]["error"]["code"], "invalid_png")
+            self.assertEqual(records[2]["error"]["exit_code"], ExitCode.INPUT_ERROR)
+            self.assertEqual(backend.language_calls, [("eng",), ("eng",)])
+            self.assertIn("invalid_png", stderr)
+            self.assertIn("batch_incomplete", stderr)
+            self.assertEqual(
+                sorted(path.name for path in output.iterdir()),
+                ["a-page", "b-page"],
+            )
+            for name in ("a-page", "b-page"):
+                bundle = output / name
+                self.assertEqual(
+                    {path.name for path in bundle.iterdir()},
+                    {"document.ir.json", "assets"},
+                )
+                document = document_ir_from_file(bundle / "document.ir.json")
+                for asset in document.assets:
+                    BundleAssetResolver(bundle).resolve(asset)
+
+            (inputs / "c-broken.png").unlink()
+            marker = output / "a-page" / "user-marker.txt"
+            marker.write_text("preserve", encoding="utf-8")
+            rerun_code, rerun_stdout, _ = _run(
+                ["batch", str(inputs), "-o", str(output)]
+            )
+            self.assertEqual(rerun_code, ExitCode.OUTPUT_CONFLICT)
+            self.assertEqual(
+                [
+                    json.loads(line)["error"]["code"]
+                    for line in rerun_stdout.splitlines()
+                ],
+                ["output_exists", "output_exists"],
+            )
+            self.assertEqual(marker.read_text(encoding="utf-8"), "preserve")
+
+    def test_batch_manifest_roundtrips_listed_inputs_and_stops_on_dependencies(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "first").mkdir()
+            (root / "second").mkdir()
+            (root / "first" / "page.png").write_bytes(_png_data())
+            (root / "second" / "page.png").write_bytes(_png_data())
+            manifest = root / "pages.txt"
+            manifest.write_text(
+                "# nightly pages\n"
+                "first/page.png\n"
+                "\n"
+                f"{root / 'second' / 'page.png'}\n"
+                "missing.png\n",
+                encoding="utf-8",
+            )
+            output = root / "roundtrips"
+
+            exit_code, stdout, stderr = _run(
+                [
+                    "batch",
+                    "--manifest",
+                    str(manifest),
+                    "-o",
+                    str(output),
+                    "--roundtrip",
+                    "--language",
+                    "eng",
+                    "--dpi",
+                    "96",
+                ]
+            )
+
+            self.assertEqual(exit_code, ExitCode.INPUT_ERROR, stderr)
+            records = [json.loads(line) for line in stdout.splitlines()]
+            self.assertEqual(
+                [
+                    (Path(record["bundle"]).name, record["status"])
+                    for record in records
+                ],
+                [("page", "succeeded"), ("page-2", "succeeded"), ("missing", "failed")],
+            )
+            self.assertEqual(records[2]["error"]["code"], "input_not_found")
+            for name in ("page", "page-2"):
+                self.assertEqual(
+                    {path.name for path in (output / name).iterdir()},
+                    {
+                        "document.ir.json",
+                        "assets",
+                        "reconstructed.docx",
+                        "reconstructed.png",
+                    },
+                )
+            self.assertEqual(
+                sorted(path.name for path in output.iterdir()),
+                ["page", "page-2"],
+            )
+
+            dependency_code, dependency_stdout, _ = _run(
+                [
+                    "batch",
+                    "--manifest",
+                    str(manifest),
+                    "-o",
+                    str(root / "dependency"),
+                    "--language",
+                    "eng",
+                ],
+                runtime=_runtime(_MissingOcrBackend()),
+            )
+            self.assertEqual(dependency_code, ExitCode.DEPENDENCY_ERROR)
+            self.assertEqual(len(dependency_stdout.splitlines()), 1)
+
+            usage_code, _, usage_stderr = _run(
+                [
+                    "batch",
+                    str(root),
+                    "--manifest",
+                    str(manifest),
+                    "-o",
+                    str(output),
+                ]
+            )
+            self.assertEqual(usage_code, ExitCode.USAGE_ERROR)
+            self.assertIn("not allowed with", usage_stderr)
+
+    def test_batch_names_never_reuse_a_disambiguated_stem(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            (root / "first").mkdir()
+            (root / "second").mkdir()
+            for path in ("first/page.png", "first/page-3.png", "second/page.png"):
+                (root / path).write_bytes(_png_data())
+            manifest = root / "pages.txt"
+            manifest.write_text(
+                "first/page.png\nfirst/page-3.png\nsecond/page.png\n",
+                encoding="utf-8",
+            )
+            output = root / "output"
+
+            exit_code, stdout, stderr = _run(
+                ["batch", "--manifest", str(manifest), "-o", str(output)]
+            )
+
+            self.assertEqual(exit_code, ExitCode.SUCCESS, stderr)
+            self.assertEqual(
+                [
+                    (Path(record["bundle"]).name, record["status"])
+                    for record in map(json.loads, stdout.splitlines())
+                ],
+                [
+                    ("page", "succeeded"),
+                    ("page-3", "succeeded"),
+                    ("page-3-2", "succeeded"),
+                ],
+            )
+
+    def test_batch_worker_processes_match_the_sequential_run(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            inputs = root / "inputs"
+            inputs.mkdir()
+            for index in range(5):
+                (inputs / f"page-{index}.png").write_bytes(_png_data())
+            (inputs / "page-2.png").write_bytes(b"not a PNG")
+
+            sequential_code, sequential_stdout, _ = _run(
+                ["batch", str(inputs), "-o", str(root / "sequential")]
+            )
+            stdout = StringIO()
+            parallel_code = main(
+                ["batch", str(inputs), "-o", str(root / "parallel"), "--jobs", "2"],
+                runtime=_runtime(),
+                runtime_factory=_runtime,
+                stdout=stdout,
+                stderr=StringIO(),
+            )
+
+            self.assertEqual(sequential_code, ExitCode.INPUT_ERROR)
+            self.assertEqual(parallel_code, ExitCode.INPUT_ERROR)
+
+            def summary(text, output):
+                records = [json.loads(line) for line in text.splitlines()]
+                for record in records:
+                    record["bundle"] = Path(record["bundle"]).relative_to(output)
+                    record.get("error", {}).pop("message", None)
+                return records
+
+            self.assertEqual(
+                summary(stdout.getvalue(), root / "parallel"),
+                summary(sequential_stdout, root / "sequential"),
+            )
+            for name in ("page-0", "page-1", "page-3", "page-4"):
+                self.assertEqual(
+                    (root / "parallel" / name / "document.ir.json").read_bytes(),
+                    (root / "sequential" / name / "document.ir.json").read_bytes(),
+                )
+            self.assertEqual(
+                sorted(path.name for path in (root / "parallel").iterdir()),
+                ["page-0", "page-1", "page-3", "page-4"],
+            )
+
+    def test_stopped_parallel_batch_reports_every_published_bundle(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            inputs = root / "inputs"
+            inputs.mkdir()
+            (inputs / "page-0.png").write_bytes(_dense_png_data())
+            for index in range(1, 8):
+                (inputs / f"page-{index}.png").write_bytes(_png_data())
+            output = root / "output"
+            stdout = StringIO()
+
+            exit_code = main(
+                ["batch", str(inputs), "-o", str(output), "--jobs", "2"],
+                runtime=_runtime(),
+                runtime_factory=_dense_page_missing_ocr_runtime,
+                stdout=stdout,
+                stderr=StringIO(),
+            )
+
+            self.assertEqual(exit_code, ExitCode.DEPENDENCY_ERROR)
+            records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+            self.assertEqual(
+                records[0]["error"]["code"],
+                "ocr_executable_missing",
+            )
+            self.assertEqual(
+                sorted(path.name for path in output.iterdir()),
+                sorted(
+                    Path(record["bundle"]).name
+                    for record in records
+                    if record["status"] == "succeeded"
+                ),
+            )
+            self.assertLess(len(records), 8)
+
+    def test_unexpected_item_failure_is_isolated_in_both_batch_modes(self):
+        for jobs in ("1", "2"):
+            with self.subTest(jobs=jobs), tempfile.TemporaryDirectory() as temp_dir:
+                root = Path(temp_dir)
+                inputs = root / "inputs"
+                inputs.mkdir()
+                (inputs / "page-1.png").write_bytes(_dense_png_data())
+                for index in (0, 2, 3):
+                    (inputs / f"page-{index}.png").write_bytes(_png_data())
+                stdout = StringIO()
+
+                exit_code = main(
+                    ["batch", str(inputs), "-o", str(root / "output"), "--jobs", jobs],
+                    runtime=_dense_page_crashing_ocr_runtime(),
+                    runtime_factory=_dense_page_crashing_ocr_runtime,
+                    stdout=stdout,
+                    stderr=StringIO(),
+                )
+
+                self.assertEqual(exit_code, ExitCode.OPERATIONAL_ERROR)
+                records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+                self.assertEqual(
+                    [record["status"] for record in records],
+                    ["succeeded", "failed", "succeeded", "succeeded"],
+                )
+                self.assertEqual(
+                    records[1]["error"],
+                    {
+                        "code": "batch_item_failed",
+                        "exit_code": int(ExitCode.OPERATIONAL_ERROR),
+                        "message": "unexpected failure while processing the input: "
+                        "simulated engine crash",
+                    },
+                )
+
 
 class RealCliRoundtripIntegrationTest(unittest.TestCase):
     @unittest.skipUnless(
@@ -442,5 +930,68 @@ class _RecordingOcrBackend(FakeOcrBackend):
         return super().recognize(image, regions, languages, options)
 
 
+class _SlowDenseMissingOcrBackend(FakeOcrBackend):
+    def __init__(self):
+        super().__init__((), available_languages=("jpn", "eng"))
+
+    def recognize(
+        self,
+        image,
+        regions=(),
+        languages=DEFAULT_OCR_LANGUAGES,
+        options=OcrOptions(),
+    ):
+        # The dense page keeps its worker busy while the other worker
+        # publishes the pages queued behind it.
+        if image.source.pixel_width != 480:
+            time.sleep(1.0)
+            raise OcrBackendError(
+                "ocr_executable_missing",
+                "simulated missing Tesseract executable",
+                provider="test",
+            )
+        return super().recognize(image, regions, languages, options)
+
+
+def _dense_page_missing_ocr_runtime():
+    return _runtime(_SlowDenseMissingOcrBackend())
+
+
+class _DenseCrashingOcrBackend(FakeOcrBackend):
+    def __init__(self):
+        super().__init__((), available_languages=("jpn", "eng"))
+
+    def recognize(
+        self,
+        image,
+        regions=(),
+        languages=DEFAULT_OCR_LANGUAGES,
+        options=OcrOptions(),
+    ):
+        if image.source.pixel_width != 480:
+            raise RuntimeError("simulated engine crash")
+        return super().recognize(image, regions, languages, options)
+
+
+def _dense_page_crashing_ocr_runtime():
+    return _runtime(_DenseCrashingOcrBackend())
+
+
+class _TimedOcrBackend(FakeOcrBackend):
+    def __init__(self, log):
+        super().__init__((), available_languages=("jpn", "eng"))
+        self.log = log
+
+    def recognize(
+        self,
+        image,
+        regions=(),
+        languages=DEFAULT_OCR_LANGUAGES,
+        options=OcrOptions(),
+    ):
+        self.log.append({"wall_seconds": 0.5})
+        return super().recognize(image, regions, languages, options)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,28 +1,46 @@
 import ast
 import copy
+import io
 import json
+import random
+import shutil
 import sys
+import tempfile
 import unittest
+from dataclasses import replace
 from pathlib import Path
+from unittest.mock import patch
 
 from jsonschema import Draft202012Validator
 
 from aiteqno.adapters.json_schema import (
+    _compiled_schema,
     document_ir_from_data,
     document_ir_from_file,
     document_ir_from_json,
     document_ir_schema_path,
+    document_ir_sidecar_path,
+    encode_document_ir_sidecar,
     load_document_ir_schema,
     validate_document_ir,
     validate_document_ir_data,
 )
 from aiteqno.domain import (
+    ELEMENT_TYPE_CODES,
+    DocumentBinaryReader,
     DocumentIR,
     DocumentIRValidationError,
     ImageElement,
     LineElement,
     RectangleElement,
     TextElement,
+    document_from_binary,
+    document_from_json,
+    document_from_json_stream,
+    document_to_dict,
+    document_to_json,
+    document_to_json_stream,
+    encode_document_binary,
 )
 
 
@@ -77,6 +95,60 @@ class DocumentIRSchemaTest(unittest.TestCase):
 
         self.assertIn("unsupported_field", str(raised.exception))
 
+    def test_compiled_schema_accepts_exactly_what_jsonschema_accepts(self):
+        reference = Draft202012Validator(load_document_ir_schema())
+        accepts = _compiled_schema()
+        self.assertIsNotNone(accepts)
+        canonical = load_fixture("canonical.document.ir.json")
+        paths = list(_value_paths(canonical))
+        replacements = (None, True, 0, -1, 0.5, 2.0, "", "x", "#00ff00", [], {})
+        generator = random.Random(20)
+        for case in range(500):
+            data = copy.deepcopy(canonical)
+            for _ in range(generator.choice((1, 1, 2))):
+                path = generator.choice(paths)
+                parent = data
+                try:
+                    for part in path[:-1]:
+                        parent = parent[part]
+                    if generator.random() < 0.15 and isinstance(parent, dict):
+                        del parent[path[-1]]
+                    elif generator.random() < 0.1 and isinstance(parent, dict):
+                        parent["unexpected"] = path[-1]
+                    else:
+                        parent[path[-1]] = generator.choice(replacements)
+                except (KeyError, IndexError, TypeError):
+                    continue
+            with self.subTest(case=case):
+                self.assertEqual(
+                    accepts(data),
+                    next(reference.iter_errors(data), None) is None,
+                )
+        for name in (
+            "canonical.document.ir.json",
+            "invalid-asset.document.ir.json",
+            "invalid-coordinate.document.ir.json",
+            "invalid-version.document.ir.json",
+        ):
+            data = load_fixture(name)
+            self.assertEqual(
+                accepts(data),
+                next(reference.iter_errors(data), None) is None,
+            )
+
+
+def _value_paths(value, prefix=()):
+    items = (
+        value.items()
+        if isinstance(value, dict)
+        else enumerate(value)
+        if isinstance(value, list)
+        else ()
+    )
+    for key, item in items:
+        yield (*prefix, key)
+        yield from _value_paths(item, (*prefix, key))
+
 
 class DocumentIRModelTest(unittest.TestCase):
     def test_canonical_fixture_loads_all_v1_element_types(self):
@@ -180,6 +252,29 @@ class DocumentIRModelTest(unittest.TestCase):
             document.extensions["jp.reactorfront.aiteqno.fixture"]["reviewed"]
         )
 
+    def test_replaced_pages_still_meet_document_wide_id_rules(self):
+        data = load_fixture("canonical.document.ir.json")
+        second_page = copy.deepcopy(data["pages"][0])
+        second_page["id"] = "page-2"
+        second_page["number"] = 2
+        for element in second_page["elements"]:
+            element["id"] += "-2"
+        data["pages"].append(second_page)
+        document = DocumentIR.from_dict(data)
+        page = document.pages[1]
+        clashing = replace(page.elements[0], id=document.pages[0].elements[0].id)
+
+        with self.assertRaises(DocumentIRValidationError) as raised:
+            document.replace_pages(
+                {1: replace(page, elements=(clashing, *page.elements[1:]))}
+            )
+
+        self.assertEqual(
+            [(issue.path, issue.code) for issue in raised.exception.issues],
+            [("$.pages[1].elements[0].id", "duplicate_id")],
+        )
+        self.assertEqual(document.replace_pages({1: replace(page)}), document)
+
     def test_direct_codec_rejects_unknown_fields_with_path(self):
         data = copy.deepcopy(load_fixture("canonical.document.ir.json"))
         data["generator"]["build_path"] = "C:/unsafe"
@@ -190,6 +285,169 @@ class DocumentIRModelTest(unittest.TestCase):
         self.assertEqual(raised.exception.issues[0].path, "$.generator")
         self.assertIn("build_path", str(raised.exception))
 
+    def test_direct_json_writer_matches_json_dumps_byte_for_byte(self):
+        data = load_fixture("canonical.document.ir.json")
+        data["metadata"] = {
+            "note": "問診\n\t\u0001\"\\ ",
+            "scale": 1e-07,
+            "large": 1e16,
+            "integer": 10**30,
+            "nested": [1, 2.5, None, True, False, {"empty": [], "object": {}}],
+        }
+        for index, element in enumerate(data["pages"][0]["elements"]):
+            element["extensions"] = {"jp.example.note": {"values": [1e-05, "é"]}}
+            element["confidence"] = {"overall": 0.125, "detection": 0.5}
+            element["provenance"][0]["notes"] = f"note {index}"
+        document = DocumentIR.from_dict(data)
+
+        for indent in (None, 0, 1, 2, 4):
+            with self.subTest(indent=indent):
+                expected = (
+                    json.dumps(
+                        document_to_dict(document),
+                        ensure_ascii=False,
+                        allow_nan=False,
+                        indent=indent,
+                        separators=None if indent is not None else (",", ":"),
+                    )
+                    + "\n"
+                )
+                written = io.StringIO()
+                document_to_json_stream(document, written, indent=indent)
+
+                self.assertEqual(document_to_json(document, indent=indent), expected)
+                self.assertEqual(written.getvalue(), expected)
+
+    def test_streaming_reader_matches_whole_text_decoder(self):
+        text = document_to_json(document_ir_from_file(CANONICAL_FIXTURE))
+        document = document_from_json(text)
+
+        for chunk_size in (1, 7, 1 << 16):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(
+                    document_from_json_stream(
+                        io.StringIO(text), chunk_size=chunk_size
+                    ),
+                    document,
+                )
+                self.assertEqual(
+                    document_from_json_stream(
+                        io.BytesIO(text.encode("utf-8")), chunk_size=chunk_size
+                    ),
+                    document,
+                )
+        for invalid in (
+            "",
+            "[]",
+            '{"ir_version": "0.1.0"} {}',
+            text[:-4],
+            text.replace('"pages"', '"pages" 1', 1),
+            '{"ir_version": NaN}',
+            "\ufeff{}",
+        ):
+            with self.subTest(invalid=invalid[:24]):
+                with self.assertRaises(DocumentIRValidationError) as expected:
+                    document_from_json(invalid)
+                with self.assertRaises(DocumentIRValidationError) as raised:
+                    document_from_json_stream(io.StringIO(invalid), chunk_size=3)
+                self.assertEqual(str(raised.exception), str(expected.exception))
+        with self.assertRaises(DocumentIRValidationError) as raised:
+            document_from_json_stream(io.BytesIO(text.encode("utf-8")[:40] + b"\xff"))
+        self.assertIn("UTF-8", str(raised.exception))
+        with self.assertRaises(ValueError):
+            document_from_json_stream(io.StringIO(text), chunk_size=0)
+
+    def test_binary_sidecar_round_trips_pages_lazily(self):
+        data = load_fixture("canonical.document.ir.json")
+        data["metadata"] = {"note": "問診票", "large": 10**30}
+        second_page = copy.deepcopy(data["pages"][0])
+        second_page["id"] = "page-2"
+        second_page["number"] = 2
+        for element in second_page["elements"]:
+            element["id"] += "-2"
+            element["extensions"] = {"jp.example.note": {"value": -0.0}}
+        second_page["elements"][0]["style"]["rotation_deg"] = -0.0
+        data["pages"].append(second_page)
+        document = DocumentIR.from_dict(data)
+
+        sidecar = encode_document_binary(document, source_digest="a" * 64)
+        reader = DocumentBinaryReader(sidecar)
+
+        self.assertEqual(reader.source_digest, "a" * 64)
+        self.assertEqual(reader.page_count, 2)
+        self.assertEqual(reader.page(1), document.pages[1])
+        self.assertIs(reader.page(1), reader.page(1))
+        self.assertEqual(reader.document(), document)
+        self.assertEqual(
+            document_to_json(document_from_binary(sidecar)),
+            document_to_json(document),
+        )
+        with self.assertRaises(IndexError):
+            reader.page(2)
+        with self.assertRaises(ValueError):
+            DocumentBinaryReader(sidecar[:-1]).page(1)
+        with self.assertRaises(ValueError):
+            DocumentBinaryReader(b"not a sidecar" * 4)
+        with self.assertRaises(ValueError):
+            encode_document_binary(document, source_digest="A" * 64)
+
+    def test_file_loader_uses_only_a_fresh_sidecar(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = Path(temp_dir) / "document.ir.json"
+            shutil.copyfile(CANONICAL_FIXTURE, path)
+            sidecar_path = document_ir_sidecar_path(path)
+            sidecar_path.write_bytes(encode_document_ir_sidecar(path))
+            original = document_ir_from_file(CANONICAL_FIXTURE)
+
+            self.assertEqual(sidecar_path.name, "document.ir.bin")
+            with patch(
+                "aiteqno.adapters.json_schema.document_ir_from_json"
+            ) as from_json:
+                self.assertEqual(document_ir_from_file(path), original)
+            from_json.assert_not_called()
+
+            data = load_fixture("canonical.document.ir.json")
+            data["metadata"]["title"] = "edited after packing"
+            path.write_text(json.dumps(data), encoding="utf-8")
+            self.assertEqual(
+                document_ir_from_file(path).metadata["title"],
+                "edited after packing",
+            )
+
+            sidecar_path.write_bytes(b"corrupt")
+            self.assertEqual(
+                document_ir_from_file(path).metadata["title"],
+                "edited after packing",
+            )
+
+    def test_page_geometry_columns_mirror_elements_and_stay_read_only(self):
+        page = document_ir_from_file(CANONICAL_FIXTURE).pages[0]
+        geometry = page.geometry
+        elements = page.elements
+
+        self.assertIs(page.geometry, geometry)
+        self.assertEqual(len(geometry), len(elements))
+        self.assertEqual(
+            list(geometry.x), [element.bbox.x for element in elements]
+        )
+        self.assertEqual(
+            list(geometry.height), [element.bbox.height for element in elements]
+        )
+        self.assertEqual(
+            [ELEMENT_TYPE_CODES[code] for code in geometry.type_codes],
+            [element.type for element in elements],
+        )
+        self.assertEqual(
+            list(geometry.reading_order),
+            [getattr(element, "reading_order", -1) for element in elements],
+        )
+        self.assertEqual(geometry.start_y[1], elements[1].start.y)
+        self.assertNotEqual(geometry.start_y[0], geometry.start_y[0])
+        with self.assertRaises(TypeError):
+            geometry.x[0] = 1.0
+        self.assertEqual(page, copy.copy(page))
+        self.assertNotIn("geometry", repr(page))
+
 
 class DomainBoundaryTest(unittest.TestCase):
     def test_domain_does_not_import_external_implementation(self):
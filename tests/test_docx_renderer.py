@@ -1,6 +1,8 @@
 import base64
+import copy
 import hashlib
 import json
+import random
 import tempfile
 import unittest
 from dataclasses import replace
@@ -18,6 +20,7 @@ from aiteqno.adapters import (
     BundleAssetResolver,
     PythonDocxRenderer,
 )
+from aiteqno.adapters.docx import _BAND_TOLERANCE_PT, _LayoutBand
 from aiteqno.application import render_docx
 from aiteqno.domain import (
     BoundingBox,
@@ -25,6 +28,7 @@ from aiteqno.domain import (
     FontStyle,
     ImageElement,
     ImageFit,
+    LineElement,
     PageSize,
     Point,
     TextAlign,
@@ -694,6 +698,83 @@ class DocxRendererTest(unittest.TestCase):
         self.assertAlmostEqual(section.page_width.pt, 841.89, places=1)
         self.assertAlmostEqual(section.page_height.pt, 595.28, places=1)
 
+    def test_columnar_band_clustering_matches_the_per_element_loop(self):
+        canonical = load_canonical_document().to_dict()
+        templates = canonical["pages"][0]["elements"]
+        generator = random.Random(23)
+        for case in range(300):
+            document = copy.deepcopy(canonical)
+            elements = []
+            reading_order = 0
+            for index in range(generator.randrange(0, 60)):
+                element = copy.deepcopy(generator.choice(templates))
+                element["id"] = f"e{generator.randrange(10**6)}-{index}"
+                x = generator.choice((10.0, 20.0, generator.uniform(0, 200)))
+                y = generator.choice((10.0, 12.0, 40.0, generator.uniform(0, 400)))
+                width = generator.uniform(1, 100)
+                height = generator.choice((2.0, generator.uniform(1, 30)))
+                element["bbox"] = {"x": x, "y": y, "width": width, "height": height}
+                element["z_index"] = generator.randrange(3)
+                if element["type"] == "text":
+                    element["reading_order"] = reading_order
+                    reading_order += 1
+                elif element["type"] == "line":
+                    if generator.random() < 0.5:
+                        start_y, end_y = y + height, y
+                    else:
+                        start_y = end_y = y + height / 2
+                    element["start"] = {"x": x, "y": start_y}
+                    element["end"] = {"x": x + width, "y": end_y}
+                elements.append(element)
+            document["pages"][0]["elements"] = elements
+            page = DocumentIR.from_dict(document).pages[0]
+            subset = [
+                index
+                for index in range(len(page.elements))
+                if generator.random() < 0.6
+            ]
+            with self.subTest(case=case):
+                self.assertEqual(
+                    PythonDocxRenderer._cluster_bands(page),
+                    _bands_by_loop(page.elements),
+                )
+                self.assertEqual(
+                    PythonDocxRenderer._cluster_bands(page, subset),
+                    _bands_by_loop(tuple(page.elements[index] for index in subset)),
+                )
+
+
+def _bands_by_loop(elements):
+    def sort_key(element):
+        reading_order = (
+            element.reading_order if isinstance(element, TextElement) else 2**31 - 1
+        )
+        return (
+            element.bbox.y,
+            reading_order,
+            element.bbox.x,
+            element.z_index,
+            element.id,
+        )
+
+    bands = []
+    for element in sorted(elements, key=sort_key):
+        top = element.bbox.y
+        bottom = element.bbox.bottom
+        if isinstance(element, LineElement):
+            top = min(element.start.y, element.end.y)
+            bottom = max(element.start.y, element.end.y)
+        if bands and top <= bands[-1].bottom + _BAND_TOLERANCE_PT:
+            previous = bands[-1]
+            bands[-1] = _LayoutBand(
+                elements=(*previous.elements, element),
+                top=min(previous.top, top),
+                bottom=max(previous.bottom, bottom),
+            )
+        else:
+            bands.append(_LayoutBand(elements=(element,), top=top, bottom=bottom))
+    return tuple(bands)
+
 
 if __name__ == "__main__":
     unittest.main()
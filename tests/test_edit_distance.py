@@ -0,0 +1,174 @@
+import random
+import unittest
+
+from aiteqno.application import (
+    levenshtein_difference_runs,
+    levenshtein_distance,
+    source_character_accuracy,
+)
+
+
+ALPHABETS = (
+    "ab",
+    "abcdefgh",
+    "診療申込書氏名 ",
+    "abcdefghijklmnopqrstuvwxyz0123456789",
+)
+
+
+class EditDistanceTest(unittest.TestCase):
+    def test_bit_parallel_distance_matches_the_full_matrix(self):
+        generator = random.Random(18)
+        for case in range(600):
+            expected, observed = _string_pair(generator)
+            matrix = _full_matrix(expected, observed)
+            with self.subTest(case=case):
+                self.assertEqual(
+                    levenshtein_distance(expected, observed),
+                    matrix[-1][-1],
+                )
+        long_text = "".join(generator.choice(ALPHABETS[3]) for _ in range(700))
+        self.assertEqual(
+            levenshtein_distance(long_text, long_text[::-1][:650]),
+            _full_matrix(long_text, long_text[::-1][:650])[-1][-1],
+        )
+        self.assertEqual(levenshtein_distance("", ""), 0)
+        self.assertEqual(levenshtein_distance("", "abc"), 3)
+        self.assertEqual(source_character_accuracy("abcd", "abxd"), 75.0)
+
+    def test_threshold_mode_stops_above_the_limit(self):
+        generator = random.Random(180)
+        for case in range(600):
+            expected, observed = _string_pair(generator)
+            distance = _full_matrix(expected, observed)[-1][-1]
+            limit = generator.randrange(0, 20)
+            with self.subTest(case=case, limit=limit):
+                self.assertEqual(
+                    levenshtein_distance(expected, observed, max_distance=limit),
+                    distance if distance <= limit else limit + 1,
+                )
+        with self.assertRaises(ValueError):
+            levenshtein_distance("a", "b", max_distance=-1)
+        with self.assertRaises(TypeError):
+            levenshtein_distance("a", "b", max_distance=True)
+        with self.assertRaises(TypeError):
+            levenshtein_distance(b"a", "b")
+
+    def test_bit_vector_runs_follow_the_full_matrix_traceback(self):
+        generator = random.Random(1800)
+        for case in range(600):
+            expected, observed = _string_pair(generator)
+            with self.subTest(case=case):
+                self.assertEqual(
+                    levenshtein_difference_runs(expected, observed),
+                    _full_matrix_runs(expected, observed),
+                )
+        self.assertEqual(
+            levenshtein_difference_runs("氏名: 山田", "氏名山本"),
+            ((": ", "田"), ("本",)),
+        )
+        self.assertEqual(levenshtein_difference_runs("", "ab"), ((), ("ab",)))
+        self.assertEqual(levenshtein_difference_runs("ab", ""), (("ab",), ()))
+
+
+def _string_pair(generator):
+    alphabet = generator.choice(ALPHABETS)
+    expected = "".join(
+        generator.choice(alphabet)
+        for _ in range(generator.randrange(0, generator.choice((3, 12, 60, 150))))
+    )
+    observed = list(expected)
+    for _ in range(generator.randrange(0, 25)):
+        operation = generator.random()
+        if operation < 0.33 and observed:
+            observed.pop(generator.randrange(len(observed)))
+        elif operation < 0.66:
+            observed.insert(
+                generator.randrange(len(observed) + 1),
+                generator.choice(alphabet),
+            )
+        elif observed:
+            observed[generator.randrange(len(observed))] = generator.choice(alphabet)
+    if generator.random() < 0.2:
+        observed = [
+            generator.choice(alphabet) for _ in range(generator.randrange(0, 40))
+        ]
+    pair = (expected, "".join(observed))
+    return pair if generator.random() < 0.5 else pair[::-1]
+
+
+def _full_matrix(expected, observed):
+    rows = [[0] * (len(observed) + 1) for _ in range(len(expected) + 1)]
+    for index in range(len(expected) + 1):
+        rows[index][0] = index
+    for index in range(len(observed) + 1):
+        rows[0][index] = index
+    for expected_index, expected_character in enumerate(expected, start=1):
+        for observed_index, observed_character in enumerate(observed, start=1):
+            rows[expected_index][observed_index] = min(
+                rows[expected_index - 1][observed_index] + 1,
+                rows[expected_index][observed_index - 1] + 1,
+                rows[expected_index - 1][observed_index - 1]
+                + (expected_character != observed_character),
+            )
+    return rows
+
+
+def _full_matrix_runs(expected, observed):
+    rows = _full_matrix(expected, observed)
+    edits = []
+    expected_index = len(expected)
+    observed_index = len(observed)
+    while expected_index or observed_index:
+        if (
+            expected_index
+            and observed_index
+            and expected[expected_index - 1] == observed[observed_index - 1]
+            and rows[expected_index][observed_index]
+            == rows[expected_index - 1][observed_index - 1]
+        ):
+            edits.append((True, "", ""))
+            expected_index -= 1
+            observed_index -= 1
+        elif (
+            expected_index
+            and observed_index
+            and rows[expected_index][observed_index]
+            == rows[expected_index - 1][observed_index - 1] + 1
+        ):
+            edits.append(
+                (False, expected[expected_index - 1], observed[observed_index - 1])
+            )
+            expected_index -= 1
+            observed_index -= 1
+        elif (
+            expected_index
+            and rows[expected_index][observed_index]
+            == rows[expected_index - 1][observed_index] + 1
+        ):
+            edits.append((False, expected[expected_index - 1], ""))
+            expected_index -= 1
+        else:
+            edits.append((False, "", observed[observed_index - 1]))
+            observed_index -= 1
+    missing, extra, missing_run, extra_run = [], [], [], []
+    for equal, expected_character, observed_character in (
+        *reversed(edits),
+        (True, "", ""),
+    ):
+        if equal:
+            if missing_run:
+                missing.append("".join(missing_run))
+            if extra_run:
+                extra.append("".join(extra_run))
+            missing_run, extra_run = [], []
+            continue
+        if expected_character:
+            missing_run.append(expected_character)
+        if observed_character:
+            extra_run.append(observed_character)
+    return tuple(missing), tuple(extra)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,8 +1,11 @@
 import base64
 import hashlib
+import io
 import json
 import os
+import subprocess
 import tempfile
+import threading
 import unittest
 from contextlib import ExitStack, contextmanager
 from dataclasses import FrozenInstanceError
@@ -10,15 +13,20 @@ from pathlib import Path
 from unittest.mock import patch
 
 import pytesseract
+from PIL import Image, ImageSequence
 
 from aiteqno.adapters import (
     FAKE_OCR_PROVIDER,
+    OCR_RESPONSE_CACHE_VERSION,
     TESSERACT_PROVIDER,
     FakeOcrBackend,
     FakeOcrObservation,
+    FilesystemOcrResponseCache,
     PillowPngDecoder,
+    TesseractBatchOcrBackend,
     TesseractOcrBackend,
 )
+from aiteqno.adapters.tesseract_common import tsv_columns
 from aiteqno.domain import PageSource, PixelBoundingBox, ProvenanceStage
 from aiteqno.ports import (
     DEFAULT_OCR_LANGUAGES,
@@ -27,6 +35,7 @@ from aiteqno.ports import (
     OcrBackendError,
     OcrOptions,
     OcrRegion,
+    OcrResponseCache,
     PixelMode,
 )
 
@@ -200,6 +209,10 @@ class TesseractOcrBackendUnitTest(unittest.TestCase):
             with self.subTest(region_padding_px=region_padding_px):
                 with self.assertRaises(ValueError):
                     TesseractOcrBackend(region_padding_px=region_padding_px)
+        for max_workers in (True, 0, -1, 2.0):
+            with self.subTest(max_workers=max_workers):
+                with self.assertRaises(ValueError):
+                    TesseractOcrBackend(max_workers=max_workers)
         with self.assertRaises(ValueError):
             TesseractOcrBackend(target_dpi=300, region_padding_px=2)
         with self.assertRaises(TypeError):
@@ -261,6 +274,51 @@ class TesseractOcrBackendUnitTest(unittest.TestCase):
         self.assertEqual(rendered["configuration"]["region_padding_px"], 2)
         self.assertEqual(rendered["crops"][0]["padding_pixels"], 2)
 
+    def test_recognize_reuses_probe_until_executable_or_traineddata_changes(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            executable = root / "bin" / "tesseract"
+            executable.parent.mkdir()
+            executable.write_bytes(b"fake executable")
+            tessdata = root / "tessdata"
+            tessdata.mkdir()
+            traineddata = tessdata / "jpn.traineddata"
+            traineddata.write_bytes(b"first-japanese-traineddata")
+            invocations = []
+            backend = TesseractOcrBackend(
+                executable_path=executable,
+                tessdata_prefix=tessdata,
+                invocation_observer=invocations.append,
+            )
+
+            with _runtime_patches() as image_to_data:
+                with patch(
+                    "aiteqno.adapters.tesseract._listed_tessdata_directory",
+                    return_value=None,
+                ) as listed:
+                    for _ in range(3):
+                        backend.recognize(self.image)
+                    version_probe = pytesseract.get_tesseract_version
+                    self.assertEqual(version_probe.call_count, 1)
+                    self.assertEqual(listed.call_count, 1)
+
+                    traineddata.write_bytes(b"second-japanese-traineddata-file")
+                    backend.recognize(self.image)
+                    self.assertEqual(version_probe.call_count, 2)
+
+                    os.utime(executable, ns=(1, 1))
+                    backend.recognize(self.image)
+                    backend.healthcheck()
+                    self.assertEqual(version_probe.call_count, 4)
+                self.assertEqual(image_to_data.call_count, 5)
+
+        hashes = [evidence.traineddata[0].sha256 for evidence in invocations]
+        self.assertEqual(
+            hashes,
+            [hashlib.sha256(b"first-japanese-traineddata").hexdigest()] * 3
+            + [hashlib.sha256(b"second-japanese-traineddata-file").hexdigest()] * 2,
+        )
+
     def test_healthcheck_diagnoses_missing_executable_version_and_language(self):
         with tempfile.TemporaryDirectory() as temp_dir:
             missing = Path(temp_dir) / "missing-tesseract.exe"
@@ -468,6 +526,91 @@ class TesseractOcrBackendUnitTest(unittest.TestCase):
         self.assertFalse(full_page_evidence.crops[0].applied)
         self.assertEqual(full_page_evidence.crops[0].padding_pixels, 0)
 
+    def test_parallel_regions_keep_sequential_token_and_evidence_order(self):
+        regions = tuple(
+            OcrRegion(
+                region_ref=f"text-region-{index}",
+                bbox=PixelBoundingBox(x=index * 20, y=10, width=20 + index, height=30),
+            )
+            for index in range(6)
+        )
+        def run(max_workers):
+            # Parallel runs hold three padded crops together so later regions
+            # finish before earlier ones.
+            held = threading.Barrier(3 if max_workers > 1 else 1, timeout=5)
+
+            def respond(image, **_kwargs):
+                width = image.size[0]
+                if width in (26, 27, 28):
+                    held.wait()
+                return {
+                    "text": [f"w{width}"],
+                    "conf": ["90"],
+                    "left": [1],
+                    "top": [1],
+                    "width": [5],
+                    "height": [5],
+                }
+
+            transforms = []
+            paddings = []
+            backend = TesseractOcrBackend(
+                executable_path="test-tesseract",
+                max_workers=max_workers,
+                transform_observer=transforms.append,
+                padding_observer=paddings.append,
+            )
+            with _runtime_patches(response_error=respond):
+                tokens = backend.recognize(self.image, regions=regions)
+            return tokens, transforms[0], paddings[0]
+
+        sequential = run(1)
+        parallel = run(3)
+
+        self.assertEqual(parallel[0], sequential[0])
+        self.assertEqual(
+            [token.parent_region_ref for token in parallel[0]],
+            [region.region_ref for region in regions],
+        )
+        self.assertEqual(parallel[1], sequential[1])
+        self.assertEqual(parallel[2], sequential[2])
+        self.assertEqual(
+            [crop.region_ref for crop in parallel[2].crops],
+            [region.region_ref for region in regions],
+        )
+
+    def test_parallel_region_failure_raises_first_planned_error(self):
+        regions = tuple(
+            OcrRegion(
+                region_ref=f"text-region-{index}",
+                bbox=PixelBoundingBox(x=index * 40, y=10, width=30 + index, height=30),
+            )
+            for index in range(4)
+        )
+
+        def fail_some(image, **_kwargs):
+            width = image.size[0]
+            if width == 35:
+                raise pytesseract.TesseractError(1, "second region failed")
+            if width == 37:
+                raise RuntimeError("Tesseract process timeout")
+            return {
+                "text": [],
+                "conf": [],
+                "left": [],
+                "top": [],
+                "width": [],
+                "height": [],
+            }
+
+        backend = TesseractOcrBackend(executable_path="test-tesseract", max_workers=4)
+        with _runtime_patches(response_error=fail_some):
+            with self.assertRaises(OcrBackendError) as context:
+                backend.recognize(self.image, regions=regions)
+
+        self.assertEqual(context.exception.code, "ocr_engine_failure")
+        self.assertIn("second region failed", str(context.exception))
+
     def test_region_plan_identity_changes_parameters_digest(self):
         response = {
             "text": ["same"],
@@ -836,6 +979,363 @@ class TesseractOcrBackendUnitTest(unittest.TestCase):
         self.assertEqual(response_context.exception.code, "ocr_invalid_response")
 
 
+class OcrResponseCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = _blank_image()
+
+    def test_identical_crops_skip_the_engine_and_report_hits(self):
+        regions = (
+            OcrRegion(
+                region_ref="header-left",
+                bbox=PixelBoundingBox(x=0, y=0, width=40, height=20),
+            ),
+            OcrRegion(
+                region_ref="header-right",
+                bbox=PixelBoundingBox(x=100, y=0, width=40, height=20),
+            ),
+            OcrRegion(
+                region_ref="body",
+                bbox=PixelBoundingBox(x=0, y=40, width=60, height=30),
+            ),
+        )
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            tessdata = root / "tessdata"
+            tessdata.mkdir()
+            (tessdata / "jpn.traineddata").write_bytes(b"japanese-model")
+            cache = FilesystemOcrResponseCache(root / "cache")
+            invocations = []
+            backend = TesseractOcrBackend(
+                executable_path="test-tesseract",
+                tessdata_prefix=tessdata,
+                response_cache=cache,
+                invocation_observer=invocations.append,
+            )
+            uncached = TesseractOcrBackend(
+                executable_path="test-tesseract",
+                tessdata_prefix=tessdata,
+            )
+
+            def respond(image, **_kwargs):
+                return _response_for_width(image.size[0])
+
+            with _runtime_patches(response_error=respond) as image_to_data:
+                expected = uncached.recognize(self.image, regions)
+                first = backend.recognize(self.image, regions)
+                after_first = image_to_data.call_count
+                second = backend.recognize(self.image, regions)
+                after_second = image_to_data.call_count
+
+        self.assertEqual(first, expected)
+        self.assertEqual(second, expected)
+        # The two blank 40x20 header crops share one engine input raster.
+        self.assertEqual(after_first - 3, 2)
+        self.assertEqual(after_second, after_first)
+        self.assertEqual(
+            [
+                invocation.to_dict()["response_cache"]
+                for invocation in invocations
+            ],
+            [
+                {
+                    "cache_version": OCR_RESPONSE_CACHE_VERSION,
+                    "enabled": True,
+                    "hits": 1,
+                    "misses": 2,
+                },
+                {
+                    "cache_version": OCR_RESPONSE_CACHE_VERSION,
+                    "enabled": True,
+                    "hits": 3,
+                    "misses": 0,
+                },
+            ],
+        )
+
+    def test_cache_without_resolvable_traineddata_is_disabled(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            backend = TesseractOcrBackend(
+                executable_path="test-tesseract",
+                tessdata_prefix=root / "missing-tessdata",
+                response_cache=FilesystemOcrResponseCache(root / "cache"),
+            )
+            with _runtime_patches() as image_to_data:
+                with patch(
+                    "aiteqno.adapters.tesseract._resolve_tessdata_directory",
+                    side_effect=OcrBackendError(
+                        "ocr_traineddata_evidence_unavailable",
+                        "unresolved",
+                        provider=TESSERACT_PROVIDER,
+                    ),
+                ):
+                    backend.recognize(self.image)
+                    backend.recognize(self.image)
+            self.assertEqual(image_to_data.call_count, 2)
+            self.assertEqual(list((root / "cache").rglob("*.json")), [])
+
+    def test_backend_accepts_any_response_cache_port(self):
+        cache = _MemoryOcrResponseCache()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tessdata = Path(temp_dir)
+            (tessdata / "jpn.traineddata").write_bytes(b"japanese-model")
+            backend = TesseractOcrBackend(
+                executable_path="test-tesseract",
+                tessdata_prefix=tessdata,
+                response_cache=cache,
+            )
+            with _runtime_patches() as image_to_data:
+                first = backend.recognize(self.image)
+                second = backend.recognize(self.image)
+
+        self.assertIsInstance(cache, OcrResponseCache)
+        self.assertEqual(second, first)
+        self.assertEqual(image_to_data.call_count, 1)
+        self.assertEqual(len(cache.entries), 1)
+        with self.assertRaises(TypeError):
+            TesseractOcrBackend(response_cache=object())
+
+    def test_filesystem_cache_evicts_least_recently_used_and_drops_corruption(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            keys = [
+                hashlib.sha256(str(index).encode()).hexdigest()
+                for index in range(4)
+            ]
+            response = {"text": ["x" * 200], "conf": [90]}
+            probe = FilesystemOcrResponseCache(root / "probe")
+            probe.store(keys[0], response)
+            entry_size = next((root / "probe").rglob("*.json")).stat().st_size
+            cache = FilesystemOcrResponseCache(
+                root / "cache",
+                max_bytes=entry_size * 3,
+            )
+            for index, key in enumerate(keys[:3]):
+                cache.store(key, response)
+                path = root / "cache" / key[:2] / f"{key}.json"
+                os.utime(path, ns=(index + 1, index + 1))
+            self.assertEqual(cache.load(keys[0]), response)
+            cache.store(keys[3], response)
+
+            self.assertIsNone(cache.load(keys[1]))
+            self.assertEqual(cache.load(keys[0]), response)
+            self.assertEqual(cache.load(keys[3]), response)
+            corrupt = root / "cache" / keys[3][:2] / f"{keys[3]}.json"
+            corrupt.write_text("{not json", encoding="utf-8")
+            self.assertIsNone(cache.load(keys[3]))
+            self.assertFalse(corrupt.exists())
+            with self.assertRaises(ValueError):
+                cache.load("../escape")
+            with self.assertRaises(ValueError):
+                FilesystemOcrResponseCache(root / "cache", max_bytes=0)
+
+    def test_filesystem_cache_misses_without_failing_on_unremovable_entries(self):
+        key = hashlib.sha256(b"entry").hexdigest()
+        response = {"text": ["x"], "conf": [90]}
+        with tempfile.TemporaryDirectory() as temp_dir:
+            cache = FilesystemOcrResponseCache(temp_dir)
+            cache.store(key, response)
+            entry = Path(temp_dir) / key[:2] / f"{key}.json"
+            with patch.object(Path, "read_text", side_effect=PermissionError("EACCES")):
+                self.assertIsNone(cache.load(key))
+            self.assertTrue(entry.exists())
+            self.assertEqual(cache.load(key), response)
+
+            entry.write_text("{not json", encoding="utf-8")
+            with patch.object(Path, "unlink", side_effect=PermissionError("EACCES")):
+                self.assertIsNone(cache.load(key))
+            self.assertTrue(entry.exists())
+
+
+class TesseractBatchOcrBackendUnitTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.image = _blank_image()
+        cls.regions = tuple(
+            OcrRegion(
+                region_ref=f"text-region-{index}",
+                bbox=PixelBoundingBox(x=index * 30, y=10, width=20 + index, height=30),
+            )
+            for index in range(5)
+        )
+
+    def test_sessions_stream_ordered_pages_and_match_per_crop_tokens(self):
+        sessions = []
+
+        def respond(image, **_kwargs):
+            return _response_for_width(image.size[0])
+
+        def run_session(command, *, input, timeout, **_kwargs):
+            with Image.open(io.BytesIO(input)) as stream:
+                sizes = [page.size for page in ImageSequence.Iterator(stream)]
+            sessions.append((command, sizes, timeout))
+            rows = ["\t".join(_TSV_HEADER)]
+            for page_number, (width, _height) in enumerate(sizes, start=1):
+                response = _response_for_width(width)
+                rows.append(
+                    f"1\t{page_number}\t0\t0\t0\t0\t0\t0\t{width}\t30\t-1\t"
+                )
+                for index, text in enumerate(response["text"]):
+                    rows.append(
+                        "\t".join(
+                            (
+                                "5",
+                                str(page_number),
+                                "1",
+                                "1",
+                                "1",
+                                str(index + 1),
+                                str(response["left"][index]),
+                                str(response["top"][index]),
+                                str(response["width"][index]),
+                                str(response["height"][index]),
+                                str(response["conf"][index]),
+                                text,
+                            )
+                        )
+                    )
+            return subprocess.CompletedProcess(
+                command,
+                0,
+                stdout="\n".join(rows).encode("utf-8"),
+                stderr=b"",
+            )
+
+        per_crop_timings = []
+        batch_timings = []
+        per_crop = TesseractOcrBackend(
+            executable_path="test-tesseract",
+            timing_observer=per_crop_timings.append,
+        )
+        batch = TesseractBatchOcrBackend(
+            executable_path="test-tesseract",
+            max_workers=2,
+            timing_observer=batch_timings.append,
+        )
+        options = OcrOptions(timeout_seconds=5)
+        with _runtime_patches(response_error=respond):
+            expected = per_crop.recognize(self.image, self.regions, options=options)
+            with patch(
+                "aiteqno.adapters.tesseract_batch.subprocess.run",
+                side_effect=run_session,
+            ):
+                tokens = batch.recognize(self.image, self.regions, options=options)
+
+        self.assertEqual(
+            [(token.text, token.bbox, token.confidence) for token in tokens],
+            [(token.text, token.bbox, token.confidence) for token in expected],
+        )
+        self.assertEqual(
+            [token.parent_region_ref for token in tokens],
+            [region.region_ref for region in self.regions for _ in range(2)],
+        )
+        self.assertNotEqual(
+            tokens[0].provenance[0].parameters_digest,
+            expected[0].provenance[0].parameters_digest,
+        )
+        self.assertEqual(len(sessions), 2)
+        self.assertEqual(
+            sorted(size for _command, sizes, _timeout in sessions for size in sizes),
+            [(24 + index, 34) for index in range(5)],
+        )
+        for command, sizes, timeout in sessions:
+            self.assertEqual(
+                command[:5],
+                [FAKE_EXECUTABLE, "stdin", "stdout", "-l", "jpn"],
+            )
+            self.assertIn("tessedit_create_tsv=1", command)
+            self.assertEqual(timeout, 5 * len(sizes))
+        for timings, session_regions in (
+            (per_crop_timings, [1] * 5),
+            (batch_timings, [3, 3, 3, 2, 2]),
+        ):
+            (timing,) = timings
+            self.assertEqual(
+                [region.region_ref for region in timing.regions],
+                [region.region_ref for region in self.regions],
+            )
+            self.assertEqual(
+                [region.session_regions for region in timing.regions],
+                session_regions,
+            )
+            self.assertEqual(
+                [region.token_count for region in timing.regions],
+                [2] * 5,
+            )
+            self.assertGreaterEqual(
+                timing.wall_seconds,
+                max(region.prepare_seconds for region in timing.regions),
+            )
+            self.assertEqual(
+                json.loads(json.dumps(timing.to_dict()))["regions"][0]["region_ref"],
+                self.regions[0].region_ref,
+            )
+
+    def test_tsv_columns_convert_numbers_and_keep_text(self):
+        tsv = (
+            "level\tpage_num\tconf\tleft\ttext\n"
+            "1\t1\t-1\t0\t\n"
+            "5\t2\t96.5\t12\t007\n"
+            "5\t2\tnan\t3\t"
+        )
+
+        self.assertEqual(
+            tsv_columns(tsv),
+            {
+                "level": [1, 5, 5],
+                "page_num": [1, 2, 2],
+                "conf": [-1, 96, "nan"],
+                "left": [0, 12, 3],
+                "text": ["", "007", ""],
+            },
+        )
+        self.assertEqual(tsv_columns("level\tpage_num\ttext\n"), {})
+
+    def test_session_failures_have_stable_codes(self):
+        cases = (
+            (
+                subprocess.TimeoutExpired("tesseract", 1),
+                "ocr_timeout",
+            ),
+            (FileNotFoundError("gone"), "ocr_executable_missing"),
+            (
+                subprocess.CompletedProcess((), 1, stdout=b"", stderr=b"bad data"),
+                "ocr_engine_failure",
+            ),
+            (
+                subprocess.CompletedProcess(
+                    (),
+                    0,
+                    stdout="\n".join(
+                        (
+                            "\t".join(_TSV_HEADER),
+                            "5\t9\t1\t1\t1\t1\t0\t0\t1\t1\t90\tx",
+                        )
+                    ).encode("utf-8"),
+                    stderr=b"",
+                ),
+                "ocr_invalid_response",
+            ),
+        )
+        backend = TesseractBatchOcrBackend(executable_path="test-tesseract")
+        for outcome, expected_code in cases:
+            with self.subTest(expected_code=expected_code):
+                run = (
+                    {"return_value": outcome}
+                    if isinstance(outcome, subprocess.CompletedProcess)
+                    else {"side_effect": outcome}
+                )
+                with _runtime_patches():
+                    with patch(
+                        "aiteqno.adapters.tesseract_batch.subprocess.run",
+                        **run,
+                    ):
+                        with self.assertRaises(OcrBackendError) as context:
+                            backend.recognize(self.image, self.regions)
+                self.assertEqual(context.exception.code, expected_code)
+
+
 class TesseractOcrBackendIntegrationTest(unittest.TestCase):
     @unittest.skipUnless(
         os.environ.get("AITEQNO_RUN_TESSERACT_INTEGRATION") == "1",
@@ -935,6 +1435,17 @@ class TesseractOcrBackendIntegrationTest(unittest.TestCase):
         self.assertTrue(all(token.model == "tessdata:jpn" for token in tokens))
 
 
+class _MemoryOcrResponseCache:
+    def __init__(self):
+        self.entries = {}
+
+    def load(self, key):
+        return self.entries.get(key)
+
+    def store(self, key, response):
+        self.entries[key] = {name: list(values) for name, values in response.items()}
+
+
 def _blank_image(*, width=200, height=100, dpi=96):
     return ImageInput(
         source=PageSource(
@@ -950,6 +1461,33 @@ def _blank_image(*, width=200, height=100, dpi=96):
     )
 
 
+_TSV_HEADER = (
+    "level",
+    "page_num",
+    "block_num",
+    "par_num",
+    "line_num",
+    "word_num",
+    "left",
+    "top",
+    "width",
+    "height",
+    "conf",
+    "text",
+)
+
+
+def _response_for_width(width):
+    return {
+        "text": [f"w{width}", "患者"],
+        "conf": [91, 87],
+        "left": [2, 8],
+        "top": [3, 4],
+        "width": [5, width - 9],
+        "height": [10, 20],
+    }
+
+
 def _recognize_through_port(backend, image, regions):
     typed_backend: OcrBackend = backend
     return typed_backend.recognize(
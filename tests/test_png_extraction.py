@@ -1,6 +1,10 @@
 import base64
 import os
+import random
+import sys
 import tempfile
+import time
+import tracemalloc
 import unittest
 from dataclasses import replace
 from io import BytesIO
@@ -10,6 +14,7 @@ from unittest.mock import patch
 from PIL import Image
 
 from aiteqno.adapters import (
+    ASSET_ENCODER_PROVIDER,
     BundleAssetResolver,
     FakeOcrBackend,
     FakeOcrObservation,
@@ -18,16 +23,32 @@ from aiteqno.adapters import (
     OpenCvStructureExtractor,
     PillowPngAssetEncoder,
     PillowPngDecoder,
+    PngCompressionProfile,
     TesseractOcrBackend,
 )
 from aiteqno.adapters.json_schema import document_ir_from_file
-from aiteqno.application import PngExtractionError, extract_png
+from aiteqno.application import (
+    ExtractionStageCache,
+    PngExtractionError,
+    extract_png,
+)
+from aiteqno.application.extract import (
+    _associate_region,
+    _AssociatedToken,
+    _intersection_fraction,
+    _reading_order,
+    _RegionIndex,
+    _token_horizontal_key,
+    _token_position_key,
+    _TokenRow,
+)
 from aiteqno.domain import (
     Confidence,
     DocumentIRValidationError,
     ImageElement,
     LineElement,
     PixelBoundingBox,
+    Provenance,
     ProvenanceStage,
     RectangleElement,
     TextElement,
@@ -37,6 +58,7 @@ from aiteqno.ports import (
     OcrBackendError,
     OcrOptions,
     OcrRegionGroupingConfig,
+    OcrToken,
     RegionCandidate,
     RegionKind,
 )
@@ -300,6 +322,81 @@ class PngExtractionPipelineTest(unittest.TestCase):
             self.assertEqual(context.exception.code, "ocr_test_failure")
             self.assertFalse(output.exists())
 
+    def test_stage_timings_are_observed_in_order_and_kept_on_the_result(self):
+        observed = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            tracemalloc.start()
+            try:
+                traced = self._extract(
+                    root / "traced",
+                    stage_timing_observer=observed.append,
+                )
+            finally:
+                tracemalloc.stop()
+            untraced = self._extract(root / "untraced")
+            failed = []
+            with self.assertRaises(PngExtractionError):
+                self._extract(
+                    root / "rejected",
+                    validator=_RejectingValidator(),
+                    stage_timing_observer=failed.append,
+                )
+
+        stages = ("decode", "structure", "ocr", "asset", "assemble", "validate", "write")
+        self.assertEqual(tuple(observed), traced.timings)
+        self.assertEqual(tuple(timing.stage for timing in traced.timings), stages)
+        self.assertEqual(tuple(timing.stage for timing in untraced.timings), stages)
+        self.assertEqual(
+            tuple(timing.stage for timing in failed),
+            stages[:5],
+        )
+        element_count = len(traced.document.pages[0].elements)
+        self.assertEqual(
+            tuple(timing.item_count for timing in traced.timings),
+            (
+                self.image.source.pixel_width * self.image.source.pixel_height,
+                len(self.structure.lines)
+                + len(self.structure.rectangles)
+                + len(self.structure.text_regions)
+                + len(self.structure.image_regions),
+                len(self.observations),
+                1,
+                element_count,
+                element_count,
+                2,
+            ),
+        )
+        for timing in traced.timings:
+            self.assertGreaterEqual(timing.wall_seconds, 0.0)
+            self.assertGreaterEqual(timing.cpu_seconds, 0.0)
+            self.assertIsInstance(timing.peak_traced_bytes, int)
+        self.assertGreater(traced.timings[0].peak_traced_bytes, 0)
+        self.assertTrue(
+            all(timing.peak_traced_bytes is None for timing in untraced.timings)
+        )
+        self.assertEqual(untraced.document, traced.document)
+        self.assertEqual(
+            traced.timings[0].to_dict()["item_count"],
+            traced.timings[0].item_count,
+        )
+
+    def test_stage_that_stops_tracing_records_no_peak(self):
+        with tempfile.TemporaryDirectory() as temp_dir:
+            tracemalloc.start()
+            try:
+                result = self._extract(
+                    Path(temp_dir) / "bundle",
+                    structure_extractor=_TracingStoppingStructureExtractor(),
+                )
+            finally:
+                tracemalloc.stop()
+
+        peaks = {timing.stage: timing.peak_traced_bytes for timing in result.timings}
+        self.assertIsInstance(peaks["decode"], int)
+        self.assertIsNone(peaks["structure"])
+        self.assertIsNone(peaks["write"])
+
     def test_application_orchestration_keeps_adapter_boundaries(self):
         source = (
             Path(__file__).resolve().parents[1]
@@ -366,6 +463,274 @@ class PngExtractionPipelineTest(unittest.TestCase):
             (("p001-text-line-group-0000",),) * 2,
         )
 
+    def test_batch_asset_encoding_matches_per_crop_encoding_in_order(self):
+        source = self.image.source
+        bboxes = (
+            *(region.bbox for region in self.structure.image_regions),
+            PixelBoundingBox(x=0, y=0, width=17, height=9),
+            PixelBoundingBox(
+                x=source.pixel_width - 5,
+                y=0,
+                width=10,
+                height=10,
+            ),
+            PixelBoundingBox(x=3, y=5, width=source.pixel_width - 3, height=4),
+        )
+        single = PillowPngAssetEncoder()
+        batched = PillowPngAssetEncoder(max_workers=4).encode_png_crops(
+            self.image,
+            bboxes,
+        )
+
+        self.assertEqual(len(batched), len(bboxes))
+        for bbox, encoded in zip(bboxes, batched, strict=True):
+            if bbox.x + bbox.width > source.pixel_width:
+                self.assertIsInstance(encoded, AssetEncodingError)
+                self.assertEqual(encoded.code, "asset_region_outside_page")
+            else:
+                self.assertEqual(encoded, single.encode_png_crop(self.image, bbox))
+        with self.assertRaises(ValueError):
+            PillowPngAssetEncoder(max_workers=0)
+
+        recording = _RecordingBatchAssetEncoder()
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            expected = self._extract(root / "single", asset_encoder=single)
+            actual = self._extract(root / "batched", asset_encoder=recording)
+            failed = self._extract(
+                root / "failed",
+                asset_encoder=_RecordingBatchAssetEncoder(fail=True),
+            )
+            truncated = self._extract(
+                root / "truncated",
+                asset_encoder=_RecordingBatchAssetEncoder(truncate=True),
+            )
+        self.assertEqual(actual.document, expected.document)
+        self.assertEqual(actual.diagnostics, expected.diagnostics)
+        self.assertEqual(
+            recording.calls,
+            [tuple(region.bbox for region in self.structure.image_regions)],
+        )
+        self.assertEqual(failed.document.assets, ())
+        self.assertEqual(
+            [
+                diagnostic.code
+                for diagnostic in failed.diagnostics
+                if diagnostic.stage == "asset"
+            ],
+            ["asset_test_failure"] * len(self.structure.image_regions),
+        )
+        self.assertEqual(truncated.document.assets, ())
+        (mismatch,) = [
+            diagnostic
+            for diagnostic in truncated.diagnostics
+            if diagnostic.stage == "asset"
+        ]
+        self.assertEqual(mismatch.code, "asset_batch_length_mismatch")
+        self.assertIsNone(mismatch.source_ref)
+        self.assertIn(
+            f"returned {len(self.structure.image_regions) - 1} results",
+            mismatch.message,
+        )
+
+    def test_png_profiles_change_only_bytes_and_record_the_profile(self):
+        bbox = self.structure.image_regions[0].bbox
+        encoded = {
+            profile: PillowPngAssetEncoder(profile=profile).encode_png_crop(
+                self.image,
+                bbox,
+            )
+            for profile in PngCompressionProfile
+        }
+
+        reference = _decoded_rgb(encoded[PngCompressionProfile.SMALLEST].data)
+        for profile, asset in encoded.items():
+            self.assertEqual(
+                asset,
+                PillowPngAssetEncoder(profile=profile.value).encode_png_crop(
+                    self.image,
+                    bbox,
+                ),
+            )
+            self.assertEqual(_decoded_rgb(asset.data), reference)
+            self.assertEqual(asset.provenance.stage, ProvenanceStage.NORMALIZE)
+            self.assertEqual(asset.provenance.provider, ASSET_ENCODER_PROVIDER)
+            self.assertEqual(asset.provenance.source_bbox_px, bbox)
+            self.assertEqual(asset.provenance.notes, f"png_profile={profile.value}")
+        self.assertEqual(
+            len({asset.provenance.parameters_digest for asset in encoded.values()}),
+            len(PngCompressionProfile),
+        )
+        self.assertLessEqual(
+            len(encoded[PngCompressionProfile.SMALLEST].data),
+            len(encoded[PngCompressionProfile.FAST].data),
+        )
+        with self.assertRaisesRegex(ValueError, "fast, balanced, smallest"):
+            PillowPngAssetEncoder(profile="maximum")
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            result = self._extract(
+                Path(temp_dir) / "fast",
+                asset_encoder=PillowPngAssetEncoder(profile="fast"),
+            )
+        image_element = next(
+            element
+            for element in result.document.pages[0].elements
+            if isinstance(element, ImageElement)
+        )
+        self.assertEqual(
+            image_element.provenance[-1],
+            encoded[PngCompressionProfile.FAST].provenance,
+        )
+
+    def test_stage_cache_shares_decode_and_structure_across_ocr_arms(self):
+        decoder = _CountingDecoder()
+        structure_extractor = _CountingStructureExtractor()
+        first_backend = _CountingOcrBackend(self.observations)
+        second_backend = _CountingOcrBackend(self.observations)
+        cache = ExtractionStageCache()
+        arms = (
+            (first_backend, OcrRegionGroupingConfig()),
+            (second_backend, OcrRegionGroupingConfig()),
+            (second_backend, OcrRegionGroupingConfig(enabled=True)),
+            (first_backend, OcrRegionGroupingConfig()),
+        )
+        observed = []
+        with tempfile.TemporaryDirectory() as temp_dir:
+            root = Path(temp_dir)
+            uncached = [
+                self._extract(
+                    root / f"uncached-{index}",
+                    ocr_region_grouping=grouping,
+                )
+                for index, (_backend, grouping) in enumerate(arms)
+            ]
+            cached = []
+            for index, (backend, grouping) in enumerate(arms):
+                cached.append(
+                    extract_png(
+                        self.png_data,
+                        root / f"cached-{index}",
+                        decoder=decoder,
+                        structure_extractor=structure_extractor,
+                        ocr_backend=backend,
+                        asset_encoder=PillowPngAssetEncoder(),
+                        validator=JsonSchemaDocumentIRValidator(),
+                        bundle_writer=FilesystemDocumentBundleWriter(),
+                        languages=("eng",),
+                        ocr_options=OcrOptions(
+                            page_segmentation_mode=6,
+                            timeout_seconds=10,
+                            min_confidence=0.1,
+                        ),
+                        ocr_region_grouping=grouping,
+                        ocr_region_grouping_observer=observed.append,
+                        stage_cache=cache,
+                    )
+                )
+
+            for expected, actual in zip(uncached, cached, strict=True):
+                self.assertEqual(actual.document, expected.document)
+                self.assertEqual(actual.diagnostics, expected.diagnostics)
+                self.assertEqual(
+                    actual.bundle.document_path.read_bytes(),
+                    expected.bundle.document_path.read_bytes(),
+                )
+        self.assertEqual(decoder.calls, 1)
+        self.assertEqual(structure_extractor.calls, 1)
+        self.assertEqual((first_backend.calls, second_backend.calls), (1, 2))
+        self.assertEqual(len(observed), len(arms))
+        self.assertEqual(
+            cache.hits,
+            {"decode": 3, "structure": 3, "region_plan": 2, "ocr": 1},
+        )
+        self.assertEqual(
+            cache.misses,
+            {"decode": 1, "structure": 1, "region_plan": 2, "ocr": 3},
+        )
+
+        with self.assertRaises(PngExtractionError) as context:
+            with tempfile.TemporaryDirectory() as temp_dir:
+                extract_png(
+                    b"not a PNG",
+                    Path(temp_dir) / "bundle",
+                    decoder=decoder,
+                    structure_extractor=structure_extractor,
+                    ocr_backend=first_backend,
+                    asset_encoder=PillowPngAssetEncoder(),
+                    validator=JsonSchemaDocumentIRValidator(),
+                    bundle_writer=FilesystemDocumentBundleWriter(),
+                    stage_cache=cache,
+                )
+        self.assertEqual(context.exception.stage, "decode")
+        self.assertEqual(cache.misses["decode"], 2)
+        cache.clear()
+        with self.assertRaises(TypeError):
+            self._extract(Path("unused"), stage_cache=object())
+
+    def test_sweep_reading_order_matches_a_scan_of_all_rows(self):
+        generator = random.Random(15)
+        for case in range(300):
+            tokens = _synthetic_tokens(
+                generator,
+                count=generator.randrange(0, 120),
+                page_height=generator.choice((40, 400, 4000)),
+                tall_fraction=generator.choice((0.0, 0.05, 0.3)),
+            )
+            generator.shuffle(tokens)
+            with self.subTest(case=case):
+                self.assertEqual(
+                    _reading_order(tokens),
+                    _reading_order_by_scan(tokens),
+                )
+
+    def test_region_index_associates_tokens_like_a_scan_of_all_regions(self):
+        generator = random.Random(14)
+        template = self.structure.text_regions[0]
+        regions = []
+        for index in range(300):
+            bbox = PixelBoundingBox(
+                x=generator.randrange(0, 600),
+                y=generator.randrange(0, 800),
+                width=generator.choice((1, 3, 20, 60, 200, 640)),
+                height=generator.choice((1, 4, 12, 30, 90, 820)),
+            )
+            regions.append(
+                (f"region-{index % 280:04d}", replace(template, bbox=bbox))
+            )
+        index = _RegionIndex(regions)
+        provenance = (
+            Provenance(
+                stage=ProvenanceStage.OCR,
+                provider="test",
+                provider_version="1",
+            ),
+        )
+        for token_index in range(2000):
+            token = OcrToken(
+                text=f"t{token_index}",
+                bbox=PixelBoundingBox(
+                    x=generator.randrange(0, 640),
+                    y=generator.randrange(0, 840),
+                    width=generator.choice((1, 2, 9, 40, 300)),
+                    height=generator.choice((1, 3, 11, 50, 500)),
+                ),
+                confidence=None,
+                provider="test",
+                provider_version="1",
+                model="test",
+                languages=("eng",),
+                provenance=provenance,
+                parent_region_ref=generator.choice(
+                    (None, None, None, "region-0007", "missing-region")
+                ),
+            )
+            with self.subTest(token=token_index):
+                self.assertEqual(
+                    _associate_region(token, index),
+                    _scan_all_regions(token, regions),
+                )
+
     def _extract(
         self,
         output,
@@ -376,6 +741,8 @@ class PngExtractionPipelineTest(unittest.TestCase):
         validator=None,
         ocr_region_grouping=OcrRegionGroupingConfig(),
         ocr_region_grouping_observer=None,
+        stage_cache=None,
+        stage_timing_observer=None,
     ):
         return extract_png(
             self.png_data,
@@ -394,6 +761,8 @@ class PngExtractionPipelineTest(unittest.TestCase):
             ),
             ocr_region_grouping=ocr_region_grouping,
             ocr_region_grouping_observer=ocr_region_grouping_observer,
+            stage_cache=stage_cache,
+            stage_timing_observer=stage_timing_observer,
         )
 
 
@@ -457,6 +826,34 @@ class TesseractPngExtractionIntegrationTest(unittest.TestCase):
                     )
 
 
+class ReadingOrderBenchmark(unittest.TestCase):
+    @unittest.skipUnless(
+        os.environ.get("AITEQNO_RUN_BENCHMARKS") == "1",
+        "set AITEQNO_RUN_BENCHMARKS=1 to time reading-order construction",
+    )
+    def test_sweep_reading_order_on_a_ten_thousand_token_page(self):
+        tokens = _synthetic_tokens(
+            random.Random(10_000),
+            count=10_000,
+            page_height=14_000,
+            tall_fraction=0.01,
+        )
+        started = time.perf_counter()
+        swept = _reading_order(tokens)
+        sweep_seconds = time.perf_counter() - started
+        started = time.perf_counter()
+        scanned = _reading_order_by_scan(tokens)
+        scan_seconds = time.perf_counter() - started
+
+        self.assertEqual(swept, scanned)
+        self.assertLess(sweep_seconds, scan_seconds)
+        print(
+            f"\nreading order, 10k tokens: sweep {sweep_seconds * 1000:.1f} ms, "
+            f"scan {scan_seconds * 1000:.1f} ms",
+            file=sys.stderr,
+        )
+
+
 class _StaticStructureExtractor:
     def __init__(self, result):
         self._result = result
@@ -465,6 +862,64 @@ class _StaticStructureExtractor:
         return self._result
 
 
+class _CountingDecoder(PillowPngDecoder):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def decode(self, data):
+        self.calls += 1
+        return super().decode(data)
+
+
+class _CountingStructureExtractor(OpenCvStructureExtractor):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def detect(self, image):
+        self.calls += 1
+        return super().detect(image)
+
+
+class _TracingStoppingStructureExtractor(OpenCvStructureExtractor):
+    def detect(self, image):
+        tracemalloc.stop()
+        return super().detect(image)
+
+
+class _CountingOcrBackend(FakeOcrBackend):
+    def __init__(self, observations):
+        super().__init__(observations)
+        self.calls = 0
+
+    def recognize(self, image, regions=(), languages=("eng",), options=OcrOptions()):
+        self.calls += 1
+        return super().recognize(image, regions, languages, options)
+
+
+class _RecordingBatchAssetEncoder(PillowPngAssetEncoder):
+    def __init__(self, *, fail=False, truncate=False):
+        super().__init__(max_workers=2)
+        self.calls = []
+        self._fail = fail
+        self._truncate = truncate
+
+    def encode_png_crop(self, image, bbox):
+        raise AssertionError("batch encoders are called once per page")
+
+    def encode_png_crops(self, image, bboxes):
+        self.calls.append(tuple(bboxes))
+        if self._fail:
+            return tuple(
+                AssetEncodingError("asset_test_failure", "simulated failure")
+                for _ in bboxes
+            )
+        if self._truncate:
+            return super().encode_png_crops(image, bboxes)[:-1]
+        return super().encode_png_crops(image, bboxes)
+
+
 class _FailingAssetEncoder:
     def encode_png_crop(self, image, bbox):
         raise AssetEncodingError("asset_test_failure", "simulated asset failure")
@@ -496,5 +951,120 @@ class _FailingOcrBackend:
         )
 
 
+def _decoded_rgb(data):
+    with Image.open(BytesIO(data)) as image:
+        return image.convert("RGB").tobytes()
+
+
+def _synthetic_tokens(generator, *, count, page_height, tall_fraction):
+    provenance = (
+        Provenance(stage=ProvenanceStage.OCR, provider="test", provider_version="1"),
+    )
+    tokens = []
+    for index in range(count):
+        height = (
+            generator.randrange(40, 400)
+            if generator.random() < tall_fraction
+            else generator.randrange(6, 24)
+        )
+        line = generator.randrange(0, max(1, page_height // 20))
+        token = OcrToken(
+            text=generator.choice(("a", "b", f"t{index}")),
+            bbox=PixelBoundingBox(
+                x=generator.randrange(0, 1600),
+                y=line * 20 + generator.randrange(0, 8),
+                width=generator.randrange(1, 120),
+                height=height,
+            ),
+            confidence=None,
+            provider="test",
+            provider_version="1",
+            model="test",
+            languages=("eng",),
+            provenance=provenance,
+        )
+        tokens.append(
+            _AssociatedToken(
+                token=token,
+                region_ref=generator.choice((None, "region-0001", "region-0002")),
+                region=None,
+            )
+        )
+    return tokens
+
+
+def _reading_order_by_scan(tokens):
+    rows = []
+    for item in sorted(tokens, key=_token_position_key):
+        bbox = item.token.bbox
+        matches = []
+        for index, row in enumerate(rows):
+            overlap = max(
+                0, min(bbox.y + bbox.height, row.bottom) - max(bbox.y, row.top)
+            )
+            denominator = min(bbox.height, row.bottom - row.top)
+            ratio = overlap / denominator if denominator else 0.0
+            if ratio >= 0.45:
+                matches.append((ratio, -index, row))
+        if matches:
+            row = max(matches, key=lambda match: (match[0], match[1]))[2]
+            row.items.append(item)
+            row.top = min(row.top, bbox.y)
+            row.bottom = max(row.bottom, bbox.y + bbox.height)
+            row.left = min(row.left, bbox.x)
+        else:
+            rows.append(
+                _TokenRow(
+                    items=[item],
+                    top=bbox.y,
+                    bottom=bbox.y + bbox.height,
+                    left=bbox.x,
+                )
+            )
+    rows.sort(key=lambda row: (row.top, row.left, row.bottom))
+    return tuple(
+        item for row in rows for item in sorted(row.items, key=_token_horizontal_key)
+    )
+
+
+def _scan_all_regions(token, regions):
+    by_ref = dict(regions)
+    if token.parent_region_ref in by_ref:
+        return token.parent_region_ref, by_ref[token.parent_region_ref], False
+    center_x = token.bbox.x + (token.bbox.width - 1) / 2
+    center_y = token.bbox.y + (token.bbox.height - 1) / 2
+    containing = [
+        (region_ref, region)
+        for region_ref, region in regions
+        if region.bbox.x <= center_x < region.bbox.x + region.bbox.width
+        and region.bbox.y <= center_y < region.bbox.y + region.bbox.height
+    ]
+    if containing:
+        return (
+            *min(
+                containing,
+                key=lambda item: (
+                    item[1].bbox.width * item[1].bbox.height,
+                    item[1].bbox.y,
+                    item[1].bbox.x,
+                    item[0],
+                ),
+            ),
+            True,
+        )
+    overlapping = [
+        (region_ref, region, _intersection_fraction(token.bbox, region.bbox))
+        for region_ref, region in regions
+    ]
+    overlapping = [item for item in overlapping if item[2] >= 0.5]
+    if overlapping:
+        region_ref, region, _ = max(
+            overlapping,
+            key=lambda item: (item[2], -item[1].bbox.y, -item[1].bbox.x, item[0]),
+        )
+        return region_ref, region, True
+    return None, None, False
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,11 @@
 import base64
+import itertools
 import json
+import random
 import tempfile
 import unittest
 from dataclasses import replace
+from difflib import SequenceMatcher
 from pathlib import Path
 
 from aiteqno.adapters import (
@@ -12,20 +15,30 @@ from aiteqno.adapters import (
     PythonDocxRenderer,
 )
 from aiteqno.application import (
+    DEFAULT_TEXT_MATCHER,
     EvaluationConfig,
     build_evaluation_reference,
     evaluate_restoration,
     evaluate_restoration_input,
+    normalize_evaluation_text,
     render_docx,
 )
+from aiteqno.application.evaluate import (
+    _candidate_pairs,
+    _element_pair_similarity,
+    _optimal_assignment,
+    _string_similarity,
+)
 from aiteqno.domain import DocumentIR, ElementType
 from aiteqno.ports import (
     DocxObservation,
     DocxRenderReport,
+    ElementAssignment,
     EvaluationReference,
     EvaluationState,
     EvaluationWriteError,
     ObservedElement,
+    ReferenceElement,
     RenderWarning,
     RestorationEvaluationInput,
     SnapshotObservation,
@@ -205,6 +218,149 @@ class RestorationEvaluationTest(unittest.TestCase):
             )
         )
 
+    def test_blocked_candidates_equal_a_scan_of_every_pair(self):
+        generator = random.Random(17)
+        fragments = ("診療", "氏名", "住所", "2026", "年", "abc", " ", "-", "")
+        for case in range(40):
+            expected = tuple(
+                ReferenceElement(
+                    id=f"expected-{index:03d}",
+                    element_type=generator.choice(
+                        (ElementType.TEXT, ElementType.TEXT, ElementType.LINE)
+                    ),
+                    page_number=generator.choice((1, 2)),
+                    text="".join(
+                        generator.choice(fragments)
+                        for _ in range(generator.randrange(0, 9))
+                    ),
+                )
+                for index in range(generator.randrange(0, 40))
+            )
+            observed = tuple(
+                ObservedElement(
+                    id=f"observed-{index:03d}",
+                    element_type=generator.choice(
+                        (ElementType.TEXT, ElementType.TEXT, ElementType.LINE)
+                    ),
+                    page_number=generator.choice((1, 2)),
+                    text="".join(
+                        generator.choice(fragments)
+                        for _ in range(generator.randrange(0, 9))
+                    ),
+                )
+                for index in range(generator.randrange(0, 40))
+            )
+            scanned = [
+                (similarity, first.id, second.id)
+                for first in expected
+                for second in observed
+                if (similarity := _element_pair_similarity(first, second))
+                is not None
+            ]
+            with self.subTest(case=case):
+                self.assertEqual(
+                    sorted(_candidate_pairs(expected, observed)),
+                    sorted(scanned),
+                )
+
+    def test_optimal_assignment_maximizes_total_similarity(self):
+        greedy_trap = [
+            (0.90, "a", "x"),
+            (0.80, "a", "y"),
+            (0.85, "b", "x"),
+        ]
+        self.assertEqual(
+            sorted(_optimal_assignment(list(greedy_trap))),
+            [(0.8, "a", "y"), (0.85, "b", "x")],
+        )
+        generator = random.Random(170)
+        for case in range(60):
+            candidates = [
+                (round(generator.uniform(0.6, 1.0), 3), reference, observed)
+                for reference in "abcde"
+                for observed in "vwxyz"
+                if generator.random() < 0.45
+            ]
+            best = max(
+                (
+                    sum(item[0] for item in subset)
+                    for size in range(len("abcde") + 1)
+                    for subset in itertools.combinations(candidates, size)
+                    if len({item[1] for item in subset}) == size
+                    and len({item[2] for item in subset}) == size
+                ),
+                default=0.0,
+            )
+            assigned = _optimal_assignment(list(candidates))
+            with self.subTest(case=case):
+                self.assertEqual(len({item[1] for item in assigned}), len(assigned))
+                self.assertEqual(len({item[2] for item in assigned}), len(assigned))
+                self.assertAlmostEqual(sum(item[0] for item in assigned), best)
+
+        greedy = evaluate_restoration_input(perfect_input())
+        optimal = evaluate_restoration_input(
+            perfect_input(),
+            config=EvaluationConfig(element_assignment="optimal"),
+        )
+        self.assertEqual(optimal.matches, greedy.matches)
+        self.assertIs(optimal.element_assignment, ElementAssignment.OPTIMAL)
+        self.assertEqual(optimal.to_dict()["elements"]["assignment"], "optimal")
+        self.assertNotIn("assignment", greedy.to_dict()["elements"])
+        with self.assertRaises(ValueError):
+            EvaluationConfig(element_assignment="hungarian")
+
+    def test_longest_block_matcher_reproduces_sequence_matcher_ratio(self):
+        generator = random.Random(190)
+        for case in range(800):
+            alphabet = generator.choice(("ab", "abcdefgh", "診療申込書氏名 番号"))
+            expected = "".join(
+                generator.choice(alphabet)
+                for _ in range(generator.randrange(1, generator.choice((4, 30, 160))))
+            )
+            observed = list(expected)
+            for _ in range(generator.randrange(0, 20)):
+                position = generator.randrange(len(observed) + 1)
+                if generator.random() < 0.5:
+                    observed.insert(position, generator.choice(alphabet))
+                else:
+                    del observed[position : position + 1]
+            observed = "".join(observed)
+            normalized = (
+                normalize_evaluation_text(expected),
+                normalize_evaluation_text(observed),
+            )
+            if not all(normalized):
+                continue
+            with self.subTest(case=case):
+                self.assertEqual(
+                    _string_similarity(expected, observed),
+                    SequenceMatcher(None, *normalized, autojunk=False).ratio(),
+                )
+
+        class CountingMatcher:
+            def __init__(self):
+                self.calls = 0
+
+            def matched_characters(self, expected, observed):
+                self.calls += 1
+                return DEFAULT_TEXT_MATCHER.matched_characters(expected, observed)
+
+        matcher = CountingMatcher()
+        custom = evaluate_restoration_input(
+            fixture_input(),
+            config=EvaluationConfig(text_matcher=matcher),
+        )
+        default = evaluate_restoration_input(fixture_input())
+        self.assertEqual(replace(custom, text_matcher=None), default)
+        self.assertGreater(matcher.calls, 0)
+        self.assertEqual(
+            custom.to_dict()["evaluator"]["text_matcher"],
+            f"{__name__}.{CountingMatcher.__qualname__}",
+        )
+        self.assertNotIn("text_matcher", default.to_dict()["evaluator"])
+        with self.assertRaises(TypeError):
+            EvaluationConfig(text_matcher=SequenceMatcher)
+
     def test_missing_essential_text_fails_even_with_score_above_70(self):
         evaluation_input = perfect_input()
         changed = tuple(
@@ -2,20 +2,27 @@ import base64
 import hashlib
 import json
 import unittest
-from dataclasses import FrozenInstanceError
+from dataclasses import FrozenInstanceError, replace
 from io import BytesIO
 from pathlib import Path
 
+import cv2
+import numpy as np
 from PIL import Image
 
 from aiteqno.adapters import (
     STRUCTURE_PROVIDER,
     STRUCTURE_PROVIDER_VERSION,
     OpenCvStructureExtractor,
+    PillowPngAssetEncoder,
     PillowPngDecoder,
+    TiledOpenCvStructureExtractor,
 )
+from aiteqno.adapters.structure_common import component_ink
+from aiteqno.adapters.structure_tiles import _BandComponents
 from aiteqno.domain import DpiSource, PixelBoundingBox, ProvenanceStage
 from aiteqno.ports import (
+    ImageInput,
     LineOrientation,
     PixelMode,
     RegionKind,
@@ -61,6 +68,69 @@ class StructureExtractorTest(unittest.TestCase):
         with self.assertRaises(FrozenInstanceError):
             self.image.pixels = b""
 
+    def test_read_only_buffers_are_shared_without_copying_the_page(self):
+        source = self.image.source
+        array = np.frombuffer(self.image.pixels, dtype=np.uint8).copy().reshape(
+            source.pixel_height,
+            source.pixel_width,
+            3,
+        )
+        array.setflags(write=False)
+        from_array = replace(self.image, pixels=array)
+        from_view = replace(self.image, pixels=memoryview(bytes(self.image.pixels)))
+
+        self.assertIsInstance(from_array.pixels, memoryview)
+        self.assertTrue(np.shares_memory(np.asarray(from_array.pixels), array))
+        self.assertEqual(from_array, self.image)
+        self.assertEqual(hash(from_view), hash(self.image))
+        self.assertEqual(self.extractor.detect(from_array), self.result)
+
+        region = self.result.image_regions[0].bbox
+        with Image.frombytes(
+            "RGB",
+            (source.pixel_width, source.pixel_height),
+            self.image.pixels,
+        ) as page:
+            with page.crop(
+                (region.x, region.y, region.x + region.width, region.y + region.height)
+            ) as expected_crop:
+                expected_pixels = expected_crop.tobytes()
+        self.assertEqual(bytes(from_array.region_pixels(region)), expected_pixels)
+        full_width = PixelBoundingBox(x=0, y=3, width=source.pixel_width, height=2)
+        self.assertEqual(
+            bytes(from_view.region_pixels(full_width)),
+            bytes(self.image.pixels)[
+                3 * source.pixel_width * 3 : 5 * source.pixel_width * 3
+            ],
+        )
+        encoder = PillowPngAssetEncoder()
+        self.assertEqual(
+            encoder.encode_png_crop(from_array, region),
+            encoder.encode_png_crop(self.image, region),
+        )
+
+        with self.assertRaises(TypeError):
+            replace(self.image, pixels=bytearray(self.image.pixels))
+        with self.assertRaises(TypeError):
+            replace(self.image, pixels=np.zeros_like(array))
+        with self.assertRaises(ValueError):
+            replace(self.image, pixels=array[:, ::-1])
+        with self.assertRaises(ValueError):
+            replace(self.image, pixels=memoryview(b"\x00" * 3))
+        with self.assertRaises(ValueError):
+            from_array.region_pixels(
+                PixelBoundingBox(x=1, y=0, width=source.pixel_width, height=1)
+            )
+        self.assertIsInstance(
+            ImageInput(
+                source=source,
+                mode=PixelMode.RGB8,
+                pixels=memoryview(array).toreadonly(),
+                source_sha256=self.image.source_sha256,
+            ).pixels,
+            memoryview,
+        )
+
     def test_page_and_major_structure_are_detected_in_source_pixels(self):
         result = self.result
 
@@ -180,6 +250,141 @@ class StructureExtractorTest(unittest.TestCase):
         self.assertTrue(all(region.bbox.width >= 4 for region in self.result.text_regions))
         self.assertTrue(all(region.bbox.height >= 4 for region in self.result.text_regions))
 
+    def test_component_ink_matches_a_per_label_window_scan(self):
+        generator = np.random.default_rng(11)
+        foreground = generator.random((97, 131)) < 0.01
+        foreground[40:70, 20:90] = generator.random((30, 70)) < 0.7
+        joined = cv2.dilate(
+            foreground.view(np.uint8) * 255,
+            cv2.getStructuringElement(cv2.MORPH_RECT, (5, 3)),
+        )
+        count, labels = cv2.connectedComponents(joined, connectivity=8)
+        self.assertGreater(count, 40)
+
+        ink = component_ink(labels, count, foreground)
+
+        self.assertEqual(int(ink.count[0]), 0)
+        for label in range(1, count):
+            points = np.argwhere((labels == label) & foreground)
+            self.assertEqual(int(ink.count[label]), len(points))
+            if not len(points):
+                continue
+            (y_min, x_min), (y_max, x_max) = points.min(axis=0), points.max(axis=0)
+            self.assertEqual(
+                (
+                    int(ink.x[label]),
+                    int(ink.y[label]),
+                    int(ink.width[label]),
+                    int(ink.height[label]),
+                ),
+                (x_min, y_min, x_max - x_min + 1, y_max - y_min + 1),
+            )
+
+    def test_pyramid_mode_refines_coarse_candidates_in_source_pixels(self):
+        with Image.open(BytesIO(self.png_data)) as page:
+            enlarged = page.convert("RGB").resize(
+                (page.width * 4, page.height * 4),
+                Image.Resampling.NEAREST,
+            )
+        buffer = BytesIO()
+        enlarged.save(buffer, format="PNG", dpi=(576, 576))
+        image = PillowPngDecoder().decode(buffer.getvalue())
+        full = self.extractor.detect(image)
+        pyramid_extractor = OpenCvStructureExtractor(pyramid_scale=0.5)
+        pyramid = pyramid_extractor.detect(image)
+
+        self.assertEqual(pyramid_extractor.pyramid_scale, 0.5)
+        for attribute in ("lines", "rectangles", "text_regions", "image_regions"):
+            with self.subTest(attribute=attribute):
+                self.assertEqual(
+                    [item.bbox for item in getattr(pyramid, attribute)],
+                    [item.bbox for item in getattr(full, attribute)],
+                )
+        full_digest = full.lines[0].provenance[0].parameters_digest
+        for candidate in (pyramid.page, *pyramid.lines, *pyramid.text_regions):
+            record = candidate.provenance[0]
+            self.assertTrue(record.notes.endswith("; pyramid_scale=0.5"))
+            self.assertNotEqual(record.parameters_digest, full_digest)
+        self.assertEqual(
+            full_digest,
+            OpenCvStructureExtractor(pyramid_scale=1)
+            .detect(self.image)
+            .lines[0]
+            .provenance[0]
+            .parameters_digest,
+        )
+        for invalid in (0, -0.5, 1.5, float("nan")):
+            with self.assertRaises(ValueError):
+                OpenCvStructureExtractor(pyramid_scale=invalid)
+        with self.assertRaises(TypeError):
+            OpenCvStructureExtractor(pyramid_scale=True)
+
+    def test_tiled_extractor_stitches_band_seams_like_the_full_page(self):
+        digests = set()
+        for tile_rows in (7, 64, 10_000):
+            with self.subTest(tile_rows=tile_rows):
+                extractor = TiledOpenCvStructureExtractor(tile_rows=tile_rows)
+                tiled = extractor.detect(self.image)
+
+                self.assertEqual(extractor.tile_rows, tile_rows)
+                self.assertEqual(tiled.page, replace(
+                    self.result.page,
+                    provenance=tiled.page.provenance,
+                ))
+                for attribute in ("lines", "text_regions", "image_regions"):
+                    self.assertEqual(
+                        [
+                            (item.bbox, item.confidence)
+                            for item in getattr(tiled, attribute)
+                        ],
+                        [
+                            (item.bbox, item.confidence)
+                            for item in getattr(self.result, attribute)
+                        ],
+                    )
+                self.assertEqual(
+                    [item.bbox for item in tiled.rectangles],
+                    [item.bbox for item in self.result.rectangles],
+                )
+                for actual, expected in zip(
+                    tiled.rectangles,
+                    self.result.rectangles,
+                    strict=True,
+                ):
+                    self.assertAlmostEqual(
+                        actual.confidence.overall,
+                        expected.confidence.overall,
+                        places=3,
+                    )
+                digests.add(tiled.lines[0].provenance[0].parameters_digest)
+        self.assertEqual(len(digests), 3)
+        self.assertNotIn(
+            self.result.lines[0].provenance[0].parameters_digest,
+            digests,
+        )
+        with self.assertRaises(ValueError):
+            TiledOpenCvStructureExtractor(tile_rows=0)
+        with self.assertRaises(TypeError):
+            TiledOpenCvStructureExtractor(tile_rows=1.5)
+
+    def test_band_components_match_whole_mask_labeling(self):
+        generator = np.random.default_rng(5)
+        mask = np.where(generator.random((61, 47)) < 0.45, 255, 0).astype(np.uint8)
+        for connectivity in (4, 8):
+            expected_count, _labels, expected_stats, _ = (
+                cv2.connectedComponentsWithStats(mask, connectivity=connectivity)
+            )
+            components = _BandComponents(connectivity=connectivity)
+            for top in range(0, mask.shape[0], 5):
+                components.add(mask[top : top + 5], top)
+            stitched = components.finish()
+
+            self.assertEqual(stitched.count, expected_count)
+            self.assertEqual(
+                sorted(map(tuple, stitched.stats[1:].tolist())),
+                sorted(map(tuple, expected_stats[1:].tolist())),
+            )
+
     def test_decoder_infers_dpi_and_composites_transparency_on_white(self):
         transparent = Image.new("RGBA", (2, 1), (255, 0, 0, 0))
         transparent.putpixel((1, 0), (0, 0, 0, 255))
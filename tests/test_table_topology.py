@@ -2,10 +2,12 @@ import base64
 import copy
 import hashlib
 import json
+import random
 import tempfile
 import unittest
 from dataclasses import replace
 from pathlib import Path
+from unittest.mock import patch
 
 from aiteqno.adapters import (
     BundleAssetResolver,
@@ -19,6 +21,11 @@ from aiteqno.adapters import (
     PillowPreviewRenderer,
 )
 from aiteqno.application import extract_png, infer_table_topology, render_preview
+from aiteqno.application.table_topology import (
+    _contains_point,
+    _ContainmentIndex,
+    _strictly_contains,
+)
 from aiteqno.domain import (
     TABLE_TOPOLOGY_EXTENSION_KEY,
     BoundingBox,
@@ -27,10 +34,13 @@ from aiteqno.domain import (
     Page,
     PageTableTopology,
     PixelBoundingBox,
+    RectangleElement,
     TablePrimitiveRole,
     TextElement,
     read_page_table_topology,
+    validate_document,
 )
+from aiteqno.domain import table_topology as topology_contract
 
 
 STRUCTURE_FIXTURE = (
@@ -247,6 +257,41 @@ class TableTopologyInferenceTest(unittest.TestCase):
                     {issue.code for issue in raised.exception.issues},
                 )
 
+    def test_validated_topology_is_rechecked_only_on_replaced_pages(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            raw, _ = self._extract(Path(temporary_directory) / "raw")
+        enriched = infer_table_topology(raw)
+        page = enriched.pages[0]
+
+        with patch.object(
+            topology_contract,
+            "validate_table_topology_extension",
+            wraps=topology_contract.validate_table_topology_extension,
+        ) as validate_extension:
+            validate_document(enriched)
+            self.assertEqual(validate_extension.call_count, 0)
+
+            edited = enriched.replace_pages({0: replace(page)})
+            self.assertEqual(validate_extension.call_count, 1)
+            validate_document(edited)
+            self.assertEqual(validate_extension.call_count, 1)
+        self.assertEqual(edited, enriched)
+
+        moved = replace(
+            page.elements[0],
+            bbox=replace(page.elements[0].bbox, x=page.size.width),
+        )
+        with self.assertRaises(DocumentIRValidationError) as raised:
+            enriched.replace_pages(
+                {0: replace(page, elements=(moved, *page.elements[1:]))}
+            )
+        self.assertIn(
+            "out_of_page_geometry",
+            {issue.code for issue in raised.exception.issues},
+        )
+        with self.assertRaises(IndexError):
+            enriched.replace_pages({1: page})
+
     def test_preview_bytes_and_element_report_ignore_semantic_extension(self):
         with tempfile.TemporaryDirectory() as temporary_directory:
             root = Path(temporary_directory)
@@ -427,6 +472,51 @@ class TableTopologyInferenceTest(unittest.TestCase):
         self.assertEqual(topology.diagnostics.unassigned_primitive_element_ids, ())
         self.assertEqual(topology.diagnostics.rejected_table_outer_element_ids, ())
 
+    def test_containment_index_answers_like_a_scan_of_every_rectangle(self):
+        with tempfile.TemporaryDirectory() as temporary_directory:
+            raw, _ = self._extract(Path(temporary_directory) / "raw")
+        template = next(
+            element
+            for element in raw.pages[0].elements
+            if isinstance(element, RectangleElement)
+        )
+        generator = random.Random(16)
+        rectangles = tuple(
+            replace(
+                template,
+                id=f"rectangle-{index:04d}",
+                bbox=BoundingBox(
+                    x=generator.choice((0.0, 10.0, 10.5, generator.uniform(0, 400))),
+                    y=generator.choice((0.0, 20.0, 20.7, generator.uniform(0, 600))),
+                    width=generator.choice((0.2, 10.0, generator.uniform(1, 300))),
+                    height=generator.choice((0.3, 12.0, generator.uniform(1, 300))),
+                ),
+            )
+            for index in range(400)
+        )
+        index = _ContainmentIndex(rectangles)
+
+        for container in rectangles[:150]:
+            self.assertEqual(
+                index.inside(container.bbox),
+                tuple(
+                    rectangle
+                    for rectangle in rectangles
+                    if _strictly_contains(container.bbox, rectangle.bbox)
+                ),
+            )
+        for _ in range(500):
+            x = generator.choice((10.0, 20.0, generator.uniform(0, 700)))
+            y = generator.choice((20.0, 32.0, generator.uniform(0, 900)))
+            self.assertEqual(
+                index.at_point(x, y),
+                tuple(
+                    rectangle
+                    for rectangle in rectangles
+                    if _contains_point(rectangle.bbox, x, y)
+                ),
+            )
+
     def _extract(self, output_directory: Path) -> tuple[DocumentIR, Path]:
         result = extract_png(
             self.png_data,